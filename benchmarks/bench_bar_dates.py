@@ -0,0 +1,70 @@
+# ------------------------------------------------------------
+# filename : bench_bar_dates.py
+# descr    : micro-benchmark of parsing the bar dates of a day of
+#            1 min bars a date at a time against barDatesToEpochs,
+#            for 'yyyymmdd hh:mm:ss tz' dates and formatDate=2 ones
+#
+# usage    : python -m benchmarks.bench_bar_dates
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+import timeit
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from ibapi.bar_batch import barDateToEpoch, barDatesToEpochs
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+N_BARS = 12000
+REPEAT = 5
+NUMBER = 5
+START  = datetime(2025, 11, 3, 9, 30, tzinfo = ZoneInfo('US/Eastern'))
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+def zoned_dates():
+    return [(START + timedelta(minutes = i)).strftime("%Y%m%d %H:%M:%S") + " US/Eastern" for i in range(N_BARS)]
+
+
+def epoch_dates():
+    return [str(int((START + timedelta(minutes = i)).timestamp())) for i in range(N_BARS)]
+
+
+def parse_each_strptime(dates):
+    """as get_hist_mkt_data parsed them, a ZoneInfo per bar"""
+    for date_str in dates:
+        dt_part, tz_part = date_str.rsplit(" ", 1)
+        datetime.strptime(dt_part, "%Y%m%d %H:%M:%S").replace(tzinfo = ZoneInfo(tz_part))
+
+
+def parse_each(dates):
+    for date_str in dates:
+        barDateToEpoch(date_str)
+
+
+def best(stmt):
+    return min(timeit.repeat(stmt, repeat = REPEAT, number = NUMBER)) / NUMBER
+
+#============================================================================================================================
+# main
+#============================================================================================================================
+
+if __name__ == '__main__':
+
+    for (name, dates) in (('yyyymmdd hh:mm:ss tz', zoned_dates()), ('epoch seconds', epoch_dates())):
+        each  = best(lambda: parse_each(dates))
+        batch = best(lambda: barDatesToEpochs(dates))
+        print(f"{N_BARS} {name} dates, barDateToEpoch each : {each * 1e3:8.2f} ms")
+        print(f"{N_BARS} {name} dates, barDatesToEpochs    : {batch * 1e3:8.2f} ms  ({each / batch:.1f}x)")
+
+    strptime = best(lambda: parse_each_strptime(zoned_dates()))
+    print(f"{N_BARS} dates, strptime and ZoneInfo each        : {strptime * 1e3:8.2f} ms")
@@ -0,0 +1,109 @@
+# ------------------------------------------------------------
+# filename : bench_codec.py
+# descr    : micro-benchmark of the per field cost of ibapi.utils.decode
+#            against the type specific decoders in ibapi.codec on
+#            TICK_PRICE and HISTORICAL_DATA payloads
+#
+# usage    : python -m benchmarks.bench_codec
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+import timeit
+from decimal import Decimal
+
+from ibapi.codec  import decode_int, decode_float, decode_decimal, decode_str
+from ibapi.comm   import read_fields
+from ibapi.utils  import decode
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+# payloads as they come off the wire after the msg id is split off
+# TICK_PRICE     : version, reqId, tickType, price, size, attrMask
+# HISTORICAL_DATA: reqId, itemCount, then date, open, high, low, close, volume, wap, barCount per bar
+
+TICK_PRICE_PAYLOAD      = b"6\x001001\x001\x00131.45\x00400\x000\x00"
+
+HIST_BAR                = b"20251128 09:31:00 US/Eastern\x00131.41\x00131.47\x00131.38\x00131.45\x001200\x00131.433\x0017\x00"
+HIST_BARS_PER_MSG       = 390
+HISTORICAL_DATA_PAYLOAD = b"1002\x00" + str(HIST_BARS_PER_MSG).encode() + b"\x00" + HIST_BAR * HIST_BARS_PER_MSG
+
+REPEAT                  = 5
+NUMBER                  = 2000
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+def tick_price_utils(fields):
+    it = iter(fields)
+    decode(int, it)
+    decode(int, it)
+    decode(int, it)
+    decode(float, it)
+    decode(Decimal, it)
+    decode(int, it)
+
+
+def tick_price_codec(fields):
+    it = iter(fields)
+    decode_int(it)
+    decode_int(it)
+    decode_int(it)
+    decode_float(it)
+    decode_decimal(it)
+    decode_int(it)
+
+
+def hist_data_utils(fields):
+    it = iter(fields)
+    decode(int, it)
+    for _ in range(decode(int, it)):
+        decode(str, it)
+        decode(float, it)
+        decode(float, it)
+        decode(float, it)
+        decode(float, it)
+        decode(Decimal, it)
+        decode(Decimal, it)
+        decode(int, it)
+
+
+def hist_data_codec(fields):
+    it = iter(fields)
+    decode_int(it)
+    for _ in range(decode_int(it)):
+        decode_str(it)
+        decode_float(it)
+        decode_float(it)
+        decode_float(it)
+        decode_float(it)
+        decode_decimal(it)
+        decode_decimal(it)
+        decode_int(it)
+
+
+def ns_per_field(fn, fields, number):
+    best = min(timeit.repeat(lambda: fn(fields), repeat = REPEAT, number = number))
+    return best / number / len(fields) * 1e9
+
+
+def bench(name, fn_utils, fn_codec, payload, number):
+    fields = read_fields(payload)
+    t_utils = ns_per_field(fn_utils, fields, number)
+    t_codec = ns_per_field(fn_codec, fields, number)
+    print(f"{name:16} utils.decode {t_utils:7.1f} ns/field   codec {t_codec:7.1f} ns/field   x{t_utils / t_codec:.2f}")
+
+
+#============================================================================================================================
+# main
+#============================================================================================================================
+
+if __name__ == '__main__':
+
+    bench('TICK_PRICE',      tick_price_utils, tick_price_codec, TICK_PRICE_PAYLOAD,      NUMBER * 50)
+    bench('HISTORICAL_DATA', hist_data_utils,  hist_data_codec,  HISTORICAL_DATA_PAYLOAD, NUMBER // 20)
@@ -0,0 +1,89 @@
+# ------------------------------------------------------------
+# filename : bench_hist_upsert.py
+# descr    : benchmark of saving a backfill of 1 minute bars to a
+#            sqlite stand-in of IMS_HIST_MKT_DATA a statement per bar
+#            against ImsHistMktDataBulk, BID rows then ASK rows
+#
+# usage    : python -m benchmarks.bench_hist_upsert
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+import sqlite3
+import time
+
+from datetime import datetime, timedelta
+
+from db_objects.ImsHistMktDataBulk import ImsHistMktDataBulk, SQLITE, SQLITE_DDL, merge_sql, row_values
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+N_BARS     = 12000
+BATCH_SIZE = 2000
+START      = datetime(2025, 11, 3, 9, 30)
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+def bar_rows(side):
+    """a BID or ASK row dict per minute, as get_hist_mkt_data makes them"""
+    row_lis = []
+    for i in range(N_BARS):
+        dt_obj = START + timedelta(minutes = i)
+        row_lis.append({'hmd_inv_ticker'               : 'RY',
+                        'hmd_start_datetime'           : dt_obj,
+                        'hmd_end_datetime'             : dt_obj + timedelta(seconds = 59),
+                        'hmd_freq_type'                : '1MIN',
+                        f'hmd_start_{side}_price'      : 131.0 + i % 7,
+                        f'hmd_highest_{side}_price'    : 132.0,
+                        f'hmd_lowest_{side}_price'     : 130.0,
+                        f'hmd_last_{side}_price'       : 131.5})
+    return row_lis
+
+
+def new_db():
+    db_con = sqlite3.connect(':memory:')
+    db_con.execute(SQLITE_DDL)
+    return db_con
+
+
+def put_each(db_con, row_lis):
+    """one statement and commit per bar, as agt_put was called"""
+    sql = merge_sql(SQLITE)
+    for row in row_lis:
+        db_con.execute(sql, row_values(SQLITE, row))
+        db_con.commit()
+    return len(row_lis)
+
+
+def put_bulk(db_con, row_lis):
+    hmd_bulk = ImsHistMktDataBulk(db_con, batch_size = BATCH_SIZE)
+    hmd_bulk.put_db(row_lis)
+    return hmd_bulk.n_round_trips
+
+
+def timed(put, row_lis_lis):
+    db_con       = new_db()
+    start        = time.perf_counter()
+    n_statements = sum(put(db_con, row_lis) for row_lis in row_lis_lis)
+    elapsed      = time.perf_counter() - start
+    db_con.close()
+    return elapsed, n_statements
+
+#============================================================================================================================
+# main
+#============================================================================================================================
+
+if __name__ == '__main__':
+
+    row_lis_lis = [bar_rows('bid'), bar_rows('ask')]
+
+    each, n_each = timed(put_each, row_lis_lis)
+    bulk, n_bulk = timed(put_bulk, row_lis_lis)
+    print(f"{N_BARS} BID and ASK bars, a statement each : {each * 1e3:8.1f} ms, {n_each} round trips")
+    print(f"{N_BARS} BID and ASK bars, batches of {BATCH_SIZE}  : {bulk * 1e3:8.1f} ms, {n_bulk} round trips  ({each / bulk:.1f}x)")
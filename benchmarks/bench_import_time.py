@@ -0,0 +1,64 @@
+# ------------------------------------------------------------
+# filename : bench_import_time.py
+# descr    : start up cost of the ibapi imports a load job pays before it
+#            can connect, each import timed in a fresh interpreter
+#
+#            also reports how many protobuf _pb2 modules the import pulled
+#            in, they are loaded lazily on first use of a message
+#
+# usage    : python -m benchmarks.bench_import_time
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+import os
+import subprocess
+import sys
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+IMPORTS = ['ibapi.client',
+           'ibapi.client, ibapi.wrapper, ibapi.contract',
+           'ibapi.sync_wrapper']
+
+REPEAT  = 7
+
+CHILD   = ("import sys, time\n"
+           "t = time.perf_counter()\n"
+           "import {imports}\n"
+           "t = time.perf_counter() - t\n"
+           "print(t, sum(1 for m in sys.modules if m.endswith('_pb2')), 'numpy' in sys.modules)\n")
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+def time_import(imports):
+    # bytecode caching is forced on, otherwise every run measures compiling the modules
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    code = CHILD.format(imports = imports)
+
+    best = None
+    for _ in range(REPEAT + 1):
+        out = subprocess.run([sys.executable, '-c', code], env = env,
+                             capture_output = True, text = True, check = True).stdout.split()
+        secs, n_pb2, numpy_loaded = float(out[0]), int(out[1]), out[2] == 'True'
+        if best is None or secs < best[0]:
+            best = (secs, n_pb2, numpy_loaded)
+    return best
+
+
+#============================================================================================================================
+# main
+#============================================================================================================================
+
+if __name__ == '__main__':
+
+    for imports in IMPORTS:
+        secs, n_pb2, numpy_loaded = time_import(imports)
+        print(f"import {imports:45} {secs * 1000:7.1f} ms   _pb2 modules {n_pb2:3}   numpy {'yes' if numpy_loaded else 'no'}")
@@ -0,0 +1,128 @@
+# ------------------------------------------------------------
+# filename : bench_replay.py
+# descr    : end to end benchmark of the reader, decoder and message
+#            loop of EClient, fed by ibapi.fake_gateway with a capture
+#            of a TICK_PRICE burst like the open auction, or with a
+#            capture file given on the command line
+#
+# usage    : python -m benchmarks.bench_replay [capture file]
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from ibapi.capture      import IN, CaptureWriter, readCapture
+from ibapi.client       import EClient
+from ibapi.common       import PROTOBUF_MSG_ID
+from ibapi.fake_gateway import FakeGateway
+from ibapi.wrapper      import EWrapper
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+# a text protocol server version, the handshake answer and the nextValidId
+SERVER_VERSION_MSG = b"176\x0020251128 09:30:00 US/Eastern\x00"
+NEXT_VALID_ID_MSG  = b"9\x001\x001\x00"
+
+# TICK_PRICE: msg id, version, reqId, tickType, price, size, attrMask
+TICK_PRICE_MSG     = b"1\x006\x00%d\x001\x00131.%02d\x00400\x000\x00"
+
+RAW_TICK_PRICE      = (1).to_bytes(4, "big")
+PROTOBUF_TICK_PRICE = (PROTOBUF_MSG_ID + 1).to_bytes(4, "big")
+
+N_TICKERS          = 300
+N_TICKS            = 200000
+SETTLE_TIMEOUT     = 120
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+class TickCounter(EWrapper):
+
+    def __init__(self, n_expected):
+        super().__init__()
+        self.n_ticks    = 0
+        self.n_expected = n_expected
+        self.done       = threading.Event()
+
+    def tickPrice(self, reqId, tickType, price, attrib):
+        self.n_ticks += 1
+        if self.n_ticks >= self.n_expected:
+            self.done.set()
+
+
+def write_burst_capture(path):
+    """a capture of the handshake and N_TICKS TICK_PRICE messages all at once"""
+    capture = CaptureWriter(path)
+    # the fake gateway only counts the messages the client sent
+    capture.sent(b"handshake")
+    capture.received(len(SERVER_VERSION_MSG).to_bytes(4, "big") + SERVER_VERSION_MSG)
+    capture.sent(b"startApi")
+    msgs = [NEXT_VALID_ID_MSG] + [TICK_PRICE_MSG % (i % N_TICKERS, i % 100) for i in range(N_TICKS)]
+    capture.received(b"".join(len(msg).to_bytes(4, "big") + msg for msg in msgs))
+    capture.close()
+    return N_TICKS
+
+
+def count_tick_prices(path):
+    """the TICK_PRICE messages of a capture, text or raw int msg ids"""
+    n_ticks = 0
+    for _, direction, data in readCapture(path):
+        if direction == IN and (data.startswith(b"1\x00") or data[:4] in (RAW_TICK_PRICE, PROTOBUF_TICK_PRICE)):
+            n_ticks += 1
+    return n_ticks
+
+
+def replay(path, n_expected, batching):
+    gateway = FakeGateway(path, speed = 0)
+    port    = gateway.start()
+
+    wrapper = TickCounter(n_expected)
+    client  = EClient(wrapper)
+    client.setReaderBatching(batching)
+    client.setMetrics(True)
+    client.connect("127.0.0.1", port, 0)
+    thread  = threading.Thread(target = client.run, daemon = True)
+
+    start   = time.perf_counter()
+    thread.start()
+    wrapper.done.wait(SETTLE_TIMEOUT)
+    elapsed = time.perf_counter() - start
+
+    client.disconnect()
+    thread.join(timeout = 1)
+    gateway.stop()
+    return wrapper.n_ticks, elapsed, client.metrics.snapshot()
+
+#============================================================================================================================
+# main
+#============================================================================================================================
+
+if __name__ == '__main__':
+
+    if len(sys.argv) > 1:
+        path       = sys.argv[1]
+        n_expected = count_tick_prices(path)
+        if not n_expected:
+            sys.exit(f"{path} has no TICK_PRICE messages")
+    else:
+        path       = os.path.join(tempfile.mkdtemp(), 'burst.ibcap')
+        n_expected = write_burst_capture(path)
+
+    for batching in (False, True):
+        n_ticks, elapsed, stats = replay(path, n_expected, batching)
+        dwell = stats["dwell"]
+        print(f"reader batching {batching!s:5}: {n_ticks} ticks in {elapsed:.2f} s, {n_ticks / elapsed:,.0f} ticks/s, "
+              f"queue high water {stats['queueHighWater']}, dwell p50 {dwell['p50'] / 1e3:.0f} us p99 {dwell['p99'] / 1e3:.0f} us")
+        for msg in sorted(stats["messages"].values(), key = lambda m: -m["count"])[:3]:
+            print(f"    {msg['name']:20} {msg['count']:8} msgs, decode p50 {msg['decode']['p50'] / 1e3:.1f} us, "
+                  f"callback p50 {msg['callback']['p50'] / 1e3:.1f} us")
@@ -0,0 +1,89 @@
+# ------------------------------------------------------------
+# filename : bench_send.py
+# descr    : micro-benchmark of sending market data requests one
+#            socket write each against a send batch, and of
+#            comm.make_field on the fields of a request
+#
+# usage    : python -m benchmarks.bench_send
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+import socket
+import threading
+import timeit
+
+from ibapi.comm       import make_field, make_msg
+from ibapi.connection import Connection
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+# a REQ_MKT_DATA request as EClient.sendMsg passes it to the connection
+MKT_DATA_FIELDS = [11, 1001, 0, "RY", "STK", "", 0.0, "", "", "SMART", "TSE", "CAD", "", "", False, "", False, False, ""]
+MKT_DATA_MSG    = make_msg(1, False, "".join(make_field(f) for f in MKT_DATA_FIELDS))
+
+N_REQUESTS      = 300
+REPEAT          = 5
+NUMBER          = 20
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+def connected_pair():
+    """a Connection over one end of a socket pair whose other end is read
+    and thrown away by a thread"""
+    ours, theirs = socket.socketpair()
+    conn = Connection("", 0)
+    conn.socket = ours
+
+    def drain():
+        while theirs.recv(1 << 16):
+            pass
+
+    threading.Thread(target=drain, daemon=True).start()
+    return conn, theirs
+
+
+def send_each(conn):
+    for _ in range(N_REQUESTS):
+        conn.sendMsg(MKT_DATA_MSG)
+
+
+def send_batch(conn):
+    conn.beginBatch()
+    for _ in range(N_REQUESTS):
+        conn.sendMsg(MKT_DATA_MSG)
+    conn.endBatch()
+
+
+def make_fields():
+    for f in MKT_DATA_FIELDS:
+        make_field(f)
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, repeat = REPEAT, number = number)) / number
+
+#============================================================================================================================
+# main
+#============================================================================================================================
+
+if __name__ == '__main__':
+
+    conn, theirs = connected_pair()
+
+    each  = best(lambda: send_each(conn), NUMBER)
+    batch = best(lambda: send_batch(conn), NUMBER)
+    print(f"{N_REQUESTS} requests, a write each : {each * 1e3:8.3f} ms")
+    print(f"{N_REQUESTS} requests, one batch    : {batch * 1e3:8.3f} ms  ({each / batch:.1f}x)")
+
+    fields = best(make_fields, NUMBER * 100)
+    print(f"make_field per request       : {fields * 1e6:8.3f} us")
+
+    conn.disconnect()
+    theirs.close()
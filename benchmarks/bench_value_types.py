@@ -0,0 +1,129 @@
+# ------------------------------------------------------------
+# filename : bench_value_types.py
+# descr    : memory and allocation cost of the slotted bar and tick value
+#            types in ibapi.common against the __dict__ variants selected
+#            by IBAPI_DICT_VALUE_TYPES=1
+#
+#            the switch is read when ibapi.common is imported, so each
+#            variant is measured in its own child process
+#
+# usage    : python -m benchmarks.bench_value_types
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# 2026-10-18 102 AG  check that a REAL_TIME_BARS message decodes into
+#                    each variant before measuring
+# ------------------------------------------------------------
+
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from decimal import Decimal
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+N_OBJECTS = 200000
+REPEAT    = 5
+
+# shared by all objects so that only the objects themselves are counted
+VOLUME    = Decimal(1200)
+WAP       = Decimal("131.433")
+SIZE      = Decimal(100)
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+def make_bar(BarData):
+    bar = BarData()
+    bar.date = "20251128 09:31:00 US/Eastern"
+    bar.open = 131.41
+    bar.high = 131.47
+    bar.low = 131.38
+    bar.close = 131.45
+    bar.volume = VOLUME
+    bar.wap = WAP
+    bar.barCount = 17
+    return bar
+
+
+def make_tick(HistoricalTickLast, TickAttribLast):
+    tick = HistoricalTickLast()
+    tick.time = 1764340260
+    tick.tickAttribLast = TickAttribLast()
+    tick.price = 131.45
+    tick.size = SIZE
+    tick.exchange = "NYSE"
+    tick.specialConditions = ""
+    return tick
+
+
+def check_real_time_bar():
+    """decodes a REAL_TIME_BARS message, every field has to go to a slot"""
+    from ibapi.comm import read_fields
+    from ibapi.decoder import Decoder
+    from ibapi.message import IN
+    from ibapi.wrapper import EWrapper
+
+    class RealTimeBarWrapper(EWrapper):
+        def realtimeBar(self, reqId, time, open_, high, low, close, volume, wap, count):
+            self.bar = (reqId, time, open_, high, low, close, volume, wap, count)
+
+    wrapper = RealTimeBarWrapper()
+    fields  = b"3\x009001\x001764340260\x00131.41\x00131.47\x00131.38\x00131.45\x001200\x00131.433\x0017\x00"
+    Decoder(wrapper, 197).interpret(read_fields(fields), IN.REAL_TIME_BARS)
+    assert wrapper.bar == (9001, 1764340260, 131.41, 131.47, 131.38, 131.45, VOLUME, WAP, 17), wrapper.bar
+
+
+def measure(name, make):
+    make()
+    tracemalloc.start()
+    objs = [make() for _ in range(N_OBJECTS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+
+    best = min(timeit.repeat(make, repeat = REPEAT, number = N_OBJECTS))
+    print(f"{name}\t{size / N_OBJECTS:.1f}\t{best / N_OBJECTS * 1e9:.1f}")
+
+
+def child():
+    from ibapi.common import BarData, HistoricalTickLast, TickAttribLast
+
+    check_real_time_bar()
+    measure('BarData', lambda: make_bar(BarData))
+    measure('HistoricalTickLast', lambda: make_tick(HistoricalTickLast, TickAttribLast))
+
+
+def run_variant(dict_value_types):
+    env = dict(os.environ, IBAPI_DICT_VALUE_TYPES = '1' if dict_value_types else '0')
+    out = subprocess.run([sys.executable, '-m', 'benchmarks.bench_value_types', '--child'],
+                         env = env, capture_output = True, text = True, check = True).stdout
+    res = {}
+    for line in out.splitlines():
+        name, size, ns = line.split('\t')
+        res[name] = (float(size), float(ns))
+    return res
+
+
+#============================================================================================================================
+# main
+#============================================================================================================================
+
+if __name__ == '__main__':
+
+    if '--child' in sys.argv:
+        child()
+    else:
+        slotted = run_variant(False)
+        dicts   = run_variant(True)
+        for name in slotted:
+            s_size, s_ns = slotted[name]
+            d_size, d_ns = dicts[name]
+            print(f"{name:20} __dict__ {d_size:6.1f} B/obj {d_ns:6.1f} ns/obj   "
+                  f"slots {s_size:6.1f} B/obj {s_ns:6.1f} ns/obj   x{d_size / s_size:.2f} memory")
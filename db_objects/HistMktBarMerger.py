@@ -0,0 +1,236 @@
+# ------------------------------------------------------------
+# filename : HistMktBarMerger.py
+# descr    : merges the BID, ASK, TRADES and MIDPOINT bars of one
+#            ticker, frequency and window in memory and hands them
+#            out as fully populated ImsHistMktData rows, so that each
+#            bar is written to IMS_HIST_MKT_DATA once instead of once
+#            per what to show
+#
+#            the bars go to preallocated numpy column arrays, a slot
+#            per bar start time of the window, instead of a DataFrame
+#            growing and looked up a bar at a time
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# 2026-10-18 102 AG  parse the bar dates of a batch at once with
+#                    barDatesToEpochs
+# 2026-10-18 103 AG  take the bar size from the HistMktBarSize registry,
+#                    which gives the frequency and the bar ends
+# ------------------------------------------------------------
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+from ibapi.bar_batch             import barDatesToEpochs
+from ibapi.hist_range            import DAY
+
+from db_objects.HistMktBarSize   import bar_size_get
+from db_objects.ImsHistMktData   import ImsHistMktData
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+# the ImsHistMktData attributes each what to show fills, from the bar open,
+# high, low, close and volume. MIDPOINT has no columns in IMS_HIST_MKT_DATA,
+# its bars are kept for column() only
+WHAT_TO_SHOW_COLUMNS = {'BID'      : ('hmd_start_bid_price',    'hmd_highest_bid_price',    'hmd_lowest_bid_price',    'hmd_last_bid_price',    None),
+                        'ASK'      : ('hmd_start_ask_price',    'hmd_highest_ask_price',    'hmd_lowest_ask_price',    'hmd_last_ask_price',    None),
+                        'TRADES'   : ('hmd_first_traded_price', 'hmd_highest_traded_price', 'hmd_lowest_traded_price', 'hmd_last_traded_price', 'hmd_total_traded_volume'),
+                        'MIDPOINT' : ('midpoint_open',          'midpoint_high',            'midpoint_low',            'midpoint_close',        None)}
+
+# the ImsHistMktData price and volume attributes, in the order of its __init__
+HMD_VALUE_COLUMNS    = ['hmd_start_bid_price',    'hmd_highest_bid_price',    'hmd_lowest_bid_price',    'hmd_last_bid_price',
+                        'hmd_start_ask_price',    'hmd_highest_ask_price',    'hmd_lowest_ask_price',    'hmd_last_ask_price',
+                        'hmd_first_traded_price', 'hmd_highest_traded_price', 'hmd_lowest_traded_price', 'hmd_last_traded_price',
+                        'hmd_total_traded_volume']
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+# --------------------------------------------------------
+# function : bar_column
+# descr    : a float array of one field of the bars, NaN where the bar
+#            has none, e.g. the volume of BID bars
+#
+# in       : (bars, field)
+# out      : (values)
+# --------------------------------------------------------
+
+def bar_column(bars, field):
+
+    values = np.fromiter((getattr(bar, field) for bar in bars), dtype = object, count = len(bars))
+    try:
+        values = values.astype(np.float64)
+    except (TypeError, ValueError):
+        values = np.array([float(value) if value is not None else np.nan for value in values], dtype = np.float64)
+
+    if field == 'volume':
+        # IB sends -1 when there is no volume
+        values[values < 0] = np.nan
+
+    return values
+
+# ============================================================================================================================
+# classes
+# ============================================================================================================================
+
+class HistMktBarMerger:
+
+    # ------------------------------------------------------------
+    # class : HistMktBarMerger
+    # descr : collects the bars of hmd_inv_ticker of bar_size, an IB
+    #         barSizeSetting or HMD_FREQ_TYPE, between start_datetime and
+    #         end_datetime and merges them by bar start time. Bars outside
+    #         the window make the arrays grow, the window only sizes them.
+    #         time_zone is that of the date times of the rows
+    #
+    # in    : (hmd_inv_ticker, bar_size, start_datetime, end_datetime, time_zone)
+    # out   : n/a
+    # ------------------------------------------------------------
+
+    def __init__(self, hmd_inv_ticker, bar_size, start_datetime, end_datetime, time_zone = timezone.utc):
+
+        self.hmd_inv_ticker = hmd_inv_ticker
+        self.bar_size       = bar_size_get(bar_size)
+        self.hmd_freq_type  = self.bar_size.hmd_freq_type
+        bar_seconds         = self.bar_size.bar_seconds
+
+        # bars of a day or longer are dated at midnight UTC and a day apart
+        # at least, so a slot a day wide holds one of them at most
+        self.slot_seconds   = min(bar_seconds, DAY)
+        self.time_zone      = timezone.utc if bar_seconds >= DAY else time_zone
+
+        start_ts            = int(start_datetime.timestamp())
+        end_ts              = int(end_datetime.timestamp())
+        self.origin         = start_ts - start_ts % self.slot_seconds
+        n_slots             = max(1, -(-(end_ts - self.origin) // self.slot_seconds))
+
+        # the bar start time of each slot, 0 for no bar yet
+        self.time           = np.zeros(n_slots, dtype = np.int64)
+        self.columns        = {column : np.full(n_slots, np.nan)
+                               for columns in WHAT_TO_SHOW_COLUMNS.values() for column in columns if column}
+
+        return
+
+
+    # ========================================================================================================================
+    # functions
+    # ========================================================================================================================
+
+    # --------------------------------------------------------
+    # function : add_bars
+    # descr    : puts the bars of a what to show, BarData as the
+    #            historical data requests answer them, in their slots
+    #
+    # in       : (what_to_show, bars)
+    # out      : ()
+    # --------------------------------------------------------
+
+    def add_bars(self, what_to_show, bars):
+
+        if what_to_show not in WHAT_TO_SHOW_COLUMNS:
+            raise ValueError(f"no columns for {what_to_show} bars")
+        if not bars:
+            return
+
+        bar_time = barDatesToEpochs([bar.date for bar in bars])
+        slot     = self.slots(bar_time)
+
+        self.time[slot] = bar_time
+        for (field, column) in zip(('open', 'high', 'low', 'close', 'volume'), WHAT_TO_SHOW_COLUMNS[what_to_show]):
+            if column:
+                self.columns[column][slot] = bar_column(bars, field)
+
+        return
+
+
+    # --------------------------------------------------------
+    # function : slots
+    # descr    : the slots of bar start times, growing the arrays for the
+    #            times outside them
+    #
+    # in       : (bar_time)
+    # out      : (slot)
+    # --------------------------------------------------------
+
+    def slots(self, bar_time):
+
+        slot  = (bar_time - self.origin) // self.slot_seconds
+        first = int(slot.min())
+        last  = int(slot.max())
+
+        if first < 0 or last >= len(self.time):
+            before = max(0, -first)
+            after  = max(0, last + 1 - len(self.time))
+            self.time    = np.concatenate((np.zeros(before, dtype = np.int64), self.time, np.zeros(after, dtype = np.int64)))
+            self.columns = {column : np.concatenate((np.full(before, np.nan), values, np.full(after, np.nan)))
+                            for (column, values) in self.columns.items()}
+            self.origin -= before * self.slot_seconds
+            slot        += before
+
+        return slot
+
+
+    # --------------------------------------------------------
+    # function : column
+    # descr    : the (bar start times, values) of a column for the bars
+    #            that had it, e.g. midpoint_close
+    #
+    # in       : (column)
+    # out      : (bar_time, values)
+    # --------------------------------------------------------
+
+    def column(self, column):
+
+        values = self.columns[column]
+        filled = ~np.isnan(values)
+
+        return self.time[filled], values[filled]
+
+
+    # --------------------------------------------------------
+    # function : hist_mkt_data
+    # descr    : an ImsHistMktData per bar start time in time order, with
+    #            the columns of every what to show added, None for those
+    #            that had no bar at that time
+    #
+    # in       : ()
+    # out      : (row_lis)
+    # --------------------------------------------------------
+
+    def hist_mkt_data(self):
+
+        filled      = np.flatnonzero(self.time)
+        value_lis   = [np.where(np.isnan(self.columns[column][filled]), None, self.columns[column][filled]).tolist()
+                       for column in HMD_VALUE_COLUMNS]
+
+        row_lis = []
+        for (i, bar_time) in enumerate(self.time[filled].tolist()):
+            start_datetime = datetime.fromtimestamp(bar_time, self.time_zone)
+            row_lis.append(ImsHistMktData(self.hmd_inv_ticker, start_datetime, self.bar_size.end_datetime(start_datetime), self.hmd_freq_type,
+                                          *[values[i] for values in value_lis]))
+
+        return row_lis
+
+
+    # ========================================================================================================================
+    #
+    # ========================================================================================================================
+
+    def __len__(self):
+
+        return int(np.count_nonzero(self.time))
+
+
+    def __repr__(self):
+
+        return f"{self.hmd_inv_ticker} {self.hmd_freq_type}"
+
+
+    def __str__(self):
+
+        return f"{self.hmd_inv_ticker} {self.hmd_freq_type}"
@@ -0,0 +1,140 @@
+# ------------------------------------------------------------
+# filename : HistMktBarSize.py
+# descr    : registry of the bar sizes of historic market data, the
+#            IB barSizeSetting, the HMD_FREQ_TYPE saved with the bars
+#            and the seconds of a bar, and the interval each bar
+#            covers in IMS_HIST_MKT_DATA
+#
+#            a bar from HMD_START_DATETIME to HMD_END_DATETIME ends a
+#            second before the next one starts, so that the bars of a
+#            frequency never overlap
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+from datetime import timedelta
+
+from ibapi.hist_range import barSizeSeconds
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+# the IB barSizeSetting values. HMD_FREQ_TYPE has always held the setting
+# as IB spells it, e.g. '1 min'
+BAR_SIZE_SETTINGS = ['1 secs',  '5 secs',  '10 secs', '15 secs', '30 secs',
+                     '1 min',   '2 mins',  '3 mins',  '5 mins',  '10 mins', '15 mins', '20 mins', '30 mins',
+                     '1 hour',  '2 hours', '3 hours', '4 hours', '8 hours',
+                     '1 day',   '1 week',  '1 month']
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+# --------------------------------------------------------
+# function : bar_size_get
+# descr    : the HistMktBarSize of an IB barSizeSetting or an
+#            HMD_FREQ_TYPE, in any case, e.g. '1 MIN' or '1 min'
+#
+# in       : (bar_size)
+# out      : (hist_mkt_bar_size)
+# --------------------------------------------------------
+
+def bar_size_get(bar_size):
+
+    hist_mkt_bar_size = BAR_SIZES.get(' '.join(bar_size.lower().split()))
+    if hist_mkt_bar_size is None:
+        raise ValueError(f"unknown bar size {bar_size!r}")
+
+    return hist_mkt_bar_size
+
+
+# --------------------------------------------------------
+# function : add_months
+# descr    : the date time months later, on the same day of the month
+#            or the last day of a shorter month
+#
+# in       : (start_datetime, months)
+# out      : (result)
+# --------------------------------------------------------
+
+def add_months(start_datetime, months):
+
+    month  = start_datetime.month - 1 + months
+    year   = start_datetime.year + month // 12
+    month  = month % 12 + 1
+    day    = start_datetime.day
+    while True:
+        try:
+            return start_datetime.replace(year = year, month = month, day = day)
+        except ValueError:
+            day -= 1
+
+# ============================================================================================================================
+# classes
+# ============================================================================================================================
+
+class HistMktBarSize:
+
+    # ------------------------------------------------------------
+    # class : HistMktBarSize
+    # descr : one bar size, see the file descr
+    #
+    # in    : (bar_size_setting, hmd_freq_type, bar_seconds)
+    # out   : n/a
+    # ------------------------------------------------------------
+
+    def __init__(self, bar_size_setting, hmd_freq_type, bar_seconds):
+
+        self.bar_size_setting = bar_size_setting
+        self.hmd_freq_type    = hmd_freq_type
+        self.bar_seconds      = bar_seconds
+
+        return
+
+
+    # ========================================================================================================================
+    # functions
+    # ========================================================================================================================
+
+    # --------------------------------------------------------
+    # function : end_datetime
+    # descr    : the HMD_END_DATETIME of the bar starting at
+    #            start_datetime, a second before the next bar, months
+    #            counted on the calendar
+    #
+    # in       : (start_datetime)
+    # out      : (end_datetime)
+    # --------------------------------------------------------
+
+    def end_datetime(self, start_datetime):
+
+        if self.bar_size_setting == '1 month':
+            return add_months(start_datetime, 1) - timedelta(seconds = 1)
+
+        return start_datetime + timedelta(seconds = self.bar_seconds - 1)
+
+
+    # ========================================================================================================================
+    #
+    # ========================================================================================================================
+
+    def __repr__(self):
+
+        return f"{self.hmd_freq_type}"
+
+
+    def __str__(self):
+
+        return f"{self.hmd_freq_type}"
+
+# ============================================================================================================================
+# registry
+# ============================================================================================================================
+
+BAR_SIZES = {bar_size_setting : HistMktBarSize(bar_size_setting = bar_size_setting,
+                                               hmd_freq_type    = bar_size_setting,
+                                               bar_seconds      = barSizeSeconds(bar_size_setting))
+             for bar_size_setting in BAR_SIZE_SETTINGS}
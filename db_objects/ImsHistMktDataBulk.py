@@ -0,0 +1,337 @@
+# ------------------------------------------------------------
+# filename : ImsHistMktDataBulk.py
+# descr    : upserts historic market data in batches, one MERGE
+#            executed with array binding per batch instead of one
+#            round trip per bar
+#
+#            works on a DB-API connection, Oracle (python-oracledb,
+#            MERGE with batch errors) or sqlite3 as a stand-in
+#            (INSERT ... ON CONFLICT DO UPDATE)
+#
+#            a column that is None in a row leaves the column in
+#            the table as it is, so that BID rows and ASK rows of the
+#            same bar can be upserted separately
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# ------------------------------------------------------------
+
+from datetime import datetime
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+TABLE_NAME    = 'IMS_HIST_MKT_DATA'
+
+# the primary key, HMD_PK
+KEY_COLUMNS   = ['HMD_INV_TICKER', 'HMD_START_DATETIME', 'HMD_END_DATETIME', 'HMD_FREQ_TYPE']
+
+DATA_COLUMNS  = ['HMD_START_BID_PRICE',    'HMD_HIGHEST_BID_PRICE',    'HMD_LOWEST_BID_PRICE',    'HMD_LAST_BID_PRICE',
+                 'HMD_START_ASK_PRICE',    'HMD_HIGHEST_ASK_PRICE',    'HMD_LOWEST_ASK_PRICE',    'HMD_LAST_ASK_PRICE',
+                 'HMD_FIRST_TRADED_PRICE', 'HMD_HIGHEST_TRADED_PRICE', 'HMD_LOWEST_TRADED_PRICE', 'HMD_LAST_TRADED_PRICE',
+                 'HMD_TOTAL_TRADED_VOLUME']
+
+COLUMNS       = KEY_COLUMNS + DATA_COLUMNS
+
+# the python types of the columns, for cursor.setinputsizes, so that a None
+# in the first row doesn't fix the type of a column for the whole batch
+COLUMN_TYPES  = [str, datetime, datetime, str] + [float] * len(DATA_COLUMNS)
+
+# rows per MERGE round trip
+BATCH_SIZE    = 2000
+
+ORACLE        = 'oracle'
+SQLITE        = 'sqlite'
+
+# the stand-in for IMS_HIST_MKT_DATA in sqlite, same columns and primary key,
+# the date times kept as the text bind_datetime makes of them
+SQLITE_DDL    = (f"CREATE TABLE IF NOT EXISTS {TABLE_NAME} ("
+                 + ", ".join(f"{col} TEXT NOT NULL" for col in KEY_COLUMNS) + ", "
+                 + ", ".join(f"{col} NUMERIC" for col in DATA_COLUMNS)
+                 + f", PRIMARY KEY ({', '.join(KEY_COLUMNS)}))")
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+# --------------------------------------------------------
+# function : db_dialect
+# descr    : oracle or sqlite, from the module of the connection
+#
+# in       : (db_con)
+# out      : (dialect)
+# --------------------------------------------------------
+
+def db_dialect(db_con):
+
+    if type(db_con).__module__.split('.')[0] == 'sqlite3':
+        return SQLITE
+
+    return ORACLE
+
+
+# --------------------------------------------------------
+# function : merge_sql
+# descr    : the statement upserting one row, executed for every row
+#            of a batch with array binding
+#
+# in       : (dialect)
+# out      : (sql)
+# --------------------------------------------------------
+
+def merge_sql(dialect):
+
+    if dialect == SQLITE:
+        return (f"INSERT INTO {TABLE_NAME} ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in COLUMNS)}) "
+                f"ON CONFLICT ({', '.join(KEY_COLUMNS)}) DO UPDATE SET "
+                + ", ".join(f"{col} = COALESCE(excluded.{col}, {col})" for col in DATA_COLUMNS))
+
+    return (f"MERGE INTO {TABLE_NAME} t "
+            f"USING (SELECT {', '.join(f':{i + 1} {col}' for i, col in enumerate(COLUMNS))} FROM dual) s "
+            f"ON ({' AND '.join(f't.{col} = s.{col}' for col in KEY_COLUMNS)}) "
+            f"WHEN MATCHED THEN UPDATE SET "
+            + ", ".join(f"t.{col} = NVL(s.{col}, t.{col})" for col in DATA_COLUMNS)
+            + f" WHEN NOT MATCHED THEN INSERT ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join(f's.{col}' for col in COLUMNS)})")
+
+
+# --------------------------------------------------------
+# function : existing_keys_sql
+# descr    : the statement selecting the keys already in the table for
+#            the tickers of a batch between its first and last start
+#            date time
+#
+# in       : (dialect, n_tickers)
+# out      : (sql)
+# --------------------------------------------------------
+
+def existing_keys_sql(dialect, n_tickers):
+
+    if dialect == SQLITE:
+        binds = ['?'] * (n_tickers + 2)
+    else:
+        binds = [f':{i + 1}' for i in range(n_tickers + 2)]
+
+    return (f"SELECT {', '.join(KEY_COLUMNS)} FROM {TABLE_NAME} "
+            f"WHERE HMD_INV_TICKER IN ({', '.join(binds[:n_tickers])}) "
+            f"AND HMD_START_DATETIME BETWEEN {binds[n_tickers]} AND {binds[n_tickers + 1]}")
+
+
+# --------------------------------------------------------
+# function : bind_datetime
+# descr    : the value bound for a date time, the wall clock time without
+#            the time zone as an Oracle DATE keeps it, as text in sqlite
+#
+# in       : (dialect, value)
+# out      : (value)
+# --------------------------------------------------------
+
+def bind_datetime(dialect, value):
+
+    if isinstance(value, datetime):
+        value = value.replace(tzinfo = None, microsecond = 0)
+        if dialect == SQLITE:
+            return value.isoformat(sep = ' ')
+
+    return value
+
+
+# --------------------------------------------------------
+# function : row_values
+# descr    : the values of a row in the order of COLUMNS, from an
+#            ImsHistMktData or a dict keyed by the lower case column
+#            names as agt_put takes it, missing columns are None
+#
+# in       : (dialect, row)
+# out      : (values)
+# --------------------------------------------------------
+
+def row_values(dialect, row):
+
+    if not isinstance(row, dict):
+        row = vars(row)
+
+    values = [row.get(col.lower()) for col in COLUMNS]
+    values[1] = bind_datetime(dialect, values[1])
+    values[2] = bind_datetime(dialect, values[2])
+
+    return values
+
+# ============================================================================================================================
+# classes
+# ============================================================================================================================
+
+class ImsHistMktDataBulk:
+
+    # ------------------------------------------------------------
+    # class : ImsHistMktDataBulk
+    # descr : upserts rows of IMS_HIST_MKT_DATA batch_size at a time over
+    #         db_con, a DB-API connection, committing after every batch
+    #
+    # in    : (db_con, batch_size)
+    # out   : n/a
+    # ------------------------------------------------------------
+
+    def __init__(self, db_con, batch_size = BATCH_SIZE):
+
+        self.db_con        = db_con
+        self.batch_size    = batch_size
+        self.dialect       = db_dialect(db_con)
+        self.merge_sql     = merge_sql(self.dialect)
+        self.n_round_trips = 0
+
+        return
+
+
+    # ========================================================================================================================
+    # functions
+    # ========================================================================================================================
+
+    # --------------------------------------------------------
+    # function : put_db
+    # descr    : upserts the rows, ImsHistMktData objects or dicts, and
+    #            returns per batch a dict of
+    #              rows     : the rows in the batch
+    #              inserted : the rows whose key was not in the table yet
+    #              updated  : the rows whose key was in the table
+    #              errors   : (row number in rows, message) of the rows
+    #                         the database refused, the others are kept
+    #
+    # in       : (row_lis)
+    # out      : (batch_lis)
+    # --------------------------------------------------------
+
+    def put_db(self, row_lis):
+
+        batch_lis = []
+
+        for first in range(0, len(row_lis), self.batch_size):
+            values_lis = [row_values(self.dialect, row) for row in row_lis[first:first + self.batch_size]]
+
+            existing  = self.existing_keys(values_lis)
+            errors    = self.execute_batch(values_lis)
+            failed    = {offset for (offset, _) in errors}
+            self.db_con.commit()
+
+            inserted  = 0
+            updated   = 0
+            for (offset, values) in enumerate(values_lis):
+                if offset in failed:
+                    continue
+                key = tuple(values[:len(KEY_COLUMNS)])
+                if key in existing:
+                    updated  += 1
+                else:
+                    inserted += 1
+                    # a second row with the same key in the batch updates it
+                    existing.add(key)
+
+            batch_lis.append({'rows'     : len(values_lis),
+                              'inserted' : inserted,
+                              'updated'  : updated,
+                              'errors'   : [(first + offset, message) for (offset, message) in errors]})
+
+        return batch_lis
+
+
+    # --------------------------------------------------------
+    # function : existing_keys
+    # descr    : the keys of the batch already in the table, in one query
+    #
+    # in       : (values_lis)
+    # out      : (key_set)
+    # --------------------------------------------------------
+
+    def existing_keys(self, values_lis):
+
+        tickers = sorted({values[0] for values in values_lis if values[0] is not None})
+        starts  = [values[1] for values in values_lis if values[1] is not None]
+        if not tickers or not starts:
+            return set()
+
+        cursor = self.db_con.cursor()
+        try:
+            cursor.execute(existing_keys_sql(self.dialect, len(tickers)), tickers + [min(starts), max(starts)])
+            key_set = {tuple(key) for key in cursor.fetchall()}
+        finally:
+            cursor.close()
+        self.n_round_trips += 1
+
+        return key_set
+
+
+    # --------------------------------------------------------
+    # function : execute_batch
+    # descr    : executes the MERGE for all the rows of a batch in one
+    #            round trip and returns the (offset, message) of the rows
+    #            that failed
+    #
+    # in       : (values_lis)
+    # out      : (errors)
+    # --------------------------------------------------------
+
+    def execute_batch(self, values_lis):
+
+        cursor = self.db_con.cursor()
+        try:
+            if self.dialect == SQLITE:
+                errors = self.execute_batch_sqlite(cursor, values_lis)
+            else:
+                cursor.setinputsizes(*COLUMN_TYPES)
+                cursor.executemany(self.merge_sql, values_lis, batcherrors = True)
+                errors = [(error.offset, error.message) for error in cursor.getbatcherrors()]
+        finally:
+            cursor.close()
+        self.n_round_trips += 1
+
+        return errors
+
+
+    # --------------------------------------------------------
+    # function : execute_batch_sqlite
+    # descr    : sqlite has no batch errors, a batch that fails is rolled
+    #            back to its savepoint and done again a row at a time to
+    #            keep the good rows, as Oracle does
+    #
+    # in       : (cursor, values_lis)
+    # out      : (errors)
+    # --------------------------------------------------------
+
+    def execute_batch_sqlite(self, cursor, values_lis):
+
+        import sqlite3
+
+        cursor.execute("SAVEPOINT hmd_batch")
+        try:
+            cursor.executemany(self.merge_sql, values_lis)
+            cursor.execute("RELEASE SAVEPOINT hmd_batch")
+            return []
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK TO SAVEPOINT hmd_batch")
+
+        errors = []
+        for (offset, values) in enumerate(values_lis):
+            try:
+                cursor.execute(self.merge_sql, values)
+            except sqlite3.Error as e:
+                errors.append((offset, str(e)))
+        cursor.execute("RELEASE SAVEPOINT hmd_batch")
+
+        return errors
+
+
+    # ========================================================================================================================
+    #
+    # ========================================================================================================================
+
+    def __repr__(self):
+
+        return f"{TABLE_NAME} batches of {self.batch_size}"
+
+
+    def __str__(self):
+
+        return f"{TABLE_NAME} batches of {self.batch_size}"
@@ -0,0 +1,288 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+asyncio transport for the EClient.
+
+AsyncEClient reads the socket with an asyncio StreamReader on the event loop
+and hands every message straight to the Decoder, on the loop thread, without
+the EReader thread, the message queue and the run() thread of the EClient.
+Framing follows the same comm rules (comm.MsgBuffer), and all the EClient
+request methods work as before.
+
+    wrapper = AsyncEWrapper()
+    client = AsyncEClient(wrapper)
+    await client.connectAsync("127.0.0.1", 7497, clientId=0)
+    bars = await client.reqHistoricalDataAsync(contract, "", "1 D", "1 min", "TRADES")
+
+The *Async request helpers need the wrapper to be an AsyncEWrapper, which
+resolves their futures from the answer callbacks.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+
+from ibapi import comm, decoder
+from ibapi.client import EClient
+from ibapi.const import NO_VALID_ID
+from ibapi.contract import Contract
+from ibapi.errors import CONNECT_FAIL
+from ibapi.futures import CURRENT_TIME_KEY, FuturesWrapper
+from ibapi.utils import ClientException, currentTimeMillis
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncConnection:
+    """The part of Connection the EClient uses, over asyncio streams.
+
+    sendMsg() may be called from any thread, off the loop thread the write
+    is handed over to the loop."""
+
+    def __init__(self, host, port, recvSize):
+        self.host = host
+        self.port = port
+        self.recvSize = recvSize
+        self.reader = None
+        self.writer = None
+        self.loop = None
+        self.loopThreadId = None
+        self.msgBuf = comm.MsgBuffer(recvSize)
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.loop = asyncio.get_running_loop()
+        self.loopThreadId = threading.get_ident()
+
+    def disconnect(self):
+        writer = self.writer
+        if writer is not None:
+            logger.debug("disconnecting")
+            self.writer = None
+            writer.close()
+
+    def isConnected(self):
+        return self.writer is not None
+
+    def sendMsg(self, msg):
+        writer = self.writer
+        if writer is None:
+            logger.debug("sendMsg attempted while not connected")
+            return 0
+        if threading.get_ident() == self.loopThreadId:
+            writer.write(msg)
+        else:
+            self.loop.call_soon_threadsafe(writer.write, msg)
+        return len(msg)
+
+    def beginBatch(self):
+        # the transport buffers the writes of a loop pass already
+        pass
+
+    def endBatch(self):
+        pass
+
+    async def drain(self):
+        """waits until the write buffer is below its high water mark"""
+        if self.writer is not None:
+            await self.writer.drain()
+
+    async def recvMsgs(self) -> list:
+        """waits for data and returns the complete messages received so far,
+        an empty list once the connection is gone"""
+        try:
+            data = await self.reader.read(self.recvSize)
+        except (ConnectionError, OSError):
+            data = b""
+        if not data:
+            logger.debug("socket either closed or broken, disconnecting")
+            self.disconnect()
+            return []
+        self.msgBuf.feed(data)
+        return self.msgBuf.popMsgs()
+
+
+class AsyncEWrapper(FuturesWrapper):
+    """FuturesWrapper for the AsyncEClient *Async request helpers, their
+    futures are asyncio futures of the running loop. Subclasses that
+    override the answer callbacks have to call the super() method for the
+    helpers to keep working."""
+
+    def startRequest(self, reqId: int) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        self.pending.start(reqId, fut)
+        return fut
+
+    def endRequest(self, reqId: int):
+        self.pending.remove(reqId)
+
+
+class AsyncEClient(EClient):
+    """EClient on an asyncio event loop, see the module docstring.
+
+    Use connectAsync() instead of connect() and do not call run(), messages
+    are decoded by a task on the loop as they arrive. The wrapper callbacks
+    run on the loop thread, so they must not block."""
+
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+        self.readerTask = None
+        self.reqIds = itertools.count(1)
+
+    def nextReqId(self) -> int:
+        """request ids used by the *Async helpers, take your own ids from
+        here too when mixing them with plain requests"""
+        return next(self.reqIds)
+
+    async def connectAsync(self, host, port, clientId):
+        """Connects, completes the handshake and starts decoding messages.
+        Errors are reported through wrapper.error() like connect() does."""
+        try:
+            self.validateInvalidSymbols(host)
+        except ClientException as ex:
+            self.wrapper.error(NO_VALID_ID, currentTimeMillis(), ex.code, ex.msg + ex.text)
+            return
+
+        try:
+            self.checkConnected()
+        except ClientException as ex:
+            self.wrapper.error(NO_VALID_ID, currentTimeMillis(), ex.code, ex.msg)
+            return
+
+        self.host = host
+        self.port = port
+        self.clientId = clientId
+        logger.debug("Connecting to %s:%d w/ id:%d", self.host, self.port, self.clientId)
+
+        conn = AsyncConnection(self.host, self.port, self.recvSize)
+        try:
+            await conn.connect()
+        except OSError:
+            self.wrapper.error(NO_VALID_ID, currentTimeMillis(), CONNECT_FAIL.code(), CONNECT_FAIL.msg())
+            logger.info("could not connect")
+            self.reset()
+            return
+
+        self.conn = conn
+        self.setConnState(EClient.CONNECTING)
+        conn.sendMsg(self.makeHandshakeMsg())
+        self.decoder = decoder.Decoder(self.wrapper, self.serverVersion())
+
+        # the server version and connection time are the first message with
+        # two fields, sometimes news come before it
+        rest = None
+        while rest is None:
+            msgs = await conn.recvMsgs()
+            if not conn.isConnected():
+                logger.warning("Disconnected; resetting connection")
+                self.reset()
+                return
+            for i, msg in enumerate(msgs):
+                fields = comm.read_fields(msg)
+                if len(fields) == 2:
+                    rest = msgs[i + 1:]
+                    break
+
+        (server_version, conn_time) = fields
+        logger.debug("ANSWER Version:%s time:%s", server_version, conn_time)
+        self.connTime = conn_time
+        self.serverVersion_ = int(server_version)
+        self.decoder.serverVersion = self.serverVersion()
+        self.instrumentDecoder()
+        self.setConnState(EClient.CONNECTED)
+
+        self.readerTask = asyncio.get_running_loop().create_task(self.runAsync(rest))
+        logger.info("sent startApi")
+        self.startApi()
+        self.wrapper.connectAck()
+
+    async def runAsync(self, msgs=()):
+        """the message loop, started by connectAsync()"""
+        conn = self.conn
+        try:
+            while True:
+                if msgs and not self.decodeMsgs(msgs):
+                    return
+                if not conn.isConnected():
+                    return
+                msgs = await conn.recvMsgs()
+        finally:
+            # disconnect() may already have replaced the connection
+            if self.conn is conn:
+                self.disconnect()
+
+    def run(self):
+        raise RuntimeError("AsyncEClient decodes on the event loop, there is no run() loop")
+
+    def beginBatch(self):
+        # the transport buffers the writes of a loop pass already
+        pass
+
+    def endBatch(self):
+        pass
+
+    async def drain(self):
+        """waits for the requests sent so far to be handed to the socket"""
+        if self.conn is not None:
+            await self.conn.drain()
+
+    def checkHelperWrapper(self):
+        if not isinstance(self.wrapper, AsyncEWrapper):
+            raise TypeError("the *Async request helpers need an AsyncEWrapper")
+
+    async def reqCurrentTimeAsync(self) -> int:
+        self.checkHelperWrapper()
+        fut, started = self.wrapper.pending.startOrJoin(CURRENT_TIME_KEY, asyncio.get_running_loop().create_future())
+        if started:
+            # a cancelled request must not be joined by the next callers
+            fut.add_done_callback(lambda fut: self.wrapper.pending.discard(CURRENT_TIME_KEY, fut))
+            self.reqCurrentTime()
+        return await fut
+
+    async def reqContractDetailsAsync(self, contract: Contract) -> list:
+        """the ContractDetails of all the contracts matching contract"""
+        self.checkHelperWrapper()
+        reqId = self.nextReqId()
+        fut = self.wrapper.startRequest(reqId)
+        try:
+            self.reqContractDetails(reqId, contract)
+            return await fut
+        finally:
+            self.wrapper.endRequest(reqId)
+
+    async def reqHistoricalDataAsync(self, contract: Contract, endDateTime: str, durationStr: str,
+                                     barSizeSetting: str, whatToShow: str, useRTH: int = 1,
+                                     formatDate: int = 1) -> list:
+        """the BarData of a historical data request, cancels the request on
+        TWS when the awaiting task is cancelled (e.g. by asyncio.wait_for)"""
+        self.checkHelperWrapper()
+        reqId = self.nextReqId()
+        fut = self.wrapper.startRequest(reqId)
+        try:
+            self.reqHistoricalData(reqId, contract, endDateTime, durationStr, barSizeSetting,
+                                   whatToShow, useRTH, formatDate, False, [])
+            return await fut
+        except asyncio.CancelledError:
+            if self.isConnected():
+                self.cancelHistoricalData(reqId)
+            raise
+        finally:
+            self.wrapper.endRequest(reqId)
+
+    async def reqHeadTimeStampAsync(self, contract: Contract, whatToShow: str, useRTH: int = 1,
+                                    formatDate: int = 1) -> str:
+        """the earliest date data is available for"""
+        self.checkHelperWrapper()
+        reqId = self.nextReqId()
+        fut = self.wrapper.startRequest(reqId)
+        try:
+            self.reqHeadTimeStamp(reqId, contract, whatToShow, useRTH, formatDate)
+            return await fut
+        except asyncio.CancelledError:
+            if self.isConnected():
+                self.cancelHeadTimeStamp(reqId)
+            raise
+        finally:
+            self.wrapper.endRequest(reqId)
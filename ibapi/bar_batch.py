@@ -0,0 +1,314 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Columnar historical bars.
+
+The bars of one HISTORICAL_DATA message are decoded in a single pass into
+NumPy arrays and handed over with one EWrapper.historicalDataBatch() call,
+instead of one BarData and one EWrapper.historicalData() call per bar.
+The Decoder only does this for wrappers that override historicalDataBatch,
+and NumPy is only needed in that case.
+"""
+
+import datetime
+import logging
+from decimal import Decimal
+from itertools import islice
+from zoneinfo import ZoneInfo
+
+from ibapi.codec import UNSET_DECIMAL_BYTES, decode_decimal
+from ibapi.common import BarData
+from ibapi.const import UNSET_DECIMAL
+from ibapi.object_implem import Object
+from ibapi.utils import BadMessage
+
+# NumPy is imported by loadNumPy() once a wrapper asks for batches, so that
+# importing ibapi does not pay for it
+np = None
+
+logger = logging.getLogger(__name__)
+
+# position of each column in the bar fields of a HISTORICAL_DATA message
+(BAR_DATE, BAR_OPEN, BAR_HIGH, BAR_LOW, BAR_CLOSE, BAR_VOLUME, BAR_WAP) = range(7)
+
+
+class BarDataBatch(Object):
+    """The bars of one historical data message, one array per column.
+
+    date     - list of the bar dates exactly as sent by TWS
+    time     - the bar start as int64 epoch seconds
+    open, high, low, close, volume, wap - float64, volume and wap are NaN
+               when TWS did not send them
+    barCount - int64
+    volumeText, wapText - the volume and wap fields as sent, so that bars()
+               gives the Decimal the row-wise decoder does, or None
+    """
+
+    def __init__(self, date, time, open_, high, low, close, volume, wap, barCount,
+                 volumeText=None, wapText=None):
+        self.date = date
+        self.time = time
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.wap = wap
+        self.barCount = barCount
+        self.volumeText = volumeText
+        self.wapText = wapText
+
+    def __len__(self):
+        return len(self.time)
+
+    def bars(self):
+        """yields the batch as BarData, for code written against historicalData()"""
+        for i in range(len(self)):
+            bar = BarData()
+            bar.date = self.date[i]
+            bar.open = float(self.open[i])
+            bar.high = float(self.high[i])
+            bar.low = float(self.low[i])
+            bar.close = float(self.close[i])
+            bar.volume = _barDecimal(self.volumeText, self.volume, i)
+            bar.wap = _barDecimal(self.wapText, self.wap, i)
+            bar.barCount = int(self.barCount[i])
+            yield bar
+
+    def __str__(self):
+        if len(self) == 0:
+            return "BarDataBatch: 0 bars"
+        return f"BarDataBatch: {len(self)} bars, {self.date[0]} - {self.date[-1]}"
+
+
+def _barDecimal(texts, values, i) -> Decimal:
+    """the Decimal of bar i, from its field as sent when there is one"""
+    if texts is not None:
+        text = texts[i]
+        if isinstance(text, bytes):
+            return decode_decimal(iter((text,)))
+        return Decimal(text) if text else UNSET_DECIMAL
+    value = float(values[i])
+    if np.isnan(value):
+        return UNSET_DECIMAL
+    # 100.0 as Decimal('100'), as TWS sends it
+    return Decimal(int(value)) if value.is_integer() else Decimal(repr(value))
+
+
+def loadNumPy() -> bool:
+    """imports NumPy on first use, returns False when it is not installed"""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+    return True
+
+
+_zones = {}
+
+
+def barDateToEpoch(date: str) -> int:
+    """converts a bar date as sent by TWS to epoch seconds
+
+    Handles formatDate=2 epoch seconds, yyyymmdd for daily and larger bars
+    (taken as midnight UTC) and 'yyyymmdd hh:mm:ss [tz]', with the time
+    zones cached. A date without a zone is taken as UTC."""
+    if date.isdigit() and len(date) != 8:
+        return int(date)
+
+    if len(date) == 8:
+        dt = datetime.datetime.strptime(date, "%Y%m%d")
+        return int(dt.replace(tzinfo=datetime.timezone.utc).timestamp())
+
+    parts = date.split()
+    dt = datetime.datetime.strptime(parts[0] + " " + parts[1], "%Y%m%d %H:%M:%S")
+    if len(parts) > 2:
+        tz = _zones.get(parts[2])
+        if tz is None:
+            tz = _zones[parts[2]] = ZoneInfo(parts[2])
+    else:
+        tz = datetime.timezone.utc
+    return int(dt.replace(tzinfo=tz).timestamp())
+
+
+# seconds of the wall clock buckets whose offset from UTC is looked up once
+# per zone, time zones change their offset on the hour or half hour
+ZONE_BUCKET = 1800
+
+_zoneOffsets = {}
+
+
+def _zoneOffset(zone: str, bucket: int) -> int:
+    """the UTC offset in seconds of zone for the wall clock bucket, cached"""
+    key = (zone, bucket)
+    offset = _zoneOffsets.get(key)
+    if offset is None:
+        tz = _zones.get(zone)
+        if tz is None:
+            tz = _zones[zone] = ZoneInfo(zone)
+        wallClock = datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=bucket * ZONE_BUCKET)
+        offset = _zoneOffsets[key] = int(wallClock.replace(tzinfo=tz).utcoffset().total_seconds())
+    return offset
+
+
+def _digits(codes, positions):
+    """the number written at positions of each row of the character codes"""
+    value = np.zeros(len(codes), dtype=np.int64)
+    for i in positions:
+        value = value * 10 + codes[:, i] - 48
+    return value
+
+
+def barDatesToEpochs(dates) -> "np.ndarray":
+    """converts the bar dates of a batch, as sent by TWS, to int64 epoch
+    seconds in one pass over arrays, with the same rules as barDateToEpoch
+
+    formatDate=2 epoch seconds, yyyymmdd and 'yyyymmdd hh:mm:ss [tz]' are
+    parsed from the character codes; the UTC offsets are looked up once per
+    zone and half hour of wall clock time. Dates in any other layout go
+    through barDateToEpoch one at a time."""
+    if not loadNumPy():
+        raise ImportError("barDatesToEpochs needs NumPy")
+    n = len(dates)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    if dates[0].isdigit() and len(dates[0]) != 8:
+        try:
+            epochs = np.fromiter(map(int, dates), dtype=np.int64, count=n)
+        except ValueError:
+            pass
+        else:
+            # epoch seconds have 9 digits or more, unlike yyyymmdd
+            if (epochs >= 100000000).all():
+                return epochs
+
+    text = np.asarray(dates, dtype=str)
+    width = text.dtype.itemsize // 4
+    if width < 18:
+        text = text.astype("<U18")
+        width = 18
+    codes = text.view(np.uint32).reshape(n, width).astype(np.int64)
+    length = np.char.str_len(text)
+    isDigit = (codes >= 48) & (codes <= 57)
+
+    dayDigits = [0, 1, 2, 3, 4, 5, 6, 7]
+    timeDigits = [9, 10, 12, 13, 15, 16]
+    isDay = isDigit[:, dayDigits].all(axis=1)
+    isDaily = isDay & (length == 8)
+    isIntraday = (isDay & isDigit[:, timeDigits].all(axis=1) & (codes[:, 8] == 32)
+                  & (codes[:, 11] == 58) & (codes[:, 14] == 58)
+                  & ((length == 17) | ((length > 18) & (codes[:, 17] == 32))))
+
+    # the others are parsed as 19700101, then by barDateToEpoch below
+    days = ((np.where(isDay, _digits(codes, dayDigits[:4]), 1970) - 1970).astype("datetime64[Y]")
+            + (np.where(isDay, _digits(codes, dayDigits[4:6]), 1) - 1).astype("timedelta64[M]")
+            + (np.where(isDay, _digits(codes, dayDigits[6:]), 1) - 1).astype("timedelta64[D]"))
+    epochs = days.astype("datetime64[D]").astype(np.int64) * 86400
+    epochs += np.where(isIntraday, _digits(codes, timeDigits[:2]) * 3600
+                       + _digits(codes, timeDigits[2:4]) * 60 + _digits(codes, timeDigits[4:]), 0)
+
+    zoned = np.flatnonzero(isIntraday & (length > 18))
+    if len(zoned):
+        zoneText = np.ascontiguousarray(codes[zoned, 18:].astype(np.uint32)).view(f"<U{width - 18}").ravel()
+        zones, zoneOf = np.unique(zoneText, return_inverse=True)
+        buckets = epochs[zoned] // ZONE_BUCKET
+        for z, zone in enumerate(zones.tolist()):
+            rows = np.flatnonzero(zoneOf == z)
+            zoneBuckets, bucketOf = np.unique(buckets[rows], return_inverse=True)
+            offsets = np.array([_zoneOffset(zone, b) for b in zoneBuckets.tolist()], dtype=np.int64)
+            epochs[zoned[rows]] -= offsets[bucketOf]
+
+    for i in np.flatnonzero(~(isDaily | isIntraday)).tolist():
+        epochs[i] = barDateToEpoch(dates[i])
+    return epochs
+
+
+def barDatesToDatetime64(dates) -> "np.ndarray":
+    """barDatesToEpochs as a datetime64[s] array, times in UTC"""
+    return barDatesToEpochs(dates).astype("datetime64[s]")
+
+
+def _floatColumn(raw):
+    try:
+        return np.array(raw).astype(np.float64)
+    except ValueError:
+        # empty fields, rare enough to take the slow path
+        return np.array([float(s) if s else 0.0 for s in raw], dtype=np.float64)
+
+
+def _decimalColumn(raw):
+    return np.array(
+        [float(s) if s and s not in UNSET_DECIMAL_BYTES else np.nan for s in raw],
+        dtype=np.float64,
+    )
+
+
+def decodeBarDataBatch(fields, itemCount: int, nBarFields: int) -> BarDataBatch:
+    """decodes itemCount bars of nBarFields fields each from the fields iterator
+
+    The barCount is the last field of a bar, older servers send an extra
+    hasGaps field before it."""
+    nFields = itemCount * nBarFields
+    raw = tuple(islice(fields, nFields))
+    if len(raw) != nFields:
+        raise BadMessage("no more fields")
+
+    date = [s.decode("UTF-8", errors="backslashreplace") for s in raw[BAR_DATE::nBarFields]]
+    barCounts = raw[nBarFields - 1::nBarFields]
+    try:
+        barCount = np.array(barCounts).astype(np.int64)
+    except ValueError:
+        barCount = np.array([int(s or 0) for s in barCounts], dtype=np.int64)
+
+    volumeText = raw[BAR_VOLUME::nBarFields]
+    wapText = raw[BAR_WAP::nBarFields]
+    return BarDataBatch(
+        date,
+        barDatesToEpochs(date),
+        _floatColumn(raw[BAR_OPEN::nBarFields]),
+        _floatColumn(raw[BAR_HIGH::nBarFields]),
+        _floatColumn(raw[BAR_LOW::nBarFields]),
+        _floatColumn(raw[BAR_CLOSE::nBarFields]),
+        _decimalColumn(volumeText),
+        _decimalColumn(wapText),
+        barCount,
+        volumeText,
+        wapText,
+    )
+
+
+def decodeBarDataBatchProtoBuf(historicalDataBars) -> BarDataBatch:
+    """decodes the historicalDataBars repeated field of a HistoricalData message"""
+    n = len(historicalDataBars)
+    date = [""] * n
+    open_ = np.zeros(n, dtype=np.float64)
+    high = np.zeros(n, dtype=np.float64)
+    low = np.zeros(n, dtype=np.float64)
+    close = np.zeros(n, dtype=np.float64)
+    volume = np.full(n, np.nan, dtype=np.float64)
+    wap = np.full(n, np.nan, dtype=np.float64)
+    barCount = np.zeros(n, dtype=np.int64)
+    volumeText = [""] * n
+    wapText = [""] * n
+
+    for i, barProto in enumerate(historicalDataBars):
+        date[i] = barProto.date
+        open_[i] = barProto.open
+        high[i] = barProto.high
+        low[i] = barProto.low
+        close[i] = barProto.close
+        if barProto.HasField("volume") and barProto.volume:
+            volumeText[i] = barProto.volume
+            volume[i] = float(barProto.volume)
+        if barProto.HasField("WAP") and barProto.WAP:
+            wapText[i] = barProto.WAP
+            wap[i] = float(barProto.WAP)
+        barCount[i] = barProto.barCount
+
+    return BarDataBatch(date, barDatesToEpochs(date), open_, high, low, close, volume, wap, barCount,
+                        volumeText, wapText)
@@ -0,0 +1,89 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Captures of the wire traffic of a connection.
+
+EClient.setCapture(path) writes every message sent and received to a
+capture file, which ibapi.fake_gateway.FakeGateway plays back to a client
+later, without TWS. A capture file is MAGIC followed by records of
+
+    RECORD header: seconds since the capture started (double), direction
+                   (OUT or IN), number of bytes (unsigned int), big endian
+    the bytes:     for IN one message payload, without its length prefix,
+                   for OUT the bytes written to the socket, the handshake
+                   or one length prefixed message
+
+A path ending in .gz is gzip compressed.
+"""
+
+import gzip
+import struct
+import threading
+import time
+
+from ibapi import comm
+
+MAGIC = b"IBCAP\x01"
+RECORD = struct.Struct("!dBI")
+OUT = 0
+IN = 1
+
+
+def openCapture(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class CaptureWriter:
+    """Appends the traffic of a connection to a capture file. Thread safe,
+    received() may be handed the bytes in any pieces."""
+
+    def __init__(self, path: str):
+        self.file = openCapture(path, "wb")
+        self.file.write(MAGIC)
+        self.lock = threading.Lock()
+        self.start = time.monotonic()
+        self.msgBuf = comm.MsgBuffer()
+        self.nRecords = 0
+
+    def write(self, direction: int, data: bytes):
+        """called with the lock held"""
+        self.file.write(RECORD.pack(time.monotonic() - self.start, direction, len(data)))
+        self.file.write(data)
+        self.nRecords += 1
+
+    def sent(self, data: bytes):
+        with self.lock:
+            if self.file is not None:
+                self.write(OUT, bytes(data))
+
+    def received(self, data: bytes):
+        with self.lock:
+            if self.file is not None:
+                self.msgBuf.feed(data)
+                for msg in self.msgBuf.popMsgs():
+                    self.write(IN, msg)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def readCapture(path: str):
+    """yields the (time, direction, bytes) records of a capture file"""
+    with openCapture(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a capture file")
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            t, direction, size = RECORD.unpack(header)
+            data = f.read(size)
+            if len(data) < size:
+                raise ValueError(f"{path} ends in the middle of a record")
+            yield t, direction, data
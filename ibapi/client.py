@@ -10,16 +10,19 @@ It takes care of almost everything:
 The user just needs to override EWrapper methods to receive the answers.
 """
 
+import contextlib
 import logging
 import queue
 import socket
 import sys
+import time
+from typing import TYPE_CHECKING
 
 from ibapi import decoder, reader, comm
 from ibapi.comm import make_field, make_field_handle_empty
 from ibapi.common import *  # @UnusedWildImport
 from ibapi.connection import Connection
-from ibapi.const import NO_VALID_ID, MAX_MSG_LEN, UNSET_DOUBLE
+from ibapi.const import NO_VALID_ID, MAX_MSG_LEN, UNSET_DOUBLE, DEFAULT_RECV_SIZE, DEFAULT_MSG_BATCH
 from ibapi.contract import Contract
 from ibapi.errors import (
     NOT_CONNECTED,
@@ -165,6 +168,7 @@ from ibapi.utils import (
 from ibapi.errors import INVALID_SYMBOL
 from ibapi.utils import isAsciiPrintable
 from ibapi.common import PROTOBUF_MSG_ID
+from ibapi.wirelog import debugOn, infoOn, WireTrace
 from ibapi.client_utils import createExecutionRequestProto, createPlaceOrderRequestProto, createCancelOrderRequestProto, createGlobalCancelRequestProto
 from ibapi.client_utils import createAllOpenOrdersRequestProto, createAutoOpenOrdersRequestProto, createOpenOrdersRequestProto, createCompletedOrdersRequestProto
 from ibapi.client_utils import createContractDataRequestProto, createMarketDataTypeRequestProto
@@ -188,88 +192,91 @@ from ibapi.client_utils import createSetServerLogLevelRequestProto, createVerify
 from ibapi.client_utils import createSubscribeToGroupEventsRequestProto, createUpdateDisplayGroupRequestProto, createUnsubscribeFromGroupEventsRequestProto, createMarketDepthExchangesRequestProto
 from ibapi.client_utils import createCancelContractDataProto, createCancelHistoricalTicksProto
 
-from ibapi.protobuf.ComboLeg_pb2 import ComboLeg as ComboLegProto
-from ibapi.protobuf.ExecutionFilter_pb2 import ExecutionFilter as ExecutionFilterProto
-from ibapi.protobuf.ExecutionRequest_pb2 import ExecutionRequest as ExecutionRequestProto
-from ibapi.protobuf.PlaceOrderRequest_pb2 import PlaceOrderRequest as PlaceOrderRequestProto
-from ibapi.protobuf.CancelOrderRequest_pb2 import CancelOrderRequest as CancelOrderRequestProto
-from ibapi.protobuf.GlobalCancelRequest_pb2 import GlobalCancelRequest as GlobalCancelRequestProto
-from ibapi.protobuf.AllOpenOrdersRequest_pb2 import AllOpenOrdersRequest as AllOpenOrdersRequestProto
-from ibapi.protobuf.AutoOpenOrdersRequest_pb2 import AutoOpenOrdersRequest as AutoOpenOrdersRequestProto
-from ibapi.protobuf.OpenOrdersRequest_pb2 import OpenOrdersRequest as OpenOrdersRequestProto
-from ibapi.protobuf.CompletedOrdersRequest_pb2 import CompletedOrdersRequest as CompletedOrdersRequestProto
-from ibapi.protobuf.ContractDataRequest_pb2 import ContractDataRequest as ContractDataRequestProto
-from ibapi.protobuf.MarketDataRequest_pb2 import MarketDataRequest as MarketDataRequestProto
-from ibapi.protobuf.CancelMarketData_pb2 import CancelMarketData as CancelMarketDataProto
-from ibapi.protobuf.MarketDepthRequest_pb2 import MarketDepthRequest as MarketDepthRequestProto
-from ibapi.protobuf.CancelMarketDepth_pb2 import CancelMarketDepth as CancelMarketDepthProto
-from ibapi.protobuf.MarketDataTypeRequest_pb2 import MarketDataTypeRequest as MarketDataTypeRequestProto
-from ibapi.protobuf.AccountDataRequest_pb2 import AccountDataRequest as AccountDataRequestProto
-from ibapi.protobuf.ManagedAccountsRequest_pb2 import ManagedAccountsRequest as ManagedAccountsRequestProto
-from ibapi.protobuf.PositionsRequest_pb2 import PositionsRequest as PositionsRequestProto
-from ibapi.protobuf.AccountSummaryRequest_pb2 import AccountSummaryRequest as AccountSummaryRequestProto
-from ibapi.protobuf.CancelAccountSummary_pb2 import CancelAccountSummary as CancelAccountSummaryProto
-from ibapi.protobuf.CancelPositions_pb2 import CancelPositions as CancelPositionsProto
-from ibapi.protobuf.PositionsMultiRequest_pb2 import PositionsMultiRequest as PositionsMultiRequestProto
-from ibapi.protobuf.CancelPositionsMulti_pb2 import CancelPositionsMulti as CancelPositionsMultiProto
-from ibapi.protobuf.AccountUpdatesMultiRequest_pb2 import AccountUpdatesMultiRequest as AccountUpdatesMultiRequestProto
-from ibapi.protobuf.CancelAccountUpdatesMulti_pb2 import CancelAccountUpdatesMulti as CancelAccountUpdatesMultiProto
-from ibapi.protobuf.HistoricalDataRequest_pb2 import HistoricalDataRequest as HistoricalDataRequestProto
-from ibapi.protobuf.RealTimeBarsRequest_pb2 import RealTimeBarsRequest as RealTimeBarsRequestProto
-from ibapi.protobuf.HeadTimestampRequest_pb2 import HeadTimestampRequest as HeadTimestampRequestProto
-from ibapi.protobuf.HistogramDataRequest_pb2 import HistogramDataRequest as HistogramDataRequestProto
-from ibapi.protobuf.HistoricalTicksRequest_pb2 import HistoricalTicksRequest as HistoricalTicksRequestProto
-from ibapi.protobuf.TickByTickRequest_pb2 import TickByTickRequest as TickByTickRequestProto
-from ibapi.protobuf.CancelHistoricalData_pb2 import CancelHistoricalData as CancelHistoricalDataProto
-from ibapi.protobuf.CancelRealTimeBars_pb2 import CancelRealTimeBars as CancelRealTimeBarsProto
-from ibapi.protobuf.CancelHeadTimestamp_pb2 import CancelHeadTimestamp as CancelHeadTimestampProto
-from ibapi.protobuf.CancelHistogramData_pb2 import CancelHistogramData as CancelHistogramDataProto
-from ibapi.protobuf.CancelTickByTick_pb2 import CancelTickByTick as CancelTickByTickProto
-from ibapi.protobuf.NewsBulletinsRequest_pb2 import NewsBulletinsRequest as NewsBulletinsRequestProto
-from ibapi.protobuf.CancelNewsBulletins_pb2 import CancelNewsBulletins as CancelNewsBulletinsProto
-from ibapi.protobuf.NewsArticleRequest_pb2 import NewsArticleRequest as NewsArticleRequestProto
-from ibapi.protobuf.NewsProvidersRequest_pb2 import NewsProvidersRequest as NewsProvidersRequestProto
-from ibapi.protobuf.HistoricalNewsRequest_pb2 import HistoricalNewsRequest as HistoricalNewsRequestProto
-from ibapi.protobuf.WshMetaDataRequest_pb2 import WshMetaDataRequest as WshMetaDataRequestProto
-from ibapi.protobuf.CancelWshMetaData_pb2 import CancelWshMetaData as CancelWshMetaDataProto
-from ibapi.protobuf.WshEventDataRequest_pb2 import WshEventDataRequest as WshEventDataRequestProto
-from ibapi.protobuf.CancelWshEventData_pb2 import CancelWshEventData as CancelWshEventDataProto
-from ibapi.protobuf.ScannerParametersRequest_pb2 import ScannerParametersRequest as ScannerParametersRequestProto
-from ibapi.protobuf.ScannerSubscriptionRequest_pb2 import ScannerSubscriptionRequest as ScannerSubscriptionRequestProto
-from ibapi.protobuf.ScannerSubscription_pb2 import ScannerSubscription as ScannerSubscriptionProto
-from ibapi.protobuf.FundamentalsDataRequest_pb2 import FundamentalsDataRequest as FundamentalsDataRequestProto
-from ibapi.protobuf.PnLRequest_pb2 import PnLRequest as PnLRequestProto
-from ibapi.protobuf.PnLSingleRequest_pb2 import PnLSingleRequest as PnLSingleRequestProto
-from ibapi.protobuf.CancelScannerSubscription_pb2 import CancelScannerSubscription as CancelScannerSubscriptionProto
-from ibapi.protobuf.CancelFundamentalsData_pb2 import CancelFundamentalsData as CancelFundamentalsDataProto
-from ibapi.protobuf.CancelPnL_pb2 import CancelPnL as CancelPnLProto
-from ibapi.protobuf.CancelPnLSingle_pb2 import CancelPnLSingle as CancelPnLSingleProto
-from ibapi.protobuf.FARequest_pb2 import FARequest as FARequestProto
-from ibapi.protobuf.FAReplace_pb2 import FAReplace as FAReplaceProto
-from ibapi.protobuf.ExerciseOptionsRequest_pb2 import ExerciseOptionsRequest as ExerciseOptionsRequestProto
-from ibapi.protobuf.CalculateImpliedVolatilityRequest_pb2 import CalculateImpliedVolatilityRequest as CalculateImpliedVolatilityRequestProto
-from ibapi.protobuf.CancelCalculateImpliedVolatility_pb2 import CancelCalculateImpliedVolatility as CancelCalculateImpliedVolatilityProto
-from ibapi.protobuf.CalculateOptionPriceRequest_pb2 import CalculateOptionPriceRequest as CalculateOptionPriceRequestProto
-from ibapi.protobuf.CancelCalculateOptionPrice_pb2 import CancelCalculateOptionPrice as CancelCalculateOptionPriceProto
-from ibapi.protobuf.SecDefOptParamsRequest_pb2 import SecDefOptParamsRequest as SecDefOptParamsRequestProto
-from ibapi.protobuf.SoftDollarTiersRequest_pb2 import SoftDollarTiersRequest as SoftDollarTiersRequestProto
-from ibapi.protobuf.FamilyCodesRequest_pb2 import FamilyCodesRequest as FamilyCodesRequestProto
-from ibapi.protobuf.MatchingSymbolsRequest_pb2 import MatchingSymbolsRequest as MatchingSymbolsRequestProto
-from ibapi.protobuf.SmartComponentsRequest_pb2 import SmartComponentsRequest as SmartComponentsRequestProto
-from ibapi.protobuf.MarketRuleRequest_pb2 import MarketRuleRequest as MarketRuleRequestProto
-from ibapi.protobuf.UserInfoRequest_pb2 import UserInfoRequest as UserInfoRequestProto
-from ibapi.protobuf.IdsRequest_pb2 import IdsRequest as IdsRequestProto
-from ibapi.protobuf.CurrentTimeRequest_pb2 import CurrentTimeRequest as CurrentTimeRequestProto
-from ibapi.protobuf.CurrentTimeInMillisRequest_pb2 import CurrentTimeInMillisRequest as CurrentTimeInMillisRequestProto
-from ibapi.protobuf.StartApiRequest_pb2 import StartApiRequest as StartApiRequestProto
-from ibapi.protobuf.SetServerLogLevelRequest_pb2 import SetServerLogLevelRequest as SetServerLogLevelRequestProto
-from ibapi.protobuf.VerifyRequest_pb2 import VerifyRequest as VerifyRequestProto
-from ibapi.protobuf.VerifyMessageRequest_pb2 import VerifyMessageRequest as VerifyMessageRequestProto
-from ibapi.protobuf.QueryDisplayGroupsRequest_pb2 import QueryDisplayGroupsRequest as QueryDisplayGroupsRequestProto
-from ibapi.protobuf.SubscribeToGroupEventsRequest_pb2 import SubscribeToGroupEventsRequest as SubscribeToGroupEventsRequestProto
-from ibapi.protobuf.UpdateDisplayGroupRequest_pb2 import UpdateDisplayGroupRequest as UpdateDisplayGroupRequestProto
-from ibapi.protobuf.UnsubscribeFromGroupEventsRequest_pb2 import UnsubscribeFromGroupEventsRequest as UnsubscribeFromGroupEventsRequestProto
-from ibapi.protobuf.MarketDepthExchangesRequest_pb2 import MarketDepthExchangesRequest as MarketDepthExchangesRequestProto
+
+if TYPE_CHECKING:
+    from ibapi.protobuf.ComboLeg_pb2 import ComboLeg as ComboLegProto
+    from ibapi.protobuf.ExecutionFilter_pb2 import ExecutionFilter as ExecutionFilterProto
+    from ibapi.protobuf.ExecutionRequest_pb2 import ExecutionRequest as ExecutionRequestProto
+    from ibapi.protobuf.PlaceOrderRequest_pb2 import PlaceOrderRequest as PlaceOrderRequestProto
+    from ibapi.protobuf.CancelOrderRequest_pb2 import CancelOrderRequest as CancelOrderRequestProto
+    from ibapi.protobuf.GlobalCancelRequest_pb2 import GlobalCancelRequest as GlobalCancelRequestProto
+    from ibapi.protobuf.AllOpenOrdersRequest_pb2 import AllOpenOrdersRequest as AllOpenOrdersRequestProto
+    from ibapi.protobuf.AutoOpenOrdersRequest_pb2 import AutoOpenOrdersRequest as AutoOpenOrdersRequestProto
+    from ibapi.protobuf.OpenOrdersRequest_pb2 import OpenOrdersRequest as OpenOrdersRequestProto
+    from ibapi.protobuf.CompletedOrdersRequest_pb2 import CompletedOrdersRequest as CompletedOrdersRequestProto
+    from ibapi.protobuf.ContractDataRequest_pb2 import ContractDataRequest as ContractDataRequestProto
+    from ibapi.protobuf.MarketDataRequest_pb2 import MarketDataRequest as MarketDataRequestProto
+    from ibapi.protobuf.CancelMarketData_pb2 import CancelMarketData as CancelMarketDataProto
+    from ibapi.protobuf.MarketDepthRequest_pb2 import MarketDepthRequest as MarketDepthRequestProto
+    from ibapi.protobuf.CancelMarketDepth_pb2 import CancelMarketDepth as CancelMarketDepthProto
+    from ibapi.protobuf.MarketDataTypeRequest_pb2 import MarketDataTypeRequest as MarketDataTypeRequestProto
+    from ibapi.protobuf.AccountDataRequest_pb2 import AccountDataRequest as AccountDataRequestProto
+    from ibapi.protobuf.ManagedAccountsRequest_pb2 import ManagedAccountsRequest as ManagedAccountsRequestProto
+    from ibapi.protobuf.PositionsRequest_pb2 import PositionsRequest as PositionsRequestProto
+    from ibapi.protobuf.AccountSummaryRequest_pb2 import AccountSummaryRequest as AccountSummaryRequestProto
+    from ibapi.protobuf.CancelAccountSummary_pb2 import CancelAccountSummary as CancelAccountSummaryProto
+    from ibapi.protobuf.CancelPositions_pb2 import CancelPositions as CancelPositionsProto
+    from ibapi.protobuf.PositionsMultiRequest_pb2 import PositionsMultiRequest as PositionsMultiRequestProto
+    from ibapi.protobuf.CancelPositionsMulti_pb2 import CancelPositionsMulti as CancelPositionsMultiProto
+    from ibapi.protobuf.AccountUpdatesMultiRequest_pb2 import AccountUpdatesMultiRequest as AccountUpdatesMultiRequestProto
+    from ibapi.protobuf.CancelAccountUpdatesMulti_pb2 import CancelAccountUpdatesMulti as CancelAccountUpdatesMultiProto
+    from ibapi.protobuf.HistoricalDataRequest_pb2 import HistoricalDataRequest as HistoricalDataRequestProto
+    from ibapi.protobuf.RealTimeBarsRequest_pb2 import RealTimeBarsRequest as RealTimeBarsRequestProto
+    from ibapi.protobuf.HeadTimestampRequest_pb2 import HeadTimestampRequest as HeadTimestampRequestProto
+    from ibapi.protobuf.HistogramDataRequest_pb2 import HistogramDataRequest as HistogramDataRequestProto
+    from ibapi.protobuf.HistoricalTicksRequest_pb2 import HistoricalTicksRequest as HistoricalTicksRequestProto
+    from ibapi.protobuf.TickByTickRequest_pb2 import TickByTickRequest as TickByTickRequestProto
+    from ibapi.protobuf.CancelHistoricalData_pb2 import CancelHistoricalData as CancelHistoricalDataProto
+    from ibapi.protobuf.CancelRealTimeBars_pb2 import CancelRealTimeBars as CancelRealTimeBarsProto
+    from ibapi.protobuf.CancelHeadTimestamp_pb2 import CancelHeadTimestamp as CancelHeadTimestampProto
+    from ibapi.protobuf.CancelHistogramData_pb2 import CancelHistogramData as CancelHistogramDataProto
+    from ibapi.protobuf.CancelTickByTick_pb2 import CancelTickByTick as CancelTickByTickProto
+    from ibapi.protobuf.NewsBulletinsRequest_pb2 import NewsBulletinsRequest as NewsBulletinsRequestProto
+    from ibapi.protobuf.CancelNewsBulletins_pb2 import CancelNewsBulletins as CancelNewsBulletinsProto
+    from ibapi.protobuf.NewsArticleRequest_pb2 import NewsArticleRequest as NewsArticleRequestProto
+    from ibapi.protobuf.NewsProvidersRequest_pb2 import NewsProvidersRequest as NewsProvidersRequestProto
+    from ibapi.protobuf.HistoricalNewsRequest_pb2 import HistoricalNewsRequest as HistoricalNewsRequestProto
+    from ibapi.protobuf.WshMetaDataRequest_pb2 import WshMetaDataRequest as WshMetaDataRequestProto
+    from ibapi.protobuf.CancelWshMetaData_pb2 import CancelWshMetaData as CancelWshMetaDataProto
+    from ibapi.protobuf.WshEventDataRequest_pb2 import WshEventDataRequest as WshEventDataRequestProto
+    from ibapi.protobuf.CancelWshEventData_pb2 import CancelWshEventData as CancelWshEventDataProto
+    from ibapi.protobuf.ScannerParametersRequest_pb2 import ScannerParametersRequest as ScannerParametersRequestProto
+    from ibapi.protobuf.ScannerSubscriptionRequest_pb2 import ScannerSubscriptionRequest as ScannerSubscriptionRequestProto
+    from ibapi.protobuf.ScannerSubscription_pb2 import ScannerSubscription as ScannerSubscriptionProto
+    from ibapi.protobuf.FundamentalsDataRequest_pb2 import FundamentalsDataRequest as FundamentalsDataRequestProto
+    from ibapi.protobuf.PnLRequest_pb2 import PnLRequest as PnLRequestProto
+    from ibapi.protobuf.PnLSingleRequest_pb2 import PnLSingleRequest as PnLSingleRequestProto
+    from ibapi.protobuf.CancelScannerSubscription_pb2 import CancelScannerSubscription as CancelScannerSubscriptionProto
+    from ibapi.protobuf.CancelFundamentalsData_pb2 import CancelFundamentalsData as CancelFundamentalsDataProto
+    from ibapi.protobuf.CancelPnL_pb2 import CancelPnL as CancelPnLProto
+    from ibapi.protobuf.CancelPnLSingle_pb2 import CancelPnLSingle as CancelPnLSingleProto
+    from ibapi.protobuf.FARequest_pb2 import FARequest as FARequestProto
+    from ibapi.protobuf.FAReplace_pb2 import FAReplace as FAReplaceProto
+    from ibapi.protobuf.ExerciseOptionsRequest_pb2 import ExerciseOptionsRequest as ExerciseOptionsRequestProto
+    from ibapi.protobuf.CalculateImpliedVolatilityRequest_pb2 import CalculateImpliedVolatilityRequest as CalculateImpliedVolatilityRequestProto
+    from ibapi.protobuf.CancelCalculateImpliedVolatility_pb2 import CancelCalculateImpliedVolatility as CancelCalculateImpliedVolatilityProto
+    from ibapi.protobuf.CalculateOptionPriceRequest_pb2 import CalculateOptionPriceRequest as CalculateOptionPriceRequestProto
+    from ibapi.protobuf.CancelCalculateOptionPrice_pb2 import CancelCalculateOptionPrice as CancelCalculateOptionPriceProto
+    from ibapi.protobuf.SecDefOptParamsRequest_pb2 import SecDefOptParamsRequest as SecDefOptParamsRequestProto
+    from ibapi.protobuf.SoftDollarTiersRequest_pb2 import SoftDollarTiersRequest as SoftDollarTiersRequestProto
+    from ibapi.protobuf.FamilyCodesRequest_pb2 import FamilyCodesRequest as FamilyCodesRequestProto
+    from ibapi.protobuf.MatchingSymbolsRequest_pb2 import MatchingSymbolsRequest as MatchingSymbolsRequestProto
+    from ibapi.protobuf.SmartComponentsRequest_pb2 import SmartComponentsRequest as SmartComponentsRequestProto
+    from ibapi.protobuf.MarketRuleRequest_pb2 import MarketRuleRequest as MarketRuleRequestProto
+    from ibapi.protobuf.UserInfoRequest_pb2 import UserInfoRequest as UserInfoRequestProto
+    from ibapi.protobuf.IdsRequest_pb2 import IdsRequest as IdsRequestProto
+    from ibapi.protobuf.CurrentTimeRequest_pb2 import CurrentTimeRequest as CurrentTimeRequestProto
+    from ibapi.protobuf.CurrentTimeInMillisRequest_pb2 import CurrentTimeInMillisRequest as CurrentTimeInMillisRequestProto
+    from ibapi.protobuf.StartApiRequest_pb2 import StartApiRequest as StartApiRequestProto
+    from ibapi.protobuf.SetServerLogLevelRequest_pb2 import SetServerLogLevelRequest as SetServerLogLevelRequestProto
+    from ibapi.protobuf.VerifyRequest_pb2 import VerifyRequest as VerifyRequestProto
+    from ibapi.protobuf.VerifyMessageRequest_pb2 import VerifyMessageRequest as VerifyMessageRequestProto
+    from ibapi.protobuf.QueryDisplayGroupsRequest_pb2 import QueryDisplayGroupsRequest as QueryDisplayGroupsRequestProto
+    from ibapi.protobuf.SubscribeToGroupEventsRequest_pb2 import SubscribeToGroupEventsRequest as SubscribeToGroupEventsRequestProto
+    from ibapi.protobuf.UpdateDisplayGroupRequest_pb2 import UpdateDisplayGroupRequest as UpdateDisplayGroupRequestProto
+    from ibapi.protobuf.UnsubscribeFromGroupEventsRequest_pb2 import UnsubscribeFromGroupEventsRequest as UnsubscribeFromGroupEventsRequestProto
+    from ibapi.protobuf.MarketDepthExchangesRequest_pb2 import MarketDepthExchangesRequest as MarketDepthExchangesRequestProto
+
 
 # TODO: use pylint
 
@@ -298,6 +305,12 @@ class EClient(object):
         self.decode = None
         self.setConnState(EClient.DISCONNECTED)
         self.connectOptions = None
+        self.recvSize = DEFAULT_RECV_SIZE
+        self.readerBatching = False
+        self.maxMsgBatch = DEFAULT_MSG_BATCH
+        self.wireTrace = None
+        self.metrics = None
+        self.capture = None
         self.reset()
 
     def reset(self):
@@ -320,17 +333,23 @@ class EClient(object):
     def setConnState(self, connState):
         _connState = self.connState
         self.connState = connState
-        logger.debug(f"{id(self)} connState: {_connState} -> {self.connState}")
+        logger.debug("%d connState: %s -> %s", id(self), _connState, self.connState)
 
     def sendMsgProtoBuf(self, msgId: int, msg: bytes):
         full_msg = comm.make_msg_proto(msgId, msg)
-        logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
+        if self.wireTrace is not None:
+            self.wireTrace.sent(msgId, msg, True)
+        if infoOn(logger):
+            logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
         self.conn.sendMsg(full_msg)
 
     def sendMsg(self, msgId:int, msg: str):
         useRawIntMsgId = self.serverVersion() >= MIN_SERVER_VER_PROTOBUF
         full_msg = comm.make_msg(msgId, useRawIntMsgId, msg)
-        logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
+        if self.wireTrace is not None:
+            self.wireTrace.sent(msgId, msg)
+        if infoOn(logger):
+            logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
         self.conn.sendMsg(full_msg)
 
     def logRequest(self, fnName, fnParams):
@@ -401,7 +420,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_STARTAPI.code(), FAIL_SEND_STARTAPI.msg() + str(ex))
             return
 
-    def startApiProtoBuf(self, startApiRequestProto: StartApiRequestProto):
+    def startApiProtoBuf(self, startApiRequestProto: "StartApiRequestProto"):
         if startApiRequestProto is None:
             return
 
@@ -458,23 +477,15 @@ class EClient(object):
                 "Connecting to %s:%d w/ id:%d", self.host, self.port, self.clientId
             )
 
-            self.conn = Connection(self.host, self.port)
+            self.conn = Connection(self.host, self.port, self.recvSize)
+            self.conn.capture = self.capture
 
             self.conn.connect()
             self.setConnState(EClient.CONNECTING)
 
-            # TODO: support async mode
-
-            v100prefix = "API\0"
-            v100version = "v%d..%d" % (MIN_CLIENT_VER, MAX_CLIENT_VER)
+            # see ibapi.async_client for async mode
 
-            if self.connectOptions:
-                v100version = v100version + " " + self.connectOptions
-
-            # v100version = "v%d..%d" % (MIN_CLIENT_VER, 101)
-            msg = comm.make_initial_msg(v100version)
-            logger.debug("msg %s", msg)
-            msg2 = str.encode(v100prefix, "ascii") + msg
+            msg2 = self.makeHandshakeMsg()
             logger.debug("REQUEST %s", msg2)
             self.conn.sendMsg(msg2)
 
@@ -506,10 +517,11 @@ class EClient(object):
             self.connTime = conn_time
             self.serverVersion_ = server_version
             self.decoder.serverVersion = self.serverVersion()
+            self.instrumentDecoder()
 
             self.setConnState(EClient.CONNECTED)
 
-            self.reader = reader.EReader(self.conn, self.msg_queue)
+            self.reader = reader.EReader(self.conn, self.msg_queue, self.readerBatching, self.metrics)
             self.reader.start()  # start thread
             logger.info("sent startApi")
             self.startApi()
@@ -520,6 +532,20 @@ class EClient(object):
             logger.info("could not connect")
             self.disconnect()
 
+    def makeHandshakeMsg(self) -> bytes:
+        """the first message sent after the socket connects, with the range
+        of client versions supported"""
+        v100prefix = "API\0"
+        v100version = "v%d..%d" % (MIN_CLIENT_VER, MAX_CLIENT_VER)
+
+        if self.connectOptions:
+            v100version = v100version + " " + self.connectOptions
+
+        # v100version = "v%d..%d" % (MIN_CLIENT_VER, 101)
+        msg = comm.make_initial_msg(v100version)
+        logger.debug("msg %s", msg)
+        return str.encode(v100prefix, "ascii") + msg
+
     def disconnect(self):
         """Call this function to terminate the connections with TWS.
         Calling this function does not cancel orders that have already been
@@ -536,9 +562,7 @@ class EClient(object):
         """Call this function to check if there is a connection with TWS"""
 
         connConnected = self.conn and self.conn.isConnected()
-        logger.debug(
-            f"{id(self)} isConn: {self.connState}, connConnected: {str(connConnected)}"
-        )
+        logger.debug("%d isConn: %s, connConnected: %s", id(self), self.connState, connConnected)
         return EClient.CONNECTED == self.connState and connConnected
 
     def keyboardInterrupt(self):
@@ -556,6 +580,83 @@ class EClient(object):
     def setOptionalCapabilities(self, optCapab):
         self.optCapab = optCapab
 
+    def setRecvSize(self, recvSize: int):
+        """Sets how many bytes the reader asks of the socket per receive.
+        Larger values help with big bursts such as long historical data
+        requests. Takes effect on the next connect()."""
+        self.recvSize = recvSize
+
+    def setReaderBatching(self, enabled: bool):
+        """When enabled the reader thread queues all the messages of one
+        receive as a single list instead of one queue item per message,
+        which saves a queue handoff per message on tick heavy sessions.
+        Only run() understands these lists, so leave it off when consuming
+        msg_queue directly. Takes effect on the next connect()."""
+        self.readerBatching = enabled
+
+    def setWireTrace(self, enabled: bool, sampleEvery: int = 1):
+        """Logs the messages sent and received as JSON lines on the
+        "ibapi.wire" logger at DEBUG level, every sampleEvery-th message in
+        each direction. See ibapi.wirelog.WireTrace."""
+        self.wireTrace = WireTrace(sampleEvery) if enabled else None
+
+    def setCapture(self, path):
+        """Writes the messages sent and received to the capture file path,
+        see ibapi.capture, until called with None. FakeGateway plays such
+        a file back. Starts with the handshake of the next connect()."""
+        if self.capture is not None:
+            self.capture.close()
+            self.capture = None
+        if path is not None:
+            # not imported by default, like the protobuf modules
+            from ibapi.capture import CaptureWriter
+            self.capture = CaptureWriter(path)
+        if self.conn is not None:
+            self.conn.capture = self.capture
+
+    def setMetrics(self, enabled: bool):
+        """Records the message counts and the reader, queue, decode and
+        callback times in self.metrics, an ibapi.metrics.MsgLoopMetrics.
+        The reader and queue figures start on the next connect()."""
+        if not enabled:
+            self.metrics = None
+            if self.decoder is not None:
+                self.decoder.wrapper = self.wrapper
+                self.decoder.compileWrapperCalls()
+            return
+        if self.metrics is None:
+            # not imported by default, like the protobuf modules
+            from ibapi.metrics import MsgLoopMetrics
+            self.metrics = MsgLoopMetrics()
+        self.instrumentDecoder()
+
+    def instrumentDecoder(self):
+        """times the wrapper callbacks made by the decoder"""
+        if self.metrics is not None and self.decoder is not None:
+            self.decoder.wrapper = self.metrics.timedWrapper(self.wrapper)
+            self.decoder.compileWrapperCalls()
+
+    @contextlib.contextmanager
+    def sendBatch(self):
+        """Holds the requests sent in the with block and writes them to the
+        socket together at its end, e.g. to subscribe to many market data
+        lines with a few system calls instead of one per request:
+
+            with client.sendBatch():
+                for reqId, contract in enumerate(contracts):
+                    client.reqMktData(reqId, contract, "", False, False, [])
+
+        The requests of other threads wait for the end of the block too."""
+        conn = self.conn
+        if conn is None:
+            yield
+            return
+        conn.beginBatch()
+        try:
+            yield
+        finally:
+            conn.endBatch()
+
     def msgLoopTmo(self):
         # intended to be overloaded
         pass
@@ -565,58 +666,119 @@ class EClient(object):
         pass
 
     def run(self):
-        """This is the function that has the message loop."""
+        """This is the function that has the message loop.
+
+        Each pass takes every message queued so far and decodes them back to
+        back; it only blocks (up to 0.2s) when the queue is empty."""
 
         try:
             while self.isConnected() or not self.msg_queue.empty():
                 try:
-                    try:
-                        text = self.msg_queue.get(block=True, timeout=0.2)
-                        if len(text) > MAX_MSG_LEN:
-                            self.wrapper.error(
-                                NO_VALID_ID,
-                                currentTimeMillis(),
-                                BAD_LENGTH.code(),
-                                f"{BAD_LENGTH.msg()}:{len(text)}:{text}",
-                            )
-                            break
-                    except queue.Empty:
+                    msgs = self.getMsgBatch()
+                    if not msgs:
                         logger.debug("queue.get: empty")
                         self.msgLoopTmo()
-                    else:
-
-                        if self.serverVersion() >= MIN_SERVER_VER_PROTOBUF:
-                            sMsgId = text[:4]
-                            msgId = int.from_bytes(sMsgId, 'big')  
-                            text = text[4:]
-                        else:
-                            sMsgId = text[:text.index(b"\0")]
-                            text = text[text.index(b"\0") + len(b"\0"):]
-                            msgId = int(sMsgId)
-
-                        if msgId > PROTOBUF_MSG_ID:
-                            msgId -= PROTOBUF_MSG_ID
-                            logger.debug("msgId: %d, protobuf: %s", msgId, text)
-                            self.decoder.processProtoBuf(text, msgId)
-                        else:
-                            fields = comm.read_fields(text)
-                            logger.debug("msgId: %d, fields: %s", msgId, fields)
-                            self.decoder.interpret(fields, msgId)
-
-                        self.msgLoopRec()
+                        continue
                 except (KeyboardInterrupt, SystemExit):
                     logger.info("detected KeyboardInterrupt, SystemExit")
                     self.keyboardInterrupt()
                     self.keyboardInterruptHard()
-                except BadMessage:
-                    logger.info("BadMessage")
+                    continue
 
-                logger.debug(
-                    "conn:%d queue.sz:%d", self.isConnected(), self.msg_queue.qsize()
-                )
+                if not self.decodeMsgs(msgs):
+                    return
+
+                if debugOn(logger):
+                    logger.debug(
+                        "conn:%d batch:%d queue.sz:%d", self.isConnected(), len(msgs), self.msg_queue.qsize()
+                    )
         finally:
             self.disconnect()
 
+    def getMsgBatch(self) -> list:
+        """Waits up to 0.2s for a message, then takes whatever else is already
+        queued without waiting, up to maxMsgBatch messages. Items put by a
+        batching EReader (see setReaderBatching) are lists of messages, and
+        with metrics on (see setMetrics) they come with the time queued."""
+        msgs = []
+        try:
+            item = self.msg_queue.get(block=True, timeout=0.2)
+            while True:
+                if type(item) is tuple:
+                    queuedAt, item = item
+                    dwell = time.perf_counter_ns() - queuedAt
+                    metrics = self.metrics
+                    if metrics is not None:
+                        metrics.recordDwell(dwell, len(item) if type(item) is list else 1)
+                if type(item) is list:
+                    msgs.extend(item)
+                else:
+                    msgs.append(item)
+                if len(msgs) >= self.maxMsgBatch:
+                    break
+                item = self.msg_queue.get_nowait()
+        except queue.Empty:
+            pass
+        return msgs
+
+    def decodeMsgs(self, msgs) -> bool:
+        """Decodes a batch of message payloads back to back. Returns False
+        when a message has a bad length, the stream can not be trusted
+        after that and the caller has to drop the connection."""
+        useRawIntMsgId = self.serverVersion() >= MIN_SERVER_VER_PROTOBUF
+        metrics = self.metrics
+        for text in msgs:
+            try:
+                if len(text) > MAX_MSG_LEN:
+                    self.wrapper.error(
+                        NO_VALID_ID,
+                        currentTimeMillis(),
+                        BAD_LENGTH.code(),
+                        f"{BAD_LENGTH.msg()}:{len(text)}:{text}",
+                    )
+                    return False
+
+                if metrics is None:
+                    self.decodeMsg(text, useRawIntMsgId)
+                else:
+                    metrics.startMessage()
+                    start = time.perf_counter_ns()
+                    msgId = self.decodeMsg(text, useRawIntMsgId)
+                    metrics.recordMessage(msgId, time.perf_counter_ns() - start)
+                self.msgLoopRec()
+            except (KeyboardInterrupt, SystemExit):
+                logger.info("detected KeyboardInterrupt, SystemExit")
+                self.keyboardInterrupt()
+                self.keyboardInterruptHard()
+            except BadMessage:
+                logger.info("BadMessage")
+        return True
+
+    def decodeMsg(self, text: bytes, useRawIntMsgId: bool) -> int:
+        """Splits the msg id off one message payload and dispatches it to the
+        decoder, returns the msg id."""
+        if useRawIntMsgId:
+            msgId = int.from_bytes(text[:4], 'big')
+            text = text[4:]
+        else:
+            sep = text.index(b"\0")
+            msgId = int(text[:sep])
+            text = text[sep + 1:]
+
+        if msgId > PROTOBUF_MSG_ID:
+            msgId -= PROTOBUF_MSG_ID
+            if self.wireTrace is not None:
+                self.wireTrace.received(msgId, text, True)
+            logger.debug("msgId: %d, protobuf: %s", msgId, text)
+            self.decoder.processProtoBuf(text, msgId)
+        else:
+            fields = comm.read_fields(text)
+            if self.wireTrace is not None:
+                self.wireTrace.received(msgId, fields)
+            logger.debug("msgId: %d, fields: %s", msgId, fields)
+            self.decoder.interpret(fields, msgId)
+        return msgId
+
     def reqCurrentTime(self):
         """Asks the current system time on the server side."""
 
@@ -641,7 +803,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQCURRTIME.code(), FAIL_SEND_REQCURRTIME.msg() + str(ex))
             return
 
-    def reqCurrentTimeProtoBuf(self, currentTimeRequestProto: CurrentTimeRequestProto):
+    def reqCurrentTimeProtoBuf(self, currentTimeRequestProto: "CurrentTimeRequestProto"):
         if currentTimeRequestProto is None:
             return
 
@@ -691,7 +853,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_SERVER_LOG_LEVEL.code(), FAIL_SEND_SERVER_LOG_LEVEL.msg() + str(ex))
             return
 
-    def setServerLogLevelProtoBuf(self, setServerLogLevelRequestProto: SetServerLogLevelRequestProto):
+    def setServerLogLevelProtoBuf(self, setServerLogLevelRequestProto: "SetServerLogLevelRequestProto"):
         if setServerLogLevelRequestProto is None:
             return
 
@@ -885,7 +1047,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQMKT.code(), FAIL_SEND_REQMKT.msg() + str(ex))
             return
 
-    def reqMarketDataProtoBuf(self, marketDataRequestProto: MarketDataRequestProto):
+    def reqMarketDataProtoBuf(self, marketDataRequestProto: "MarketDataRequestProto"):
         if marketDataRequestProto is None:
             return
 
@@ -944,7 +1106,7 @@ class EClient(object):
             return
 
 
-    def cancelMarketDataProtoBuf(self, cancelMarketDataProto: CancelMarketDataProto):
+    def cancelMarketDataProtoBuf(self, cancelMarketDataProto: "CancelMarketDataProto"):
         if cancelMarketDataProto is None:
             return
 
@@ -1013,7 +1175,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQMARKETDATATYPE.code(), FAIL_SEND_REQMARKETDATATYPE.msg() + str(ex))
             return
 
-    def reqMarketDataTypeProtoBuf(self, marketDataTypeRequestProto: MarketDataTypeRequestProto):
+    def reqMarketDataTypeProtoBuf(self, marketDataTypeRequestProto: "MarketDataTypeRequestProto"):
         if marketDataTypeRequestProto is None:
             return
 
@@ -1066,7 +1228,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQSMARTCOMPONENTS.code(), FAIL_SEND_REQSMARTCOMPONENTS.msg() + str(ex))
             return
 
-    def reqSmartComponentsProtoBuf(self, smartComponentsRequestProto: SmartComponentsRequestProto):
+    def reqSmartComponentsProtoBuf(self, smartComponentsRequestProto: "SmartComponentsRequestProto"):
         if smartComponentsRequestProto is None:
             return
 
@@ -1117,7 +1279,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQMARKETRULE.code(), FAIL_SEND_REQMARKETRULE.msg() + str(ex))
             return
 
-    def reqMarketRuleProtoBuf(self, marketRuleRequestProto: MarketRuleRequestProto):
+    def reqMarketRuleProtoBuf(self, marketRuleRequestProto: "MarketRuleRequestProto"):
         if marketRuleRequestProto is None:
             return
 
@@ -1206,7 +1368,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQTICKBYTICKDATA.code(), FAIL_SEND_REQTICKBYTICKDATA.msg() + str(ex))
             return
 
-    def reqTickByTickDataProtoBuf(self, tickByTickRequestProto: TickByTickRequestProto):
+    def reqTickByTickDataProtoBuf(self, tickByTickRequestProto: "TickByTickRequestProto"):
         if tickByTickRequestProto is None:
             return
         
@@ -1258,7 +1420,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANCELTICKBYTICKDATA.code(), FAIL_SEND_CANCELTICKBYTICKDATA.msg() + str(ex))
             return
 
-    def cancelTickByTickProtoBuf(self, cancelTickByTickProto: CancelTickByTickProto):
+    def cancelTickByTickProtoBuf(self, cancelTickByTickProto: "CancelTickByTickProto"):
         if cancelTickByTickProto is None:
             return
         
@@ -1377,7 +1539,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQCALCIMPLIEDVOLAT.code(), FAIL_SEND_REQCALCIMPLIEDVOLAT.msg() + str(ex))
             return
 
-    def calculateImpliedVolatilityProtoBuf(self, calculateImpliedVolatilityRequestProto: CalculateImpliedVolatilityRequestProto):
+    def calculateImpliedVolatilityProtoBuf(self, calculateImpliedVolatilityRequestProto: "CalculateImpliedVolatilityRequestProto"):
         if calculateImpliedVolatilityRequestProto is None:
             return
 
@@ -1440,7 +1602,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANCALCIMPLIEDVOLAT.code(), FAIL_SEND_CANCALCIMPLIEDVOLAT.msg() + str(ex))
             return
 
-    def cancelCalculateImpliedVolatilityProtoBuf(self, cancelCalculateImpliedVolatilityProto: CancelCalculateImpliedVolatilityProto):
+    def cancelCalculateImpliedVolatilityProtoBuf(self, cancelCalculateImpliedVolatilityProto: "CancelCalculateImpliedVolatilityProto"):
         if cancelCalculateImpliedVolatilityProto is None:
             return
 
@@ -1554,7 +1716,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQCALCOPTIONPRICE.code(), FAIL_SEND_REQCALCOPTIONPRICE.msg() + str(ex))
             return
 
-    def calculateOptionPriceProtoBuf(self, calculateOptionPriceRequestProto: CalculateOptionPriceRequestProto):
+    def calculateOptionPriceProtoBuf(self, calculateOptionPriceRequestProto: "CalculateOptionPriceRequestProto"):
         if calculateOptionPriceRequestProto is None:
             return
 
@@ -1617,7 +1779,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANCALCOPTIONPRICE.code(), FAIL_SEND_CANCALCOPTIONPRICE.msg() + str(ex))
             return
 
-    def cancelCalculateOptionPriceProtoBuf(self, cancelCalculateOptionPriceProto: CancelCalculateOptionPriceProto):
+    def cancelCalculateOptionPriceProtoBuf(self, cancelCalculateOptionPriceProto: "CancelCalculateOptionPriceProto"):
         if cancelCalculateOptionPriceProto is None:
             return
 
@@ -1782,7 +1944,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQMKT.code(), FAIL_SEND_REQMKT.msg() + str(ex))
             return
 
-    def exerciseOptionsProtoBuf(self, exerciseOptionsRequestProto: ExerciseOptionsRequestProto):
+    def exerciseOptionsProtoBuf(self, exerciseOptionsRequestProto: "ExerciseOptionsRequestProto"):
         if exerciseOptionsRequestProto is None:
             return
 
@@ -2759,7 +2921,7 @@ class EClient(object):
             self.wrapper.error(orderId, currentTimeMillis(), FAIL_SEND_ORDER.code(), FAIL_SEND_ORDER.msg() + str(ex))
             return
 
-    def placeOrderProtoBuf(self, placeOrderRequestProto: PlaceOrderRequestProto):
+    def placeOrderProtoBuf(self, placeOrderRequestProto: "PlaceOrderRequestProto"):
         if placeOrderRequestProto is None:
             return
 
@@ -2885,7 +3047,7 @@ class EClient(object):
             self.wrapper.error(orderId, currentTimeMillis(), FAIL_SEND_CORDER.code(), FAIL_SEND_CORDER.msg() + str(ex))
             return
 
-    def cancelOrderProtoBuf(self, cancelOrderRequestProto: CancelOrderRequestProto):
+    def cancelOrderProtoBuf(self, cancelOrderRequestProto: "CancelOrderRequestProto"):
         if cancelOrderRequestProto is None:
             return
 
@@ -2940,7 +3102,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_OORDER.code(), FAIL_SEND_OORDER.msg() + str(ex))
             return
 
-    def reqOpenOrdersProtoBuf(self, openOrdersRequestProto: OpenOrdersRequestProto):
+    def reqOpenOrdersProtoBuf(self, openOrdersRequestProto: "OpenOrdersRequestProto"):
         if openOrdersRequestProto is None:
             return
 
@@ -2993,7 +3155,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_OORDER.code(), FAIL_SEND_OORDER.msg() + str(ex))
             return
 
-    def reqAutoOpenOrdersProtoBuf(self, autoOpenOrdersRequestProto: AutoOpenOrdersRequestProto):
+    def reqAutoOpenOrdersProtoBuf(self, autoOpenOrdersRequestProto: "AutoOpenOrdersRequestProto"):
         if autoOpenOrdersRequestProto is None:
             return
 
@@ -3039,7 +3201,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_OORDER.code(), FAIL_SEND_OORDER.msg() + str(ex))
             return
 
-    def reqAllOpenOrdersProtoBuf(self, allOpenOrdersRequestProto: AllOpenOrdersRequestProto):
+    def reqAllOpenOrdersProtoBuf(self, allOpenOrdersRequestProto: "AllOpenOrdersRequestProto"):
         if allOpenOrdersRequestProto is None:
             return
 
@@ -3107,7 +3269,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQGLOBALCANCEL.code(), FAIL_SEND_REQGLOBALCANCEL.msg() + str(ex))
             return
 
-    def reqGlobalCancelProtoBuf(self, globalCancelRequestProto: GlobalCancelRequestProto):
+    def reqGlobalCancelProtoBuf(self, globalCancelRequestProto: "GlobalCancelRequestProto"):
         if globalCancelRequestProto is None:
             return
 
@@ -3158,7 +3320,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_CORDER.code(), FAIL_SEND_CORDER.msg() + str(ex))
             return
 
-    def reqIdsProtoBuf(self, idsRequestProto: IdsRequestProto):
+    def reqIdsProtoBuf(self, idsRequestProto: "IdsRequestProto"):
         if idsRequestProto is None:
             return
 
@@ -3225,7 +3387,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_ACCT.code(), FAIL_SEND_ACCT.msg() + str(ex))
             return
 
-    def reqAccountUpdatesProtoBuf(self, accountDataRequestProto: AccountDataRequestProto):
+    def reqAccountUpdatesProtoBuf(self, accountDataRequestProto: "AccountDataRequestProto"):
         if accountDataRequestProto is None:
             return
 
@@ -3330,7 +3492,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQACCOUNTDATA.code(), FAIL_SEND_REQACCOUNTDATA.msg() + str(ex))
             return
 
-    def reqAccountSummaryProtoBuf(self, accountSummaryRequestProto: AccountSummaryRequestProto):
+    def reqAccountSummaryProtoBuf(self, accountSummaryRequestProto: "AccountSummaryRequestProto"):
         if accountSummaryRequestProto is None:
             return
 
@@ -3381,7 +3543,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANACCOUNTDATA.code(), FAIL_SEND_CANACCOUNTDATA.msg() + str(ex))
             return
 
-    def cancelAccountSummaryProtoBuf(self, cancelAccountSummaryProto: CancelAccountSummaryProto):
+    def cancelAccountSummaryProtoBuf(self, cancelAccountSummaryProto: "CancelAccountSummaryProto"):
         if cancelAccountSummaryProto is None:
             return
 
@@ -3436,7 +3598,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQPOSITIONS.code(), FAIL_SEND_REQPOSITIONS.msg() + str(ex))
             return
 
-    def reqPositionsProtoBuf(self, positionsRequestProto: PositionsRequestProto):
+    def reqPositionsProtoBuf(self, positionsRequestProto: "PositionsRequestProto"):
         if positionsRequestProto is None:
             return
 
@@ -3490,7 +3652,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_CANPOSITIONS.code(), FAIL_SEND_CANPOSITIONS.msg() + str(ex))
             return
 
-    def cancelPositionsProtoBuf(self, cancelPositionsProto: CancelPositionsProto):
+    def cancelPositionsProtoBuf(self, cancelPositionsProto: "CancelPositionsProto"):
         if cancelPositionsProto is None:
             return
 
@@ -3554,7 +3716,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQPOSITIONSMULTI.code(), FAIL_SEND_REQPOSITIONSMULTI.msg() + str(ex))
             return
 
-    def reqPositionsMultiProtoBuf(self, positionsMultiRequestProto: PositionsMultiRequestProto):
+    def reqPositionsMultiProtoBuf(self, positionsMultiRequestProto: "PositionsMultiRequestProto"):
         if positionsMultiRequestProto is None:
             return
 
@@ -3611,7 +3773,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANPOSITIONSMULTI.code(), FAIL_SEND_CANPOSITIONSMULTI.msg() + str(ex))
             return
 
-    def cancelPositionsMultiProtoBuf(self, cancelPositionsMultiProto: CancelPositionsMultiProto):
+    def cancelPositionsMultiProtoBuf(self, cancelPositionsMultiProto: "CancelPositionsMultiProto"):
         if cancelPositionsMultiProto is None:
             return
 
@@ -3679,7 +3841,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQACCOUNTUPDATESMULTI.code(), FAIL_SEND_REQACCOUNTUPDATESMULTI.msg() + str(ex))
             return
 
-    def reqAccountUpdatesMultiProtoBuf(self, accountUpdatesMultiRequestProto: AccountUpdatesMultiRequestProto):
+    def reqAccountUpdatesMultiProtoBuf(self, accountUpdatesMultiRequestProto: "AccountUpdatesMultiRequestProto"):
         if accountUpdatesMultiRequestProto is None:
             return
 
@@ -3737,7 +3899,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANACCOUNTUPDATESMULTI.code(), FAIL_SEND_CANACCOUNTUPDATESMULTI.msg() + str(ex))
             return
 
-    def cancelAccountUpdatesMultiProtoBuf(self, cancelAccountUpdatesMultiProto: CancelAccountUpdatesMultiProto):
+    def cancelAccountUpdatesMultiProtoBuf(self, cancelAccountUpdatesMultiProto: "CancelAccountUpdatesMultiProto"):
         if cancelAccountUpdatesMultiProto is None:
             return
 
@@ -3800,7 +3962,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQPNL.code(), FAIL_SEND_REQPNL.msg() + str(ex))
             return
 
-    def reqPnLProtoBuf(self, pnlRequestProto: PnLRequestProto):
+    def reqPnLProtoBuf(self, pnlRequestProto: "PnLRequestProto"):
         if pnlRequestProto is None:
             return
 
@@ -3851,7 +4013,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANCELPNL.code(), FAIL_SEND_CANCELPNL.msg() + str(ex))
             return
 
-    def cancelPnLProtoBuf(self, cancelPnLProto: CancelPnLProto):
+    def cancelPnLProtoBuf(self, cancelPnLProto: "CancelPnLProto"):
         if cancelPnLProto is None:
             return
 
@@ -3907,7 +4069,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQPNLSINGLE.code(), FAIL_SEND_REQPNLSINGLE.msg() + str(ex))
             return
 
-    def reqPnLSingleProtoBuf(self, pnlSingleRequestProto: PnLSingleRequestProto):
+    def reqPnLSingleProtoBuf(self, pnlSingleRequestProto: "PnLSingleRequestProto"):
         if pnlSingleRequestProto is None:
             return
 
@@ -3957,7 +4119,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANCELPNLSINGLE.code(), FAIL_SEND_CANCELPNLSINGLE.msg() + str(ex))
             return
 
-    def cancelPnLSingleProtoBuf(self, cancelPnLSingleProto: CancelPnLSingleProto):
+    def cancelPnLSingleProtoBuf(self, cancelPnLSingleProto: "CancelPnLSingleProto"):
         if cancelPnLSingleProto is None:
             return
 
@@ -4071,7 +4233,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_EXEC.code(), FAIL_SEND_EXEC.msg() + str(ex))
             return
 
-    def reqExecutionsProtoBuf(self, executionRequestProto: ExecutionRequestProto):
+    def reqExecutionsProtoBuf(self, executionRequestProto: "ExecutionRequestProto"):
         if executionRequestProto is None:
             return
 
@@ -4231,7 +4393,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQCONTRACT.code(), FAIL_SEND_REQCONTRACT.msg() + str(ex))
             return
 
-    def reqContractDataProtoBuf(self, contractDataRequestProto: ContractDataRequestProto):
+    def reqContractDataProtoBuf(self, contractDataRequestProto: "ContractDataRequestProto"):
         if contractDataRequestProto is None:
             return
 
@@ -4287,7 +4449,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQMKTDEPTHEXCHANGES.code(), FAIL_SEND_REQMKTDEPTHEXCHANGES.msg() + str(ex))
             return
 
-    def reqMarketDepthExchangesProtoBuf(self, marketDepthExchangesRequestProto: MarketDepthExchangesRequestProto):
+    def reqMarketDepthExchangesProtoBuf(self, marketDepthExchangesRequestProto: "MarketDepthExchangesRequestProto"):
         if marketDepthExchangesRequestProto is None:
             return
 
@@ -4443,7 +4605,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQMKTDEPTH.code(), FAIL_SEND_REQMKTDEPTH.msg() + str(ex))
             return
 
-    def reqMarketDepthProtoBuf(self, marketDepthRequestProto: MarketDepthRequestProto):
+    def reqMarketDepthProtoBuf(self, marketDepthRequestProto: "MarketDepthRequestProto"):
         if marketDepthRequestProto is None:
             return
 
@@ -4514,7 +4676,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANMKTDEPTH.code(), FAIL_SEND_CANMKTDEPTH.msg() + str(ex))
             return
 
-    def cancelMarketDepthProtoBuf(self, cancelMarketDepthProto: CancelMarketDepthProto):
+    def cancelMarketDepthProtoBuf(self, cancelMarketDepthProto: "CancelMarketDepthProto"):
         if cancelMarketDepthProto is None:
             return
 
@@ -4569,7 +4731,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_CORDER.code(), FAIL_SEND_CORDER.msg() + str(ex))
             return
 
-    def reqNewsBulletinsProtoBuf(self, newsBulletinsRequestProto: NewsBulletinsRequestProto):
+    def reqNewsBulletinsProtoBuf(self, newsBulletinsRequestProto: "NewsBulletinsRequestProto"):
         if newsBulletinsRequestProto is None:
             return
 
@@ -4610,7 +4772,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_CORDER.code(), FAIL_SEND_CORDER.msg() + str(ex))
             return
 
-    def cancelNewsBulletinsProtoBuf(self, cancelNewsBulletinsProto: CancelNewsBulletinsProto):
+    def cancelNewsBulletinsProtoBuf(self, cancelNewsBulletinsProto: "CancelNewsBulletinsProto"):
         if cancelNewsBulletinsProto is None:
             return
 
@@ -4658,7 +4820,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_OORDER.code(), FAIL_SEND_OORDER.msg() + str(ex))
             return
 
-    def reqManagedAcctsProtoBuf(self, managedAccountsRequestProto: ManagedAccountsRequestProto):
+    def reqManagedAcctsProtoBuf(self, managedAccountsRequestProto: "ManagedAccountsRequestProto"):
         if managedAccountsRequestProto is None:
             return
 
@@ -4718,7 +4880,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_FA_REQUEST.code(), FAIL_SEND_FA_REQUEST.msg() + str(ex))
             return
 
-    def reqFAProtoBuf(self, faRequestProto: FARequestProto):
+    def reqFAProtoBuf(self, faRequestProto: "FARequestProto"):
         if faRequestProto is None:
             return
 
@@ -4784,7 +4946,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_FA_REPLACE.code(), FAIL_SEND_FA_REPLACE.msg() + str(ex))
             return
 
-    def replaceFAProtoBuf(self, faReplaceProto: FAReplaceProto):
+    def replaceFAProtoBuf(self, faReplaceProto: "FAReplaceProto"):
         if faReplaceProto is None:
             return
 
@@ -4998,7 +5160,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQHISTDATA.code(), FAIL_SEND_REQHISTDATA.msg() + str(ex))
             return
 
-    def reqHistoricalDataProtoBuf(self, historicalDataRequestProto: HistoricalDataRequestProto):
+    def reqHistoricalDataProtoBuf(self, historicalDataRequestProto: "HistoricalDataRequestProto"):
         if historicalDataRequestProto is None:
             return
         
@@ -5052,7 +5214,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANHISTDATA.code(), FAIL_SEND_CANHISTDATA.msg() + str(ex))
             return
 
-    def cancelHistoricalDataProtoBuf(self, cancelHistoricalDataProto: CancelHistoricalDataProto):
+    def cancelHistoricalDataProtoBuf(self, cancelHistoricalDataProto: "CancelHistoricalDataProto"):
         if cancelHistoricalDataProto is None:
             return
         
@@ -5136,7 +5298,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQHEADTIMESTAMP.code(), FAIL_SEND_REQHEADTIMESTAMP.msg() + str(ex))
             return
 
-    def reqHeadTimestampProtoBuf(self, headTimestampRequestProto: HeadTimestampRequestProto):
+    def reqHeadTimestampProtoBuf(self, headTimestampRequestProto: "HeadTimestampRequestProto"):
         if headTimestampRequestProto is None:
             return
         
@@ -5191,7 +5353,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_CANCELHEADTIMESTAMP.code(), FAIL_SEND_CANCELHEADTIMESTAMP.msg() + str(ex))
             return
 
-    def cancelHeadTimestampProtoBuf(self, cancelHeadTimestampProto: CancelHeadTimestampProto):
+    def cancelHeadTimestampProtoBuf(self, cancelHeadTimestampProto: "CancelHeadTimestampProto"):
         if cancelHeadTimestampProto is None:
             return
         
@@ -5266,7 +5428,7 @@ class EClient(object):
             self.wrapper.error(tickerId, currentTimeMillis(), FAIL_SEND_REQHISTOGRAMDATA.code(), FAIL_SEND_REQHISTOGRAMDATA.msg() + str(ex))
             return
 
-    def reqHistogramDataProtoBuf(self, histogramDataRequestProto: HistogramDataRequestProto):
+    def reqHistogramDataProtoBuf(self, histogramDataRequestProto: "HistogramDataRequestProto"):
         if histogramDataRequestProto is None:
             return
         
@@ -5319,7 +5481,7 @@ class EClient(object):
             self.wrapper.error(tickerId, currentTimeMillis(), FAIL_SEND_CANCELHISTOGRAMDATA.code(), FAIL_SEND_CANCELHISTOGRAMDATA.msg() + str(ex))
             return
 
-    def cancelHistogramDataProtoBuf(self, cancelHistogramDataProto: CancelHistogramDataProto):
+    def cancelHistogramDataProtoBuf(self, cancelHistogramDataProto: "CancelHistogramDataProto"):
         if cancelHistogramDataProto is None:
             return
         
@@ -5415,7 +5577,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQHISTORICALTICKS.code(), FAIL_SEND_REQHISTORICALTICKS.msg() + str(ex))
             return
 
-    def reqHistoricalTicksProtoBuf(self, historicalTicksRequestProto: HistoricalTicksRequestProto):
+    def reqHistoricalTicksProtoBuf(self, historicalTicksRequestProto: "HistoricalTicksRequestProto"):
         if historicalTicksRequestProto is None:
             return
         
@@ -5465,7 +5627,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQSCANNERPARAMETERS.code(), FAIL_SEND_REQSCANNERPARAMETERS.msg() + str(ex))
             return
 
-    def reqScannerParametersProtoBuf(self, scannerParametersRequestProto: ScannerParametersRequestProto):
+    def reqScannerParametersProtoBuf(self, scannerParametersRequestProto: "ScannerParametersRequestProto"):
         if scannerParametersRequestProto is None:
             return
 
@@ -5582,7 +5744,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQSCANNER.code(), FAIL_SEND_REQSCANNER.msg() + str(ex))
             return
 
-    def reqScannerSubscriptionProtoBuf(self, scannerSubscriptionRequestProto: ScannerSubscriptionRequestProto):
+    def reqScannerSubscriptionProtoBuf(self, scannerSubscriptionRequestProto: "ScannerSubscriptionRequestProto"):
         if scannerSubscriptionRequestProto is None:
             return
 
@@ -5631,7 +5793,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANSCANNER.code(), FAIL_SEND_CANSCANNER.msg() + str(ex))
             return
 
-    def cancelScannerSubscriptionProtoBuf(self, cancelScannerSubscriptionProto: CancelScannerSubscriptionProto):
+    def cancelScannerSubscriptionProtoBuf(self, cancelScannerSubscriptionProto: "CancelScannerSubscriptionProto"):
         if cancelScannerSubscriptionProto is None:
             return
 
@@ -5763,7 +5925,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQRTBARS.code(), FAIL_SEND_REQRTBARS.msg() + str(ex))
             return
 
-    def reqRealTimeBarsProtoBuf(self, realTimeBarsRequestProto: RealTimeBarsRequestProto):
+    def reqRealTimeBarsProtoBuf(self, realTimeBarsRequestProto: "RealTimeBarsRequestProto"):
         if realTimeBarsRequestProto is None:
             return
         
@@ -5819,7 +5981,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANRTBARS.code(), FAIL_SEND_CANRTBARS.msg() + str(ex))
             return
 
-    def cancelRealTimeBarsProtoBuf(self, cancelRealTimeBarsProto: CancelRealTimeBarsProto):
+    def cancelRealTimeBarsProtoBuf(self, cancelRealTimeBarsProto: "CancelRealTimeBarsProto"):
         if cancelRealTimeBarsProto is None:
             return
         
@@ -5946,7 +6108,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQFUNDDATA.code(), FAIL_SEND_REQFUNDDATA.msg() + str(ex))
             return
 
-    def reqFundamentalsDataProtoBuf(self, fundamentalsDataRequestProto: FundamentalsDataRequestProto):
+    def reqFundamentalsDataProtoBuf(self, fundamentalsDataRequestProto: "FundamentalsDataRequestProto"):
         if fundamentalsDataRequestProto is None:
             return
 
@@ -6006,7 +6168,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CANFUNDDATA.code(), FAIL_SEND_CANFUNDDATA.msg() + str(ex))
             return
 
-    def cancelFundamentalsDataProtoBuf(self, cancelFundamentalsDataProto: CancelFundamentalsDataProto):
+    def cancelFundamentalsDataProtoBuf(self, cancelFundamentalsDataProto: "CancelFundamentalsDataProto"):
         if cancelFundamentalsDataProto is None:
             return
 
@@ -6056,7 +6218,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQNEWSPROVIDERS.code(), FAIL_SEND_REQNEWSPROVIDERS.msg() + str(ex))
             return
 
-    def reqNewsProvidersProtoBuf(self, newsProvidersRequestProto: NewsProvidersRequestProto):
+    def reqNewsProvidersProtoBuf(self, newsProvidersRequestProto: "NewsProvidersRequestProto"):
         if newsProvidersRequestProto is None:
             return
 
@@ -6130,7 +6292,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQNEWSARTICLE.code(), FAIL_SEND_REQNEWSARTICLE.msg() + str(ex))
             return
 
-    def reqNewsArticleProtoBuf(self, newsArticleRequestProto: NewsArticleRequestProto):
+    def reqNewsArticleProtoBuf(self, newsArticleRequestProto: "NewsArticleRequestProto"):
         if newsArticleRequestProto is None:
             return
 
@@ -6215,7 +6377,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQHISTORICALNEWS.code(), FAIL_SEND_REQHISTORICALNEWS.msg() + str(ex))
             return
 
-    def reqHistoricalNewsProtoBuf(self, historicalNewsRequestProto: HistoricalNewsRequestProto):
+    def reqHistoricalNewsProtoBuf(self, historicalNewsRequestProto: "HistoricalNewsRequestProto"):
         if historicalNewsRequestProto is None:
             return
 
@@ -6283,7 +6445,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_QUERYDISPLAYGROUPS.code(), FAIL_SEND_QUERYDISPLAYGROUPS.msg() + str(ex))
             return
 
-    def queryDisplayGroupsProtoBuf(self, queryDisplayGroupsRequestProto: QueryDisplayGroupsRequestProto):
+    def queryDisplayGroupsProtoBuf(self, queryDisplayGroupsRequestProto: "QueryDisplayGroupsRequestProto"):
         if queryDisplayGroupsRequestProto is None:
             return
 
@@ -6346,7 +6508,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_SUBSCRIBETOGROUPEVENTS.code(), FAIL_SEND_SUBSCRIBETOGROUPEVENTS.msg() + str(ex))
             return
 
-    def subscribeToGroupEventsProtoBuf(self, subscribeToGroupEventsRequestProto: SubscribeToGroupEventsRequestProto):
+    def subscribeToGroupEventsProtoBuf(self, subscribeToGroupEventsRequestProto: "SubscribeToGroupEventsRequestProto"):
         if subscribeToGroupEventsRequestProto is None:
             return
 
@@ -6417,7 +6579,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_UPDATEDISPLAYGROUP.code(), FAIL_SEND_UPDATEDISPLAYGROUP.msg() + str(ex))
             return
 
-    def updateDisplayGroupProtoBuf(self, updateDisplayGroupRequestProto: UpdateDisplayGroupRequestProto):
+    def updateDisplayGroupProtoBuf(self, updateDisplayGroupRequestProto: "UpdateDisplayGroupRequestProto"):
         if updateDisplayGroupRequestProto is None:
             return
 
@@ -6477,7 +6639,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_UNSUBSCRIBEFROMGROUPEVENTS.code(), FAIL_SEND_UNSUBSCRIBEFROMGROUPEVENTS.msg() + str(ex))
             return
 
-    def unsubscribeFromGroupEventsProtoBuf(self, unsubscribeFromGroupEventsRequestProto: UnsubscribeFromGroupEventsRequestProto):
+    def unsubscribeFromGroupEventsProtoBuf(self, unsubscribeFromGroupEventsRequestProto: "UnsubscribeFromGroupEventsRequestProto"):
         if unsubscribeFromGroupEventsRequestProto is None:
             return
 
@@ -6551,7 +6713,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_VERIFYREQUEST.code(), FAIL_SEND_VERIFYREQUEST.msg() + str(ex))
             return
 
-    def verifyRequestProtoBuf(self, verifyRequestProto: VerifyRequestProto):
+    def verifyRequestProtoBuf(self, verifyRequestProto: "VerifyRequestProto"):
         if verifyRequestProto is None:
             return
 
@@ -6616,7 +6778,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_VERIFYMESSAGE.code(), FAIL_SEND_VERIFYMESSAGE.msg() + str(ex))
             return
 
-    def verifyMessageProtoBuf(self, verifyMessageRequestProto: VerifyMessageRequestProto):
+    def verifyMessageProtoBuf(self, verifyMessageRequestProto: "VerifyMessageRequestProto"):
         if verifyMessageRequestProto is None:
             return
 
@@ -6777,7 +6939,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQSECDEFOPTPARAMS.code(), FAIL_SEND_REQSECDEFOPTPARAMS.msg() + str(ex))
             return
 
-    def reqSecDefOptParamsProtoBuf(self, secDefOptParamsRequestProto: SecDefOptParamsRequestProto):
+    def reqSecDefOptParamsProtoBuf(self, secDefOptParamsRequestProto: "SecDefOptParamsRequestProto"):
         if secDefOptParamsRequestProto is None:
             return
 
@@ -6823,7 +6985,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQSOFTDOLLARTIERS.code(), FAIL_SEND_REQSOFTDOLLARTIERS.msg() + str(ex))
             return
 
-    def reqSoftDollarTiersProtoBuf(self, softDollarTiersRequestProto: SoftDollarTiersRequestProto):
+    def reqSoftDollarTiersProtoBuf(self, softDollarTiersRequestProto: "SoftDollarTiersRequestProto"):
         if softDollarTiersRequestProto is None:
             return
 
@@ -6874,7 +7036,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQFAMILYCODES.code(), FAIL_SEND_REQFAMILYCODES.msg() + str(ex))
             return
 
-    def reqFamilyCodesProtoBuf(self, familyCodesRequestProto: FamilyCodesRequestProto):
+    def reqFamilyCodesProtoBuf(self, familyCodesRequestProto: "FamilyCodesRequestProto"):
         if familyCodesRequestProto is None:
             return
 
@@ -6930,7 +7092,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQMATCHINGSYMBOLS.code(), FAIL_SEND_REQMATCHINGSYMBOLS.msg() + str(ex))
             return
 
-    def reqMatchingSymbolsProtoBuf(self, matchingSymbolsRequestProto: MatchingSymbolsRequestProto):
+    def reqMatchingSymbolsProtoBuf(self, matchingSymbolsRequestProto: "MatchingSymbolsRequestProto"):
         if matchingSymbolsRequestProto is None:
             return
 
@@ -6979,7 +7141,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQCOMPLETEDORDERS.code(), FAIL_SEND_REQCOMPLETEDORDERS.msg() + str(ex))
             return
 
-    def reqCompletedOrdersProtoBuf(self, completedOrdersRequestProto: CompletedOrdersRequestProto):
+    def reqCompletedOrdersProtoBuf(self, completedOrdersRequestProto: "CompletedOrdersRequestProto"):
         if completedOrdersRequestProto is None:
             return
 
@@ -7028,7 +7190,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQ_WSH_META_DATA.code(), FAIL_SEND_REQ_WSH_META_DATA.msg() + str(ex))
             return
 
-    def reqWshMetaDataProtoBuf(self, wshMetaDataRequestProto: WshMetaDataRequestProto):
+    def reqWshMetaDataProtoBuf(self, wshMetaDataRequestProto: "WshMetaDataRequestProto"):
         if wshMetaDataRequestProto is None:
             return
 
@@ -7079,7 +7241,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CAN_WSH_META_DATA.code(), FAIL_SEND_CAN_WSH_META_DATA.msg() + str(ex))
             return
 
-    def cancelWshMetaDataProtoBuf(self, cancelWshMetaDataProto: CancelWshMetaDataProto):
+    def cancelWshMetaDataProtoBuf(self, cancelWshMetaDataProto: "CancelWshMetaDataProto"):
         if cancelWshMetaDataProto is None:
             return
 
@@ -7181,7 +7343,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQ_WSH_EVENT_DATA.code(), FAIL_SEND_REQ_WSH_EVENT_DATA.msg() + str(ex))
             return
 
-    def reqWshEventDataProtoBuf(self, wshEventDataRequestProto: WshEventDataRequestProto):
+    def reqWshEventDataProtoBuf(self, wshEventDataRequestProto: "WshEventDataRequestProto"):
         if wshEventDataRequestProto is None:
             return
 
@@ -7232,7 +7394,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_CAN_WSH_EVENT_DATA.code(), FAIL_SEND_CAN_WSH_EVENT_DATA.msg() + str(ex))
             return
 
-    def cancelWshEventDataProtoBuf(self, cancelWshEventDataProto: CancelWshEventDataProto):
+    def cancelWshEventDataProtoBuf(self, cancelWshEventDataProto: "CancelWshEventDataProto"):
         if cancelWshEventDataProto is None:
             return
 
@@ -7280,7 +7442,7 @@ class EClient(object):
             self.wrapper.error(reqId, currentTimeMillis(), FAIL_SEND_REQ_USER_INFO.code(), FAIL_SEND_REQ_USER_INFO.msg() + str(ex))
             return
         
-    def reqUserInfoProtoBuf(self, userInfoRequestProto: UserInfoRequestProto):
+    def reqUserInfoProtoBuf(self, userInfoRequestProto: "UserInfoRequestProto"):
         if userInfoRequestProto is None:
             return
 
@@ -7333,7 +7495,7 @@ class EClient(object):
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), FAIL_SEND_REQCURRTIMEINMILLIS.code(), FAIL_SEND_REQCURRTIMEINMILLIS.msg() + str(ex))
             return
 
-    def reqCurrentTimeInMillisProtoBuf(self, currentTimeInMillisRequestProto: CurrentTimeInMillisRequestProto):
+    def reqCurrentTimeInMillisProtoBuf(self, currentTimeInMillisRequestProto: "CurrentTimeInMillisRequestProto"):
         if currentTimeInMillisRequestProto is None:
             return
 
@@ -3,6 +3,8 @@ Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is su
  and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
 """
 
+from typing import TYPE_CHECKING
+
 from ibapi.const import UNSET_DOUBLE
 from ibapi.execution import ExecutionFilter
 
@@ -16,96 +18,99 @@ from ibapi.common import TagValueList, WshEventData
 from ibapi.order_cancel import OrderCancel
 from ibapi.scanner import ScannerSubscription
 
-from ibapi.protobuf.ComboLeg_pb2 import ComboLeg as ComboLegProto
-from ibapi.protobuf.Contract_pb2 import Contract as ContractProto
-from ibapi.protobuf.DeltaNeutralContract_pb2 import DeltaNeutralContract as DeltaNeutralContractProto
-from ibapi.protobuf.OrderCancel_pb2 import OrderCancel as OrderCancelProto
-from ibapi.protobuf.OrderCondition_pb2 import OrderCondition as OrderConditionProto
-from ibapi.protobuf.PlaceOrderRequest_pb2 import PlaceOrderRequest as PlaceOrderRequestProto
-from ibapi.protobuf.CancelOrderRequest_pb2 import CancelOrderRequest as CancelOrderRequestProto
-from ibapi.protobuf.GlobalCancelRequest_pb2 import GlobalCancelRequest as GlobalCancelRequestProto
-from ibapi.protobuf.ExecutionFilter_pb2 import ExecutionFilter as ExecutionFilterProto
-from ibapi.protobuf.ExecutionRequest_pb2 import ExecutionRequest as ExecutionRequestProto
-from ibapi.protobuf.Order_pb2 import Order as OrderProto
-from ibapi.protobuf.SoftDollarTier_pb2 import SoftDollarTier as SoftDollarTierProto
-from ibapi.protobuf.AllOpenOrdersRequest_pb2 import AllOpenOrdersRequest as AllOpenOrdersRequestProto
-from ibapi.protobuf.AutoOpenOrdersRequest_pb2 import AutoOpenOrdersRequest as AutoOpenOrdersRequestProto
-from ibapi.protobuf.OpenOrdersRequest_pb2 import OpenOrdersRequest as OpenOrdersRequestProto
-from ibapi.protobuf.CompletedOrdersRequest_pb2 import CompletedOrdersRequest as CompletedOrdersRequestProto
-from ibapi.protobuf.ContractDataRequest_pb2 import ContractDataRequest as ContractDataRequestProto
-from ibapi.protobuf.MarketDataRequest_pb2 import MarketDataRequest as MarketDataRequestProto
-from ibapi.protobuf.CancelMarketData_pb2 import CancelMarketData as CancelMarketDataProto
-from ibapi.protobuf.MarketDepthRequest_pb2 import MarketDepthRequest as MarketDepthRequestProto
-from ibapi.protobuf.CancelMarketDepth_pb2 import CancelMarketDepth as CancelMarketDepthProto
-from ibapi.protobuf.MarketDataTypeRequest_pb2 import MarketDataTypeRequest as MarketDataTypeRequestProto
-from ibapi.protobuf.AccountDataRequest_pb2 import AccountDataRequest as AccountDataRequestProto
-from ibapi.protobuf.ManagedAccountsRequest_pb2 import ManagedAccountsRequest as ManagedAccountsRequestProto
-from ibapi.protobuf.PositionsRequest_pb2 import PositionsRequest as PositionsRequestProto
-from ibapi.protobuf.CancelPositions_pb2 import CancelPositions as CancelPositionsProto
-from ibapi.protobuf.AccountSummaryRequest_pb2 import AccountSummaryRequest as AccountSummaryRequestProto
-from ibapi.protobuf.CancelAccountSummary_pb2 import CancelAccountSummary as CancelAccountSummaryProto
-from ibapi.protobuf.PositionsMultiRequest_pb2 import PositionsMultiRequest as PositionsMultiRequestProto
-from ibapi.protobuf.CancelPositionsMulti_pb2 import CancelPositionsMulti as CancelPositionsMultiProto
-from ibapi.protobuf.AccountUpdatesMultiRequest_pb2 import AccountUpdatesMultiRequest as AccountUpdatesMultiRequestProto
-from ibapi.protobuf.CancelAccountUpdatesMulti_pb2 import CancelAccountUpdatesMulti as CancelAccountUpdatesMultiProto
-from ibapi.protobuf.HistoricalDataRequest_pb2 import HistoricalDataRequest as HistoricalDataRequestProto
-from ibapi.protobuf.RealTimeBarsRequest_pb2 import RealTimeBarsRequest as RealTimeBarsRequestProto
-from ibapi.protobuf.HeadTimestampRequest_pb2 import HeadTimestampRequest as HeadTimestampRequestProto
-from ibapi.protobuf.HistogramDataRequest_pb2 import HistogramDataRequest as HistogramDataRequestProto
-from ibapi.protobuf.HistoricalTicksRequest_pb2 import HistoricalTicksRequest as HistoricalTicksRequestProto
-from ibapi.protobuf.TickByTickRequest_pb2 import TickByTickRequest as TickByTickRequestProto
-from ibapi.protobuf.CancelHistoricalData_pb2 import CancelHistoricalData as CancelHistoricalDataProto
-from ibapi.protobuf.CancelRealTimeBars_pb2 import CancelRealTimeBars as CancelRealTimeBarsProto
-from ibapi.protobuf.CancelHeadTimestamp_pb2 import CancelHeadTimestamp as CancelHeadTimestampProto
-from ibapi.protobuf.CancelHistogramData_pb2 import CancelHistogramData as CancelHistogramDataProto
-from ibapi.protobuf.CancelTickByTick_pb2 import CancelTickByTick as CancelTickByTickProto
-from ibapi.protobuf.NewsBulletinsRequest_pb2 import NewsBulletinsRequest as NewsBulletinsRequestProto
-from ibapi.protobuf.CancelNewsBulletins_pb2 import CancelNewsBulletins as CancelNewsBulletinsProto
-from ibapi.protobuf.NewsArticleRequest_pb2 import NewsArticleRequest as NewsArticleRequestProto
-from ibapi.protobuf.NewsProvidersRequest_pb2 import NewsProvidersRequest as NewsProvidersRequestProto
-from ibapi.protobuf.HistoricalNewsRequest_pb2 import HistoricalNewsRequest as HistoricalNewsRequestProto
-from ibapi.protobuf.WshMetaDataRequest_pb2 import WshMetaDataRequest as WshMetaDataRequestProto
-from ibapi.protobuf.CancelWshMetaData_pb2 import CancelWshMetaData as CancelWshMetaDataProto
-from ibapi.protobuf.WshEventDataRequest_pb2 import WshEventDataRequest as WshEventDataRequestProto
-from ibapi.protobuf.CancelWshEventData_pb2 import CancelWshEventData as CancelWshEventDataProto
-from ibapi.protobuf.ScannerParametersRequest_pb2 import ScannerParametersRequest as ScannerParametersRequestProto
-from ibapi.protobuf.ScannerSubscriptionRequest_pb2 import ScannerSubscriptionRequest as ScannerSubscriptionRequestProto
-from ibapi.protobuf.ScannerSubscription_pb2 import ScannerSubscription as ScannerSubscriptionProto
-from ibapi.protobuf.FundamentalsDataRequest_pb2 import FundamentalsDataRequest as FundamentalsDataRequestProto
-from ibapi.protobuf.PnLRequest_pb2 import PnLRequest as PnLRequestProto
-from ibapi.protobuf.PnLSingleRequest_pb2 import PnLSingleRequest as PnLSingleRequestProto
-from ibapi.protobuf.CancelScannerSubscription_pb2 import CancelScannerSubscription as CancelScannerSubscriptionProto
-from ibapi.protobuf.CancelFundamentalsData_pb2 import CancelFundamentalsData as CancelFundamentalsDataProto
-from ibapi.protobuf.CancelPnL_pb2 import CancelPnL as CancelPnLProto
-from ibapi.protobuf.CancelPnLSingle_pb2 import CancelPnLSingle as CancelPnLSingleProto
-from ibapi.protobuf.FARequest_pb2 import FARequest as FARequestProto
-from ibapi.protobuf.FAReplace_pb2 import FAReplace as FAReplaceProto
-from ibapi.protobuf.ExerciseOptionsRequest_pb2 import ExerciseOptionsRequest as ExerciseOptionsRequestProto
-from ibapi.protobuf.CalculateImpliedVolatilityRequest_pb2 import CalculateImpliedVolatilityRequest as CalculateImpliedVolatilityRequestProto
-from ibapi.protobuf.CancelCalculateImpliedVolatility_pb2 import CancelCalculateImpliedVolatility as CancelCalculateImpliedVolatilityProto
-from ibapi.protobuf.CalculateOptionPriceRequest_pb2 import CalculateOptionPriceRequest as CalculateOptionPriceRequestProto
-from ibapi.protobuf.CancelCalculateOptionPrice_pb2 import CancelCalculateOptionPrice as CancelCalculateOptionPriceProto
-from ibapi.protobuf.SecDefOptParamsRequest_pb2 import SecDefOptParamsRequest as SecDefOptParamsRequestProto
-from ibapi.protobuf.SoftDollarTiersRequest_pb2 import SoftDollarTiersRequest as SoftDollarTiersRequestProto
-from ibapi.protobuf.FamilyCodesRequest_pb2 import FamilyCodesRequest as FamilyCodesRequestProto
-from ibapi.protobuf.MatchingSymbolsRequest_pb2 import MatchingSymbolsRequest as MatchingSymbolsRequestProto
-from ibapi.protobuf.SmartComponentsRequest_pb2 import SmartComponentsRequest as SmartComponentsRequestProto
-from ibapi.protobuf.MarketRuleRequest_pb2 import MarketRuleRequest as MarketRuleRequestProto
-from ibapi.protobuf.UserInfoRequest_pb2 import UserInfoRequest as UserInfoRequestProto
-from ibapi.protobuf.IdsRequest_pb2 import IdsRequest as IdsRequestProto
-from ibapi.protobuf.CurrentTimeRequest_pb2 import CurrentTimeRequest as CurrentTimeRequestProto
-from ibapi.protobuf.CurrentTimeInMillisRequest_pb2 import CurrentTimeInMillisRequest as CurrentTimeInMillisRequestProto
-from ibapi.protobuf.StartApiRequest_pb2 import StartApiRequest as StartApiRequestProto
-from ibapi.protobuf.SetServerLogLevelRequest_pb2 import SetServerLogLevelRequest as SetServerLogLevelRequestProto
-from ibapi.protobuf.VerifyRequest_pb2 import VerifyRequest as VerifyRequestProto
-from ibapi.protobuf.VerifyMessageRequest_pb2 import VerifyMessageRequest as VerifyMessageRequestProto
-from ibapi.protobuf.QueryDisplayGroupsRequest_pb2 import QueryDisplayGroupsRequest as QueryDisplayGroupsRequestProto
-from ibapi.protobuf.SubscribeToGroupEventsRequest_pb2 import SubscribeToGroupEventsRequest as SubscribeToGroupEventsRequestProto
-from ibapi.protobuf.UpdateDisplayGroupRequest_pb2 import UpdateDisplayGroupRequest as UpdateDisplayGroupRequestProto
-from ibapi.protobuf.UnsubscribeFromGroupEventsRequest_pb2 import UnsubscribeFromGroupEventsRequest as UnsubscribeFromGroupEventsRequestProto
-from ibapi.protobuf.MarketDepthExchangesRequest_pb2 import MarketDepthExchangesRequest as MarketDepthExchangesRequestProto
-from ibapi.protobuf.CancelContractData_pb2 import CancelContractData as CancelContractDataProto
-from ibapi.protobuf.CancelHistoricalTicks_pb2 import CancelHistoricalTicks as CancelHistoricalTicksProto
+from ibapi import protobuf as pb
+
+if TYPE_CHECKING:
+    from ibapi.protobuf.ComboLeg_pb2 import ComboLeg as ComboLegProto
+    from ibapi.protobuf.Contract_pb2 import Contract as ContractProto
+    from ibapi.protobuf.DeltaNeutralContract_pb2 import DeltaNeutralContract as DeltaNeutralContractProto
+    from ibapi.protobuf.OrderCancel_pb2 import OrderCancel as OrderCancelProto
+    from ibapi.protobuf.OrderCondition_pb2 import OrderCondition as OrderConditionProto
+    from ibapi.protobuf.PlaceOrderRequest_pb2 import PlaceOrderRequest as PlaceOrderRequestProto
+    from ibapi.protobuf.CancelOrderRequest_pb2 import CancelOrderRequest as CancelOrderRequestProto
+    from ibapi.protobuf.GlobalCancelRequest_pb2 import GlobalCancelRequest as GlobalCancelRequestProto
+    from ibapi.protobuf.ExecutionRequest_pb2 import ExecutionRequest as ExecutionRequestProto
+    from ibapi.protobuf.Order_pb2 import Order as OrderProto
+    from ibapi.protobuf.SoftDollarTier_pb2 import SoftDollarTier as SoftDollarTierProto
+    from ibapi.protobuf.AllOpenOrdersRequest_pb2 import AllOpenOrdersRequest as AllOpenOrdersRequestProto
+    from ibapi.protobuf.AutoOpenOrdersRequest_pb2 import AutoOpenOrdersRequest as AutoOpenOrdersRequestProto
+    from ibapi.protobuf.OpenOrdersRequest_pb2 import OpenOrdersRequest as OpenOrdersRequestProto
+    from ibapi.protobuf.CompletedOrdersRequest_pb2 import CompletedOrdersRequest as CompletedOrdersRequestProto
+    from ibapi.protobuf.ContractDataRequest_pb2 import ContractDataRequest as ContractDataRequestProto
+    from ibapi.protobuf.MarketDataRequest_pb2 import MarketDataRequest as MarketDataRequestProto
+    from ibapi.protobuf.CancelMarketData_pb2 import CancelMarketData as CancelMarketDataProto
+    from ibapi.protobuf.MarketDepthRequest_pb2 import MarketDepthRequest as MarketDepthRequestProto
+    from ibapi.protobuf.CancelMarketDepth_pb2 import CancelMarketDepth as CancelMarketDepthProto
+    from ibapi.protobuf.MarketDataTypeRequest_pb2 import MarketDataTypeRequest as MarketDataTypeRequestProto
+    from ibapi.protobuf.AccountDataRequest_pb2 import AccountDataRequest as AccountDataRequestProto
+    from ibapi.protobuf.ManagedAccountsRequest_pb2 import ManagedAccountsRequest as ManagedAccountsRequestProto
+    from ibapi.protobuf.PositionsRequest_pb2 import PositionsRequest as PositionsRequestProto
+    from ibapi.protobuf.CancelPositions_pb2 import CancelPositions as CancelPositionsProto
+    from ibapi.protobuf.AccountSummaryRequest_pb2 import AccountSummaryRequest as AccountSummaryRequestProto
+    from ibapi.protobuf.CancelAccountSummary_pb2 import CancelAccountSummary as CancelAccountSummaryProto
+    from ibapi.protobuf.PositionsMultiRequest_pb2 import PositionsMultiRequest as PositionsMultiRequestProto
+    from ibapi.protobuf.CancelPositionsMulti_pb2 import CancelPositionsMulti as CancelPositionsMultiProto
+    from ibapi.protobuf.AccountUpdatesMultiRequest_pb2 import AccountUpdatesMultiRequest as AccountUpdatesMultiRequestProto
+    from ibapi.protobuf.CancelAccountUpdatesMulti_pb2 import CancelAccountUpdatesMulti as CancelAccountUpdatesMultiProto
+    from ibapi.protobuf.HistoricalDataRequest_pb2 import HistoricalDataRequest as HistoricalDataRequestProto
+    from ibapi.protobuf.RealTimeBarsRequest_pb2 import RealTimeBarsRequest as RealTimeBarsRequestProto
+    from ibapi.protobuf.HeadTimestampRequest_pb2 import HeadTimestampRequest as HeadTimestampRequestProto
+    from ibapi.protobuf.HistogramDataRequest_pb2 import HistogramDataRequest as HistogramDataRequestProto
+    from ibapi.protobuf.HistoricalTicksRequest_pb2 import HistoricalTicksRequest as HistoricalTicksRequestProto
+    from ibapi.protobuf.TickByTickRequest_pb2 import TickByTickRequest as TickByTickRequestProto
+    from ibapi.protobuf.CancelHistoricalData_pb2 import CancelHistoricalData as CancelHistoricalDataProto
+    from ibapi.protobuf.CancelRealTimeBars_pb2 import CancelRealTimeBars as CancelRealTimeBarsProto
+    from ibapi.protobuf.CancelHeadTimestamp_pb2 import CancelHeadTimestamp as CancelHeadTimestampProto
+    from ibapi.protobuf.CancelHistogramData_pb2 import CancelHistogramData as CancelHistogramDataProto
+    from ibapi.protobuf.CancelTickByTick_pb2 import CancelTickByTick as CancelTickByTickProto
+    from ibapi.protobuf.NewsBulletinsRequest_pb2 import NewsBulletinsRequest as NewsBulletinsRequestProto
+    from ibapi.protobuf.CancelNewsBulletins_pb2 import CancelNewsBulletins as CancelNewsBulletinsProto
+    from ibapi.protobuf.NewsArticleRequest_pb2 import NewsArticleRequest as NewsArticleRequestProto
+    from ibapi.protobuf.NewsProvidersRequest_pb2 import NewsProvidersRequest as NewsProvidersRequestProto
+    from ibapi.protobuf.HistoricalNewsRequest_pb2 import HistoricalNewsRequest as HistoricalNewsRequestProto
+    from ibapi.protobuf.WshMetaDataRequest_pb2 import WshMetaDataRequest as WshMetaDataRequestProto
+    from ibapi.protobuf.CancelWshMetaData_pb2 import CancelWshMetaData as CancelWshMetaDataProto
+    from ibapi.protobuf.WshEventDataRequest_pb2 import WshEventDataRequest as WshEventDataRequestProto
+    from ibapi.protobuf.CancelWshEventData_pb2 import CancelWshEventData as CancelWshEventDataProto
+    from ibapi.protobuf.ScannerParametersRequest_pb2 import ScannerParametersRequest as ScannerParametersRequestProto
+    from ibapi.protobuf.ScannerSubscriptionRequest_pb2 import ScannerSubscriptionRequest as ScannerSubscriptionRequestProto
+    from ibapi.protobuf.ScannerSubscription_pb2 import ScannerSubscription as ScannerSubscriptionProto
+    from ibapi.protobuf.FundamentalsDataRequest_pb2 import FundamentalsDataRequest as FundamentalsDataRequestProto
+    from ibapi.protobuf.PnLRequest_pb2 import PnLRequest as PnLRequestProto
+    from ibapi.protobuf.PnLSingleRequest_pb2 import PnLSingleRequest as PnLSingleRequestProto
+    from ibapi.protobuf.CancelScannerSubscription_pb2 import CancelScannerSubscription as CancelScannerSubscriptionProto
+    from ibapi.protobuf.CancelFundamentalsData_pb2 import CancelFundamentalsData as CancelFundamentalsDataProto
+    from ibapi.protobuf.CancelPnL_pb2 import CancelPnL as CancelPnLProto
+    from ibapi.protobuf.CancelPnLSingle_pb2 import CancelPnLSingle as CancelPnLSingleProto
+    from ibapi.protobuf.FARequest_pb2 import FARequest as FARequestProto
+    from ibapi.protobuf.FAReplace_pb2 import FAReplace as FAReplaceProto
+    from ibapi.protobuf.ExerciseOptionsRequest_pb2 import ExerciseOptionsRequest as ExerciseOptionsRequestProto
+    from ibapi.protobuf.CalculateImpliedVolatilityRequest_pb2 import CalculateImpliedVolatilityRequest as CalculateImpliedVolatilityRequestProto
+    from ibapi.protobuf.CancelCalculateImpliedVolatility_pb2 import CancelCalculateImpliedVolatility as CancelCalculateImpliedVolatilityProto
+    from ibapi.protobuf.CalculateOptionPriceRequest_pb2 import CalculateOptionPriceRequest as CalculateOptionPriceRequestProto
+    from ibapi.protobuf.CancelCalculateOptionPrice_pb2 import CancelCalculateOptionPrice as CancelCalculateOptionPriceProto
+    from ibapi.protobuf.SecDefOptParamsRequest_pb2 import SecDefOptParamsRequest as SecDefOptParamsRequestProto
+    from ibapi.protobuf.SoftDollarTiersRequest_pb2 import SoftDollarTiersRequest as SoftDollarTiersRequestProto
+    from ibapi.protobuf.FamilyCodesRequest_pb2 import FamilyCodesRequest as FamilyCodesRequestProto
+    from ibapi.protobuf.MatchingSymbolsRequest_pb2 import MatchingSymbolsRequest as MatchingSymbolsRequestProto
+    from ibapi.protobuf.SmartComponentsRequest_pb2 import SmartComponentsRequest as SmartComponentsRequestProto
+    from ibapi.protobuf.MarketRuleRequest_pb2 import MarketRuleRequest as MarketRuleRequestProto
+    from ibapi.protobuf.UserInfoRequest_pb2 import UserInfoRequest as UserInfoRequestProto
+    from ibapi.protobuf.IdsRequest_pb2 import IdsRequest as IdsRequestProto
+    from ibapi.protobuf.CurrentTimeRequest_pb2 import CurrentTimeRequest as CurrentTimeRequestProto
+    from ibapi.protobuf.CurrentTimeInMillisRequest_pb2 import CurrentTimeInMillisRequest as CurrentTimeInMillisRequestProto
+    from ibapi.protobuf.StartApiRequest_pb2 import StartApiRequest as StartApiRequestProto
+    from ibapi.protobuf.SetServerLogLevelRequest_pb2 import SetServerLogLevelRequest as SetServerLogLevelRequestProto
+    from ibapi.protobuf.VerifyRequest_pb2 import VerifyRequest as VerifyRequestProto
+    from ibapi.protobuf.VerifyMessageRequest_pb2 import VerifyMessageRequest as VerifyMessageRequestProto
+    from ibapi.protobuf.QueryDisplayGroupsRequest_pb2 import QueryDisplayGroupsRequest as QueryDisplayGroupsRequestProto
+    from ibapi.protobuf.SubscribeToGroupEventsRequest_pb2 import SubscribeToGroupEventsRequest as SubscribeToGroupEventsRequestProto
+    from ibapi.protobuf.UpdateDisplayGroupRequest_pb2 import UpdateDisplayGroupRequest as UpdateDisplayGroupRequestProto
+    from ibapi.protobuf.UnsubscribeFromGroupEventsRequest_pb2 import UnsubscribeFromGroupEventsRequest as UnsubscribeFromGroupEventsRequestProto
+    from ibapi.protobuf.MarketDepthExchangesRequest_pb2 import MarketDepthExchangesRequest as MarketDepthExchangesRequestProto
+    from ibapi.protobuf.CancelContractData_pb2 import CancelContractData as CancelContractDataProto
+    from ibapi.protobuf.CancelHistoricalTicks_pb2 import CancelHistoricalTicks as CancelHistoricalTicksProto
+
 
 from ibapi.errors import (
     ERROR_ENCODING_PROTOBUF
@@ -113,8 +118,8 @@ from ibapi.errors import (
 from ibapi.utils import ClientException
 
 @staticmethod
-def createExecutionRequestProto(reqId: int, execFilter: ExecutionFilter) -> ExecutionRequestProto:
-    executionFilterProto = ExecutionFilterProto()
+def createExecutionRequestProto(reqId: int, execFilter: ExecutionFilter) -> "ExecutionRequestProto":
+    executionFilterProto = pb.ExecutionFilter()
     if isValidIntValue(execFilter.clientId): executionFilterProto.clientId = execFilter.clientId
     if execFilter.acctCode: executionFilterProto.acctCode = execFilter.acctCode
     if execFilter.time: executionFilterProto.time = execFilter.time
@@ -124,14 +129,14 @@ def createExecutionRequestProto(reqId: int, execFilter: ExecutionFilter) -> Exec
     if execFilter.side: executionFilterProto.side = execFilter.side
     if isValidIntValue(execFilter.lastNDays): executionFilterProto.lastNDays = execFilter.lastNDays
     if execFilter.specificDates is not None and execFilter.specificDates: executionFilterProto.specificDates.extend(execFilter.specificDates)
-    executionRequestProto = ExecutionRequestProto()
+    executionRequestProto = pb.ExecutionRequest()
     if isValidIntValue(reqId): executionRequestProto.reqId = reqId
     executionRequestProto.executionFilter.CopyFrom(executionFilterProto)
     return executionRequestProto
  
 @staticmethod
-def createPlaceOrderRequestProto(orderId: int, contract: Contract, order: Order) -> PlaceOrderRequestProto:
-    placeOrderRequestProto = PlaceOrderRequestProto()
+def createPlaceOrderRequestProto(orderId: int, contract: Contract, order: Order) -> "PlaceOrderRequestProto":
+    placeOrderRequestProto = pb.PlaceOrderRequest()
     if isValidIntValue(orderId): placeOrderRequestProto.orderId = orderId
     contractProto = createContractProto(contract, order)
     if contractProto is not None: placeOrderRequestProto.contract.CopyFrom(contractProto)
@@ -140,8 +145,8 @@ def createPlaceOrderRequestProto(orderId: int, contract: Contract, order: Order)
     return placeOrderRequestProto
 
 @staticmethod
-def createContractProto(contract: Contract, order: Order) -> ContractProto:
-    contractProto = ContractProto()
+def createContractProto(contract: Contract, order: Order) -> "ContractProto":
+    contractProto = pb.Contract()
     if isValidIntValue(contract.conId): contractProto.conId = contract.conId
     if contract.symbol: contractProto.symbol = contract.symbol
     if contract.secType: contractProto.secType = contract.secType
@@ -170,11 +175,11 @@ def createContractProto(contract: Contract, order: Order) -> ContractProto:
     return contractProto
 
 @staticmethod
-def createDeltaNeutralContractProto(contract: Contract) -> DeltaNeutralContractProto:
+def createDeltaNeutralContractProto(contract: Contract) -> "DeltaNeutralContractProto":
     deltaNeutralContractProto = None
     if contract.deltaNeutralContract is not None:
         deltaNeutralContract = contract.deltaNeutralContract
-        deltaNeutralContractProto = DeltaNeutralContractProto()
+        deltaNeutralContractProto = pb.DeltaNeutralContract()
         if isValidIntValue(deltaNeutralContract.conId): deltaNeutralContractProto.conId = deltaNeutralContract.conId
         if isValidFloatValue(deltaNeutralContract.delta): deltaNeutralContractProto.delta = deltaNeutralContract.delta
         if isValidFloatValue(deltaNeutralContract.price): deltaNeutralContractProto.price = deltaNeutralContract.price
@@ -182,7 +187,7 @@ def createDeltaNeutralContractProto(contract: Contract) -> DeltaNeutralContractP
 
 
 @staticmethod
-def createComboLegProtoList(contract: Contract, order: Order) -> list[ComboLegProto]:
+def createComboLegProtoList(contract: Contract, order: Order) -> list["ComboLegProto"]:
     comboLegs = contract.comboLegs
     orderComboLegs = order.orderComboLegs if order is not None else None 
     comboLegProtoList = []
@@ -196,8 +201,8 @@ def createComboLegProtoList(contract: Contract, order: Order) -> list[ComboLegPr
     return comboLegProtoList
 
 @staticmethod
-def createComboLegProto(comboLeg: ComboLeg, perLegPrice: float) -> ComboLegProto:
-    comboLegProto = ComboLegProto()
+def createComboLegProto(comboLeg: ComboLeg, perLegPrice: float) -> "ComboLegProto":
+    comboLegProto = pb.ComboLeg()
     if isValidIntValue(comboLeg.conId): comboLegProto.conId = comboLeg.conId
     if isValidIntValue(comboLeg.ratio): comboLegProto.ratio = comboLeg.ratio
     if comboLeg.action: comboLegProto.action = comboLeg.action
@@ -210,8 +215,8 @@ def createComboLegProto(comboLeg: ComboLeg, perLegPrice: float) -> ComboLegProto
     return comboLegProto
 
 @staticmethod
-def createOrderProto(order: Order) -> OrderProto:
-    orderProto = OrderProto()
+def createOrderProto(order: Order) -> "OrderProto":
+    orderProto = pb.Order()
     if isValidIntValue(order.clientId): order.clientId = order.clientId
     if isValidLongValue(order.permId): orderProto.permId = order.permId
     if isValidIntValue(order.parentId): orderProto.parentId = order.parentId
@@ -364,7 +369,7 @@ def createOrderProto(order: Order) -> OrderProto:
 
     return orderProto
 
-def createConditionsProto(order: Order) -> list[OrderConditionProto]:
+def createConditionsProto(order: Order) -> list["OrderConditionProto"]:
     orderConditionProtoList = []
     try:
         if order.conditions is not None and order.conditions:
@@ -392,60 +397,60 @@ def createConditionsProto(order: Order) -> list[OrderConditionProto]:
     return orderConditionProtoList
 
 @staticmethod
-def createOrderConditionProto(orderCondition: OrderCondition) -> OrderConditionProto:
+def createOrderConditionProto(orderCondition: OrderCondition) -> "OrderConditionProto":
     conditionType = orderCondition.condType
     isConjunctionConnection = orderCondition.isConjunctionConnection
-    orderConditionProto = OrderConditionProto()
+    orderConditionProto = pb.OrderCondition()
     if isValidIntValue(conditionType): orderConditionProto.type = conditionType
     orderConditionProto.isConjunctionConnection = isConjunctionConnection
     return orderConditionProto
 
 @staticmethod
-def createOperatorConditionProto(operatorCondition: OperatorCondition) -> OrderConditionProto:
+def createOperatorConditionProto(operatorCondition: OperatorCondition) -> "OrderConditionProto":
     orderConditionProto = createOrderConditionProto(operatorCondition)
-    operatorConditionProto = OrderConditionProto()
+    operatorConditionProto = pb.OrderCondition()
     operatorConditionProto.MergeFrom(orderConditionProto)
     operatorConditionProto.isMore = operatorCondition.isMore
     return operatorConditionProto
 
 @staticmethod
-def createContractConditionProto(contractCondition: ContractCondition) -> OrderConditionProto:
+def createContractConditionProto(contractCondition: ContractCondition) -> "OrderConditionProto":
     operatorConditionProto = createOperatorConditionProto(contractCondition)
-    contractConditionProto = OrderConditionProto()
+    contractConditionProto = pb.OrderCondition()
     contractConditionProto.MergeFrom(operatorConditionProto)
     if isValidIntValue(contractCondition.conId): contractConditionProto.conId = contractCondition.conId
     if contractCondition.exchange: contractConditionProto.exchange = contractCondition.exchange
     return contractConditionProto
 
 @staticmethod
-def createPriceConditionProto(priceCondition: PriceCondition) -> OrderConditionProto:
+def createPriceConditionProto(priceCondition: PriceCondition) -> "OrderConditionProto":
     contractConditionProto = createContractConditionProto(priceCondition)
-    priceConditionProto = OrderConditionProto()
+    priceConditionProto = pb.OrderCondition()
     priceConditionProto.MergeFrom(contractConditionProto)
     if isValidFloatValue(priceCondition.price): priceConditionProto.price = priceCondition.price
     if isValidIntValue(priceCondition.triggerMethod): priceConditionProto.triggerMethod = priceCondition.triggerMethod
     return priceConditionProto
 
 @staticmethod
-def createTimeConditionProto(timeCondition: TimeCondition) -> OrderConditionProto:
+def createTimeConditionProto(timeCondition: TimeCondition) -> "OrderConditionProto":
     operatorConditionProto = createOperatorConditionProto(timeCondition)
-    timeConditionProto = OrderConditionProto()
+    timeConditionProto = pb.OrderCondition()
     timeConditionProto.MergeFrom(operatorConditionProto)
     if timeCondition.time: timeConditionProto.time = timeCondition.time
     return timeConditionProto
 
 @staticmethod
-def createMarginConditionProto(marginCondition: MarginCondition) -> OrderConditionProto:
+def createMarginConditionProto(marginCondition: MarginCondition) -> "OrderConditionProto":
     operatorConditionProto = createOperatorConditionProto(marginCondition)
-    marginConditionProto = OrderConditionProto()
+    marginConditionProto = pb.OrderCondition()
     marginConditionProto.MergeFrom(operatorConditionProto)
     if isValidFloatValue(marginCondition.percent): marginConditionProto.percent = marginCondition.percent
     return marginConditionProto
 
 @staticmethod
-def createExecutionConditionProto(executionCondition: ExecutionCondition) -> OrderConditionProto:
+def createExecutionConditionProto(executionCondition: ExecutionCondition) -> "OrderConditionProto":
     orderConditionProto = createOrderConditionProto(executionCondition)
-    executionConditionProto = OrderConditionProto()
+    executionConditionProto = pb.OrderCondition()
     executionConditionProto.MergeFrom(orderConditionProto)
     if executionCondition.secType: executionConditionProto.secType = executionCondition.secType
     if executionCondition.exchange: executionConditionProto.exchange = executionCondition.exchange
@@ -453,27 +458,27 @@ def createExecutionConditionProto(executionCondition: ExecutionCondition) -> Ord
     return executionConditionProto
 
 @staticmethod
-def createVolumeConditionProto(volumeCondition: VolumeCondition) -> OrderConditionProto:
+def createVolumeConditionProto(volumeCondition: VolumeCondition) -> "OrderConditionProto":
     contractConditionProto = createContractConditionProto(volumeCondition)
-    volumeConditionProto = OrderConditionProto()
+    volumeConditionProto = pb.OrderCondition()
     volumeConditionProto.MergeFrom(contractConditionProto)
     if isValidIntValue(volumeCondition.volume): volumeConditionProto.volume = volumeCondition.volume
     return volumeConditionProto
 
 @staticmethod
-def createPercentChangeConditionProto(percentChangeCondition: PercentChangeCondition) -> OrderConditionProto:
+def createPercentChangeConditionProto(percentChangeCondition: PercentChangeCondition) -> "OrderConditionProto":
     contractConditionProto = createContractConditionProto(percentChangeCondition)
-    percentChangeConditionProto = OrderConditionProto()
+    percentChangeConditionProto = pb.OrderCondition()
     percentChangeConditionProto.MergeFrom(contractConditionProto)
     if isValidFloatValue(percentChangeCondition.changePercent): percentChangeConditionProto.changePercent = percentChangeCondition.changePercent
     return percentChangeConditionProto
 
 @staticmethod
-def createSoftDollarTierProto(order: Order) -> SoftDollarTierProto:
+def createSoftDollarTierProto(order: Order) -> "SoftDollarTierProto":
     softDollarTierProto = None
     tier = order.softDollarTier
     if tier is not None:
-        softDollarTierProto = SoftDollarTierProto()
+        softDollarTierProto = pb.SoftDollarTier()
         if tier.name: softDollarTierProto.name = tier.name
         if tier.val: softDollarTierProto.value = tier.val
         if tier.displayName: softDollarTierProto.displayName = tier.displayName
@@ -486,63 +491,63 @@ def fillTagValueList(tagValueList: list, orderProtoMap: dict):
             orderProtoMap[tagValue.tag] = tagValue.value
 
 @staticmethod
-def createCancelOrderRequestProto(orderId: int, orderCancel: OrderCancel) -> CancelOrderRequestProto:
-    cancelOrderRequestProto = CancelOrderRequestProto()
+def createCancelOrderRequestProto(orderId: int, orderCancel: OrderCancel) -> "CancelOrderRequestProto":
+    cancelOrderRequestProto = pb.CancelOrderRequest()
     if isValidIntValue(orderId): cancelOrderRequestProto.orderId = orderId
     orderCancelProto = createOrderCancelProto(orderCancel)
     if orderCancelProto is not None: cancelOrderRequestProto.orderCancel.CopyFrom(orderCancelProto)
     return cancelOrderRequestProto
 
 @staticmethod
-def createGlobalCancelRequestProto(orderCancel: OrderCancel) -> GlobalCancelRequestProto:
-    globalCancelRequestProto = GlobalCancelRequestProto()
+def createGlobalCancelRequestProto(orderCancel: OrderCancel) -> "GlobalCancelRequestProto":
+    globalCancelRequestProto = pb.GlobalCancelRequest()
     orderCancelProto = createOrderCancelProto(orderCancel)
     if orderCancelProto is not None: globalCancelRequestProto.orderCancel.CopyFrom(orderCancelProto)
     return globalCancelRequestProto
 
 @staticmethod
-def createOrderCancelProto(orderCancel: OrderCancel) -> OrderCancelProto:
+def createOrderCancelProto(orderCancel: OrderCancel) -> "OrderCancelProto":
     if orderCancel is None:
         return None
-    orderCancelProto = OrderCancelProto()
+    orderCancelProto = pb.OrderCancel()
     if orderCancel.manualOrderCancelTime: orderCancelProto.manualOrderCancelTime = orderCancel.manualOrderCancelTime
     if orderCancel.extOperator: orderCancelProto.extOperator = orderCancel.extOperator
     if isValidIntValue(orderCancel.manualOrderIndicator): orderCancelProto.manualOrderIndicator = orderCancel.manualOrderIndicator
     return orderCancelProto
 
 @staticmethod
-def createAllOpenOrdersRequestProto() -> AllOpenOrdersRequestProto:
-    allOpenOrdersRequestProto = AllOpenOrdersRequestProto()
+def createAllOpenOrdersRequestProto() -> "AllOpenOrdersRequestProto":
+    allOpenOrdersRequestProto = pb.AllOpenOrdersRequest()
     return allOpenOrdersRequestProto
 
 @staticmethod
-def createAutoOpenOrdersRequestProto(autoBind: bool) -> AutoOpenOrdersRequestProto:
-    autoOpenOrdersRequestProto = AutoOpenOrdersRequestProto()
+def createAutoOpenOrdersRequestProto(autoBind: bool) -> "AutoOpenOrdersRequestProto":
+    autoOpenOrdersRequestProto = pb.AutoOpenOrdersRequest()
     if autoBind: autoOpenOrdersRequestProto.autoBind = autoBind
     return autoOpenOrdersRequestProto
 
 @staticmethod
-def createOpenOrdersRequestProto() -> OpenOrdersRequestProto:
-    openOrdersRequestProto = OpenOrdersRequestProto()
+def createOpenOrdersRequestProto() -> "OpenOrdersRequestProto":
+    openOrdersRequestProto = pb.OpenOrdersRequest()
     return openOrdersRequestProto
 
 @staticmethod
-def createCompletedOrdersRequestProto(apiOnly: bool) -> CompletedOrdersRequestProto:
-    completedOrdersRequestProto = CompletedOrdersRequestProto()
+def createCompletedOrdersRequestProto(apiOnly: bool) -> "CompletedOrdersRequestProto":
+    completedOrdersRequestProto = pb.CompletedOrdersRequest()
     if apiOnly: completedOrdersRequestProto.apiOnly = apiOnly
     return completedOrdersRequestProto
 
 @staticmethod
-def createContractDataRequestProto(reqId: int, contract: Contract) -> ContractDataRequestProto:
-    contractDataRequestProto = ContractDataRequestProto()
+def createContractDataRequestProto(reqId: int, contract: Contract) -> "ContractDataRequestProto":
+    contractDataRequestProto = pb.ContractDataRequest()
     if isValidIntValue(reqId): contractDataRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: contractDataRequestProto.contract.CopyFrom(contractProto)
     return contractDataRequestProto
 
 @staticmethod
-def createMarketDataRequestProto(reqId: int, contract: Contract, genericTickList: str, snapshot: bool, regulatorySnapshot: bool, marketDataOptionsList: TagValueList) -> MarketDataRequestProto:
-    marketDataRequestProto = MarketDataRequestProto()
+def createMarketDataRequestProto(reqId: int, contract: Contract, genericTickList: str, snapshot: bool, regulatorySnapshot: bool, marketDataOptionsList: TagValueList) -> "MarketDataRequestProto":
+    marketDataRequestProto = pb.MarketDataRequest()
     if isValidIntValue(reqId): marketDataRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: marketDataRequestProto.contract.CopyFrom(contractProto)
@@ -553,8 +558,8 @@ def createMarketDataRequestProto(reqId: int, contract: Contract, genericTickList
     return marketDataRequestProto
 
 @staticmethod
-def createMarketDepthRequestProto(reqId: int, contract: Contract, numRows: int, isSmartDepth: bool, marketDepthOptionsList: TagValueList) -> MarketDepthRequestProto:
-    marketDepthRequestProto = MarketDepthRequestProto()
+def createMarketDepthRequestProto(reqId: int, contract: Contract, numRows: int, isSmartDepth: bool, marketDepthOptionsList: TagValueList) -> "MarketDepthRequestProto":
+    marketDepthRequestProto = pb.MarketDepthRequest()
     if isValidIntValue(reqId): marketDepthRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: marketDepthRequestProto.contract.CopyFrom(contractProto)
@@ -564,77 +569,77 @@ def createMarketDepthRequestProto(reqId: int, contract: Contract, numRows: int,
     return marketDepthRequestProto
 
 @staticmethod
-def createMarketDataTypeRequestProto(marketDataType: int) -> MarketDataTypeRequestProto:
-    marketDataTypeRequestProto = MarketDataTypeRequestProto()
+def createMarketDataTypeRequestProto(marketDataType: int) -> "MarketDataTypeRequestProto":
+    marketDataTypeRequestProto = pb.MarketDataTypeRequest()
     if isValidIntValue(marketDataType): marketDataTypeRequestProto.marketDataType = marketDataType
     return marketDataTypeRequestProto
 
 @staticmethod
-def createCancelMarketDataProto(reqId: int) -> CancelMarketDataProto:
-    cancelMarketDataProto = CancelMarketDataProto()
+def createCancelMarketDataProto(reqId: int) -> "CancelMarketDataProto":
+    cancelMarketDataProto = pb.CancelMarketData()
     if isValidIntValue(reqId): cancelMarketDataProto.reqId = reqId
     return cancelMarketDataProto
 
 @staticmethod
-def createCancelMarketDepthProto(reqId: int, isSmartDepth: bool) -> CancelMarketDepthProto:
-    cancelMarketDepthProto = CancelMarketDepthProto()
+def createCancelMarketDepthProto(reqId: int, isSmartDepth: bool) -> "CancelMarketDepthProto":
+    cancelMarketDepthProto = pb.CancelMarketDepth()
     if isValidIntValue(reqId): cancelMarketDepthProto.reqId = reqId
     if isSmartDepth: cancelMarketDepthProto.isSmartDepth = isSmartDepth
     return cancelMarketDepthProto
 
 @staticmethod
-def createAccountDataRequestProto(subscribe: bool, acctCode: str) -> AccountDataRequestProto:
-    accountDataRequestProto = AccountDataRequestProto()
+def createAccountDataRequestProto(subscribe: bool, acctCode: str) -> "AccountDataRequestProto":
+    accountDataRequestProto = pb.AccountDataRequest()
     if subscribe: accountDataRequestProto.subscribe = subscribe
     if acctCode: accountDataRequestProto.acctCode = acctCode
     return accountDataRequestProto
 
 @staticmethod
-def createManagedAccountsRequestProto() -> ManagedAccountsRequestProto:
-    managedAccountsRequestProto = ManagedAccountsRequestProto()
+def createManagedAccountsRequestProto() -> "ManagedAccountsRequestProto":
+    managedAccountsRequestProto = pb.ManagedAccountsRequest()
     return managedAccountsRequestProto
 
 @staticmethod
-def createPositionsRequestProto() -> PositionsRequestProto:
-    positionsRequestProto = PositionsRequestProto()
+def createPositionsRequestProto() -> "PositionsRequestProto":
+    positionsRequestProto = pb.PositionsRequest()
     return positionsRequestProto
 
 @staticmethod
-def createCancelPositionsRequestProto() -> CancelPositionsProto:
-    cancelPositionsProto = CancelPositionsProto()
+def createCancelPositionsRequestProto() -> "CancelPositionsProto":
+    cancelPositionsProto = pb.CancelPositions()
     return cancelPositionsProto
 
 @staticmethod
-def createAccountSummaryRequestProto(reqId: int, group: str, tags: str) -> AccountSummaryRequestProto:
-    accountSummaryRequestProto = AccountSummaryRequestProto()
+def createAccountSummaryRequestProto(reqId: int, group: str, tags: str) -> "AccountSummaryRequestProto":
+    accountSummaryRequestProto = pb.AccountSummaryRequest()
     if isValidIntValue(reqId): accountSummaryRequestProto.reqId = reqId
     if group: accountSummaryRequestProto.group = group
     if tags: accountSummaryRequestProto.tags = tags
     return accountSummaryRequestProto
 
 @staticmethod
-def createCancelAccountSummaryRequestProto(reqId: int) -> CancelAccountSummaryProto:
-    cancelAccountSummaryProto = CancelAccountSummaryProto()
+def createCancelAccountSummaryRequestProto(reqId: int) -> "CancelAccountSummaryProto":
+    cancelAccountSummaryProto = pb.CancelAccountSummary()
     if isValidIntValue(reqId): cancelAccountSummaryProto.reqId = reqId
     return cancelAccountSummaryProto
 
 @staticmethod
-def createPositionsMultiRequestProto(reqId: int, account: str, modelCode: str) -> PositionsMultiRequestProto:
-    positionsMultiRequestProto = PositionsMultiRequestProto()
+def createPositionsMultiRequestProto(reqId: int, account: str, modelCode: str) -> "PositionsMultiRequestProto":
+    positionsMultiRequestProto = pb.PositionsMultiRequest()
     if isValidIntValue(reqId): positionsMultiRequestProto.reqId = reqId
     if account: positionsMultiRequestProto.account = account
     if modelCode: positionsMultiRequestProto.modelCode = modelCode
     return positionsMultiRequestProto
 
 @staticmethod
-def createCancelPositionsMultiRequestProto(reqId: int) -> CancelPositionsMultiProto:
-    cancelPositionsMultiProto = CancelPositionsMultiProto()
+def createCancelPositionsMultiRequestProto(reqId: int) -> "CancelPositionsMultiProto":
+    cancelPositionsMultiProto = pb.CancelPositionsMulti()
     if isValidIntValue(reqId): cancelPositionsMultiProto.reqId = reqId
     return cancelPositionsMultiProto
 
 @staticmethod
-def createAccountUpdatesMultiRequestProto(reqId: int, account: str, modelCode: str, ledgerAndNLV: bool) -> AccountUpdatesMultiRequestProto:
-    accountUpdatesMultiRequestProto = AccountUpdatesMultiRequestProto()
+def createAccountUpdatesMultiRequestProto(reqId: int, account: str, modelCode: str, ledgerAndNLV: bool) -> "AccountUpdatesMultiRequestProto":
+    accountUpdatesMultiRequestProto = pb.AccountUpdatesMultiRequest()
     if isValidIntValue(reqId): accountUpdatesMultiRequestProto.reqId = reqId
     if account: accountUpdatesMultiRequestProto.account = account
     if modelCode: accountUpdatesMultiRequestProto.modelCode = modelCode
@@ -642,15 +647,15 @@ def createAccountUpdatesMultiRequestProto(reqId: int, account: str, modelCode: s
     return accountUpdatesMultiRequestProto
 
 @staticmethod
-def createCancelAccountUpdatesMultiRequestProto(reqId: int) -> CancelAccountUpdatesMultiProto:
-    cancelAccountUpdatesMultiProto = CancelAccountUpdatesMultiProto()
+def createCancelAccountUpdatesMultiRequestProto(reqId: int) -> "CancelAccountUpdatesMultiProto":
+    cancelAccountUpdatesMultiProto = pb.CancelAccountUpdatesMulti()
     if isValidIntValue(reqId): cancelAccountUpdatesMultiProto.reqId = reqId
     return cancelAccountUpdatesMultiProto
 
 @staticmethod
 def createHistoricalDataRequestProto(reqId: int, contract: Contract, endDateTime: str, duration: str, barSizeSetting: str, whatToShow: str, useRTH: bool, formatDate: int,
-                                    keepUpToDate: bool, chartOptionsList: TagValueList) -> HistoricalDataRequestProto:
-    historicalDataRequestProto = HistoricalDataRequestProto()
+                                    keepUpToDate: bool, chartOptionsList: TagValueList) -> "HistoricalDataRequestProto":
+    historicalDataRequestProto = pb.HistoricalDataRequest()
     if isValidIntValue(reqId): historicalDataRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: historicalDataRequestProto.contract.CopyFrom(contractProto)
@@ -665,8 +670,8 @@ def createHistoricalDataRequestProto(reqId: int, contract: Contract, endDateTime
     return historicalDataRequestProto
 
 @staticmethod
-def createRealTimeBarsRequestProto(reqId: int, contract: Contract, barSize: int, whatToShow: str, useRTH: bool, realTimeBarsOptionsList: TagValueList) -> RealTimeBarsRequestProto:
-    realTimeBarsRequestProto = RealTimeBarsRequestProto()
+def createRealTimeBarsRequestProto(reqId: int, contract: Contract, barSize: int, whatToShow: str, useRTH: bool, realTimeBarsOptionsList: TagValueList) -> "RealTimeBarsRequestProto":
+    realTimeBarsRequestProto = pb.RealTimeBarsRequest()
     if isValidIntValue(reqId): realTimeBarsRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: realTimeBarsRequestProto.contract.CopyFrom(contractProto)
@@ -677,8 +682,8 @@ def createRealTimeBarsRequestProto(reqId: int, contract: Contract, barSize: int,
     return realTimeBarsRequestProto
 
 @staticmethod
-def createHeadTimestampRequestProto(reqId: int, contract: Contract, whatToShow: str, useRTH: bool, formatDate: int) -> HeadTimestampRequestProto:
-    headTimestampRequestProto = HeadTimestampRequestProto()
+def createHeadTimestampRequestProto(reqId: int, contract: Contract, whatToShow: str, useRTH: bool, formatDate: int) -> "HeadTimestampRequestProto":
+    headTimestampRequestProto = pb.HeadTimestampRequest()
     if isValidIntValue(reqId): headTimestampRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: headTimestampRequestProto.contract.CopyFrom(contractProto)
@@ -688,8 +693,8 @@ def createHeadTimestampRequestProto(reqId: int, contract: Contract, whatToShow:
     return headTimestampRequestProto
 
 @staticmethod
-def createHistogramDataRequestProto(reqId: int, contract: Contract, useRTH: bool, timePeriod: str) -> HistogramDataRequestProto:
-    histogramDataRequestProto = HistogramDataRequestProto()
+def createHistogramDataRequestProto(reqId: int, contract: Contract, useRTH: bool, timePeriod: str) -> "HistogramDataRequestProto":
+    histogramDataRequestProto = pb.HistogramDataRequest()
     if isValidIntValue(reqId): histogramDataRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: histogramDataRequestProto.contract.CopyFrom(contractProto)
@@ -699,8 +704,8 @@ def createHistogramDataRequestProto(reqId: int, contract: Contract, useRTH: bool
 
 @staticmethod
 def createHistoricalTicksRequestProto(reqId: int, contract: Contract, startDateTime: str, endDateTime: str, numberOfTicks: int, whatToShow: str, useRTH: bool, ignoreSize: bool,
-                                     miscOptionsList: TagValueList) -> HistoricalTicksRequestProto:
-    historicalTicksRequestProto = HistoricalTicksRequestProto()
+                                     miscOptionsList: TagValueList) -> "HistoricalTicksRequestProto":
+    historicalTicksRequestProto = pb.HistoricalTicksRequest()
     if isValidIntValue(reqId): historicalTicksRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: historicalTicksRequestProto.contract.CopyFrom(contractProto)
@@ -714,8 +719,8 @@ def createHistoricalTicksRequestProto(reqId: int, contract: Contract, startDateT
     return historicalTicksRequestProto
 
 @staticmethod
-def createTickByTickRequestProto(reqId: int, contract: Contract, tickType: str, numberOfTicks: int, ignoreSize: bool) -> TickByTickRequestProto:
-    tickByTickRequestProto = TickByTickRequestProto()
+def createTickByTickRequestProto(reqId: int, contract: Contract, tickType: str, numberOfTicks: int, ignoreSize: bool) -> "TickByTickRequestProto":
+    tickByTickRequestProto = pb.TickByTickRequest()
     if isValidIntValue(reqId): tickByTickRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: tickByTickRequestProto.contract.CopyFrom(contractProto)
@@ -725,49 +730,49 @@ def createTickByTickRequestProto(reqId: int, contract: Contract, tickType: str,
     return tickByTickRequestProto
 
 @staticmethod
-def createCancelHistoricalDataProto(reqId: int) -> CancelHistoricalDataProto:
-    cancelHistoricalDataProto = CancelHistoricalDataProto()
+def createCancelHistoricalDataProto(reqId: int) -> "CancelHistoricalDataProto":
+    cancelHistoricalDataProto = pb.CancelHistoricalData()
     if isValidIntValue(reqId): cancelHistoricalDataProto.reqId = reqId
     return cancelHistoricalDataProto
 
 @staticmethod
-def createCancelRealTimeBarsProto(reqId: int) -> CancelRealTimeBarsProto:
-    cancelRealTimeBarsProto = CancelRealTimeBarsProto()
+def createCancelRealTimeBarsProto(reqId: int) -> "CancelRealTimeBarsProto":
+    cancelRealTimeBarsProto = pb.CancelRealTimeBars()
     if isValidIntValue(reqId): cancelRealTimeBarsProto.reqId = reqId
     return cancelRealTimeBarsProto
 
 @staticmethod
-def createCancelHeadTimestampProto(reqId: int) -> CancelHeadTimestampProto:
-    cancelHeadTimestampProto = CancelHeadTimestampProto()
+def createCancelHeadTimestampProto(reqId: int) -> "CancelHeadTimestampProto":
+    cancelHeadTimestampProto = pb.CancelHeadTimestamp()
     if isValidIntValue(reqId): cancelHeadTimestampProto.reqId = reqId
     return cancelHeadTimestampProto
 
 @staticmethod
-def createCancelHistogramDataProto(reqId: int) -> CancelHistogramDataProto:
-    cancelHistogramDataProto = CancelHistogramDataProto()
+def createCancelHistogramDataProto(reqId: int) -> "CancelHistogramDataProto":
+    cancelHistogramDataProto = pb.CancelHistogramData()
     if isValidIntValue(reqId): cancelHistogramDataProto.reqId = reqId
     return cancelHistogramDataProto
 
 @staticmethod
-def createCancelTickByTickProto(reqId: int) -> CancelTickByTickProto:
-    cancelTickByTickProto = CancelTickByTickProto()
+def createCancelTickByTickProto(reqId: int) -> "CancelTickByTickProto":
+    cancelTickByTickProto = pb.CancelTickByTick()
     if isValidIntValue(reqId): cancelTickByTickProto.reqId = reqId
     return cancelTickByTickProto
 
 @staticmethod
-def createNewsBulletinsRequestProto(allMessages: bool) -> NewsBulletinsRequestProto:
-    newsBulletinsRequestProto = NewsBulletinsRequestProto()
+def createNewsBulletinsRequestProto(allMessages: bool) -> "NewsBulletinsRequestProto":
+    newsBulletinsRequestProto = pb.NewsBulletinsRequest()
     if (allMessages): newsBulletinsRequestProto.allMessages = allMessages
     return newsBulletinsRequestProto
 
 @staticmethod
-def createCancelNewsBulletinsProto() -> CancelNewsBulletinsProto:
-    cancelNewsBulletinsProto = CancelNewsBulletinsProto()
+def createCancelNewsBulletinsProto() -> "CancelNewsBulletinsProto":
+    cancelNewsBulletinsProto = pb.CancelNewsBulletins()
     return cancelNewsBulletinsProto
 
 @staticmethod
-def createNewsArticleRequestProto(reqId: int, providerCode: str, articleId: str, newsArticleOptionsList: TagValueList) -> NewsArticleRequestProto:
-    newsArticleRequestProto = NewsArticleRequestProto()
+def createNewsArticleRequestProto(reqId: int, providerCode: str, articleId: str, newsArticleOptionsList: TagValueList) -> "NewsArticleRequestProto":
+    newsArticleRequestProto = pb.NewsArticleRequest()
     if isValidIntValue(reqId): newsArticleRequestProto.reqId = reqId
     if providerCode: newsArticleRequestProto.providerCode = providerCode
     if articleId: newsArticleRequestProto.articleId = articleId
@@ -775,13 +780,13 @@ def createNewsArticleRequestProto(reqId: int, providerCode: str, articleId: str,
     return newsArticleRequestProto
 
 @staticmethod
-def createNewsProvidersRequestProto() -> NewsProvidersRequestProto:
-    newsProvidersRequestProto = NewsProvidersRequestProto()
+def createNewsProvidersRequestProto() -> "NewsProvidersRequestProto":
+    newsProvidersRequestProto = pb.NewsProvidersRequest()
     return newsProvidersRequestProto
 
 @staticmethod
-def createHistoricalNewsRequestProto(reqId: int, conId: int, providerCodes: str, startDateTime: str, endDateTime: str, totalResults: int, historicalNewsOptionsList: TagValueList) -> HistoricalNewsRequestProto:
-    historicalNewsRequestProto = HistoricalNewsRequestProto()
+def createHistoricalNewsRequestProto(reqId: int, conId: int, providerCodes: str, startDateTime: str, endDateTime: str, totalResults: int, historicalNewsOptionsList: TagValueList) -> "HistoricalNewsRequestProto":
+    historicalNewsRequestProto = pb.HistoricalNewsRequest()
     if isValidIntValue(reqId): historicalNewsRequestProto.reqId = reqId
     if isValidIntValue(conId): historicalNewsRequestProto.conId = conId
     if providerCodes: historicalNewsRequestProto.providerCodes = providerCodes
@@ -792,20 +797,20 @@ def createHistoricalNewsRequestProto(reqId: int, conId: int, providerCodes: str,
     return historicalNewsRequestProto
 
 @staticmethod
-def createWshMetaDataRequestProto(reqId: int) -> WshMetaDataRequestProto:
-    wshMetaDataRequestProto = WshMetaDataRequestProto()
+def createWshMetaDataRequestProto(reqId: int) -> "WshMetaDataRequestProto":
+    wshMetaDataRequestProto = pb.WshMetaDataRequest()
     if isValidIntValue(reqId): wshMetaDataRequestProto.reqId = reqId
     return wshMetaDataRequestProto
 
 @staticmethod
-def createCancelWshMetaDataProto(reqId: int) -> CancelWshMetaDataProto:
-    cancelWshMetaDataProto = CancelWshMetaDataProto()
+def createCancelWshMetaDataProto(reqId: int) -> "CancelWshMetaDataProto":
+    cancelWshMetaDataProto = pb.CancelWshMetaData()
     if isValidIntValue(reqId): cancelWshMetaDataProto.reqId = reqId
     return cancelWshMetaDataProto
 
 @staticmethod
-def createWshEventDataRequestProto(reqId: int, wshEventData: WshEventData) -> WshEventDataRequestProto:
-    wshEventDataRequestProto = WshEventDataRequestProto()
+def createWshEventDataRequestProto(reqId: int, wshEventData: WshEventData) -> "WshEventDataRequestProto":
+    wshEventDataRequestProto = pb.WshEventDataRequest()
     if isValidIntValue(reqId): wshEventDataRequestProto.reqId = reqId
     
     if wshEventData is not None:
@@ -821,20 +826,20 @@ def createWshEventDataRequestProto(reqId: int, wshEventData: WshEventData) -> Ws
     return wshEventDataRequestProto
 
 @staticmethod
-def createCancelWshEventDataProto(reqId: int) -> CancelWshEventDataProto:
-    cancelWshEventDataProto = CancelWshEventDataProto()
+def createCancelWshEventDataProto(reqId: int) -> "CancelWshEventDataProto":
+    cancelWshEventDataProto = pb.CancelWshEventData()
     if isValidIntValue(reqId): cancelWshEventDataProto.reqId = reqId
     return cancelWshEventDataProto
 
 @staticmethod
-def createScannerParametersRequestProto() -> ScannerParametersRequestProto:
-    scannerParametersRequestProto = ScannerParametersRequestProto()
+def createScannerParametersRequestProto() -> "ScannerParametersRequestProto":
+    scannerParametersRequestProto = pb.ScannerParametersRequest()
     return scannerParametersRequestProto
 
 @staticmethod
 def createScannerSubscriptionRequestProto(reqId: int, subscription: ScannerSubscription, 
-        scannerSubscriptionOptionsList: TagValueList, scannerSubscriptionFilterOptionsList: TagValueList) -> ScannerSubscriptionRequestProto:
-    scannerSubscriptionRequestProto = ScannerSubscriptionRequestProto()
+        scannerSubscriptionOptionsList: TagValueList, scannerSubscriptionFilterOptionsList: TagValueList) -> "ScannerSubscriptionRequestProto":
+    scannerSubscriptionRequestProto = pb.ScannerSubscriptionRequest()
     if isValidIntValue(reqId): scannerSubscriptionRequestProto.reqId = reqId
     scannerSubscriptionProto = createScannerSubscriptionProto(subscription, scannerSubscriptionOptionsList, scannerSubscriptionFilterOptionsList)
     if scannerSubscriptionProto is not None: scannerSubscriptionRequestProto.scannerSubscription.CopyFrom(scannerSubscriptionProto)
@@ -842,10 +847,10 @@ def createScannerSubscriptionRequestProto(reqId: int, subscription: ScannerSubsc
 
 @staticmethod
 def createScannerSubscriptionProto(subscription: ScannerSubscription, 
-        scannerSubscriptionOptionsList: TagValueList, scannerSubscriptionFilterOptionsList: TagValueList) -> ScannerSubscriptionProto:
+        scannerSubscriptionOptionsList: TagValueList, scannerSubscriptionFilterOptionsList: TagValueList) -> "ScannerSubscriptionProto":
     if subscription is None:
         return None
-    scannerSubscriptionProto = ScannerSubscriptionProto()
+    scannerSubscriptionProto = pb.ScannerSubscription()
     if isValidIntValue(subscription.numberOfRows): scannerSubscriptionProto.numberOfRows = subscription.numberOfRows
     if subscription.instrument: scannerSubscriptionProto.instrument = subscription.instrument
     if subscription.locationCode: scannerSubscriptionProto.locationCode = subscription.locationCode
@@ -872,8 +877,8 @@ def createScannerSubscriptionProto(subscription: ScannerSubscription,
     return scannerSubscriptionProto
 
 @staticmethod
-def createFundamentalsDataRequestProto(reqId: int, contract: Contract, reportType: str, fundamentalsDataOptionsList: TagValueList) -> FundamentalsDataRequestProto:
-    fundamentalsDataRequestProto = FundamentalsDataRequestProto()
+def createFundamentalsDataRequestProto(reqId: int, contract: Contract, reportType: str, fundamentalsDataOptionsList: TagValueList) -> "FundamentalsDataRequestProto":
+    fundamentalsDataRequestProto = pb.FundamentalsDataRequest()
     if isValidIntValue(reqId): fundamentalsDataRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: fundamentalsDataRequestProto.contract.CopyFrom(contractProto)
@@ -882,16 +887,16 @@ def createFundamentalsDataRequestProto(reqId: int, contract: Contract, reportTyp
     return fundamentalsDataRequestProto
 
 @staticmethod
-def createPnLRequestProto(reqId: int, account: str, modelCode: str) -> PnLRequestProto:
-    pnlRequestProto = PnLRequestProto()
+def createPnLRequestProto(reqId: int, account: str, modelCode: str) -> "PnLRequestProto":
+    pnlRequestProto = pb.PnLRequest()
     if isValidIntValue(reqId): pnlRequestProto.reqId = reqId
     if account: pnlRequestProto.account = account
     if modelCode: pnlRequestProto.modelCode = modelCode
     return pnlRequestProto
 
 @staticmethod
-def createPnLSingleRequestProto(reqId: int, account: str, modelCode: str, conId: int) -> PnLSingleRequestProto:
-    pnlSingleRequestProto = PnLSingleRequestProto()
+def createPnLSingleRequestProto(reqId: int, account: str, modelCode: str, conId: int) -> "PnLSingleRequestProto":
+    pnlSingleRequestProto = pb.PnLSingleRequest()
     if isValidIntValue(reqId): pnlSingleRequestProto.reqId = reqId
     if account: pnlSingleRequestProto.account = account
     if modelCode: pnlSingleRequestProto.modelCode = modelCode
@@ -899,38 +904,38 @@ def createPnLSingleRequestProto(reqId: int, account: str, modelCode: str, conId:
     return pnlSingleRequestProto
 
 @staticmethod
-def createCancelScannerSubscriptionProto(reqId: int) -> CancelScannerSubscriptionProto:
-    cancelScannerSubscriptionProto = CancelScannerSubscriptionProto()
+def createCancelScannerSubscriptionProto(reqId: int) -> "CancelScannerSubscriptionProto":
+    cancelScannerSubscriptionProto = pb.CancelScannerSubscription()
     if isValidIntValue(reqId): cancelScannerSubscriptionProto.reqId = reqId
     return cancelScannerSubscriptionProto
 
 @staticmethod
-def createCancelFundamentalsDataProto(reqId: int) -> CancelFundamentalsDataProto:
-    cancelFundamentalsDataProto = CancelFundamentalsDataProto()
+def createCancelFundamentalsDataProto(reqId: int) -> "CancelFundamentalsDataProto":
+    cancelFundamentalsDataProto = pb.CancelFundamentalsData()
     if isValidIntValue(reqId): cancelFundamentalsDataProto.reqId = reqId
     return cancelFundamentalsDataProto
 
 @staticmethod
-def createCancelPnLProto(reqId: int) -> CancelPnLProto:
-    cancelPnLProto = CancelPnLProto()
+def createCancelPnLProto(reqId: int) -> "CancelPnLProto":
+    cancelPnLProto = pb.CancelPnL()
     if isValidIntValue(reqId): cancelPnLProto.reqId = reqId
     return cancelPnLProto
 
 @staticmethod
-def createCancelPnLSingleProto(reqId: int) -> CancelPnLSingleProto:
-    cancelPnLSingleProto = CancelPnLSingleProto()
+def createCancelPnLSingleProto(reqId: int) -> "CancelPnLSingleProto":
+    cancelPnLSingleProto = pb.CancelPnLSingle()
     if isValidIntValue(reqId): cancelPnLSingleProto.reqId = reqId
     return cancelPnLSingleProto
 
 @staticmethod
-def createFARequestProto(faDataType: int) -> FARequestProto:
-    faRequestProto = FARequestProto()
+def createFARequestProto(faDataType: int) -> "FARequestProto":
+    faRequestProto = pb.FARequest()
     if isValidIntValue(faDataType): faRequestProto.faDataType = faDataType
     return faRequestProto
 
 @staticmethod
-def createFAReplaceProto(reqId: int, faDataType: int, xml: str) -> FAReplaceProto:
-    faReplaceProto = FAReplaceProto()
+def createFAReplaceProto(reqId: int, faDataType: int, xml: str) -> "FAReplaceProto":
+    faReplaceProto = pb.FAReplace()
     if isValidIntValue(reqId): faReplaceProto.reqId = reqId
     if isValidIntValue(faDataType): faReplaceProto.faDataType = faDataType
     if xml: faReplaceProto.xml = xml
@@ -938,8 +943,8 @@ def createFAReplaceProto(reqId: int, faDataType: int, xml: str) -> FAReplaceProt
 
 @staticmethod
 def createExerciseOptionsRequestProto(orderId: int, contract: Contract, exerciseAction: int, exerciseQuantity: int, account: str, override: bool,
-        manualOrderTime: str, customerAccount: str, professionalCustomer: bool) -> ExerciseOptionsRequestProto:
-    exerciseOptionsRequestProto = ExerciseOptionsRequestProto()
+        manualOrderTime: str, customerAccount: str, professionalCustomer: bool) -> "ExerciseOptionsRequestProto":
+    exerciseOptionsRequestProto = pb.ExerciseOptionsRequest()
     if isValidIntValue(orderId): exerciseOptionsRequestProto.orderId = orderId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: exerciseOptionsRequestProto.contract.CopyFrom(contractProto)
@@ -953,8 +958,8 @@ def createExerciseOptionsRequestProto(orderId: int, contract: Contract, exercise
     return exerciseOptionsRequestProto
 
 @staticmethod
-def createCalculateImpliedVolatilityRequestProto(reqId: int, contract: Contract, optionPrice: float, underPrice: float, impliedVolatilityOptionsList: TagValueList) -> CalculateImpliedVolatilityRequestProto:
-    calculateImpliedVolatilityRequestProto = CalculateImpliedVolatilityRequestProto()
+def createCalculateImpliedVolatilityRequestProto(reqId: int, contract: Contract, optionPrice: float, underPrice: float, impliedVolatilityOptionsList: TagValueList) -> "CalculateImpliedVolatilityRequestProto":
+    calculateImpliedVolatilityRequestProto = pb.CalculateImpliedVolatilityRequest()
     if isValidIntValue(reqId): calculateImpliedVolatilityRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: calculateImpliedVolatilityRequestProto.contract.CopyFrom(contractProto)
@@ -964,14 +969,14 @@ def createCalculateImpliedVolatilityRequestProto(reqId: int, contract: Contract,
     return calculateImpliedVolatilityRequestProto
 
 @staticmethod
-def createCancelCalculateImpliedVolatilityProto(reqId: int) -> CancelCalculateImpliedVolatilityProto:
-    cancelCalculateImpliedVolatilityProto = CancelCalculateImpliedVolatilityProto()
+def createCancelCalculateImpliedVolatilityProto(reqId: int) -> "CancelCalculateImpliedVolatilityProto":
+    cancelCalculateImpliedVolatilityProto = pb.CancelCalculateImpliedVolatility()
     if isValidIntValue(reqId): cancelCalculateImpliedVolatilityProto.reqId = reqId
     return cancelCalculateImpliedVolatilityProto
 
 @staticmethod
-def createCalculateOptionPriceRequestProto(reqId: int, contract: Contract, volatility: float, underPrice: float, optionPriceOptionsList: TagValueList) -> CalculateOptionPriceRequestProto:
-    calculateOptionPriceRequestProto = CalculateOptionPriceRequestProto()
+def createCalculateOptionPriceRequestProto(reqId: int, contract: Contract, volatility: float, underPrice: float, optionPriceOptionsList: TagValueList) -> "CalculateOptionPriceRequestProto":
+    calculateOptionPriceRequestProto = pb.CalculateOptionPriceRequest()
     if isValidIntValue(reqId): calculateOptionPriceRequestProto.reqId = reqId
     contractProto = createContractProto(contract, None)
     if contractProto is not None: calculateOptionPriceRequestProto.contract.CopyFrom(contractProto)
@@ -981,14 +986,14 @@ def createCalculateOptionPriceRequestProto(reqId: int, contract: Contract, volat
     return calculateOptionPriceRequestProto
 
 @staticmethod
-def createCancelCalculateOptionPriceProto(reqId: int) -> CancelCalculateOptionPriceProto:
-    cancelCalculateOptionPriceProto = CancelCalculateOptionPriceProto()
+def createCancelCalculateOptionPriceProto(reqId: int) -> "CancelCalculateOptionPriceProto":
+    cancelCalculateOptionPriceProto = pb.CancelCalculateOptionPrice()
     if isValidIntValue(reqId): cancelCalculateOptionPriceProto.reqId = reqId
     return cancelCalculateOptionPriceProto
 
 @staticmethod
-def createSecDefOptParamsRequestProto(reqId: int, underlyingSymbol: str, futFopExchange: str, underlyingSecType: str, underlyingConId: int) -> SecDefOptParamsRequestProto:
-    secDefOptParamsRequestProto = SecDefOptParamsRequestProto()
+def createSecDefOptParamsRequestProto(reqId: int, underlyingSymbol: str, futFopExchange: str, underlyingSecType: str, underlyingConId: int) -> "SecDefOptParamsRequestProto":
+    secDefOptParamsRequestProto = pb.SecDefOptParamsRequest()
     if isValidIntValue(reqId): secDefOptParamsRequestProto.reqId = reqId
     if underlyingSymbol: secDefOptParamsRequestProto.underlyingSymbol = underlyingSymbol
     if futFopExchange: secDefOptParamsRequestProto.futFopExchange = futFopExchange
@@ -997,123 +1002,123 @@ def createSecDefOptParamsRequestProto(reqId: int, underlyingSymbol: str, futFopE
     return secDefOptParamsRequestProto
 
 @staticmethod
-def createSoftDollarTiersRequestProto(reqId: int) -> SoftDollarTiersRequestProto:
-    softDollarTiersRequestProto = SoftDollarTiersRequestProto()
+def createSoftDollarTiersRequestProto(reqId: int) -> "SoftDollarTiersRequestProto":
+    softDollarTiersRequestProto = pb.SoftDollarTiersRequest()
     if isValidIntValue(reqId): softDollarTiersRequestProto.reqId = reqId
     return softDollarTiersRequestProto
 
 @staticmethod
-def createFamilyCodesRequestProto() -> FamilyCodesRequestProto:
-    familyCodesRequestProto = FamilyCodesRequestProto()
+def createFamilyCodesRequestProto() -> "FamilyCodesRequestProto":
+    familyCodesRequestProto = pb.FamilyCodesRequest()
     return familyCodesRequestProto
 
 @staticmethod
-def createMatchingSymbolsRequestProto(reqId: int, pattern: str) -> MatchingSymbolsRequestProto:
-    matchingSymbolsRequestProto = MatchingSymbolsRequestProto()
+def createMatchingSymbolsRequestProto(reqId: int, pattern: str) -> "MatchingSymbolsRequestProto":
+    matchingSymbolsRequestProto = pb.MatchingSymbolsRequest()
     if isValidIntValue(reqId): matchingSymbolsRequestProto.reqId = reqId
     if pattern: matchingSymbolsRequestProto.pattern = pattern
     return matchingSymbolsRequestProto
 
 @staticmethod
-def createSmartComponentsRequestProto(reqId: int, bboExchange: str) -> SmartComponentsRequestProto:
-    smartComponentsRequestProto = SmartComponentsRequestProto()
+def createSmartComponentsRequestProto(reqId: int, bboExchange: str) -> "SmartComponentsRequestProto":
+    smartComponentsRequestProto = pb.SmartComponentsRequest()
     if isValidIntValue(reqId): smartComponentsRequestProto.reqId = reqId
     if bboExchange: smartComponentsRequestProto.bboExchange = bboExchange
     return smartComponentsRequestProto
 
 @staticmethod
-def createMarketRuleRequestProto(marketRuleId: int) -> MarketRuleRequestProto:
-    marketRuleRequestProto = MarketRuleRequestProto()
+def createMarketRuleRequestProto(marketRuleId: int) -> "MarketRuleRequestProto":
+    marketRuleRequestProto = pb.MarketRuleRequest()
     if isValidIntValue(marketRuleId): marketRuleRequestProto.marketRuleId = marketRuleId
     return marketRuleRequestProto
 
 @staticmethod
-def createUserInfoRequestProto(reqId: int) -> UserInfoRequestProto:
-    userInfoRequestProto = UserInfoRequestProto()
+def createUserInfoRequestProto(reqId: int) -> "UserInfoRequestProto":
+    userInfoRequestProto = pb.UserInfoRequest()
     if isValidIntValue(reqId): userInfoRequestProto.reqId = reqId
     return userInfoRequestProto
 
 @staticmethod
-def createIdsRequestProto(numIds: int) -> IdsRequestProto:
-    idsRequestProto = IdsRequestProto()
+def createIdsRequestProto(numIds: int) -> "IdsRequestProto":
+    idsRequestProto = pb.IdsRequest()
     if isValidIntValue(numIds): idsRequestProto.numIds = numIds
     return idsRequestProto
 
 @staticmethod
-def createCurrentTimeRequestProto() -> CurrentTimeRequestProto:
-    currentTimeRequestProto = CurrentTimeRequestProto()
+def createCurrentTimeRequestProto() -> "CurrentTimeRequestProto":
+    currentTimeRequestProto = pb.CurrentTimeRequest()
     return currentTimeRequestProto
 
 @staticmethod
-def createCurrentTimeInMillisRequestProto() -> CurrentTimeInMillisRequestProto:
-    currentTimeInMillisRequestProto = CurrentTimeInMillisRequestProto()
+def createCurrentTimeInMillisRequestProto() -> "CurrentTimeInMillisRequestProto":
+    currentTimeInMillisRequestProto = pb.CurrentTimeInMillisRequest()
     return currentTimeInMillisRequestProto
 
 @staticmethod
-def createStartApiRequestProto(clientId: int, optionalCapabilities: str) -> StartApiRequestProto:
-    startApiRequestProto = StartApiRequestProto()
+def createStartApiRequestProto(clientId: int, optionalCapabilities: str) -> "StartApiRequestProto":
+    startApiRequestProto = pb.StartApiRequest()
     if isValidIntValue(clientId): startApiRequestProto.clientId = clientId
     if optionalCapabilities: startApiRequestProto.optionalCapabilities = optionalCapabilities
     return startApiRequestProto
 
 @staticmethod
-def createSetServerLogLevelRequestProto(logLevel: int) -> SetServerLogLevelRequestProto:
-    setServerLogLevelRequestProto = SetServerLogLevelRequestProto()
+def createSetServerLogLevelRequestProto(logLevel: int) -> "SetServerLogLevelRequestProto":
+    setServerLogLevelRequestProto = pb.SetServerLogLevelRequest()
     if isValidIntValue(logLevel): setServerLogLevelRequestProto.logLevel = logLevel
     return setServerLogLevelRequestProto
 
 @staticmethod
-def createVerifyRequestProto(apiName: str, apiVersion: str) -> VerifyRequestProto:
-    verifyRequestProto = VerifyRequestProto()
+def createVerifyRequestProto(apiName: str, apiVersion: str) -> "VerifyRequestProto":
+    verifyRequestProto = pb.VerifyRequest()
     if apiName: verifyRequestProto.apiName = apiName
     if apiVersion: verifyRequestProto.apiVersion = apiVersion
     return verifyRequestProto
 
 @staticmethod
-def createVerifyMessageRequestProto(apiData: str) -> VerifyMessageRequestProto:
-    verifyMessageRequestProto = VerifyMessageRequestProto()
+def createVerifyMessageRequestProto(apiData: str) -> "VerifyMessageRequestProto":
+    verifyMessageRequestProto = pb.VerifyMessageRequest()
     if apiData: verifyMessageRequestProto.apiData = apiData
     return verifyMessageRequestProto
 
 @staticmethod
-def createQueryDisplayGroupsRequestProto(reqId: int) -> QueryDisplayGroupsRequestProto:
-    queryDisplayGroupsRequestProto = QueryDisplayGroupsRequestProto()
+def createQueryDisplayGroupsRequestProto(reqId: int) -> "QueryDisplayGroupsRequestProto":
+    queryDisplayGroupsRequestProto = pb.QueryDisplayGroupsRequest()
     if isValidIntValue(reqId): queryDisplayGroupsRequestProto.reqId = reqId
     return queryDisplayGroupsRequestProto
 
 @staticmethod
-def createSubscribeToGroupEventsRequestProto(reqId: int, groupId: int) -> SubscribeToGroupEventsRequestProto:
-    subscribeToGroupEventsRequestProto = SubscribeToGroupEventsRequestProto()
+def createSubscribeToGroupEventsRequestProto(reqId: int, groupId: int) -> "SubscribeToGroupEventsRequestProto":
+    subscribeToGroupEventsRequestProto = pb.SubscribeToGroupEventsRequest()
     if isValidIntValue(reqId): subscribeToGroupEventsRequestProto.reqId = reqId
     if isValidIntValue(groupId): subscribeToGroupEventsRequestProto.groupId = groupId
     return subscribeToGroupEventsRequestProto
 
 @staticmethod
-def createUpdateDisplayGroupRequestProto(reqId: int, contractInfo: str) -> UpdateDisplayGroupRequestProto:
-    updateDisplayGroupRequestProto = UpdateDisplayGroupRequestProto()
+def createUpdateDisplayGroupRequestProto(reqId: int, contractInfo: str) -> "UpdateDisplayGroupRequestProto":
+    updateDisplayGroupRequestProto = pb.UpdateDisplayGroupRequest()
     if isValidIntValue(reqId): updateDisplayGroupRequestProto.reqId = reqId
     if contractInfo: updateDisplayGroupRequestProto.contractInfo = contractInfo
     return updateDisplayGroupRequestProto
 
 @staticmethod
-def createUnsubscribeFromGroupEventsRequestProto(reqId: int) -> UnsubscribeFromGroupEventsRequestProto:
-    unsubscribeFromGroupEventsRequestProto = UnsubscribeFromGroupEventsRequestProto()
+def createUnsubscribeFromGroupEventsRequestProto(reqId: int) -> "UnsubscribeFromGroupEventsRequestProto":
+    unsubscribeFromGroupEventsRequestProto = pb.UnsubscribeFromGroupEventsRequest()
     if isValidIntValue(reqId): unsubscribeFromGroupEventsRequestProto.reqId = reqId
     return unsubscribeFromGroupEventsRequestProto
 
 @staticmethod
-def createMarketDepthExchangesRequestProto() -> MarketDepthExchangesRequestProto:
-    marketDepthExchangesRequestProto = MarketDepthExchangesRequestProto()
+def createMarketDepthExchangesRequestProto() -> "MarketDepthExchangesRequestProto":
+    marketDepthExchangesRequestProto = pb.MarketDepthExchangesRequest()
     return marketDepthExchangesRequestProto
 
 @staticmethod
-def createCancelContractDataProto(reqId: int) -> CancelContractDataProto:
-    cancelContractDataProto = CancelContractDataProto()
+def createCancelContractDataProto(reqId: int) -> "CancelContractDataProto":
+    cancelContractDataProto = pb.CancelContractData()
     if isValidIntValue(reqId): cancelContractDataProto.reqId = reqId
     return cancelContractDataProto
 
 @staticmethod
-def createCancelHistoricalTicksProto(reqId: int) -> CancelHistoricalTicksProto:
-    cancelHistoricalTicksProto = CancelHistoricalTicksProto()
+def createCancelHistoricalTicksProto(reqId: int) -> "CancelHistoricalTicksProto":
+    cancelHistoricalTicksProto = pb.CancelHistoricalTicks()
     if isValidIntValue(reqId): cancelHistoricalTicksProto.reqId = reqId
     return cancelHistoricalTicksProto
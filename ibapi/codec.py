@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Type specific decoders for the fields of the NULL separated messages.
+
+They give the same results as ibapi.utils.decode() for the corresponding
+type but skip the type dispatch and the debug logging, and compare the
+sentinel values as bytes instead of decoding every field first. They are
+used on the hot path by the Decoder and the OrderDecoder.
+"""
+
+from decimal import Decimal
+
+from ibapi.const import (
+    UNSET_INTEGER,
+    UNSET_DOUBLE,
+    UNSET_DECIMAL,
+    DOUBLE_INFINITY,
+    INFINITY_STR,
+)
+from ibapi.utils import BadMessage
+
+INFINITY_BYTES = INFINITY_STR.encode()
+
+# values TWS sends for an unset decimal
+UNSET_DECIMAL_BYTES = frozenset(
+    (
+        b"2147483647",
+        b"9223372036854775807",
+        b"1.7976931348623157E308",
+        b"-9223372036854775808",
+    )
+)
+
+
+def decode_int(fields, show_unset=False) -> int:
+    try:
+        s = next(fields)
+    except StopIteration:
+        raise BadMessage("no more fields")
+
+    if not s:
+        return UNSET_INTEGER if show_unset else 0
+    return int(s)
+
+
+def decode_float(fields, show_unset=False) -> float:
+    try:
+        s = next(fields)
+    except StopIteration:
+        raise BadMessage("no more fields")
+
+    if not s:
+        return UNSET_DOUBLE if show_unset else 0.0
+    if s == INFINITY_BYTES:
+        return DOUBLE_INFINITY
+    return float(s)
+
+
+def decode_bool(fields, show_unset=False) -> bool:
+    try:
+        s = next(fields)
+    except StopIteration:
+        raise BadMessage("no more fields")
+
+    if not s:
+        return show_unset
+    return int(s) != 0
+
+
+def decode_decimal(fields) -> Decimal:
+    try:
+        s = next(fields)
+    except StopIteration:
+        raise BadMessage("no more fields")
+
+    if not s or s in UNSET_DECIMAL_BYTES:
+        return UNSET_DECIMAL
+    return Decimal(s.decode())
+
+
+def decode_str(fields, use_unicode=False) -> str:
+    try:
+        s = next(fields)
+    except StopIteration:
+        raise BadMessage("no more fields")
+
+    if type(s) is bytes:
+        return s.decode(
+            "unicode-escape" if use_unicode else "UTF-8", errors="backslashreplace"
+        )
+    if type(s) is str:
+        return s
+    raise TypeError(f"unsupported incoming type {type(s)} for desired type 'str'")
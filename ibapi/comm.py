@@ -9,7 +9,7 @@ import struct
 import logging
 import sys
 
-from ibapi.const import UNSET_INTEGER, UNSET_DOUBLE, DOUBLE_INFINITY, INFINITY_STR
+from ibapi.const import UNSET_INTEGER, UNSET_DOUBLE, DOUBLE_INFINITY, INFINITY_STR, DEFAULT_RECV_SIZE
 from ibapi.utils import ClientException
 from ibapi.utils import isAsciiPrintable
 from ibapi.errors import INVALID_SYMBOL
@@ -18,19 +18,15 @@ logger = logging.getLogger(__name__)
 
 def make_msg_proto(msgId: int, protobufData: bytes) -> bytes:
     """adds the length prefix"""
-    byteArray = msgId.to_bytes(4, 'big') + protobufData
-    msg = struct.pack(f"!I{len(byteArray)}s", len(byteArray), byteArray)
-    return msg
+    return (len(protobufData) + 4).to_bytes(4, 'big') + msgId.to_bytes(4, 'big') + protobufData
 
 def make_msg(msgId:int, useRawIntMsgId: bool, text: str) -> bytes:
     """adds the length prefix"""
     if useRawIntMsgId:
-        text = msgId.to_bytes(4, 'big') + str.encode(text)
+        text = msgId.to_bytes(4, 'big') + text.encode()
     else:
-        text = str.encode(make_field(msgId) + text)
-
-    msg = struct.pack(f"!I{len(text)}s", len(text), text)
-    return msg
+        text = (make_field(msgId) + text).encode()
+    return len(text).to_bytes(4, 'big') + text
 
 def make_initial_msg(text: str) -> bytes:
     """adds the length prefix"""
@@ -44,7 +40,7 @@ def make_field(val) -> str:
         raise ValueError("Cannot send None to TWS")
 
     # if string is not empty and contains invalid symbols
-    if val is not None and type(val) == str and val and not isAsciiPrintable(val):
+    if type(val) is str and val and not isAsciiPrintable(val):
         raise ClientException(
             INVALID_SYMBOL.code(),
             INVALID_SYMBOL.msg(),
@@ -54,7 +50,7 @@ def make_field(val) -> str:
         )
 
     # bool type is encoded as int
-    if val is not None and type(val) == bool:
+    if type(val) is bool:
         val = int(val)
 
     field = str(val) + "\0"
@@ -88,6 +84,87 @@ def read_msg(buf: bytes) -> tuple:
         return (size, "", buf)
 
 
+class MsgBuffer:
+    """
+    Reusable receive buffer for the size prefixed wire stream.
+
+    The socket reads straight into free space at the end of the buffer
+    (see writeView/commit) and popMsgs() walks the unread region with a
+    moving offset, so the unread tail is never re-sliced or concatenated.
+    Only a partial message left at the end of the buffer is ever moved,
+    and the buffer only grows when a single message does not fit.
+    Each complete message is copied out exactly once, as it has to outlive
+    the buffer when handed over to another thread.
+    """
+
+    _header = struct.Struct("!I")
+
+    def __init__(self, recvSize: int = DEFAULT_RECV_SIZE):
+        self.recvSize = recvSize
+        self.buf = bytearray(2 * recvSize)
+        self.view = memoryview(self.buf)
+        self.head = 0  # first unread byte
+        self.tail = 0  # first free byte
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def writeView(self) -> memoryview:
+        """returns a view of at least recvSize free bytes to receive into"""
+        if len(self.buf) - self.tail < self.recvSize:
+            self._makeRoom(self.recvSize)
+        return self.view[self.tail :]
+
+    def commit(self, nBytes: int):
+        """marks nBytes received into the last writeView() as unread data"""
+        self.tail += nBytes
+
+    def feed(self, data: bytes):
+        """appends already received bytes"""
+        if len(self.buf) - self.tail < len(data):
+            self._makeRoom(len(data))
+        self.buf[self.tail : self.tail + len(data)] = data
+        self.tail += len(data)
+
+    def popMsgs(self) -> list:
+        """returns the payloads of all complete messages in the buffer"""
+        msgs = []
+        view = self.view
+        head = self.head
+        tail = self.tail
+        while tail - head >= 4:
+            end = head + 4 + self._header.unpack_from(view, head)[0]
+            if end > tail:
+                # make sure a large message can be completed in place
+                if end - head > len(self.buf):
+                    self.head = head
+                    self._makeRoom(end - tail)
+                    return msgs
+                break
+            msgs.append(bytes(view[head + 4 : end]))
+            head = end
+
+        if head == tail:
+            head = tail = 0
+        self.head = head
+        self.tail = tail
+        return msgs
+
+    def _makeRoom(self, nBytes: int):
+        pending = self.tail - self.head
+        if pending + nBytes > len(self.buf):
+            # grow: the buffer cannot hold the message being assembled
+            newBuf = bytearray(max(2 * len(self.buf), pending + nBytes))
+            newBuf[:pending] = self.view[self.head : self.tail]
+            self.buf = newBuf
+            self.view = memoryview(newBuf)
+        else:
+            # compact: move the partial message to the front
+            self.buf[:pending] = bytes(self.view[self.head : self.tail])
+        self.head = 0
+        self.tail = pending
+
+
 def read_fields(buf: bytes) -> tuple:
     if isinstance(buf, str):
         buf = buf.encode()
@@ -3,6 +3,7 @@ Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is su
  and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
 """
 
+import os
 
 from ibapi.const import UNSET_INTEGER, UNSET_DECIMAL
 from ibapi.enum_implem import Enum
@@ -135,7 +136,20 @@ PROTOBUF_MSG_IDS = {
     OUT.REQ_MKT_DEPTH_EXCHANGES: MIN_SERVER_VER_PROTOBUF_REST_MESSAGES_3
 }
 
+# The bar and tick value types below are slotted: they have no per instance
+# __dict__, which matters when holding millions of them. Code that sets its
+# own attributes on them can set IBAPI_DICT_VALUE_TYPES=1 in the environment
+# before importing ibapi to get the __dict__ back.
+DICT_VALUE_TYPES = os.environ.get("IBAPI_DICT_VALUE_TYPES", "0") not in ("", "0")
+
+
+def valueTypeSlots(*names) -> tuple:
+    return names + ("__dict__",) if DICT_VALUE_TYPES else names
+
+
 class BarData(Object):
+    __slots__ = valueTypeSlots("date", "open", "high", "low", "close", "volume", "wap", "barCount")
+
     def __init__(self):
         self.date = ""
         self.open = 0.0
@@ -160,6 +174,8 @@ class BarData(Object):
 
 
 class RealTimeBar(Object):
+    __slots__ = valueTypeSlots("time", "endTime", "open_", "high", "low", "close", "volume", "wap", "count")
+
     def __init__(
         self,
         time=0,
@@ -259,6 +275,8 @@ class SmartComponent(Object):
 
 
 class TickAttrib(Object):
+    __slots__ = valueTypeSlots("canAutoExecute", "pastLimit", "preOpen")
+
     def __init__(self):
         self.canAutoExecute = False
         self.pastLimit = False
@@ -273,6 +291,8 @@ class TickAttrib(Object):
 
 
 class TickAttribBidAsk(Object):
+    __slots__ = valueTypeSlots("bidPastLow", "askPastHigh")
+
     def __init__(self):
         self.bidPastLow = False
         self.askPastHigh = False
@@ -282,6 +302,8 @@ class TickAttribBidAsk(Object):
 
 
 class TickAttribLast(Object):
+    __slots__ = valueTypeSlots("pastLimit", "unreported")
+
     def __init__(self):
         self.pastLimit = False
         self.unreported = False
@@ -312,6 +334,8 @@ class PriceIncrement(Object):
 
 
 class HistoricalTick(Object):
+    __slots__ = valueTypeSlots("time", "price", "size")
+
     def __init__(self):
         self.time = 0
         self.price = 0.0
@@ -326,6 +350,8 @@ class HistoricalTick(Object):
 
 
 class HistoricalTickBidAsk(Object):
+    __slots__ = valueTypeSlots("time", "tickAttribBidAsk", "priceBid", "priceAsk", "sizeBid", "sizeAsk")
+
     def __init__(self):
         self.time = 0
         self.tickAttribBidAsk = TickAttribBidAsk()
@@ -346,6 +372,8 @@ class HistoricalTickBidAsk(Object):
 
 
 class HistoricalTickLast(Object):
+    __slots__ = valueTypeSlots("time", "tickAttribLast", "price", "size", "exchange", "specialConditions")
+
     def __init__(self):
         self.time = 0
         self.tickAttribLast = TickAttribLast()
@@ -14,21 +14,49 @@ import logging
 import sys
 from ibapi.errors import FAIL_CREATE_SOCK
 from ibapi.errors import CONNECT_FAIL
-from ibapi.const import NO_VALID_ID
+from ibapi.const import NO_VALID_ID, DEFAULT_RECV_SIZE, MAX_SEND_BATCH
 from ibapi.utils import currentTimeMillis
+from ibapi.wirelog import debugOn
 
 # TODO: support SSL !!
 
 logger = logging.getLogger(__name__)
 
+# buffers per sendmsg() call, below the usual IOV_MAX of 1024
+MAX_IOV = 512
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+def sendAllFrames(sock, frames):
+    """writes all the frames with scatter-gather sendmsg() calls, going on
+    after partial writes"""
+    frames = [memoryview(frame) for frame in frames]
+    i = 0
+    while i < len(frames):
+        nSent = sock.sendmsg(frames[i:i + MAX_IOV])
+        while nSent > 0:
+            if nSent >= len(frames[i]):
+                nSent -= len(frames[i])
+                i += 1
+            else:
+                frames[i] = frames[i][nSent:]
+                nSent = 0
+
 
 class Connection:
-    def __init__(self, host, port):
+    def __init__(self, host, port, recvSize=DEFAULT_RECV_SIZE):
         self.host = host
         self.port = port
+        self.recvSize = recvSize
         self.socket = None
         self.wrapper = None
         self.lock = threading.Lock()
+        # messages held by an open send batch, see beginBatch()
+        self.batchDepth = 0
+        self.outbound = []
+        self.nOutbound = 0
+        # an ibapi.capture.CaptureWriter, see EClient.setCapture()
+        self.capture = None
 
     def connect(self):
         try:
@@ -55,6 +83,8 @@ class Connection:
                 logger.debug("disconnecting")
                 self.socket.close()
                 self.socket = None
+                self.outbound = []
+                self.nOutbound = 0
                 logger.debug("disconnected")
                 if self.wrapper:
                     self.wrapper.connectionClosed()
@@ -65,26 +95,61 @@ class Connection:
         return self.socket is not None
 
     def sendMsg(self, msg):
-        logger.debug("acquiring lock")
-        self.lock.acquire()
-        logger.debug("acquired lock")
-        if not self.isConnected():
-            logger.debug("sendMsg attempted while not connected, releasing lock")
-            self.lock.release()
-            return 0
+        # checked once, this runs for every message sent
+        debug = debugOn(logger)
+        if debug:
+            logger.debug("acquiring lock")
+        with self.lock:
+            if not self.isConnected():
+                if debug:
+                    logger.debug("sendMsg attempted while not connected, releasing lock")
+                return 0
+            if self.capture is not None:
+                self.capture.sent(msg)
+            try:
+                if self.batchDepth:
+                    self.outbound.append(msg)
+                    self.nOutbound += len(msg)
+                    if self.nOutbound >= MAX_SEND_BATCH:
+                        self.flush()
+                else:
+                    self.socket.sendall(msg)
+            except socket.error:
+                logger.debug("exception from sendMsg %s", sys.exc_info())
+                raise
+
+        if debug:
+            logger.debug("sendMsg: sent: %d", len(msg))
+
+        return len(msg)
+
+    def beginBatch(self):
+        """Holds the messages sent from any thread until the matching
+        endBatch(), which writes them with as few system calls as it can.
+        Batches nest, the outermost one writes."""
+        with self.lock:
+            self.batchDepth += 1
+
+    def endBatch(self):
+        with self.lock:
+            self.batchDepth -= 1
+            if self.batchDepth == 0 and self.isConnected():
+                self.flush()
+
+    def flush(self):
+        """writes the messages held by the batch, called with the lock held"""
+        frames, self.outbound = self.outbound, []
+        self.nOutbound = 0
+        if not frames:
+            return
         try:
-            nSent = self.socket.send(msg)
+            if HAS_SENDMSG and len(frames) > 1:
+                sendAllFrames(self.socket, frames)
+            else:
+                self.socket.sendall(b"".join(frames))
         except socket.error:
-            logger.debug("exception from sendMsg %s", sys.exc_info())
+            logger.debug("exception from flush %s", sys.exc_info())
             raise
-        finally:
-            logger.debug("releasing lock")
-            self.lock.release()
-            logger.debug("release lock")
-
-        logger.debug("sendMsg: sent: %d", nSent)
-
-        return nSent
 
     def recvMsg(self):
         if not self.isConnected():
@@ -92,6 +157,8 @@ class Connection:
             return b""
         try:
             buf = self._recvAllMsg()
+            if buf and self.capture is not None:
+                self.capture.received(buf)
             # receiving 0 bytes outside a timeout means the connection is either
             # closed or broken
             if len(buf) == 0:
@@ -111,16 +178,44 @@ class Connection:
 
         return buf
 
+    def recvMsgInto(self, buf) -> int:
+        """Receives straight into the writable buffer buf (see
+        comm.MsgBuffer.writeView) and returns the number of bytes read,
+        0 on a timeout or when the connection is gone."""
+        sock = self.socket
+        if sock is None:
+            logger.debug("recvMsgInto attempted while not connected")
+            return 0
+        try:
+            nRecvd = sock.recv_into(buf)
+            if nRecvd and self.capture is not None:
+                self.capture.received(buf[:nRecvd])
+            # receiving 0 bytes outside a timeout means the connection is either
+            # closed or broken
+            if nRecvd == 0:
+                logger.debug("socket either closed or broken, disconnecting")
+                self.disconnect()
+        except socket.timeout:
+            nRecvd = 0
+        except OSError:
+            # also thrown if the socket was closed (ex: disconnected at end of
+            # script) while waiting for recv_into() to timeout
+            logger.debug("socket broken, disconnecting")
+            self.disconnect()
+            nRecvd = 0
+
+        return nRecvd
+
     def _recvAllMsg(self):
         cont = True
-        allbuf = b""
+        allbuf = bytearray()
 
         while cont and self.isConnected():
-            buf = self.socket.recv(4096)
+            buf = self.socket.recv(self.recvSize)
             allbuf += buf
-            logger.debug("len %d raw:%s|", len(buf), buf)
+            logger.debug("len %d", len(buf))
 
-            if len(buf) < 4096:
+            if len(buf) < self.recvSize:
                 cont = False
 
-        return allbuf
+        return bytes(allbuf)
@@ -4,6 +4,9 @@ from _decimal import Decimal
 
 NO_VALID_ID = -1
 MAX_MSG_LEN = 0xFFFFFF  # 16Mb - 1byte
+DEFAULT_RECV_SIZE = 65536  # bytes asked of the socket per recv
+DEFAULT_MSG_BATCH = 1000  # most messages EClient.run decodes per queue drain
+MAX_SEND_BATCH = 65536  # bytes a send batch holds before writing them out
 UNSET_INTEGER = 2**31 - 1
 UNSET_DOUBLE = float(sys.float_info.max)
 UNSET_LONG = 2**63 - 1
@@ -0,0 +1,219 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Cache of the ContractDetails of the contracts a job asks for.
+
+ContractDetailsCache keeps the answer of reqContractDetails by contract key,
+(symbol, secType, exchange, currency, primaryExchange), and each of the
+ContractDetails in it by conId. It holds up to maxSize of each in memory,
+least recently used dropped first, and with a path also in an SQLite file,
+so the next runs of a job skip the round trip too. Entries older than ttl
+seconds are treated as missing.
+
+    cache = ContractDetailsCache("contract_details.sqlite")
+    details = cache.get(contract)
+    if details is None:
+        details = ...  # reqContractDetails
+        cache.put(contract, details)
+    contract = details[0].contract  # with its conId for the later requests
+
+The details are stored as JSON. Only the ibapi types in VALUE_TYPES are
+rebuilt from it, nothing in the file can make the cache run code.
+"""
+
+import collections
+import json
+import sqlite3
+import threading
+import time
+from decimal import Decimal
+
+from ibapi.contract import (
+    ComboLeg,
+    Contract,
+    ContractDetails,
+    DeltaNeutralContract,
+    FundAssetType,
+    FundDistributionPolicyIndicator,
+)
+from ibapi.ineligibility_reason import IneligibilityReason
+from ibapi.tag_value import TagValue
+
+# a week, contract details hardly change
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_SIZE = 1000
+
+VALUE_TYPES = {cls.__name__: cls for cls in (
+    ComboLeg, Contract, ContractDetails, DeltaNeutralContract, IneligibilityReason, TagValue)}
+ENUM_TYPES = {cls.__name__: cls for cls in (FundAssetType, FundDistributionPolicyIndicator)}
+
+
+def cacheKey(contract: Contract) -> tuple:
+    return (contract.symbol, contract.secType, contract.exchange, contract.currency, contract.primaryExchange)
+
+
+def toJsonValue(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, (list, tuple)):
+        return [toJsonValue(v) for v in value]
+    name = type(value).__name__
+    if ENUM_TYPES.get(name) is type(value):
+        return {"$enum": name, "name": value.name}
+    if VALUE_TYPES.get(name) is type(value):
+        obj = {k: toJsonValue(v) for k, v in vars(value).items()}
+        obj["$type"] = name
+        return obj
+    raise TypeError(f"cannot store a {name} in the contract details cache")
+
+
+def fromJsonValue(value):
+    if isinstance(value, list):
+        return [fromJsonValue(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "$decimal" in value:
+        return Decimal(value["$decimal"])
+    if "$enum" in value:
+        return ENUM_TYPES[value["$enum"]][value["name"]]
+    obj = VALUE_TYPES[value["$type"]]()
+    for k, v in value.items():
+        if k != "$type":
+            setattr(obj, k, fromJsonValue(v))
+    return obj
+
+
+def encodeDetails(details: ContractDetails) -> str:
+    return json.dumps(toJsonValue(details))
+
+
+def decodeDetails(text: str) -> ContractDetails:
+    return fromJsonValue(json.loads(text))
+
+
+class ContractDetailsCache:
+    """See the module docstring. Thread safe."""
+
+    def __init__(self, path=None, ttl: float = DEFAULT_TTL, maxSize: int = DEFAULT_MAX_SIZE,
+                 clock=time.time):
+        self.ttl = ttl
+        self.maxSize = maxSize
+        self.clock = clock
+        self.lock = threading.Lock()
+        # key -> (stored at, [conId]) and conId -> (stored at, ContractDetails)
+        self.byKey = collections.OrderedDict()
+        self.byConId = collections.OrderedDict()
+        self.nHits = 0
+        self.nMisses = 0
+
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.executescript(
+                "CREATE TABLE IF NOT EXISTS contract_keys ("
+                " key TEXT PRIMARY KEY, con_ids TEXT NOT NULL, stored_at REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS contract_details ("
+                " con_id INTEGER PRIMARY KEY, details TEXT NOT NULL, stored_at REAL NOT NULL);"
+            )
+
+    def fresh(self, storedAt: float) -> bool:
+        return self.clock() - storedAt < self.ttl
+
+    def remember(self, lru: collections.OrderedDict, key, entry):
+        lru[key] = entry
+        lru.move_to_end(key)
+        while len(lru) > self.maxSize:
+            lru.popitem(last=False)
+
+    def lookupConId(self, conId: int):
+        """the ContractDetails of conId, None when missing or expired,
+        called with the lock held"""
+        entry = self.byConId.get(conId)
+        if entry is None and self.db is not None:
+            row = self.db.execute(
+                "SELECT stored_at, details FROM contract_details WHERE con_id = ?", (conId,)).fetchone()
+            if row is not None:
+                entry = (row[0], decodeDetails(row[1]))
+                self.remember(self.byConId, conId, entry)
+        if entry is None or not self.fresh(entry[0]):
+            return None
+        self.byConId.move_to_end(conId)
+        return entry[1]
+
+    def get(self, contract: Contract):
+        """the list of ContractDetails cached for contract, by its conId if
+        it has one, None when missing or expired"""
+        with self.lock:
+            if contract.conId:
+                details = self.lookupConId(contract.conId)
+                result = None if details is None else [details]
+            else:
+                result = self.lookupKey(cacheKey(contract))
+            if result is None:
+                self.nMisses += 1
+            else:
+                self.nHits += 1
+            return result
+
+    def lookupKey(self, key: tuple):
+        """the list of ContractDetails of key, None when missing or expired,
+        called with the lock held"""
+        textKey = json.dumps(key)
+        entry = self.byKey.get(textKey)
+        if entry is None and self.db is not None:
+            row = self.db.execute(
+                "SELECT stored_at, con_ids FROM contract_keys WHERE key = ?", (textKey,)).fetchone()
+            if row is not None:
+                entry = (row[0], json.loads(row[1]))
+                self.remember(self.byKey, textKey, entry)
+        if entry is None or not self.fresh(entry[0]):
+            return None
+        self.byKey.move_to_end(textKey)
+
+        result = []
+        for conId in entry[1]:
+            details = self.lookupConId(conId)
+            if details is None:
+                return None
+            result.append(details)
+        return result
+
+    def getByConId(self, conId: int):
+        """the ContractDetails of conId, None when missing or expired"""
+        with self.lock:
+            return self.lookupConId(conId)
+
+    def put(self, contract: Contract, detailsList: list):
+        """stores the answer of reqContractDetails for contract"""
+        now = self.clock()
+        textKey = json.dumps(cacheKey(contract))
+        conIds = [details.contract.conId for details in detailsList]
+        with self.lock:
+            self.remember(self.byKey, textKey, (now, conIds))
+            for details in detailsList:
+                self.remember(self.byConId, details.contract.conId, (now, details))
+            if self.db is not None:
+                with self.db:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO contract_keys (key, con_ids, stored_at) VALUES (?, ?, ?)",
+                        (textKey, json.dumps(conIds), now))
+                    self.db.executemany(
+                        "INSERT OR REPLACE INTO contract_details (con_id, details, stored_at) VALUES (?, ?, ?)",
+                        [(details.contract.conId, encodeDetails(details), now) for details in detailsList])
+
+    def purge(self):
+        """deletes the expired entries from the file"""
+        if self.db is not None:
+            with self.lock, self.db:
+                limit = self.clock() - self.ttl
+                self.db.execute("DELETE FROM contract_keys WHERE stored_at <= ?", (limit,))
+                self.db.execute("DELETE FROM contract_details WHERE stored_at <= ?", (limit,))
+
+    def close(self):
+        if self.db is not None:
+            with self.lock:
+                self.db.close()
+                self.db = None
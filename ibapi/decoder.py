@@ -18,6 +18,9 @@ from ibapi.wrapper import *  # @UnusedWildImport
 from ibapi.contract import ContractDescription
 from ibapi.server_versions import *  # @UnusedWildImport
 from ibapi.utils import *  # @UnusedWildImport
+from ibapi.bar_batch import decodeBarDataBatch, decodeBarDataBatchProtoBuf
+from ibapi import bar_batch
+from ibapi.codec import decode_int, decode_float, decode_bool, decode_decimal, decode_str
 from ibapi.softdollartier import SoftDollarTier
 from ibapi.ticktype import *  # @UnusedWildImport
 from ibapi.tag_value import TagValue
@@ -32,90 +35,7 @@ from ibapi.decoder_utils import decodeContract, decodeOrder, decodeExecution, de
 from ibapi.decoder_utils import decodeHistoricalDataBar, decodeHistogramDataEntry, decodeHistoricalTickLast, decodeHistoricalTickBidAsk, decodeHistoricalTick
 from ibapi.decoder_utils import decodeSoftDollarTier, decodeFamilyCode, decodeSmartComponents, decodePriceIncrement, decodeDepthMarketDataDescription
 
-from ibapi.protobuf.OrderStatus_pb2 import OrderStatus as OrderStatusProto
-from ibapi.protobuf.OpenOrder_pb2 import OpenOrder as OpenOrderProto
-from ibapi.protobuf.OpenOrdersEnd_pb2 import OpenOrdersEnd as OpenOrdersEndProto
-from ibapi.protobuf.ErrorMessage_pb2 import ErrorMessage as ErrorMessageProto
-from ibapi.protobuf.ExecutionDetails_pb2 import ExecutionDetails as ExecutionDetailsProto
-from ibapi.protobuf.ExecutionDetailsEnd_pb2 import ExecutionDetailsEnd as ExecutionDetailsEndProto
-from ibapi.protobuf.CompletedOrder_pb2 import CompletedOrder as CompletedOrderProto
-from ibapi.protobuf.CompletedOrdersEnd_pb2 import CompletedOrdersEnd as CompletedOrdersEndProto
-from ibapi.protobuf.OrderBound_pb2 import OrderBound as OrderBoundProto
-from ibapi.protobuf.ContractData_pb2 import ContractData as ContractDataProto
-from ibapi.protobuf.ContractDataEnd_pb2 import ContractDataEnd as ContractDataEndProto
-from ibapi.protobuf.CompletedOrder_pb2 import CompletedOrder as CompletedOrderProto
-from ibapi.protobuf.CompletedOrdersEnd_pb2 import CompletedOrdersEnd as CompletedOrdersEndProto
-from ibapi.protobuf.OrderBound_pb2 import OrderBound as OrderBoundProto
-from ibapi.protobuf.ContractData_pb2 import ContractData as ContractDataProto
-from ibapi.protobuf.ContractDataEnd_pb2 import ContractDataEnd as ContractDataEndProto
-from ibapi.protobuf.TickPrice_pb2 import TickPrice as TickPriceProto
-from ibapi.protobuf.TickSize_pb2 import TickSize as TickSizeProto
-from ibapi.protobuf.TickOptionComputation_pb2 import TickOptionComputation as TickOptionComputationProto
-from ibapi.protobuf.TickGeneric_pb2 import TickGeneric as TickGenericProto
-from ibapi.protobuf.TickString_pb2 import TickString as TickStringProto
-from ibapi.protobuf.TickSnapshotEnd_pb2 import TickSnapshotEnd as TickSnapshotEndProto
-from ibapi.protobuf.MarketDepth_pb2 import MarketDepth as MarketDepthProto
-from ibapi.protobuf.MarketDepthL2_pb2 import MarketDepthL2 as MarketDepthL2Proto
-from ibapi.protobuf.MarketDataType_pb2 import MarketDataType as MarketDataTypeProto
-from ibapi.protobuf.TickReqParams_pb2 import TickReqParams as TickReqParamsProto
-from ibapi.protobuf.AccountValue_pb2 import AccountValue as AccountValueProto
-from ibapi.protobuf.PortfolioValue_pb2 import PortfolioValue as PortfolioValueProto
-from ibapi.protobuf.AccountUpdateTime_pb2 import AccountUpdateTime as AccountUpdateTimeProto
-from ibapi.protobuf.AccountDataEnd_pb2 import AccountDataEnd as AccountDataEndProto
-from ibapi.protobuf.ManagedAccounts_pb2 import ManagedAccounts as ManagedAccountsProto
-from ibapi.protobuf.Position_pb2 import Position as PositionProto
-from ibapi.protobuf.PositionEnd_pb2 import PositionEnd as PositionEndProto
-from ibapi.protobuf.AccountSummary_pb2 import AccountSummary as AccountSummaryProto
-from ibapi.protobuf.AccountSummaryEnd_pb2 import AccountSummaryEnd as AccountSummaryEndProto
-from ibapi.protobuf.PositionMulti_pb2 import PositionMulti as PositionMultiProto
-from ibapi.protobuf.PositionMultiEnd_pb2 import PositionMultiEnd as PositionMultiEndProto
-from ibapi.protobuf.AccountUpdateMulti_pb2 import AccountUpdateMulti as AccountUpdateMultiProto
-from ibapi.protobuf.AccountUpdateMultiEnd_pb2 import AccountUpdateMultiEnd as AccountUpdateMultiEndProto
-from ibapi.protobuf.HistoricalData_pb2 import HistoricalData as HistoricalDataProto
-from ibapi.protobuf.HistoricalDataUpdate_pb2 import HistoricalDataUpdate as HistoricalDataUpdateProto
-from ibapi.protobuf.HistoricalDataEnd_pb2 import HistoricalDataEnd as HistoricalDataEndProto
-from ibapi.protobuf.RealTimeBarTick_pb2 import RealTimeBarTick as RealTimeBarTickProto
-from ibapi.protobuf.HeadTimestamp_pb2 import HeadTimestamp as HeadTimestampProto
-from ibapi.protobuf.HistogramData_pb2 import HistogramData as HistogramDataProto
-from ibapi.protobuf.HistoricalTicks_pb2 import HistoricalTicks as HistoricalTicksProto
-from ibapi.protobuf.HistoricalTicksBidAsk_pb2 import HistoricalTicksBidAsk as HistoricalTicksBidAskProto
-from ibapi.protobuf.HistoricalTicksLast_pb2 import HistoricalTicksLast as HistoricalTicksLastProto
-from ibapi.protobuf.TickByTickData_pb2 import TickByTickData as TickByTickDataProto
-from ibapi.protobuf.NewsBulletin_pb2 import NewsBulletin as NewsBulletinProto
-from ibapi.protobuf.NewsArticle_pb2 import NewsArticle as NewsArticleProto
-from ibapi.protobuf.NewsProviders_pb2 import NewsProviders as NewsProvidersProto
-from ibapi.protobuf.HistoricalNews_pb2 import HistoricalNews as HistoricalNewsProto
-from ibapi.protobuf.HistoricalNewsEnd_pb2 import HistoricalNewsEnd as HistoricalNewsEndProto
-from ibapi.protobuf.WshMetaData_pb2 import WshMetaData as WshMetaDataProto
-from ibapi.protobuf.WshEventData_pb2 import WshEventData as WshEventDataProto
-from ibapi.protobuf.TickNews_pb2 import TickNews as TickNewsProto
-from ibapi.protobuf.ScannerParameters_pb2 import ScannerParameters as ScannerParametersProto
-from ibapi.protobuf.ScannerData_pb2 import ScannerData as ScannerDataProto
-from ibapi.protobuf.FundamentalsData_pb2 import FundamentalsData as FundamentalsDataProto
-from ibapi.protobuf.PnL_pb2 import PnL as PnLProto
-from ibapi.protobuf.PnLSingle_pb2 import PnLSingle as PnLSingleProto
-from ibapi.protobuf.ReceiveFA_pb2 import ReceiveFA as ReceiveFAProto
-from ibapi.protobuf.ReplaceFAEnd_pb2 import ReplaceFAEnd as ReplaceFAEndProto
-from ibapi.protobuf.CommissionAndFeesReport_pb2 import CommissionAndFeesReport as CommissionAndFeesReportProto
-from ibapi.protobuf.HistoricalSchedule_pb2 import HistoricalSchedule as HistoricalScheduleProto
-from ibapi.protobuf.RerouteMarketDataRequest_pb2 import RerouteMarketDataRequest as RerouteMarketDataRequestProto
-from ibapi.protobuf.RerouteMarketDepthRequest_pb2 import RerouteMarketDepthRequest as RerouteMarketDepthRequestProto
-from ibapi.protobuf.SecDefOptParameter_pb2 import SecDefOptParameter as SecDefOptParameterProto
-from ibapi.protobuf.SecDefOptParameterEnd_pb2 import SecDefOptParameterEnd as SecDefOptParameterEndProto
-from ibapi.protobuf.SoftDollarTiers_pb2 import SoftDollarTiers as SoftDollarTiersProto
-from ibapi.protobuf.FamilyCodes_pb2 import FamilyCodes as FamilyCodesProto
-from ibapi.protobuf.SymbolSamples_pb2 import SymbolSamples as SymbolSamplesProto
-from ibapi.protobuf.SmartComponents_pb2 import SmartComponents as SmartComponentsProto
-from ibapi.protobuf.MarketRule_pb2 import MarketRule as MarketRuleProto
-from ibapi.protobuf.UserInfo_pb2 import UserInfo as UserInfoProto
-from ibapi.protobuf.NextValidId_pb2 import NextValidId as NextValidIdProto
-from ibapi.protobuf.CurrentTime_pb2 import CurrentTime as CurrentTimeProto
-from ibapi.protobuf.CurrentTimeInMillis_pb2 import CurrentTimeInMillis as CurrentTimeInMillisProto
-from ibapi.protobuf.VerifyMessageApi_pb2 import VerifyMessageApi as VerifyMessageApiProto
-from ibapi.protobuf.VerifyCompleted_pb2 import VerifyCompleted as VerifyCompletedProto
-from ibapi.protobuf.DisplayGroupList_pb2 import DisplayGroupList as DisplayGroupListProto
-from ibapi.protobuf.DisplayGroupUpdated_pb2 import DisplayGroupUpdated as DisplayGroupUpdatedProto
-from ibapi.protobuf.MarketDepthExchanges_pb2 import MarketDepthExchanges as MarketDepthExchangesProto
+from ibapi.protobuf import parseProtoBuf
 
 logger = logging.getLogger(__name__)
 
@@ -133,20 +53,62 @@ class HandleInfo(Object):
         return s
 
 
+def decodeStrUnicodeEscape(field: bytes) -> str:
+    try:
+        return field.decode("unicode-escape")
+    except UnicodeDecodeError:
+        return field.decode("latin-1")
+
+
+def decodeStrUTF8(field: bytes) -> str:
+    try:
+        return field.decode("UTF-8")
+    except UnicodeDecodeError:
+        return field.decode("latin-1")
+
+
+def decodeDecimalField(field: bytes) -> Decimal:
+    return Decimal(field.decode()) if field else UNSET_DECIMAL
+
+
 class Decoder(Object):
     def __init__(self, wrapper, serverVersion):
         self.wrapper = wrapper
-        self.serverVersion = serverVersion
+        # wrapperMeth -> function decoding the fields and calling the wrapper,
+        # built by compileWrapperCalls() for the current server version
+        self.wrapperCalls = {}
+        self._serverVersion = serverVersion
+        self.useBarDataBatch = self.wantsBarDataBatch(wrapper)
         self.discoverParams()
 
+    @staticmethod
+    def wantsBarDataBatch(wrapper) -> bool:
+        """historical bars go to historicalDataBatch() when the wrapper overrides it"""
+        if wrapper is None or type(wrapper).historicalDataBatch is EWrapper.historicalDataBatch:
+            return False
+        if not bar_batch.loadNumPy():
+            logger.warning("historicalDataBatch needs NumPy, delivering bars through historicalData")
+            return False
+        return True
+
+    @property
+    def serverVersion(self):
+        return self._serverVersion
+
+    @serverVersion.setter
+    def serverVersion(self, serverVersion):
+        # the string codec of the signature driven messages depends on it
+        self._serverVersion = serverVersion
+        self.compileWrapperCalls()
+
     def processTickPriceMsg(self, fields):
-        decode(int, fields)
+        decode_int(fields)
 
-        reqId = decode(int, fields)
-        tickType = decode(int, fields)
-        price = decode(float, fields)
-        size = decode(Decimal, fields)  # ver 2 field
-        attrMask = decode(int, fields)  # ver 3 field
+        reqId = decode_int(fields)
+        tickType = decode_int(fields)
+        price = decode_float(fields)
+        size = decode_decimal(fields)  # ver 2 field
+        attrMask = decode_int(fields)  # ver 3 field
 
         attrib = TickAttrib()
 
@@ -179,8 +141,7 @@ class Decoder(Object):
             self.wrapper.tickSize(reqId, sizeTickType, size)
 
     def processTickPriceMsgProtoBuf(self, protobuf):
-        tickPriceProto = TickPriceProto()
-        tickPriceProto.ParseFromString(protobuf)
+        tickPriceProto = parseProtoBuf(IN.TICK_PRICE, protobuf)
 
         self.wrapper.tickPriceProtoBuf(tickPriceProto)
 
@@ -214,18 +175,17 @@ class Decoder(Object):
             self.wrapper.tickSize(reqId, sizeTickType, size)
 
     def processTickSizeMsg(self, fields):
-        decode(int, fields)
+        decode_int(fields)
 
-        reqId = decode(int, fields)
-        sizeTickType = decode(int, fields)
-        size = decode(Decimal, fields)
+        reqId = decode_int(fields)
+        sizeTickType = decode_int(fields)
+        size = decode_decimal(fields)
 
         if sizeTickType != TickTypeEnum.NOT_SET:
             self.wrapper.tickSize(reqId, sizeTickType, size)
 
     def processTickSizeMsgProtoBuf(self, protobuf):
-        tickSizeProto = TickSizeProto()
-        tickSizeProto.ParseFromString(protobuf)
+        tickSizeProto = parseProtoBuf(IN.TICK_SIZE, protobuf)
 
         self.wrapper.tickSizeProtoBuf(tickSizeProto)
 
@@ -238,21 +198,21 @@ class Decoder(Object):
 
     def processOrderStatusMsg(self, fields):
         if self.serverVersion < MIN_SERVER_VER_MARKET_CAP_PRICE:
-            decode(int, fields)
-        orderId = decode(int, fields)
-        status = decode(str, fields)
-        filled = decode(Decimal, fields)
-        remaining = decode(Decimal, fields)
-        avgFillPrice = decode(float, fields)
-
-        permId = decode(int, fields)  # ver 2 field
-        parentId = decode(int, fields)  # ver 3 field
-        lastFillPrice = decode(float, fields)  # ver 4 field
-        clientId = decode(int, fields)  # ver 5 field
-        whyHeld = decode(str, fields)  # ver 6 field
+            decode_int(fields)
+        orderId = decode_int(fields)
+        status = decode_str(fields)
+        filled = decode_decimal(fields)
+        remaining = decode_decimal(fields)
+        avgFillPrice = decode_float(fields)
+
+        permId = decode_int(fields)  # ver 2 field
+        parentId = decode_int(fields)  # ver 3 field
+        lastFillPrice = decode_float(fields)  # ver 4 field
+        clientId = decode_int(fields)  # ver 5 field
+        whyHeld = decode_str(fields)  # ver 6 field
 
         if self.serverVersion >= MIN_SERVER_VER_MARKET_CAP_PRICE:
-            mktCapPrice = decode(float, fields)
+            mktCapPrice = decode_float(fields)
         else:
             mktCapPrice = None
 
@@ -271,8 +231,7 @@ class Decoder(Object):
         )
 
     def processOrderStatusMsgProtoBuf(self, protobuf):
-        orderStatusProto = OrderStatusProto()
-        orderStatusProto.ParseFromString(protobuf)
+        orderStatusProto = parseProtoBuf(IN.ORDER_STATUS, protobuf)
 
         self.wrapper.orderStatusProtoBuf(orderStatusProto)
 
@@ -296,7 +255,7 @@ class Decoder(Object):
         orderState = OrderState()
 
         if self.serverVersion < MIN_SERVER_VER_ORDER_CONTAINER:
-            version = decode(int, fields)
+            version = decode_int(fields)
         else:
             version = self.serverVersion
 
@@ -393,8 +352,7 @@ class Decoder(Object):
         self.wrapper.openOrder(order.orderId, contract, order, orderState)
 
     def processOpenOrderMsgProtoBuf(self, protobuf):
-        openOrderProto = OpenOrderProto()
-        openOrderProto.ParseFromString(protobuf)
+        openOrderProto = parseProtoBuf(IN.OPEN_ORDER, protobuf)
 
         self.wrapper.openOrderProtoBuf(openOrderProto)
 
@@ -418,46 +376,45 @@ class Decoder(Object):
         self.wrapper.openOrder(orderId, contract, order, orderState);
 
     def processOpenOrdersEndMsgProtoBuf(self, protobuf):
-        openOrdersEndProto = OpenOrdersEndProto()
-        openOrdersEndProto.ParseFromString(protobuf)
+        openOrdersEndProto = parseProtoBuf(IN.OPEN_ORDER_END, protobuf)
 
         self.wrapper.openOrdersEndProtoBuf(openOrdersEndProto)
 
         self.wrapper.openOrderEnd()
 
     def processPortfolioValueMsg(self, fields):
-        version = decode(int, fields)
+        version = decode_int(fields)
 
         # read contract fields
         contract = Contract()
-        contract.conId = decode(int, fields)  # ver 6 field
-        contract.symbol = decode(str, fields)
-        contract.secType = decode(str, fields)
-        contract.lastTradeDateOrContractMonth = decode(str, fields)
-        contract.strike = decode(float, fields)
-        contract.right = decode(str, fields)
+        contract.conId = decode_int(fields)  # ver 6 field
+        contract.symbol = decode_str(fields)
+        contract.secType = decode_str(fields)
+        contract.lastTradeDateOrContractMonth = decode_str(fields)
+        contract.strike = decode_float(fields)
+        contract.right = decode_str(fields)
 
         if version >= 7:
-            contract.multiplier = decode(str, fields)
-            contract.primaryExchange = decode(str, fields)
+            contract.multiplier = decode_str(fields)
+            contract.primaryExchange = decode_str(fields)
 
-        contract.currency = decode(str, fields)
-        contract.localSymbol = decode(str, fields)  # ver 2 field
+        contract.currency = decode_str(fields)
+        contract.localSymbol = decode_str(fields)  # ver 2 field
         if version >= 8:
-            contract.tradingClass = decode(str, fields)
+            contract.tradingClass = decode_str(fields)
 
-        position = decode(Decimal, fields)
+        position = decode_decimal(fields)
 
-        marketPrice = decode(float, fields)
-        marketValue = decode(float, fields)
-        averageCost = decode(float, fields)  # ver 3 field
-        unrealizedPNL = decode(float, fields)  # ver 3 field
-        realizedPNL = decode(float, fields)  # ver 3 field
+        marketPrice = decode_float(fields)
+        marketValue = decode_float(fields)
+        averageCost = decode_float(fields)  # ver 3 field
+        unrealizedPNL = decode_float(fields)  # ver 3 field
+        realizedPNL = decode_float(fields)  # ver 3 field
 
-        accountName = decode(str, fields)  # ver 4 field
+        accountName = decode_str(fields)  # ver 4 field
 
         if version == 6 and self.serverVersion == 39:
-            contract.primaryExchange = decode(str, fields)
+            contract.primaryExchange = decode_str(fields)
 
         self.wrapper.updatePortfolio(
             contract,
@@ -471,8 +428,7 @@ class Decoder(Object):
         )
 
     def processPortfolioValueMsgProtoBuf(self, protobuf):
-        portfolioValueProto = PortfolioValueProto()
-        portfolioValueProto.ParseFromString(protobuf)
+        portfolioValueProto = parseProtoBuf(IN.PORTFOLIO_VALUE, protobuf)
 
         self.wrapper.updatePortfolioProtoBuf(portfolioValueProto)
 
@@ -494,130 +450,129 @@ class Decoder(Object):
     def processContractDataMsg(self, fields):
         version = 8
         if self.serverVersion < MIN_SERVER_VER_SIZE_RULES:
-            version = decode(int, fields)
+            version = decode_int(fields)
 
         reqId = -1
         if version >= 3:
-            reqId = decode(int, fields)
+            reqId = decode_int(fields)
 
         contract = ContractDetails()
-        contract.contract.symbol = decode(str, fields)
-        contract.contract.secType = decode(str, fields)
+        contract.contract.symbol = decode_str(fields)
+        contract.contract.secType = decode_str(fields)
         self.readLastTradeDate(fields, contract, False)
         if self.serverVersion >= MIN_SERVER_VER_LAST_TRADE_DATE:
-            contract.contract.lastTradeDate = decode(str, fields)
-        contract.contract.strike = decode(float, fields)
-        contract.contract.right = decode(str, fields)
-        contract.contract.exchange = decode(str, fields)
-        contract.contract.currency = decode(str, fields)
-        contract.contract.localSymbol = decode(str, fields)
-        contract.marketName = decode(str, fields)
-        contract.contract.tradingClass = decode(str, fields)
-        contract.contract.conId = decode(int, fields)
-        contract.minTick = decode(float, fields)
+            contract.contract.lastTradeDate = decode_str(fields)
+        contract.contract.strike = decode_float(fields)
+        contract.contract.right = decode_str(fields)
+        contract.contract.exchange = decode_str(fields)
+        contract.contract.currency = decode_str(fields)
+        contract.contract.localSymbol = decode_str(fields)
+        contract.marketName = decode_str(fields)
+        contract.contract.tradingClass = decode_str(fields)
+        contract.contract.conId = decode_int(fields)
+        contract.minTick = decode_float(fields)
         if (
             self.serverVersion >= MIN_SERVER_VER_MD_SIZE_MULTIPLIER
             and self.serverVersion < MIN_SERVER_VER_SIZE_RULES
         ):
-            decode(int, fields)  # mdSizeMultiplier - not used anymore
-        contract.contract.multiplier = decode(str, fields)
-        contract.orderTypes = decode(str, fields)
-        contract.validExchanges = decode(str, fields)
-        contract.priceMagnifier = decode(int, fields)  # ver 2 field
+            decode_int(fields)  # mdSizeMultiplier - not used anymore
+        contract.contract.multiplier = decode_str(fields)
+        contract.orderTypes = decode_str(fields)
+        contract.validExchanges = decode_str(fields)
+        contract.priceMagnifier = decode_int(fields)  # ver 2 field
         if version >= 4:
-            contract.underConId = decode(int, fields)
+            contract.underConId = decode_int(fields)
         if version >= 5:
             contract.longName = (
-                decode(str, fields).encode().decode("unicode-escape")
+                decode_str(fields).encode().decode("unicode-escape")
                 if self.serverVersion >= MIN_SERVER_VER_ENCODE_MSG_ASCII7
-                else decode(str, fields)
+                else decode_str(fields)
             )
-            contract.contract.primaryExchange = decode(str, fields)
+            contract.contract.primaryExchange = decode_str(fields)
         if version >= 6:
-            contract.contractMonth = decode(str, fields)
-            contract.industry = decode(str, fields)
-            contract.category = decode(str, fields)
-            contract.subcategory = decode(str, fields)
-            contract.timeZoneId = decode(str, fields)
-            contract.tradingHours = decode(str, fields)
-            contract.liquidHours = decode(str, fields)
+            contract.contractMonth = decode_str(fields)
+            contract.industry = decode_str(fields)
+            contract.category = decode_str(fields)
+            contract.subcategory = decode_str(fields)
+            contract.timeZoneId = decode_str(fields)
+            contract.tradingHours = decode_str(fields)
+            contract.liquidHours = decode_str(fields)
         if version >= 8:
-            contract.evRule = decode(str, fields)
-            contract.evMultiplier = decode(int, fields)
+            contract.evRule = decode_str(fields)
+            contract.evMultiplier = decode_int(fields)
         if version >= 7:
-            secIdListCount = decode(int, fields)
+            secIdListCount = decode_int(fields)
             if secIdListCount > 0:
                 contract.secIdList = []
                 for _ in range(secIdListCount):
                     tagValue = TagValue()
-                    tagValue.tag = decode(str, fields)
-                    tagValue.value = decode(str, fields)
+                    tagValue.tag = decode_str(fields)
+                    tagValue.value = decode_str(fields)
                     contract.secIdList.append(tagValue)
 
         if self.serverVersion >= MIN_SERVER_VER_AGG_GROUP:
-            contract.aggGroup = decode(int, fields)
+            contract.aggGroup = decode_int(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_UNDERLYING_INFO:
-            contract.underSymbol = decode(str, fields)
-            contract.underSecType = decode(str, fields)
+            contract.underSymbol = decode_str(fields)
+            contract.underSecType = decode_str(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_MARKET_RULES:
-            contract.marketRuleIds = decode(str, fields)
+            contract.marketRuleIds = decode_str(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_REAL_EXPIRATION_DATE:
-            contract.realExpirationDate = decode(str, fields)
+            contract.realExpirationDate = decode_str(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_STOCK_TYPE:
-            contract.stockType = decode(str, fields)
+            contract.stockType = decode_str(fields)
 
         if (
             self.serverVersion >= MIN_SERVER_VER_FRACTIONAL_SIZE_SUPPORT
             and self.serverVersion < MIN_SERVER_VER_SIZE_RULES
         ):
-            decode(Decimal, fields)  # sizeMinTick - not used anymore
+            decode_decimal(fields)  # sizeMinTick - not used anymore
 
         if self.serverVersion >= MIN_SERVER_VER_SIZE_RULES:
-            contract.minSize = decode(Decimal, fields)
-            contract.sizeIncrement = decode(Decimal, fields)
-            contract.suggestedSizeIncrement = decode(Decimal, fields)
+            contract.minSize = decode_decimal(fields)
+            contract.sizeIncrement = decode_decimal(fields)
+            contract.suggestedSizeIncrement = decode_decimal(fields)
 
         if (
             self.serverVersion >= MIN_SERVER_VER_FUND_DATA_FIELDS
             and contract.contract.secType == "FUND"
         ):
-            contract.fundName = decode(str, fields)
-            contract.fundFamily = decode(str, fields)
-            contract.fundType = decode(str, fields)
-            contract.fundFrontLoad = decode(str, fields)
-            contract.fundBackLoad = decode(str, fields)
-            contract.fundBackLoadTimeInterval = decode(str, fields)
-            contract.fundManagementFee = decode(str, fields)
-            contract.fundClosed = decode(bool, fields)
-            contract.fundClosedForNewInvestors = decode(bool, fields)
-            contract.fundClosedForNewMoney = decode(bool, fields)
-            contract.fundNotifyAmount = decode(str, fields)
-            contract.fundMinimumInitialPurchase = decode(str, fields)
-            contract.fundSubsequentMinimumPurchase = decode(str, fields)
-            contract.fundBlueSkyStates = decode(str, fields)
-            contract.fundBlueSkyTerritories = decode(str, fields)
-            contract.fundDistributionPolicyIndicator = getEnumTypeFromString(FundDistributionPolicyIndicator, decode(str, fields))
-            contract.fundAssetType = getEnumTypeFromString(FundAssetType, decode(str, fields))
+            contract.fundName = decode_str(fields)
+            contract.fundFamily = decode_str(fields)
+            contract.fundType = decode_str(fields)
+            contract.fundFrontLoad = decode_str(fields)
+            contract.fundBackLoad = decode_str(fields)
+            contract.fundBackLoadTimeInterval = decode_str(fields)
+            contract.fundManagementFee = decode_str(fields)
+            contract.fundClosed = decode_bool(fields)
+            contract.fundClosedForNewInvestors = decode_bool(fields)
+            contract.fundClosedForNewMoney = decode_bool(fields)
+            contract.fundNotifyAmount = decode_str(fields)
+            contract.fundMinimumInitialPurchase = decode_str(fields)
+            contract.fundSubsequentMinimumPurchase = decode_str(fields)
+            contract.fundBlueSkyStates = decode_str(fields)
+            contract.fundBlueSkyTerritories = decode_str(fields)
+            contract.fundDistributionPolicyIndicator = getEnumTypeFromString(FundDistributionPolicyIndicator, decode_str(fields))
+            contract.fundAssetType = getEnumTypeFromString(FundAssetType, decode_str(fields))
 
         if self.serverVersion >= MIN_SERVER_VER_INELIGIBILITY_REASONS:
-            ineligibilityReasonListCount = decode(int, fields)
+            ineligibilityReasonListCount = decode_int(fields)
             if ineligibilityReasonListCount > 0:
                 contract.ineligibilityReasonList = []
                 for _ in range(ineligibilityReasonListCount):
                     ineligibilityReason = IneligibilityReason()
-                    ineligibilityReason.id_ = decode(str, fields)
-                    ineligibilityReason.description = decode(str, fields)
+                    ineligibilityReason.id_ = decode_str(fields)
+                    ineligibilityReason.description = decode_str(fields)
                     contract.ineligibilityReasonList.append(ineligibilityReason)
 
         self.wrapper.contractDetails(reqId, contract)
 
     def processContractDataMsgProtoBuf(self, protobuf):
-        contractDataProto = ContractDataProto()
-        contractDataProto.ParseFromString(protobuf)
+        contractDataProto = parseProtoBuf(IN.CONTRACT_DATA, protobuf)
 
         self.wrapper.contractDataProtoBuf(contractDataProto)
 
@@ -633,78 +588,77 @@ class Decoder(Object):
     def processBondContractDataMsg(self, fields):
         version = 6
         if self.serverVersion < MIN_SERVER_VER_SIZE_RULES:
-            version = decode(int, fields)
+            version = decode_int(fields)
 
         reqId = -1
         if version >= 3:
-            reqId = decode(int, fields)
+            reqId = decode_int(fields)
 
         contract = ContractDetails()
-        contract.contract.symbol = decode(str, fields)
-        contract.contract.secType = decode(str, fields)
-        contract.cusip = decode(str, fields)
-        contract.coupon = decode(float, fields)
+        contract.contract.symbol = decode_str(fields)
+        contract.contract.secType = decode_str(fields)
+        contract.cusip = decode_str(fields)
+        contract.coupon = decode_float(fields)
         self.readLastTradeDate(fields, contract, True)
-        contract.issueDate = decode(str, fields)
-        contract.ratings = decode(str, fields)
-        contract.bondType = decode(str, fields)
-        contract.couponType = decode(str, fields)
-        contract.convertible = decode(bool, fields)
-        contract.callable = decode(bool, fields)
-        contract.putable = decode(bool, fields)
-        contract.descAppend = decode(str, fields)
-        contract.contract.exchange = decode(str, fields)
-        contract.contract.currency = decode(str, fields)
-        contract.marketName = decode(str, fields)
-        contract.contract.tradingClass = decode(str, fields)
-        contract.contract.conId = decode(int, fields)
-        contract.minTick = decode(float, fields)
+        contract.issueDate = decode_str(fields)
+        contract.ratings = decode_str(fields)
+        contract.bondType = decode_str(fields)
+        contract.couponType = decode_str(fields)
+        contract.convertible = decode_bool(fields)
+        contract.callable = decode_bool(fields)
+        contract.putable = decode_bool(fields)
+        contract.descAppend = decode_str(fields)
+        contract.contract.exchange = decode_str(fields)
+        contract.contract.currency = decode_str(fields)
+        contract.marketName = decode_str(fields)
+        contract.contract.tradingClass = decode_str(fields)
+        contract.contract.conId = decode_int(fields)
+        contract.minTick = decode_float(fields)
         if (
             self.serverVersion >= MIN_SERVER_VER_MD_SIZE_MULTIPLIER
             and self.serverVersion < MIN_SERVER_VER_SIZE_RULES
         ):
-            decode(int, fields)  # mdSizeMultiplier - not used anymore
-        contract.orderTypes = decode(str, fields)
-        contract.validExchanges = decode(str, fields)
-        contract.nextOptionDate = decode(str, fields)  # ver 2 field
-        contract.nextOptionType = decode(str, fields)  # ver 2 field
-        contract.nextOptionPartial = decode(bool, fields)  # ver 2 field
-        contract.notes = decode(str, fields)  # ver 2 field
+            decode_int(fields)  # mdSizeMultiplier - not used anymore
+        contract.orderTypes = decode_str(fields)
+        contract.validExchanges = decode_str(fields)
+        contract.nextOptionDate = decode_str(fields)  # ver 2 field
+        contract.nextOptionType = decode_str(fields)  # ver 2 field
+        contract.nextOptionPartial = decode_bool(fields)  # ver 2 field
+        contract.notes = decode_str(fields)  # ver 2 field
         if version >= 4:
-            contract.longName = decode(str, fields)
+            contract.longName = decode_str(fields)
         if self.serverVersion >= MIN_SERVER_VER_BOND_TRADING_HOURS:
-            contract.timeZoneId = decode(str, fields)
-            contract.tradingHours = decode(str, fields)
-            contract.liquidHours = decode(str, fields)
+            contract.timeZoneId = decode_str(fields)
+            contract.tradingHours = decode_str(fields)
+            contract.liquidHours = decode_str(fields)
         if version >= 6:
-            contract.evRule = decode(str, fields)
-            contract.evMultiplier = decode(int, fields)
+            contract.evRule = decode_str(fields)
+            contract.evMultiplier = decode_int(fields)
         if version >= 5:
-            secIdListCount = decode(int, fields)
+            secIdListCount = decode_int(fields)
             if secIdListCount > 0:
                 contract.secIdList = []
                 for _ in range(secIdListCount):
                     tagValue = TagValue()
-                    tagValue.tag = decode(str, fields)
-                    tagValue.value = decode(str, fields)
+                    tagValue.tag = decode_str(fields)
+                    tagValue.value = decode_str(fields)
                     contract.secIdList.append(tagValue)
 
         if self.serverVersion >= MIN_SERVER_VER_AGG_GROUP:
-            contract.aggGroup = decode(int, fields)
+            contract.aggGroup = decode_int(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_MARKET_RULES:
-            contract.marketRuleIds = decode(str, fields)
+            contract.marketRuleIds = decode_str(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_SIZE_RULES:
-            contract.minSize = decode(Decimal, fields)
-            contract.sizeIncrement = decode(Decimal, fields)
-            contract.suggestedSizeIncrement = decode(Decimal, fields)
+            contract.minSize = decode_decimal(fields)
+            contract.sizeIncrement = decode_decimal(fields)
+            contract.suggestedSizeIncrement = decode_decimal(fields)
 
         self.wrapper.bondContractDetails(reqId, contract)
 
     def processBondContractDataMsgProtoBuf(self, protobuf):
-        contractDataProto = ContractDataProto()
-        contractDataProto.ParseFromString(protobuf)
+        contractDataProto = parseProtoBuf(IN.BOND_CONTRACT_DATA, protobuf)
 
         self.wrapper.bondContractDataProtoBuf(contractDataProto)
 
@@ -718,8 +672,7 @@ class Decoder(Object):
         self.wrapper.bondContractDetails(reqId, contractDetails)
 
     def processContractDataEndMsgProtoBuf(self, protobuf):
-        contractDataEndProto = ContractDataEndProto()
-        contractDataEndProto.ParseFromString(protobuf)
+        contractDataEndProto = parseProtoBuf(IN.CONTRACT_DATA_END, protobuf)
 
         self.wrapper.contractDataEndProtoBuf(contractDataEndProto)
 
@@ -728,31 +681,31 @@ class Decoder(Object):
         self.wrapper.contractDetailsEnd(reqId)
 
     def processScannerDataMsg(self, fields):
-        decode(int, fields)
-        reqId = decode(int, fields)
+        decode_int(fields)
+        reqId = decode_int(fields)
 
-        numberOfElements = decode(int, fields)
+        numberOfElements = decode_int(fields)
 
         for _ in range(numberOfElements):
             data = ScanData()
             data.contract = ContractDetails()
 
-            data.rank = decode(int, fields)
-            data.contract.contract.conId = decode(int, fields)  # ver 3 field
-            data.contract.contract.symbol = decode(str, fields)
-            data.contract.contract.secType = decode(str, fields)
-            data.contract.contract.lastTradeDateOrContractMonth = decode(str, fields)
-            data.contract.contract.strike = decode(float, fields)
-            data.contract.contract.right = decode(str, fields)
-            data.contract.contract.exchange = decode(str, fields)
-            data.contract.contract.currency = decode(str, fields)
-            data.contract.contract.localSymbol = decode(str, fields)
-            data.contract.marketName = decode(str, fields)
-            data.contract.contract.tradingClass = decode(str, fields)
-            data.distance = decode(str, fields)
-            data.benchmark = decode(str, fields)
-            data.projection = decode(str, fields)
-            data.legsStr = decode(str, fields)
+            data.rank = decode_int(fields)
+            data.contract.contract.conId = decode_int(fields)  # ver 3 field
+            data.contract.contract.symbol = decode_str(fields)
+            data.contract.contract.secType = decode_str(fields)
+            data.contract.contract.lastTradeDateOrContractMonth = decode_str(fields)
+            data.contract.contract.strike = decode_float(fields)
+            data.contract.contract.right = decode_str(fields)
+            data.contract.contract.exchange = decode_str(fields)
+            data.contract.contract.currency = decode_str(fields)
+            data.contract.contract.localSymbol = decode_str(fields)
+            data.contract.marketName = decode_str(fields)
+            data.contract.contract.tradingClass = decode_str(fields)
+            data.distance = decode_str(fields)
+            data.benchmark = decode_str(fields)
+            data.projection = decode_str(fields)
+            data.legsStr = decode_str(fields)
             self.wrapper.scannerData(
                 reqId,
                 data.rank,
@@ -766,8 +719,7 @@ class Decoder(Object):
         self.wrapper.scannerDataEnd(reqId)
 
     def processScannerDataMsgProtoBuf(self, protobuf):
-        scannerDataProto = ScannerDataProto()
-        scannerDataProto.ParseFromString(protobuf)
+        scannerDataProto = parseProtoBuf(IN.SCANNER_DATA, protobuf)
 
         self.wrapper.scannerDataProtoBuf(scannerDataProto)
 
@@ -797,68 +749,67 @@ class Decoder(Object):
         version = self.serverVersion
 
         if self.serverVersion < MIN_SERVER_VER_LAST_LIQUIDITY:
-            version = decode(int, fields)
+            version = decode_int(fields)
 
         reqId = -1
         if version >= 7:
-            reqId = decode(int, fields)
+            reqId = decode_int(fields)
 
-        orderId = decode(int, fields)
+        orderId = decode_int(fields)
 
         # decode contract fields
         contract = Contract()
-        contract.conId = decode(int, fields)  # ver 5 field
-        contract.symbol = decode(str, fields)
-        contract.secType = decode(str, fields)
-        contract.lastTradeDateOrContractMonth = decode(str, fields)
-        contract.strike = decode(float, fields)
-        contract.right = decode(str, fields)
+        contract.conId = decode_int(fields)  # ver 5 field
+        contract.symbol = decode_str(fields)
+        contract.secType = decode_str(fields)
+        contract.lastTradeDateOrContractMonth = decode_str(fields)
+        contract.strike = decode_float(fields)
+        contract.right = decode_str(fields)
         if version >= 9:
-            contract.multiplier = decode(str, fields)
-        contract.exchange = decode(str, fields)
-        contract.currency = decode(str, fields)
-        contract.localSymbol = decode(str, fields)
+            contract.multiplier = decode_str(fields)
+        contract.exchange = decode_str(fields)
+        contract.currency = decode_str(fields)
+        contract.localSymbol = decode_str(fields)
         if version >= 10:
-            contract.tradingClass = decode(str, fields)
+            contract.tradingClass = decode_str(fields)
 
         # decode execution fields
         execution = Execution()
         execution.orderId = orderId
-        execution.execId = decode(str, fields)
-        execution.time = decode(str, fields)
-        execution.acctNumber = decode(str, fields)
-        execution.exchange = decode(str, fields)
-        execution.side = decode(str, fields)
-        execution.shares = decode(Decimal, fields)
-        execution.price = decode(float, fields)
-        execution.permId = decode(int, fields)  # ver 2 field
-        execution.clientId = decode(int, fields)  # ver 3 field
-        execution.liquidation = decode(int, fields)  # ver 4 field
+        execution.execId = decode_str(fields)
+        execution.time = decode_str(fields)
+        execution.acctNumber = decode_str(fields)
+        execution.exchange = decode_str(fields)
+        execution.side = decode_str(fields)
+        execution.shares = decode_decimal(fields)
+        execution.price = decode_float(fields)
+        execution.permId = decode_int(fields)  # ver 2 field
+        execution.clientId = decode_int(fields)  # ver 3 field
+        execution.liquidation = decode_int(fields)  # ver 4 field
 
         if version >= 6:
-            execution.cumQty = decode(Decimal, fields)
-            execution.avgPrice = decode(float, fields)
+            execution.cumQty = decode_decimal(fields)
+            execution.avgPrice = decode_float(fields)
 
         if version >= 8:
-            execution.orderRef = decode(str, fields)
+            execution.orderRef = decode_str(fields)
 
         if version >= 9:
-            execution.evRule = decode(str, fields)
-            execution.evMultiplier = decode(float, fields)
+            execution.evRule = decode_str(fields)
+            execution.evMultiplier = decode_float(fields)
         if self.serverVersion >= MIN_SERVER_VER_MODELS_SUPPORT:
-            execution.modelCode = decode(str, fields)
+            execution.modelCode = decode_str(fields)
         if self.serverVersion >= MIN_SERVER_VER_LAST_LIQUIDITY:
-            execution.lastLiquidity = decode(int, fields)
+            execution.lastLiquidity = decode_int(fields)
         if self.serverVersion >= MIN_SERVER_VER_PENDING_PRICE_REVISION:
-            execution.pendingPriceRevision = decode(bool, fields)
+            execution.pendingPriceRevision = decode_bool(fields)
         if self.serverVersion >= MIN_SERVER_VER_SUBMITTER:
-            execution.submitter = decode(str, fields)
+            execution.submitter = decode_str(fields)
 
         self.wrapper.execDetails(reqId, contract, execution)
 
     def processExecutionDataEndMsgProtoBuf(self, protobuf):
-        executionDetailsEndProto = ExecutionDetailsEndProto()
-        executionDetailsEndProto.ParseFromString(protobuf)
+        executionDetailsEndProto = parseProtoBuf(IN.EXECUTION_DATA_END, protobuf)
 
         self.wrapper.executionDetailsEndProtoBuf(executionDetailsEndProto)
 
@@ -867,8 +818,7 @@ class Decoder(Object):
         self.wrapper.execDetailsEnd(reqId)
 
     def processExecutionDataMsgProtoBuf(self, protobuf):
-        executionDetailsProto = ExecutionDetailsProto()
-        executionDetailsProto.ParseFromString(protobuf)
+        executionDetailsProto = parseProtoBuf(IN.EXECUTION_DATA, protobuf)
 
         self.wrapper.executionDetailsProtoBuf(executionDetailsProto)
 
@@ -888,30 +838,35 @@ class Decoder(Object):
 
     def processHistoricalDataMsg(self, fields):
         if self.serverVersion < MIN_SERVER_VER_SYNT_REALTIME_BARS:
-            decode(int, fields)
+            decode_int(fields)
 
-        reqId = decode(int, fields)
+        reqId = decode_int(fields)
         
         if self.serverVersion < MIN_SERVER_VER_HISTORICAL_DATA_END:
-            startDateStr = decode(str, fields)  # ver 2 field
-            endDateStr = decode(str, fields)  # ver 2 field
+            startDateStr = decode_str(fields)  # ver 2 field
+            endDateStr = decode_str(fields)  # ver 2 field
 
-        itemCount = decode(int, fields)
+        itemCount = decode_int(fields)
+
+        if self.useBarDataBatch:
+            nBarFields = 8 if self.serverVersion >= MIN_SERVER_VER_SYNT_REALTIME_BARS else 9
+            self.wrapper.historicalDataBatch(reqId, decodeBarDataBatch(fields, itemCount, nBarFields))
+            itemCount = 0
 
         for _ in range(itemCount):
             bar = BarData()
-            bar.date = decode(str, fields)
-            bar.open = decode(float, fields)
-            bar.high = decode(float, fields)
-            bar.low = decode(float, fields)
-            bar.close = decode(float, fields)
-            bar.volume = decode(Decimal, fields)
-            bar.wap = decode(Decimal, fields)
+            bar.date = decode_str(fields)
+            bar.open = decode_float(fields)
+            bar.high = decode_float(fields)
+            bar.low = decode_float(fields)
+            bar.close = decode_float(fields)
+            bar.volume = decode_decimal(fields)
+            bar.wap = decode_decimal(fields)
 
             if self.serverVersion < MIN_SERVER_VER_SYNT_REALTIME_BARS:
-                decode(str, fields)
+                decode_str(fields)
 
-            bar.barCount = decode(int, fields)  # ver 3 field
+            bar.barCount = decode_int(fields)  # ver 3 field
 
             self.wrapper.historicalData(reqId, bar)
 
@@ -920,8 +875,7 @@ class Decoder(Object):
             self.wrapper.historicalDataEnd(reqId, startDateStr, endDateStr)
 
     def processHistoricalDataMsgProtoBuf(self, protobuf):
-        historicalDataProto = HistoricalDataProto()
-        historicalDataProto.ParseFromString(protobuf)
+        historicalDataProto = parseProtoBuf(IN.HISTORICAL_DATA, protobuf)
 
         self.wrapper.historicalDataProtoBuf(historicalDataProto)
 
@@ -930,20 +884,23 @@ class Decoder(Object):
         if not historicalDataProto.historicalDataBars:
             return
 
+        if self.useBarDataBatch:
+            self.wrapper.historicalDataBatch(reqId, decodeBarDataBatchProtoBuf(historicalDataProto.historicalDataBars))
+            return
+
         for historicalDataBarProto in historicalDataProto.historicalDataBars:
             bar = decodeHistoricalDataBar(historicalDataBarProto)
             self.wrapper.historicalData(reqId, bar)
 
     def processHistoricalDataEndMsg(self, fields):
-        reqId = decode(int, fields)
-        startDateStr = decode(str, fields)
-        endDateStr = decode(str, fields)
+        reqId = decode_int(fields)
+        startDateStr = decode_str(fields)
+        endDateStr = decode_str(fields)
         
         self.wrapper.historicalDataEnd(reqId, startDateStr, endDateStr)
 
     def processHistoricalDataEndMsgProtoBuf(self, protobuf):
-        historicalDataEndProto = HistoricalDataEndProto()
-        historicalDataEndProto.ParseFromString(protobuf)
+        historicalDataEndProto = parseProtoBuf(IN.HISTORICAL_DATA_END, protobuf)
 
         self.wrapper.historicalDataEndProtoBuf(historicalDataEndProto)
 
@@ -954,21 +911,20 @@ class Decoder(Object):
         self.wrapper.historicalDataEnd(reqId, startDateStr, endDateStr)
 
     def processHistoricalDataUpdateMsg(self, fields):
-        reqId = decode(int, fields)
+        reqId = decode_int(fields)
         bar = BarData()
-        bar.barCount = decode(int, fields)
-        bar.date = decode(str, fields)
-        bar.open = decode(float, fields)
-        bar.close = decode(float, fields)
-        bar.high = decode(float, fields)
-        bar.low = decode(float, fields)
-        bar.wap = decode(Decimal, fields)
-        bar.volume = decode(Decimal, fields)
+        bar.barCount = decode_int(fields)
+        bar.date = decode_str(fields)
+        bar.open = decode_float(fields)
+        bar.close = decode_float(fields)
+        bar.high = decode_float(fields)
+        bar.low = decode_float(fields)
+        bar.wap = decode_decimal(fields)
+        bar.volume = decode_decimal(fields)
         self.wrapper.historicalDataUpdate(reqId, bar)
 
     def processHistoricalDataUpdateMsgProtoBuf(self, protobuf):
-        historicalDataUpdateProto = HistoricalDataUpdateProto()
-        historicalDataUpdateProto.ParseFromString(protobuf)
+        historicalDataUpdateProto = parseProtoBuf(IN.HISTORICAL_DATA_UPDATE, protobuf)
 
         self.wrapper.historicalDataUpdateProtoBuf(historicalDataUpdateProto)
 
@@ -981,23 +937,23 @@ class Decoder(Object):
         self.wrapper.historicalDataUpdate(reqId, bar)
 
     def processRealTimeBarMsg(self, fields):
-        decode(int, fields)
-        reqId = decode(int, fields)
+        decode_int(fields)
+        reqId = decode_int(fields)
 
         bar = RealTimeBar()
-        bar.time = decode(int, fields)
-        bar.open = decode(float, fields)
-        bar.high = decode(float, fields)
-        bar.low = decode(float, fields)
-        bar.close = decode(float, fields)
-        bar.volume = decode(Decimal, fields)
-        bar.wap = decode(Decimal, fields)
-        bar.count = decode(int, fields)
+        bar.time = decode_int(fields)
+        bar.open_ = decode_float(fields)
+        bar.high = decode_float(fields)
+        bar.low = decode_float(fields)
+        bar.close = decode_float(fields)
+        bar.volume = decode_decimal(fields)
+        bar.wap = decode_decimal(fields)
+        bar.count = decode_int(fields)
 
         self.wrapper.realtimeBar(
             reqId,
             bar.time,
-            bar.open,
+            bar.open_,
             bar.high,
             bar.low,
             bar.close,
@@ -1007,8 +963,7 @@ class Decoder(Object):
         )
 
     def processRealTimeBarMsgProtoBuf(self, protobuf):
-        realTimeBarTickProto = RealTimeBarTickProto()
-        realTimeBarTickProto.ParseFromString(protobuf)
+        realTimeBarTickProto = parseProtoBuf(IN.REAL_TIME_BARS, protobuf)
 
         self.wrapper.realTimeBarTickProtoBuf(realTimeBarTickProto)
 
@@ -1035,16 +990,16 @@ class Decoder(Object):
         undPrice = None
 
         if self.serverVersion < MIN_SERVER_VER_PRICE_BASED_VOLATILITY:
-            version = decode(int, fields)
+            version = decode_int(fields)
 
-        reqId = decode(int, fields)
-        tickTypeInt = decode(int, fields)
+        reqId = decode_int(fields)
+        tickTypeInt = decode_int(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_PRICE_BASED_VOLATILITY:
-            tickAttrib = decode(int, fields)
+            tickAttrib = decode_int(fields)
 
-        impliedVol = decode(float, fields)
-        delta = decode(float, fields)
+        impliedVol = decode_float(fields)
+        delta = decode_float(fields)
 
         if impliedVol < 0:  # -1 is the "not computed" indicator
             impliedVol = None
@@ -1056,8 +1011,8 @@ class Decoder(Object):
             or tickTypeInt == TickTypeEnum.MODEL_OPTION
             or tickTypeInt == TickTypeEnum.DELAYED_MODEL_OPTION
         ):
-            optPrice = decode(float, fields)
-            pvDividend = decode(float, fields)
+            optPrice = decode_float(fields)
+            pvDividend = decode_float(fields)
 
             if optPrice == -1:  # -1 is the "not computed" indicator
                 optPrice = None
@@ -1065,10 +1020,10 @@ class Decoder(Object):
                 pvDividend = None
 
         if version >= 6:
-            gamma = decode(float, fields)
-            vega = decode(float, fields)
-            theta = decode(float, fields)
-            undPrice = decode(float, fields)
+            gamma = decode_float(fields)
+            vega = decode_float(fields)
+            theta = decode_float(fields)
+            undPrice = decode_float(fields)
 
             if gamma == -2:  # -2 is the "not yet computed" indicator
                 gamma = None
@@ -1094,8 +1049,7 @@ class Decoder(Object):
         )
 
     def processTickOptionComputationMsgProtoBuf(self, protobuf):
-        tickOptionComputationProto = TickOptionComputationProto()
-        tickOptionComputationProto.ParseFromString(protobuf)
+        tickOptionComputationProto = parseProtoBuf(IN.TICK_OPTION_COMPUTATION, protobuf)
 
         self.wrapper.tickOptionComputationProtoBuf(tickOptionComputationProto)
 
@@ -1130,27 +1084,26 @@ class Decoder(Object):
         self.wrapper.tickOptionComputation(reqId, tickType, tickAttrib, impliedVol, delta, optPrice, pvDividend, gamma, vega, theta, undPrice)
 
     def processDeltaNeutralValidationMsg(self, fields):
-        decode(int, fields)
-        reqId = decode(int, fields)
+        decode_int(fields)
+        reqId = decode_int(fields)
 
         deltaNeutralContract = DeltaNeutralContract()
 
-        deltaNeutralContract.conId = decode(int, fields)
-        deltaNeutralContract.delta = decode(float, fields)
-        deltaNeutralContract.price = decode(float, fields)
+        deltaNeutralContract.conId = decode_int(fields)
+        deltaNeutralContract.delta = decode_float(fields)
+        deltaNeutralContract.price = decode_float(fields)
 
         self.wrapper.deltaNeutralValidation(reqId, deltaNeutralContract)
 
     def processMarketDataTypeMsg(self, fields):
-        decode(int, fields)
-        reqId = decode(int, fields)
-        marketDataType = decode(int, fields)
+        decode_int(fields)
+        reqId = decode_int(fields)
+        marketDataType = decode_int(fields)
 
         self.wrapper.marketDataType(reqId, marketDataType)
 
     def processMarketDataTypeMsgProtoBuf(self, protobuf):
-        marketDataTypeProto = MarketDataTypeProto()
-        marketDataTypeProto.ParseFromString(protobuf)
+        marketDataTypeProto = parseProtoBuf(IN.MARKET_DATA_TYPE, protobuf)
 
         self.wrapper.updateMarketDataTypeProtoBuf(marketDataTypeProto)
 
@@ -1160,21 +1113,20 @@ class Decoder(Object):
         self.wrapper.marketDataType(reqId, marketDataType)
 
     def processCommissionAndFeesReportMsg(self, fields):
-        decode(int, fields)
+        decode_int(fields)
 
         commissionAndFeesReport = CommissionAndFeesReport()
-        commissionAndFeesReport.execId = decode(str, fields)
-        commissionAndFeesReport.commissionAndFees = decode(float, fields)
-        commissionAndFeesReport.currency = decode(str, fields)
-        commissionAndFeesReport.realizedPNL = decode(float, fields)
-        commissionAndFeesReport.yield_ = decode(float, fields)
-        commissionAndFeesReport.yieldRedemptionDate = decode(int, fields)
+        commissionAndFeesReport.execId = decode_str(fields)
+        commissionAndFeesReport.commissionAndFees = decode_float(fields)
+        commissionAndFeesReport.currency = decode_str(fields)
+        commissionAndFeesReport.realizedPNL = decode_float(fields)
+        commissionAndFeesReport.yield_ = decode_float(fields)
+        commissionAndFeesReport.yieldRedemptionDate = decode_int(fields)
 
         self.wrapper.commissionAndFeesReport(commissionAndFeesReport)
 
     def processCommissionAndFeesReportMsgProtoBuf(self, protobuf):
-        commissionAndFeesReportProto = CommissionAndFeesReportProto()
-        commissionAndFeesReportProto.ParseFromString(protobuf)
+        commissionAndFeesReportProto = parseProtoBuf(IN.COMMISSION_AND_FEES_REPORT, protobuf)
     
         self.wrapper.commissionAndFeesReportProtoBuf(commissionAndFeesReportProto)
     
@@ -1189,36 +1141,35 @@ class Decoder(Object):
         self.wrapper.commissionAndFeesReport(commissionAndFeesReport)
 
     def processPositionDataMsg(self, fields):
-        version = decode(int, fields)
+        version = decode_int(fields)
 
-        account = decode(str, fields)
+        account = decode_str(fields)
 
         # decode contract fields
         contract = Contract()
-        contract.conId = decode(int, fields)
-        contract.symbol = decode(str, fields)
-        contract.secType = decode(str, fields)
-        contract.lastTradeDateOrContractMonth = decode(str, fields)
-        contract.strike = decode(float, fields)
-        contract.right = decode(str, fields)
-        contract.multiplier = decode(str, fields)
-        contract.exchange = decode(str, fields)
-        contract.currency = decode(str, fields)
-        contract.localSymbol = decode(str, fields)
+        contract.conId = decode_int(fields)
+        contract.symbol = decode_str(fields)
+        contract.secType = decode_str(fields)
+        contract.lastTradeDateOrContractMonth = decode_str(fields)
+        contract.strike = decode_float(fields)
+        contract.right = decode_str(fields)
+        contract.multiplier = decode_str(fields)
+        contract.exchange = decode_str(fields)
+        contract.currency = decode_str(fields)
+        contract.localSymbol = decode_str(fields)
         if version >= 2:
-            contract.tradingClass = decode(str, fields)
+            contract.tradingClass = decode_str(fields)
 
-        position = decode(Decimal, fields)
+        position = decode_decimal(fields)
 
         avgCost = 0.0
         if version >= 3:
-            avgCost = decode(float, fields)
+            avgCost = decode_float(fields)
 
         self.wrapper.position(account, contract, position, avgCost)
 
     def processPositionMsgProtoBuf(self, protobuf):
-        positionProto = PositionProto()
-        positionProto.ParseFromString(protobuf)
+        positionProto = parseProtoBuf(IN.POSITION_DATA, protobuf)
 
         self.wrapper.positionProtoBuf(positionProto)
 
@@ -1234,34 +1185,33 @@ class Decoder(Object):
         self.wrapper.position(account, contract, position, avgCost)
 
     def processPositionMultiMsg(self, fields):
-        decode(int, fields)
-        reqId = decode(int, fields)
-        account = decode(str, fields)
+        decode_int(fields)
+        reqId = decode_int(fields)
+        account = decode_str(fields)
 
         # decode contract fields
         contract = Contract()
-        contract.conId = decode(int, fields)
-        contract.symbol = decode(str, fields)
-        contract.secType = decode(str, fields)
-        contract.lastTradeDateOrContractMonth = decode(str, fields)
-        contract.strike = decode(float, fields)
-        contract.right = decode(str, fields)
-        contract.multiplier = decode(str, fields)
-        contract.exchange = decode(str, fields)
-        contract.currency = decode(str, fields)
-        contract.localSymbol = decode(str, fields)
-        contract.tradingClass = decode(str, fields)
-        position = decode(Decimal, fields)
-        avgCost = decode(float, fields)
-        modelCode = decode(str, fields)
+        contract.conId = decode_int(fields)
+        contract.symbol = decode_str(fields)
+        contract.secType = decode_str(fields)
+        contract.lastTradeDateOrContractMonth = decode_str(fields)
+        contract.strike = decode_float(fields)
+        contract.right = decode_str(fields)
+        contract.multiplier = decode_str(fields)
+        contract.exchange = decode_str(fields)
+        contract.currency = decode_str(fields)
+        contract.localSymbol = decode_str(fields)
+        contract.tradingClass = decode_str(fields)
+        position = decode_decimal(fields)
+        avgCost = decode_float(fields)
+        modelCode = decode_str(fields)
 
         self.wrapper.positionMulti(
             reqId, account, modelCode, contract, position, avgCost
         )
 
     def processPositionMultiMsgProtoBuf(self, protobuf):
-        positionMultiProto = PositionMultiProto()
-        positionMultiProto.ParseFromString(protobuf)
+        positionMultiProto = parseProtoBuf(IN.POSITION_MULTI, protobuf)
 
         self.wrapper.positionMultiProtoBuf(positionMultiProto)
 
@@ -1280,22 +1230,22 @@ class Decoder(Object):
         self.wrapper.positionMulti(reqId, account, modelCode, contract, position, avgCost)
 
     def processSecurityDefinitionOptionParameterMsg(self, fields):
-        reqId = decode(int, fields)
-        exchange = decode(str, fields)
-        underlyingConId = decode(int, fields)
-        tradingClass = decode(str, fields)
-        multiplier = decode(str, fields)
+        reqId = decode_int(fields)
+        exchange = decode_str(fields)
+        underlyingConId = decode_int(fields)
+        tradingClass = decode_str(fields)
+        multiplier = decode_str(fields)
 
-        expCount = decode(int, fields)
+        expCount = decode_int(fields)
         expirations = set()
         for _ in range(expCount):
-            expiration = decode(str, fields)
+            expiration = decode_str(fields)
             expirations.add(expiration)
 
-        strikeCount = decode(int, fields)
+        strikeCount = decode_int(fields)
         strikes = set()
         for _ in range(strikeCount):
-            strike = decode(float, fields)
+            strike = decode_float(fields)
             strikes.add(strike)
 
         self.wrapper.securityDefinitionOptionParameter(
@@ -1309,8 +1259,7 @@ class Decoder(Object):
         )
 
     def processSecurityDefinitionOptionParameterMsgProtoBuf(self, protobuf):
-        secDefOptParameterProto = SecDefOptParameterProto()
-        secDefOptParameterProto.ParseFromString(protobuf)
+        secDefOptParameterProto = parseProtoBuf(IN.SECURITY_DEFINITION_OPTION_PARAMETER, protobuf)
     
         self.wrapper.secDefOptParameterProtoBuf(secDefOptParameterProto)
     
@@ -1333,12 +1282,11 @@ class Decoder(Object):
         self.wrapper.securityDefinitionOptionParameter(reqId, exchange, underlyingConId, tradingClass, multiplier, expirations, strikes)
 
     def processSecurityDefinitionOptionParameterEndMsg(self, fields):
-        reqId = decode(int, fields)
+        reqId = decode_int(fields)
         self.wrapper.securityDefinitionOptionParameterEnd(reqId)
 
     def processSecurityDefinitionOptionParameterEndMsgProtoBuf(self, protobuf):
-        secDefOptParameterEndProto = SecDefOptParameterEndProto()
-        secDefOptParameterEndProto.ParseFromString(protobuf)
+        secDefOptParameterEndProto = parseProtoBuf(IN.SECURITY_DEFINITION_OPTION_PARAMETER_END, protobuf)
     
         self.wrapper.secDefOptParameterEndProtoBuf(secDefOptParameterEndProto)
     
@@ -1347,22 +1295,21 @@ class Decoder(Object):
         self.wrapper.securityDefinitionOptionParameterEnd(reqId)
 
     def processSoftDollarTiersMsg(self, fields):
-        reqId = decode(int, fields)
-        nTiers = decode(int, fields)
+        reqId = decode_int(fields)
+        nTiers = decode_int(fields)
 
         tiers = []
         for _ in range(nTiers):
             tier = SoftDollarTier()
-            tier.name = decode(str, fields)
-            tier.val = decode(str, fields)
-            tier.displayName = decode(str, fields)
+            tier.name = decode_str(fields)
+            tier.val = decode_str(fields)
+            tier.displayName = decode_str(fields)
             tiers.append(tier)
 
         self.wrapper.softDollarTiers(reqId, tiers)
 
     def processSoftDollarTiersMsgProtoBuf(self, protobuf):
-        softDollarTiersProto = SoftDollarTiersProto()
-        softDollarTiersProto.ParseFromString(protobuf)
+        softDollarTiersProto = parseProtoBuf(IN.SOFT_DOLLAR_TIERS, protobuf)
     
         self.wrapper.softDollarTiersProtoBuf(softDollarTiersProto)
     
@@ -1377,19 +1324,18 @@ class Decoder(Object):
         self.wrapper.softDollarTiers(reqId, tiers)
 
     def processFamilyCodesMsg(self, fields):
-        nFamilyCodes = decode(int, fields)
+        nFamilyCodes = decode_int(fields)
         familyCodes = []
         for _ in range(nFamilyCodes):
             famCode = FamilyCode()
-            famCode.accountID = decode(str, fields)
-            famCode.familyCodeStr = decode(str, fields)
+            famCode.accountID = decode_str(fields)
+            famCode.familyCodeStr = decode_str(fields)
             familyCodes.append(famCode)
 
         self.wrapper.familyCodes(familyCodes)
 
     def processFamilyCodesMsgProtoBuf(self, protobuf):
-        familyCodesProto = FamilyCodesProto()
-        familyCodesProto.ParseFromString(protobuf)
+        familyCodesProto = parseProtoBuf(IN.FAMILY_CODES, protobuf)
     
         self.wrapper.familyCodesProtoBuf(familyCodesProto)
     
@@ -1402,34 +1348,33 @@ class Decoder(Object):
         self.wrapper.familyCodes(familyCodes)
 
     def processSymbolSamplesMsg(self, fields):
-        reqId = decode(int, fields)
-        nContractDescriptions = decode(int, fields)
+        reqId = decode_int(fields)
+        nContractDescriptions = decode_int(fields)
         contractDescriptions = []
         for _ in range(nContractDescriptions):
             conDesc = ContractDescription()
-            conDesc.contract.conId = decode(int, fields)
-            conDesc.contract.symbol = decode(str, fields)
-            conDesc.contract.secType = decode(str, fields)
-            conDesc.contract.primaryExchange = decode(str, fields)
-            conDesc.contract.currency = decode(str, fields)
+            conDesc.contract.conId = decode_int(fields)
+            conDesc.contract.symbol = decode_str(fields)
+            conDesc.contract.secType = decode_str(fields)
+            conDesc.contract.primaryExchange = decode_str(fields)
+            conDesc.contract.currency = decode_str(fields)
 
-            nDerivativeSecTypes = decode(int, fields)
+            nDerivativeSecTypes = decode_int(fields)
             conDesc.derivativeSecTypes = []
             for _ in range(nDerivativeSecTypes):
-                derivSecType = decode(str, fields)
+                derivSecType = decode_str(fields)
                 conDesc.derivativeSecTypes.append(derivSecType)
             contractDescriptions.append(conDesc)
 
             if self.serverVersion >= MIN_SERVER_VER_BOND_ISSUERID:
-                conDesc.contract.description = decode(str, fields)
-                conDesc.contract.issuerId = decode(str, fields)
+                conDesc.contract.description = decode_str(fields)
+                conDesc.contract.issuerId = decode_str(fields)
 
         self.wrapper.symbolSamples(reqId, contractDescriptions)
 
 
     def processSymbolSamplesMsgProtoBuf(self, protobuf):
-        symbolSamplesProto = SymbolSamplesProto()
-        symbolSamplesProto.ParseFromString(protobuf)
+        symbolSamplesProto = parseProtoBuf(IN.SYMBOL_SAMPLES, protobuf)
     
         self.wrapper.symbolSamplesProtoBuf(symbolSamplesProto)
     
@@ -1456,22 +1401,21 @@ class Decoder(Object):
         self.wrapper.symbolSamples(reqId, contractDescriptions)
 
     def processSmartComponents(self, fields):
-        reqId = decode(int, fields)
-        n = decode(int, fields)
+        reqId = decode_int(fields)
+        n = decode_int(fields)
 
         smartComponentMap = []
         for _ in range(n):
             smartComponent = SmartComponent()
-            smartComponent.bitNumber = decode(int, fields)
-            smartComponent.exchange = decode(str, fields)
-            smartComponent.exchangeLetter = decode(str, fields)
+            smartComponent.bitNumber = decode_int(fields)
+            smartComponent.exchange = decode_str(fields)
+            smartComponent.exchangeLetter = decode_str(fields)
             smartComponentMap.append(smartComponent)
 
         self.wrapper.smartComponents(reqId, smartComponentMap)
 
     def processSmartComponentsMsgProtoBuf(self, protobuf):
-        smartComponentsProto = SmartComponentsProto()
-        smartComponentsProto.ParseFromString(protobuf)
+        smartComponentsProto = parseProtoBuf(IN.SMART_COMPONENTS, protobuf)
     
         self.wrapper.smartComponentsProtoBuf(smartComponentsProto)
     
@@ -1484,15 +1428,14 @@ class Decoder(Object):
         self.wrapper.smartComponents(reqId, smartComponentsMap)
 
     def processTickReqParams(self, fields):
-        tickerId = decode(int, fields)
-        minTick = decode(float, fields)
-        bboExchange = decode(str, fields)
-        snapshotPermissions = decode(int, fields)
+        tickerId = decode_int(fields)
+        minTick = decode_float(fields)
+        bboExchange = decode_str(fields)
+        snapshotPermissions = decode_int(fields)
         self.wrapper.tickReqParams(tickerId, minTick, bboExchange, snapshotPermissions)
 
     def processTickReqParamsMsgProtoBuf(self, protobuf):
-        tickReqParamsProto = TickReqParamsProto()
-        tickReqParamsProto.ParseFromString(protobuf)
+        tickReqParamsProto = parseProtoBuf(IN.TICK_REQ_PARAMS, protobuf)
 
         self.wrapper.tickReqParamsProtoBuf(tickReqParamsProto)
 
@@ -1505,26 +1448,25 @@ class Decoder(Object):
 
     def processMktDepthExchanges(self, fields):
         depthMktDataDescriptions = []
-        nDepthMktDataDescriptions = decode(int, fields)
+        nDepthMktDataDescriptions = decode_int(fields)
 
         if nDepthMktDataDescriptions > 0:
             for _ in range(nDepthMktDataDescriptions):
                 desc = DepthMktDataDescription()
-                desc.exchange = decode(str, fields)
-                desc.secType = decode(str, fields)
+                desc.exchange = decode_str(fields)
+                desc.secType = decode_str(fields)
                 if self.serverVersion >= MIN_SERVER_VER_SERVICE_DATA_TYPE:
-                    desc.listingExch = decode(str, fields)
-                    desc.serviceDataType = decode(str, fields)
-                    desc.aggGroup = decode(int, fields)
+                    desc.listingExch = decode_str(fields)
+                    desc.serviceDataType = decode_str(fields)
+                    desc.aggGroup = decode_int(fields)
                 else:
-                    decode(int, fields)  # boolean notSuppIsL2
+                    decode_int(fields)  # boolean notSuppIsL2
                 depthMktDataDescriptions.append(desc)
 
         self.wrapper.mktDepthExchanges(depthMktDataDescriptions)
 
     def processMktDepthExchangesMsgProtoBuf(self, protobuf):
-        marketDepthExchangesProto = MarketDepthExchangesProto()
-        marketDepthExchangesProto.ParseFromString(protobuf)
+        marketDepthExchangesProto = parseProtoBuf(IN.MKT_DEPTH_EXCHANGES, protobuf)
     
         self.wrapper.marketDepthExchangesProtoBuf(marketDepthExchangesProto)
     
@@ -1536,13 +1478,12 @@ class Decoder(Object):
         self.wrapper.mktDepthExchanges(depthMktDataDescriptions)
 
     def processHeadTimestamp(self, fields):
-        reqId = decode(int, fields)
-        headTimestamp = decode(str, fields)
+        reqId = decode_int(fields)
+        headTimestamp = decode_str(fields)
         self.wrapper.headTimestamp(reqId, headTimestamp)
 
     def processHeadTimestampMsgProtoBuf(self, protobuf):
-        headTimestampProto = HeadTimestampProto()
-        headTimestampProto.ParseFromString(protobuf)
+        headTimestampProto = parseProtoBuf(IN.HEAD_TIMESTAMP, protobuf)
 
         self.wrapper.headTimestampProtoBuf(headTimestampProto)
 
@@ -1552,19 +1493,18 @@ class Decoder(Object):
         self.wrapper.headTimestamp(reqId, headTimestamp)
 
     def processTickNews(self, fields):
-        tickerId = decode(int, fields)
-        timeStamp = decode(int, fields)
-        providerCode = decode(str, fields)
-        articleId = decode(str, fields)
-        headline = decode(str, fields)
-        extraData = decode(str, fields)
+        tickerId = decode_int(fields)
+        timeStamp = decode_int(fields)
+        providerCode = decode_str(fields)
+        articleId = decode_str(fields)
+        headline = decode_str(fields)
+        extraData = decode_str(fields)
         self.wrapper.tickNews(
             tickerId, timeStamp, providerCode, articleId, headline, extraData
         )
 
     def processTickNewsMsgProtoBuf(self, protobuf):
-        tickNewsProto = TickNewsProto()
-        tickNewsProto.ParseFromString(protobuf)
+        tickNewsProto = parseProtoBuf(IN.TICK_NEWS, protobuf)
 
         self.wrapper.tickNewsProtoBuf(tickNewsProto)
 
@@ -1579,19 +1519,18 @@ class Decoder(Object):
 
     def processNewsProviders(self, fields):
         newsProviders = []
-        nNewsProviders = decode(int, fields)
+        nNewsProviders = decode_int(fields)
         if nNewsProviders > 0:
             for _ in range(nNewsProviders):
                 provider = NewsProvider()
-                provider.code = decode(str, fields)
-                provider.name = decode(str, fields)
+                provider.code = decode_str(fields)
+                provider.name = decode_str(fields)
                 newsProviders.append(provider)
 
         self.wrapper.newsProviders(newsProviders)
 
     def processNewsProvidersMsgProtoBuf(self, protobuf):
-        newsProvidersProto = NewsProvidersProto()
-        newsProvidersProto.ParseFromString(protobuf)
+        newsProvidersProto = parseProtoBuf(IN.NEWS_PROVIDERS, protobuf)
 
         self.wrapper.newsProvidersProtoBuf(newsProvidersProto)
 
@@ -1606,14 +1545,13 @@ class Decoder(Object):
         self.wrapper.newsProviders(newsProviders)
 
     def processNewsArticle(self, fields):
-        reqId = decode(int, fields)
-        articleType = decode(int, fields)
-        articleText = decode(str, fields)
+        reqId = decode_int(fields)
+        articleType = decode_int(fields)
+        articleText = decode_str(fields)
         self.wrapper.newsArticle(reqId, articleType, articleText)
 
     def processNewsArticleMsgProtoBuf(self, protobuf):
-        newsArticleProto = NewsArticleProto()
-        newsArticleProto.ParseFromString(protobuf)
+        newsArticleProto = parseProtoBuf(IN.NEWS_ARTICLE, protobuf)
 
         self.wrapper.newsArticleProtoBuf(newsArticleProto)
 
@@ -1624,16 +1562,15 @@ class Decoder(Object):
         self.wrapper.newsArticle(reqId, articleType, articleText)
 
     def processHistoricalNews(self, fields):
-        requestId = decode(int, fields)
-        time = decode(str, fields)
-        providerCode = decode(str, fields)
-        articleId = decode(str, fields)
-        headline = decode(str, fields)
+        requestId = decode_int(fields)
+        time = decode_str(fields)
+        providerCode = decode_str(fields)
+        articleId = decode_str(fields)
+        headline = decode_str(fields)
         self.wrapper.historicalNews(requestId, time, providerCode, articleId, headline)
 
     def processHistoricalNewsMsgProtoBuf(self, protobuf):
-        historicalNewsProto = HistoricalNewsProto()
-        historicalNewsProto.ParseFromString(protobuf)
+        historicalNewsProto = parseProtoBuf(IN.HISTORICAL_NEWS, protobuf)
 
         self.wrapper.historicalNewsProtoBuf(historicalNewsProto)
 
@@ -1646,13 +1583,12 @@ class Decoder(Object):
         self.wrapper.historicalNews(reqId, time, providerCode, articleId, headline)
 
     def processHistoricalNewsEnd(self, fields):
-        reqId = decode(int, fields)
-        hasMore = decode(bool, fields)
+        reqId = decode_int(fields)
+        hasMore = decode_bool(fields)
         self.wrapper.historicalNewsEnd(reqId, hasMore)
 
     def processHistoricalNewsEndMsgProtoBuf(self, protobuf):
-        historicalNewsEndProto = HistoricalNewsEndProto()
-        historicalNewsEndProto.ParseFromString(protobuf)
+        historicalNewsEndProto = parseProtoBuf(IN.HISTORICAL_NEWS_END, protobuf)
 
         self.wrapper.historicalNewsEndProtoBuf(historicalNewsEndProto)
 
@@ -1662,21 +1598,20 @@ class Decoder(Object):
         self.wrapper.historicalNewsEnd(reqId, hasMore)
 
     def processHistogramData(self, fields):
-        reqId = decode(int, fields)
-        numPoints = decode(int, fields)
+        reqId = decode_int(fields)
+        numPoints = decode_int(fields)
 
         histogram = []
         for _ in range(numPoints):
             dataPoint = HistogramData()
-            dataPoint.price = decode(float, fields)
-            dataPoint.size = decode(Decimal, fields)
+            dataPoint.price = decode_float(fields)
+            dataPoint.size = decode_decimal(fields)
             histogram.append(dataPoint)
 
         self.wrapper.histogramData(reqId, histogram)
 
     def processHistogramDataMsgProtoBuf(self, protobuf):
-        histogramDataProto = HistogramDataProto()
-        histogramDataProto.ParseFromString(protobuf)
+        histogramDataProto = parseProtoBuf(IN.HISTOGRAM_DATA, protobuf)
 
         self.wrapper.histogramDataProtoBuf(histogramDataProto)
 
@@ -1691,15 +1626,14 @@ class Decoder(Object):
         self.wrapper.histogramData(reqId, histogram)
 
     def processRerouteMktDataReq(self, fields):
-        reqId = decode(int, fields)
-        conId = decode(int, fields)
-        exchange = decode(str, fields)
+        reqId = decode_int(fields)
+        conId = decode_int(fields)
+        exchange = decode_str(fields)
 
         self.wrapper.rerouteMktDataReq(reqId, conId, exchange)
 
     def processRerouteMktDataReqMsgProtoBuf(self, protobuf):
-        rerouteMarketDataRequestProto = RerouteMarketDataRequestProto()
-        rerouteMarketDataRequestProto.ParseFromString(protobuf)
+        rerouteMarketDataRequestProto = parseProtoBuf(IN.REROUTE_MKT_DATA_REQ, protobuf)
     
         self.wrapper.rerouteMarketDataRequestProtoBuf(rerouteMarketDataRequestProto)
     
@@ -1710,15 +1644,14 @@ class Decoder(Object):
         self.wrapper.rerouteMktDataReq(reqId, conId, exchange)
 
     def processRerouteMktDepthReq(self, fields):
-        reqId = decode(int, fields)
-        conId = decode(int, fields)
-        exchange = decode(str, fields)
+        reqId = decode_int(fields)
+        conId = decode_int(fields)
+        exchange = decode_str(fields)
 
         self.wrapper.rerouteMktDepthReq(reqId, conId, exchange)
 
     def processRerouteMktDepthReqMsgProtoBuf(self, protobuf):
-        rerouteMarketDepthRequestProto = RerouteMarketDepthRequestProto()
-        rerouteMarketDepthRequestProto.ParseFromString(protobuf)
+        rerouteMarketDepthRequestProto = parseProtoBuf(IN.REROUTE_MKT_DEPTH_REQ, protobuf)
     
         self.wrapper.rerouteMarketDepthRequestProtoBuf(rerouteMarketDepthRequestProto)
     
@@ -1729,23 +1662,22 @@ class Decoder(Object):
         self.wrapper.rerouteMktDepthReq(reqId, conId, exchange)
 
     def processMarketRuleMsg(self, fields):
-        marketRuleId = decode(int, fields)
+        marketRuleId = decode_int(fields)
 
-        nPriceIncrements = decode(int, fields)
+        nPriceIncrements = decode_int(fields)
         priceIncrements = []
 
         if nPriceIncrements > 0:
             for _ in range(nPriceIncrements):
                 prcInc = PriceIncrement()
-                prcInc.lowEdge = decode(float, fields)
-                prcInc.increment = decode(float, fields)
+                prcInc.lowEdge = decode_float(fields)
+                prcInc.increment = decode_float(fields)
                 priceIncrements.append(prcInc)
 
         self.wrapper.marketRule(marketRuleId, priceIncrements)
 
     def processMarketRuleMsgProtoBuf(self, protobuf):
-        marketRuleProto = MarketRuleProto()
-        marketRuleProto.ParseFromString(protobuf)
+        marketRuleProto = parseProtoBuf(IN.MARKET_RULE, protobuf)
     
         self.wrapper.marketRuleProtoBuf(marketRuleProto)
     
@@ -1760,22 +1692,21 @@ class Decoder(Object):
         self.wrapper.marketRule(marketRuleId, priceIncrements)
 
     def processPnLMsg(self, fields):
-        reqId = decode(int, fields)
-        dailyPnL = decode(float, fields)
+        reqId = decode_int(fields)
+        dailyPnL = decode_float(fields)
         unrealizedPnL = None
         realizedPnL = None
 
         if self.serverVersion >= MIN_SERVER_VER_UNREALIZED_PNL:
-            unrealizedPnL = decode(float, fields)
+            unrealizedPnL = decode_float(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_REALIZED_PNL:
-            realizedPnL = decode(float, fields)
+            realizedPnL = decode_float(fields)
 
         self.wrapper.pnl(reqId, dailyPnL, unrealizedPnL, realizedPnL)
 
     def processPnLMsgProtoBuf(self, protobuf):
-        pnlProto = PnLProto()
-        pnlProto.ParseFromString(protobuf)
+        pnlProto = parseProtoBuf(IN.PNL, protobuf)
 
         self.wrapper.pnlProtoBuf(pnlProto)
 
@@ -1787,25 +1718,24 @@ class Decoder(Object):
         self.wrapper.pnl(reqId, dailyPnL, unrealizedPnL, realizedPnL)
 
     def processPnLSingleMsg(self, fields):
-        reqId = decode(int, fields)
-        pos = decode(Decimal, fields)
-        dailyPnL = decode(float, fields)
+        reqId = decode_int(fields)
+        pos = decode_decimal(fields)
+        dailyPnL = decode_float(fields)
         unrealizedPnL = None
         realizedPnL = None
 
         if self.serverVersion >= MIN_SERVER_VER_UNREALIZED_PNL:
-            unrealizedPnL = decode(float, fields)
+            unrealizedPnL = decode_float(fields)
 
         if self.serverVersion >= MIN_SERVER_VER_REALIZED_PNL:
-            realizedPnL = decode(float, fields)
+            realizedPnL = decode_float(fields)
 
-        value = decode(float, fields)
+        value = decode_float(fields)
 
         self.wrapper.pnlSingle(reqId, pos, dailyPnL, unrealizedPnL, realizedPnL, value)
 
     def processPnLSingleMsgProtoBuf(self, protobuf):
-        pnlSingleProto = PnLSingleProto()
-        pnlSingleProto.ParseFromString(protobuf)
+        pnlSingleProto = parseProtoBuf(IN.PNL_SINGLE, protobuf)
 
         self.wrapper.pnlSingleProtoBuf(pnlSingleProto)
 
@@ -1819,26 +1749,25 @@ class Decoder(Object):
         self.wrapper.pnlSingle(reqId, pos, dailyPnL, unrealizedPnL, realizedPnL, value)
 
     def processHistoricalTicks(self, fields):
-        reqId = decode(int, fields)
-        tickCount = decode(int, fields)
+        reqId = decode_int(fields)
+        tickCount = decode_int(fields)
 
         ticks = []
 
         for _ in range(tickCount):
             historicalTick = HistoricalTick()
-            historicalTick.time = decode(int, fields)
+            historicalTick.time = decode_int(fields)
             next(fields)  # for consistency
-            historicalTick.price = decode(float, fields)
-            historicalTick.size = decode(Decimal, fields)
+            historicalTick.price = decode_float(fields)
+            historicalTick.size = decode_decimal(fields)
             ticks.append(historicalTick)
 
-        done = decode(bool, fields)
+        done = decode_bool(fields)
 
         self.wrapper.historicalTicks(reqId, ticks, done)
 
     def processHistoricalTicksMsgProtoBuf(self, protobuf):
-        historicalTicksProto = HistoricalTicksProto()
-        historicalTicksProto.ParseFromString(protobuf)
+        historicalTicksProto = parseProtoBuf(IN.HISTORICAL_TICKS, protobuf)
 
         self.wrapper.historicalTicksProtoBuf(historicalTicksProto)
 
@@ -1854,32 +1783,31 @@ class Decoder(Object):
         self.wrapper.historicalTicks(reqId, historicalTicks, isDone)
 
     def processHistoricalTicksBidAsk(self, fields):
-        reqId = decode(int, fields)
-        tickCount = decode(int, fields)
+        reqId = decode_int(fields)
+        tickCount = decode_int(fields)
 
         ticks = []
 
         for _ in range(tickCount):
             historicalTickBidAsk = HistoricalTickBidAsk()
-            historicalTickBidAsk.time = decode(int, fields)
-            mask = decode(int, fields)
+            historicalTickBidAsk.time = decode_int(fields)
+            mask = decode_int(fields)
             tickAttribBidAsk = TickAttribBidAsk()
             tickAttribBidAsk.askPastHigh = mask & 1 != 0
             tickAttribBidAsk.bidPastLow = mask & 2 != 0
             historicalTickBidAsk.tickAttribBidAsk = tickAttribBidAsk
-            historicalTickBidAsk.priceBid = decode(float, fields)
-            historicalTickBidAsk.priceAsk = decode(float, fields)
-            historicalTickBidAsk.sizeBid = decode(Decimal, fields)
-            historicalTickBidAsk.sizeAsk = decode(Decimal, fields)
+            historicalTickBidAsk.priceBid = decode_float(fields)
+            historicalTickBidAsk.priceAsk = decode_float(fields)
+            historicalTickBidAsk.sizeBid = decode_decimal(fields)
+            historicalTickBidAsk.sizeAsk = decode_decimal(fields)
             ticks.append(historicalTickBidAsk)
 
-        done = decode(bool, fields)
+        done = decode_bool(fields)
 
         self.wrapper.historicalTicksBidAsk(reqId, ticks, done)
 
     def processHistoricalTicksBidAskMsgProtoBuf(self, protobuf):
-        historicalTicksBidAskProto = HistoricalTicksBidAskProto()
-        historicalTicksBidAskProto.ParseFromString(protobuf)
+        historicalTicksBidAskProto = parseProtoBuf(IN.HISTORICAL_TICKS_BID_ASK, protobuf)
 
         self.wrapper.historicalTicksBidAskProtoBuf(historicalTicksBidAskProto)
 
@@ -1895,32 +1823,31 @@ class Decoder(Object):
         self.wrapper.historicalTicksBidAsk(reqId, historicalTicksBidAsk, isDone)
 
     def processHistoricalTicksLast(self, fields):
-        reqId = decode(int, fields)
-        tickCount = decode(int, fields)
+        reqId = decode_int(fields)
+        tickCount = decode_int(fields)
 
         ticks = []
 
         for _ in range(tickCount):
             historicalTickLast = HistoricalTickLast()
-            historicalTickLast.time = decode(int, fields)
-            mask = decode(int, fields)
+            historicalTickLast.time = decode_int(fields)
+            mask = decode_int(fields)
             tickAttribLast = TickAttribLast()
             tickAttribLast.pastLimit = mask & 1 != 0
             tickAttribLast.unreported = mask & 2 != 0
             historicalTickLast.tickAttribLast = tickAttribLast
-            historicalTickLast.price = decode(float, fields)
-            historicalTickLast.size = decode(Decimal, fields)
-            historicalTickLast.exchange = decode(str, fields)
-            historicalTickLast.specialConditions = decode(str, fields)
+            historicalTickLast.price = decode_float(fields)
+            historicalTickLast.size = decode_decimal(fields)
+            historicalTickLast.exchange = decode_str(fields)
+            historicalTickLast.specialConditions = decode_str(fields)
             ticks.append(historicalTickLast)
 
-        done = decode(bool, fields)
+        done = decode_bool(fields)
 
         self.wrapper.historicalTicksLast(reqId, ticks, done)
 
     def processHistoricalTicksLastMsgProtoBuf(self, protobuf):
-        historicalTicksLastProto = HistoricalTicksLastProto()
-        historicalTicksLastProto.ParseFromString(protobuf)
+        historicalTicksLastProto = parseProtoBuf(IN.HISTORICAL_TICKS_LAST, protobuf)
 
         self.wrapper.historicalTicksLastProtoBuf(historicalTicksLastProto)
 
@@ -1936,24 +1863,24 @@ class Decoder(Object):
         self.wrapper.historicalTicksLast(reqId, historicalTicksLast, isDone)
 
     def processTickByTickMsg(self, fields):
-        reqId = decode(int, fields)
-        tickType = decode(int, fields)
-        time = decode(int, fields)
+        reqId = decode_int(fields)
+        tickType = decode_int(fields)
+        time = decode_int(fields)
 
         if tickType == 0:
             # None
             pass
         elif tickType == 1 or tickType == 2:
             # Last or AllLast
-            price = decode(float, fields)
-            size = decode(Decimal, fields)
-            mask = decode(int, fields)
+            price = decode_float(fields)
+            size = decode_decimal(fields)
+            mask = decode_int(fields)
 
             tickAttribLast = TickAttribLast()
             tickAttribLast.pastLimit = mask & 1 != 0
             tickAttribLast.unreported = mask & 2 != 0
-            exchange = decode(str, fields)
-            specialConditions = decode(str, fields)
+            exchange = decode_str(fields)
+            specialConditions = decode_str(fields)
 
             self.wrapper.tickByTickAllLast(
                 reqId,
@@ -1967,11 +1894,11 @@ class Decoder(Object):
             )
         elif tickType == 3:
             # BidAsk
-            bidPrice = decode(float, fields)
-            askPrice = decode(float, fields)
-            bidSize = decode(Decimal, fields)
-            askSize = decode(Decimal, fields)
-            mask = decode(int, fields)
+            bidPrice = decode_float(fields)
+            askPrice = decode_float(fields)
+            bidSize = decode_decimal(fields)
+            askSize = decode_decimal(fields)
+            mask = decode_int(fields)
             tickAttribBidAsk = TickAttribBidAsk()
             tickAttribBidAsk.bidPastLow = mask & 1 != 0
             tickAttribBidAsk.askPastHigh = mask & 2 != 0
@@ -1981,13 +1908,12 @@ class Decoder(Object):
             )
         elif tickType == 4:
             # MidPoint
-            midPoint = decode(float, fields)
+            midPoint = decode_float(fields)
 
             self.wrapper.tickByTickMidPoint(reqId, time, midPoint)
 
     def processTickByTickMsgProtoBuf(self, protobuf):
-        tickByTickDataProto = TickByTickDataProto()
-        tickByTickDataProto.ParseFromString(protobuf)
+        tickByTickDataProto = parseProtoBuf(IN.TICK_BY_TICK, protobuf)
 
         self.wrapper.tickByTickDataProtoBuf(tickByTickDataProto)
 
@@ -2031,15 +1957,14 @@ class Decoder(Object):
                 self.wrapper.tickByTickMidPoint(reqId, historicalTick.time, historicalTick.price)
 
     def processOrderBoundMsg(self, fields):
-        permId = decode(int, fields)
-        clientId = decode(int, fields)
-        orderId = decode(int, fields)
+        permId = decode_int(fields)
+        clientId = decode_int(fields)
+        orderId = decode_int(fields)
 
         self.wrapper.orderBound(permId, clientId, orderId)
 
     def processOrderBoundMsgProtoBuf(self, protobuf):
-        orderBoundProto = OrderBoundProto()
-        orderBoundProto.ParseFromString(protobuf)
+        orderBoundProto = parseProtoBuf(IN.ORDER_BOUND, protobuf)
 
         self.wrapper.orderBoundProtoBuf(orderBoundProto)
 
@@ -2050,20 +1975,19 @@ class Decoder(Object):
         self.wrapper.orderBound(permId, clientId, orderId)
 
     def processMarketDepthMsg(self, fields):
-        decode(int, fields)
-        reqId = decode(int, fields)
+        decode_int(fields)
+        reqId = decode_int(fields)
 
-        position = decode(int, fields)
-        operation = decode(int, fields)
-        side = decode(int, fields)
-        price = decode(float, fields)
-        size = decode(Decimal, fields)
+        position = decode_int(fields)
+        operation = decode_int(fields)
+        side = decode_int(fields)
+        price = decode_float(fields)
+        size = decode_decimal(fields)
 
         self.wrapper.updateMktDepth(reqId, position, operation, side, price, size)
 
     def processMarketDepthMsgProtoBuf(self, protobuf):
-        marketDepthProto = MarketDepthProto()
-        marketDepthProto.ParseFromString(protobuf)
+        marketDepthProto = parseProtoBuf(IN.MARKET_DEPTH, protobuf)
 
         self.wrapper.updateMarketDepthProtoBuf(marketDepthProto)
 
@@ -2083,27 +2007,26 @@ class Decoder(Object):
         self.wrapper.updateMktDepth(reqId, position, operation, side, price, size)
 
     def processMarketDepthL2Msg(self, fields):
-        decode(int, fields)
-        reqId = decode(int, fields)
-
-        position = decode(int, fields)
-        marketMaker = decode(str, fields)
-        operation = decode(int, fields)
-        side = decode(int, fields)
-        price = decode(float, fields)
-        size = decode(Decimal, fields)
+        decode_int(fields)
+        reqId = decode_int(fields)
+
+        position = decode_int(fields)
+        marketMaker = decode_str(fields)
+        operation = decode_int(fields)
+        side = decode_int(fields)
+        price = decode_float(fields)
+        size = decode_decimal(fields)
         isSmartDepth = False
 
         if self.serverVersion >= MIN_SERVER_VER_SMART_DEPTH:
-            isSmartDepth = decode(bool, fields)
+            isSmartDepth = decode_bool(fields)
 
         self.wrapper.updateMktDepthL2(
             reqId, position, marketMaker, operation, side, price, size, isSmartDepth
         )
 
     def processMarketDepthL2MsgProtoBuf(self, protobuf):
-        marketDepthL2Proto = MarketDepthL2Proto()
-        marketDepthL2Proto.ParseFromString(protobuf)
+        marketDepthL2Proto = parseProtoBuf(IN.MARKET_DEPTH_L2, protobuf)
 
         self.wrapper.updateMarketDepthL2ProtoBuf(marketDepthL2Proto)
 
@@ -2205,8 +2128,7 @@ class Decoder(Object):
         self.wrapper.completedOrder(contract, order, orderState)
 
     def processCompletedOrderMsgProtoBuf(self, protobuf):
-        completedOrderProto = CompletedOrderProto()
-        completedOrderProto.ParseFromString(protobuf)
+        completedOrderProto = parseProtoBuf(IN.COMPLETED_ORDER, protobuf)
 
         self.wrapper.completedOrderProtoBuf(completedOrderProto)
 
@@ -2231,22 +2153,20 @@ class Decoder(Object):
         self.wrapper.completedOrdersEnd()
 
     def processCompletedOrdersEndMsgProtoBuf(self, protobuf):
-        completedOrdersEndProto = CompletedOrdersEndProto()
-        completedOrdersEndProto.ParseFromString(protobuf)
+        completedOrdersEndProto = parseProtoBuf(IN.COMPLETED_ORDERS_END, protobuf)
 
         self.wrapper.completedOrdersEndProtoBuf(completedOrdersEndProto)
 
         self.wrapper.completedOrdersEnd()
 
     def processReplaceFAEndMsg(self, fields):
-        reqId = decode(int, fields)
-        text = decode(str, fields)
+        reqId = decode_int(fields)
+        text = decode_str(fields)
 
         self.wrapper.replaceFAEnd(reqId, text)
 
     def processReplaceFAEndMsgProtoBuf(self, protobuf):
-        replaceFAEndProto = ReplaceFAEndProto()
-        replaceFAEndProto.ParseFromString(protobuf)
+        replaceFAEndProto = parseProtoBuf(IN.REPLACE_FA_END, protobuf)
     
         self.wrapper.replaceFAEndProtoBuf(replaceFAEndProto)
     
@@ -2256,14 +2176,13 @@ class Decoder(Object):
         self.wrapper.replaceFAEnd(reqId, text)
 
     def processWshMetaDataMsg(self, fields):
-        reqId = decode(int, fields)
-        dataJson = decode(str, fields)
+        reqId = decode_int(fields)
+        dataJson = decode_str(fields)
 
         self.wrapper.wshMetaData(reqId, dataJson)
 
     def processWshMetaDataMsgProtoBuf(self, protobuf):
-        wshMetaDataProto = WshMetaDataProto()
-        wshMetaDataProto.ParseFromString(protobuf)
+        wshMetaDataProto = parseProtoBuf(IN.WSH_META_DATA, protobuf)
 
         self.wrapper.wshMetaDataProtoBuf(wshMetaDataProto)
 
@@ -2273,14 +2192,13 @@ class Decoder(Object):
         self.wrapper.wshMetaData(reqId, dataJson)
 
     def processWshEventDataMsg(self, fields):
-        reqId = decode(int, fields)
-        dataJson = decode(str, fields)
+        reqId = decode_int(fields)
+        dataJson = decode_str(fields)
 
         self.wrapper.wshEventData(reqId, dataJson)
 
     def processWshEventDataMsgProtoBuf(self, protobuf):
-        wshEventDataProto = WshEventDataProto()
-        wshEventDataProto.ParseFromString(protobuf)
+        wshEventDataProto = parseProtoBuf(IN.WSH_EVENT_DATA, protobuf)
 
         self.wrapper.wshEventDataProtoBuf(wshEventDataProto)
 
@@ -2290,19 +2208,19 @@ class Decoder(Object):
         self.wrapper.wshEventData(reqId, dataJson)
 
     def processHistoricalSchedule(self, fields):
-        reqId = decode(int, fields)
-        startDateTime = decode(str, fields)
-        endDateTime = decode(str, fields)
-        timeZone = decode(str, fields)
-        sessionsCount = decode(int, fields)
+        reqId = decode_int(fields)
+        startDateTime = decode_str(fields)
+        endDateTime = decode_str(fields)
+        timeZone = decode_str(fields)
+        sessionsCount = decode_int(fields)
 
         sessions = []
 
         for _ in range(sessionsCount):
             historicalSession = HistoricalSession()
-            historicalSession.startDateTime = decode(str, fields)
-            historicalSession.endDateTime = decode(str, fields)
-            historicalSession.refDate = decode(str, fields)
+            historicalSession.startDateTime = decode_str(fields)
+            historicalSession.endDateTime = decode_str(fields)
+            historicalSession.refDate = decode_str(fields)
             sessions.append(historicalSession)
 
         self.wrapper.historicalSchedule(
@@ -2310,8 +2228,7 @@ class Decoder(Object):
         )
 
     def processHistoricalScheduleMsgProtoBuf(self, protobuf):
-        historicalScheduleProto = HistoricalScheduleProto()
-        historicalScheduleProto.ParseFromString(protobuf)
+        historicalScheduleProto = parseProtoBuf(IN.HISTORICAL_SCHEDULE, protobuf)
     
         self.wrapper.historicalScheduleProtoBuf(historicalScheduleProto)
     
@@ -2332,14 +2249,13 @@ class Decoder(Object):
         self.wrapper.historicalSchedule(reqId, startDateTime, endDateTime, timeZone, sessions)
 
     def processUserInfo(self, fields):
-        reqId = decode(int, fields)
-        whiteBrandingId = decode(str, fields)
+        reqId = decode_int(fields)
+        whiteBrandingId = decode_str(fields)
 
         self.wrapper.userInfo(reqId, whiteBrandingId)
 
     def processUserInfoMsgProtoBuf(self, protobuf):
-        userInfoProto = UserInfoProto()
-        userInfoProto.ParseFromString(protobuf)
+        userInfoProto = parseProtoBuf(IN.USER_INFO, protobuf)
     
         self.wrapper.userInfoProtoBuf(userInfoProto)
     
@@ -2349,13 +2265,12 @@ class Decoder(Object):
         self.wrapper.userInfo(reqId, whiteBrandingId)
 
     def processCurrentTimeInMillis(self, fields):
-        timeInMillis = decode(int, fields)
+        timeInMillis = decode_int(fields)
 
         self.wrapper.currentTimeInMillis(timeInMillis)
 
     def processCurrentTimeInMillisMsgProtoBuf(self, protobuf):
-        currentTimeInMillisProto = CurrentTimeInMillisProto()
-        currentTimeInMillisProto.ParseFromString(protobuf)
+        currentTimeInMillisProto = parseProtoBuf(IN.CURRENT_TIME_IN_MILLIS, protobuf)
     
         self.wrapper.currentTimeInMillisProtoBuf(currentTimeInMillisProto)
     
@@ -2365,24 +2280,23 @@ class Decoder(Object):
 
     def processErrorMsg(self, fields):
         if self.serverVersion < MIN_SERVER_VER_ERROR_TIME:
-            decode(int, fields)
-        reqId = decode(TickerId, fields)
-        errorCode = decode(int, fields)
-        errorString = decode(
-            str, fields, False, self.serverVersion >= MIN_SERVER_VER_ENCODE_MSG_ASCII7
+            decode_int(fields)
+        reqId = decode_int(fields)
+        errorCode = decode_int(fields)
+        errorString = decode_str(
+            fields, self.serverVersion >= MIN_SERVER_VER_ENCODE_MSG_ASCII7
         )
         advancedOrderRejectJson = ""
         if self.serverVersion >= MIN_SERVER_VER_ADVANCED_ORDER_REJECT:
-            advancedOrderRejectJson = decode(str, fields, False, True)
+            advancedOrderRejectJson = decode_str(fields, True)
         errorTime = 0
         if self.serverVersion >= MIN_SERVER_VER_ERROR_TIME:
-            errorTime = decode(int, fields)
+            errorTime = decode_int(fields)
 
         self.wrapper.error(reqId, errorTime, errorCode, errorString, advancedOrderRejectJson)
 
     def processErrorMsgProtoBuf(self, protobuf):
-        errorMessageProto = ErrorMessageProto()
-        errorMessageProto.ParseFromString(protobuf)
+        errorMessageProto = parseProtoBuf(IN.ERR_MSG, protobuf)
 
         self.wrapper.errorProtoBuf(errorMessageProto)
 
@@ -2395,8 +2309,7 @@ class Decoder(Object):
         self.wrapper.error(reqId, errorTime, errorCode, errorMsg, advancedOrderRejectJson)
 
     def processTickStringMsgProtoBuf(self, protobuf):
-        tickStringProto = TickStringProto()
-        tickStringProto.ParseFromString(protobuf)
+        tickStringProto = parseProtoBuf(IN.TICK_STRING, protobuf)
 
         self.wrapper.tickStringProtoBuf(tickStringProto)
 
@@ -2408,8 +2321,7 @@ class Decoder(Object):
             self.wrapper.tickString(reqId, tickType, value)
 
     def processTickGenericMsgProtoBuf(self, protobuf):
-        tickGenericProto = TickGenericProto()
-        tickGenericProto.ParseFromString(protobuf)
+        tickGenericProto = parseProtoBuf(IN.TICK_GENERIC, protobuf)
 
         self.wrapper.tickGenericProtoBuf(tickGenericProto)
 
@@ -2421,8 +2333,7 @@ class Decoder(Object):
             self.wrapper.tickGeneric(reqId, tickType, value)
 
     def processTickSnapshotEndMsgProtoBuf(self, protobuf):
-        tickSnapshotEndProto = TickSnapshotEndProto()
-        tickSnapshotEndProto.ParseFromString(protobuf)
+        tickSnapshotEndProto = parseProtoBuf(IN.TICK_SNAPSHOT_END, protobuf)
 
         self.wrapper.tickSnapshotEndProtoBuf(tickSnapshotEndProto)
 
@@ -2431,8 +2342,7 @@ class Decoder(Object):
         self.wrapper.tickSnapshotEnd(reqId)
 
     def processAccountValueMsgProtoBuf(self, protobuf):
-        accountValueProto = AccountValueProto()
-        accountValueProto.ParseFromString(protobuf)
+        accountValueProto = parseProtoBuf(IN.ACCT_VALUE, protobuf)
 
         self.wrapper.updateAccountValueProtoBuf(accountValueProto)
 
@@ -2444,8 +2354,7 @@ class Decoder(Object):
         self.wrapper.updateAccountValue(key, value, currency, accountName)
 
     def processAcctUpdateTimeMsgProtoBuf(self, protobuf):
-        accountUpdateTimeProto = AccountUpdateTimeProto()
-        accountUpdateTimeProto.ParseFromString(protobuf)
+        accountUpdateTimeProto = parseProtoBuf(IN.ACCT_UPDATE_TIME, protobuf)
 
         self.wrapper.updateAccountTimeProtoBuf(accountUpdateTimeProto)
 
@@ -2454,8 +2363,7 @@ class Decoder(Object):
         self.wrapper.updateAccountTime(timeStamp)
 
     def processAccountDataEndMsgProtoBuf(self, protobuf):
-        accountDataEndProto = AccountDataEndProto()
-        accountDataEndProto.ParseFromString(protobuf)
+        accountDataEndProto = parseProtoBuf(IN.ACCT_DOWNLOAD_END, protobuf)
 
         self.wrapper.accountDataEndProtoBuf(accountDataEndProto)
 
@@ -2464,8 +2372,7 @@ class Decoder(Object):
         self.wrapper.accountDownloadEnd(accountName)
 
     def processManagedAccountsMsgProtoBuf(self, protobuf):
-        managedAccountsProto = ManagedAccountsProto()
-        managedAccountsProto.ParseFromString(protobuf)
+        managedAccountsProto = parseProtoBuf(IN.MANAGED_ACCTS, protobuf)
 
         self.wrapper.managedAccountsProtoBuf(managedAccountsProto)
 
@@ -2474,16 +2381,14 @@ class Decoder(Object):
         self.wrapper.managedAccounts(accountsList)
 
     def processPositionEndMsgProtoBuf(self, protobuf):
-        positionEndProto = PositionEndProto()
-        positionEndProto.ParseFromString(protobuf)
+        positionEndProto = parseProtoBuf(IN.POSITION_END, protobuf)
 
         self.wrapper.positionEndProtoBuf(positionEndProto)
 
         self.wrapper.positionEnd()
 
     def processAccountSummaryMsgProtoBuf(self, protobuf):
-        accountSummaryProto = AccountSummaryProto()
-        accountSummaryProto.ParseFromString(protobuf)
+        accountSummaryProto = parseProtoBuf(IN.ACCOUNT_SUMMARY, protobuf)
 
         self.wrapper.accountSummaryProtoBuf(accountSummaryProto)
 
@@ -2496,8 +2401,7 @@ class Decoder(Object):
         self.wrapper.accountSummary(reqId, account, tag, value, currency)
 
     def processAccountSummaryEndMsgProtoBuf(self, protobuf):
-        accountSummaryEndProto = AccountSummaryEndProto()
-        accountSummaryEndProto.ParseFromString(protobuf)
+        accountSummaryEndProto = parseProtoBuf(IN.ACCOUNT_SUMMARY_END, protobuf)
 
         self.wrapper.accountSummaryEndProtoBuf(accountSummaryEndProto)
 
@@ -2506,8 +2410,7 @@ class Decoder(Object):
         self.wrapper.accountSummaryEnd(reqId)
 
     def processPositionMultiEndMsgProtoBuf(self, protobuf):
-        positionMultiEndProto = PositionMultiEndProto()
-        positionMultiEndProto.ParseFromString(protobuf)
+        positionMultiEndProto = parseProtoBuf(IN.POSITION_MULTI_END, protobuf)
 
         self.wrapper.positionMultiEndProtoBuf(positionMultiEndProto)
 
@@ -2516,8 +2419,7 @@ class Decoder(Object):
         self.wrapper.positionMultiEnd(reqId)
 
     def processAccountUpdateMultiMsgProtoBuf(self, protobuf):
-        accountUpdateMultiProto = AccountUpdateMultiProto()
-        accountUpdateMultiProto.ParseFromString(protobuf)
+        accountUpdateMultiProto = parseProtoBuf(IN.ACCOUNT_UPDATE_MULTI, protobuf)
 
         self.wrapper.accountUpdateMultiProtoBuf(accountUpdateMultiProto)
 
@@ -2531,8 +2433,7 @@ class Decoder(Object):
         self.wrapper.accountUpdateMulti(reqId, account, modelCode, key, value, currency)
 
     def processAccountUpdateMultiEndMsgProtoBuf(self, protobuf):
-        accountUpdateMultiEndProto = AccountUpdateMultiEndProto()
-        accountUpdateMultiEndProto.ParseFromString(protobuf)
+        accountUpdateMultiEndProto = parseProtoBuf(IN.ACCOUNT_UPDATE_MULTI_END, protobuf)
 
         self.wrapper.accountUpdateMultiEndProtoBuf(accountUpdateMultiEndProto)
 
@@ -2541,8 +2442,7 @@ class Decoder(Object):
         self.wrapper.accountUpdateMultiEnd(reqId)
 
     def processNewsBulletinMsgProtoBuf(self, protobuf):
-        newsBulletinProto = NewsBulletinProto()
-        newsBulletinProto.ParseFromString(protobuf)
+        newsBulletinProto = parseProtoBuf(IN.NEWS_BULLETINS, protobuf)
 
         self.wrapper.updateNewsBulletinProtoBuf(newsBulletinProto)
 
@@ -2554,8 +2454,7 @@ class Decoder(Object):
         self.wrapper.updateNewsBulletin(msgId, msgType, message, originExch)
 
     def processScannerParametersMsgProtoBuf(self, protobuf):
-        scannerParametersProto = ScannerParametersProto()
-        scannerParametersProto.ParseFromString(protobuf)
+        scannerParametersProto = parseProtoBuf(IN.SCANNER_PARAMETERS, protobuf)
 
         self.wrapper.scannerParametersProtoBuf(scannerParametersProto)
 
@@ -2564,8 +2463,7 @@ class Decoder(Object):
         self.wrapper.scannerParameters(xml)
 
     def processFundamentalsDataMsgProtoBuf(self, protobuf):
-        fundamentalsDataProto = FundamentalsDataProto()
-        fundamentalsDataProto.ParseFromString(protobuf)
+        fundamentalsDataProto = parseProtoBuf(IN.FUNDAMENTAL_DATA, protobuf)
 
         self.wrapper.fundamentalsDataProtoBuf(fundamentalsDataProto)
 
@@ -2575,8 +2473,7 @@ class Decoder(Object):
         self.wrapper.fundamentalData(reqId, data)
 
     def processReceiveFAMsgProtoBuf(self, protobuf):
-        receiveFAProto = ReceiveFAProto()
-        receiveFAProto.ParseFromString(protobuf)
+        receiveFAProto = parseProtoBuf(IN.RECEIVE_FA, protobuf)
     
         self.wrapper.receiveFAProtoBuf(receiveFAProto)
     
@@ -2586,8 +2483,7 @@ class Decoder(Object):
         self.wrapper.receiveFA(faDataType, xml)
 
     def processNextValidIdMsgProtoBuf(self, protobuf):
-        nextValidIdProto = NextValidIdProto()
-        nextValidIdProto.ParseFromString(protobuf)
+        nextValidIdProto = parseProtoBuf(IN.NEXT_VALID_ID, protobuf)
     
         self.wrapper.nextValidIdProtoBuf(nextValidIdProto)
     
@@ -2596,8 +2492,7 @@ class Decoder(Object):
         self.wrapper.nextValidId(orderId)
 
     def processCurrentTimeMsgProtoBuf(self, protobuf):
-        currentTimeProto = CurrentTimeProto()
-        currentTimeProto.ParseFromString(protobuf)
+        currentTimeProto = parseProtoBuf(IN.CURRENT_TIME, protobuf)
     
         self.wrapper.currentTimeProtoBuf(currentTimeProto)
     
@@ -2606,8 +2501,7 @@ class Decoder(Object):
         self.wrapper.currentTime(time)
 
     def processVerifyMessageApiMsgProtoBuf(self, protobuf):
-        verifyMessageApiProto = VerifyMessageApiProto()
-        verifyMessageApiProto.ParseFromString(protobuf)
+        verifyMessageApiProto = parseProtoBuf(IN.VERIFY_MESSAGE_API, protobuf)
     
         self.wrapper.verifyMessageApiProtoBuf(verifyMessageApiProto)
     
@@ -2616,8 +2510,7 @@ class Decoder(Object):
         self.wrapper.verifyMessageAPI(apiData)
 
     def processVerifyCompletedMsgProtoBuf(self, protobuf):
-        verifyCompletedProto = VerifyCompletedProto()
-        verifyCompletedProto.ParseFromString(protobuf)
+        verifyCompletedProto = parseProtoBuf(IN.VERIFY_COMPLETED, protobuf)
     
         self.wrapper.verifyCompletedProtoBuf(verifyCompletedProto)
     
@@ -2627,8 +2520,7 @@ class Decoder(Object):
         self.wrapper.verifyCompleted(isSuccessful, errorText)
 
     def processDisplayGroupListMsgProtoBuf(self, protobuf):
-        displayGroupListProto = DisplayGroupListProto()
-        displayGroupListProto.ParseFromString(protobuf)
+        displayGroupListProto = parseProtoBuf(IN.DISPLAY_GROUP_LIST, protobuf)
     
         self.wrapper.displayGroupListProtoBuf(displayGroupListProto)
     
@@ -2638,8 +2530,7 @@ class Decoder(Object):
         self.wrapper.displayGroupList(reqId, groups)
 
     def processDisplayGroupUpdatedMsgProtoBuf(self, protobuf):
-        displayGroupUpdatedProto = DisplayGroupUpdatedProto()
-        displayGroupUpdatedProto.ParseFromString(protobuf)
+        displayGroupUpdatedProto = parseProtoBuf(IN.DISPLAY_GROUP_UPDATED, protobuf)
     
         self.wrapper.displayGroupUpdatedProtoBuf(displayGroupUpdatedProto)
     
@@ -2651,7 +2542,7 @@ class Decoder(Object):
     ######################################################################
 
     def readLastTradeDate(self, fields, contract: ContractDetails, isBond: bool):
-        lastTradeDateOrContractMonth = decode(str, fields)
+        lastTradeDateOrContractMonth = decode_str(fields)
         setLastTradeDate(lastTradeDateOrContractMonth, contract, isBond)
 
     ######################################################################
@@ -2672,6 +2563,59 @@ class Decoder(Object):
             # for (pname, param) in sig.parameters.items():
             #     logger.debug("\tparam %s %s %s", pname, param.name, param.annotation)
 
+        self.compileWrapperCalls()
+
+    def compileWrapperCalls(self):
+        """Turns the signature of every wrap= message into a function with
+        the field converters fixed, so decoding one of those messages is a
+        single call instead of a walk over inspect.Signature.parameters."""
+        self.wrapperCalls = {}
+        if self.wrapper is None:
+            return
+
+        if self._serverVersion is not None and self._serverVersion >= MIN_SERVER_VER_ENCODE_MSG_ASCII7:
+            decodeStr = decodeStrUnicodeEscape
+        else:
+            decodeStr = decodeStrUTF8
+
+        for handleInfo in self.msgId2handleInfo.values():
+            if handleInfo.wrapperMeth is None or handleInfo.wrapperParams is None:
+                continue
+            converters = []
+            for pname, param in handleInfo.wrapperParams.items():
+                if pname == "self":
+                    continue
+                if param.annotation is int:
+                    converters.append(int)
+                elif param.annotation is float:
+                    converters.append(float)
+                elif param.annotation is Decimal:
+                    converters.append(decodeDecimalField)
+                else:
+                    converters.append(decodeStr)
+            method = getattr(self.wrapper, handleInfo.wrapperMeth.__name__)
+            self.wrapperCalls[handleInfo.wrapperMeth] = self.makeWrapperCall(
+                handleInfo, method, tuple(converters)
+            )
+
+    @staticmethod
+    def makeWrapperCall(handleInfo, method, converters):
+        nFields = len(converters) + 1  # bypass the version field
+
+        def wrapperCall(fields):
+            if len(fields) != nFields:
+                logger.error(
+                    "diff len fields and params %d %d for fields: %s and handleInfo: %s",
+                    len(fields),
+                    len(handleInfo.wrapperParams),
+                    fields,
+                    handleInfo,
+                )
+                return
+            method(*[convert(field) for convert, field in zip(converters, fields[1:])])
+
+        return wrapperCall
+
     def printParams(self):
         for _, handleInfo in self.msgId2handleInfo.items():
             if handleInfo.wrapperMeth is not None:
@@ -2683,51 +2627,12 @@ class Decoder(Object):
                         )
 
     def interpretWithSignature(self, fields, handleInfo):
-        if handleInfo.wrapperParams is None:
+        wrapperCall = self.wrapperCalls.get(handleInfo.wrapperMeth)
+        if wrapperCall is None:
             logger.debug("%s: no param info in %s", fields, handleInfo)
             return
 
-        nIgnoreFields = 1  # bypass msgId faster this way
-        if len(fields) - nIgnoreFields != len(handleInfo.wrapperParams) - 1:
-            logger.error(
-                "diff len fields and params %d %d for fields: %s and handleInfo: %s",
-                len(fields),
-                len(handleInfo.wrapperParams),
-                fields,
-                handleInfo,
-            )
-            return
-
-        fieldIdx = nIgnoreFields
-        args = []
-        for pname, param in handleInfo.wrapperParams.items():
-            if pname != "self":
-                logger.debug("field %s ", fields[fieldIdx])
-                try:
-                    arg = fields[fieldIdx].decode(
-                        "unicode-escape"
-                        if self.serverVersion >= MIN_SERVER_VER_ENCODE_MSG_ASCII7
-                        else "UTF-8"
-                    )
-                except UnicodeDecodeError:
-                    arg = fields[fieldIdx].decode("latin-1")
-                logger.debug("arg %s type %s", arg, param.annotation)
-                if param.annotation is int:
-                    arg = int(arg)
-                elif param.annotation is float:
-                    arg = float(arg)
-                elif param.annotation is Decimal:
-                    if arg is None or len(arg) == 0:
-                        return UNSET_DECIMAL
-                    else:
-                        return Decimal(arg)
-
-                args.append(arg)
-                fieldIdx += 1
-
-        method = getattr(self.wrapper, handleInfo.wrapperMeth.__name__)
-        logger.debug("calling %s with %s %s", method, self.wrapper, args)
-        method(*args)
+        wrapperCall(fields)
 
     def interpret(self, fields, msgId):
         if msgId == 0:
@@ -2743,7 +2648,6 @@ class Decoder(Object):
 
         try:
             if handleInfo.wrapperMeth is not None:
-                logger.debug("In interpret(), handleInfo: %s", handleInfo)
                 self.interpretWithSignature(fields, handleInfo)
             elif handleInfo.processMeth is not None:
                 handleInfo.processMeth(self, iter(fields))
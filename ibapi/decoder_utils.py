@@ -3,6 +3,7 @@ Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is su
  and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
 """
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from ibapi.contract import ComboLeg, Contract, DeltaNeutralContract, ContractDetails
 from ibapi.execution import Execution, OptionExerciseType
@@ -17,28 +18,31 @@ from ibapi.contract import FundDistributionPolicyIndicator
 from ibapi.contract import FundAssetType
 from ibapi.common import BarData, HistogramData, TickAttribBidAsk, TickAttribLast, HistoricalTick, HistoricalTickBidAsk, HistoricalTickLast, FamilyCode, PriceIncrement, SmartComponent, SmartComponentMap, DepthMktDataDescription
 
-from ibapi.protobuf.Contract_pb2 import Contract as ContractProto
-from ibapi.protobuf.DeltaNeutralContract_pb2 import DeltaNeutralContract as DeltaNeutralContractProto
-from ibapi.protobuf.Execution_pb2 import Execution as ExecutionProto
-from ibapi.protobuf.Order_pb2 import Order as OrderProto
-from ibapi.protobuf.OrderCondition_pb2 import OrderCondition as OrderConditionProto
-from ibapi.protobuf.OrderState_pb2 import OrderState as OrderStateProto
-from ibapi.protobuf.OrderAllocation_pb2 import OrderAllocation as OrderAllocatiionProto
-from ibapi.protobuf.SoftDollarTier_pb2 import SoftDollarTier as SoftDollarTierProto
-from ibapi.protobuf.ContractDetails_pb2 import ContractDetails as ContractDetailsProto
-from ibapi.protobuf.HistoricalTick_pb2 import HistoricalTick as HistoricalTickProto
-from ibapi.protobuf.HistoricalTickBidAsk_pb2 import HistoricalTickBidAsk as HistoricalTickBidAskProto
-from ibapi.protobuf.HistoricalTickLast_pb2 import HistoricalTickLast as HistoricalTickLastProto
-from ibapi.protobuf.HistogramDataEntry_pb2 import HistogramDataEntry as HistogramDataEntryProto
-from ibapi.protobuf.HistoricalDataBar_pb2 import HistoricalDataBar as HistoricalDataBarProto
-from ibapi.protobuf.FamilyCode_pb2 import FamilyCode as FamilyCodeProto
-from ibapi.protobuf.SmartComponents_pb2 import SmartComponents as SmartComponentsProto
-from ibapi.protobuf.SmartComponent_pb2 import SmartComponent as SmartComponentProto
-from ibapi.protobuf.PriceIncrement_pb2 import PriceIncrement as PriceIncrementProto
-from ibapi.protobuf.DepthMarketDataDescription_pb2 import DepthMarketDataDescription as DepthMarketDataDescriptionProto
-
-@staticmethod
-def decodeContract(contractProto: ContractProto) -> Contract:
+from ibapi import protobuf as pb
+
+if TYPE_CHECKING:
+    from ibapi.protobuf.Contract_pb2 import Contract as ContractProto
+    from ibapi.protobuf.Execution_pb2 import Execution as ExecutionProto
+    from ibapi.protobuf.Order_pb2 import Order as OrderProto
+    from ibapi.protobuf.OrderCondition_pb2 import OrderCondition as OrderConditionProto
+    from ibapi.protobuf.OrderState_pb2 import OrderState as OrderStateProto
+    from ibapi.protobuf.OrderAllocation_pb2 import OrderAllocation as OrderAllocatiionProto
+    from ibapi.protobuf.SoftDollarTier_pb2 import SoftDollarTier as SoftDollarTierProto
+    from ibapi.protobuf.ContractDetails_pb2 import ContractDetails as ContractDetailsProto
+    from ibapi.protobuf.HistoricalTick_pb2 import HistoricalTick as HistoricalTickProto
+    from ibapi.protobuf.HistoricalTickBidAsk_pb2 import HistoricalTickBidAsk as HistoricalTickBidAskProto
+    from ibapi.protobuf.HistoricalTickLast_pb2 import HistoricalTickLast as HistoricalTickLastProto
+    from ibapi.protobuf.HistogramDataEntry_pb2 import HistogramDataEntry as HistogramDataEntryProto
+    from ibapi.protobuf.HistoricalDataBar_pb2 import HistoricalDataBar as HistoricalDataBarProto
+    from ibapi.protobuf.FamilyCode_pb2 import FamilyCode as FamilyCodeProto
+    from ibapi.protobuf.SmartComponents_pb2 import SmartComponents as SmartComponentsProto
+    from ibapi.protobuf.SmartComponent_pb2 import SmartComponent as SmartComponentProto
+    from ibapi.protobuf.PriceIncrement_pb2 import PriceIncrement as PriceIncrementProto
+    from ibapi.protobuf.DepthMarketDataDescription_pb2 import DepthMarketDataDescription as DepthMarketDataDescriptionProto
+
+
+@staticmethod
+def decodeContract(contractProto: "ContractProto") -> Contract:
     contract = Contract()
     if contractProto.HasField('conId'): contract.conId = contractProto.conId
     if contractProto.HasField('symbol'): contract.symbol = contractProto.symbol
@@ -67,7 +71,7 @@ def decodeContract(contractProto: ContractProto) -> Contract:
     return contract
 
 @staticmethod
-def decodeComboLegs(contractProto: ContractProto) -> list[ComboLeg]:
+def decodeComboLegs(contractProto: "ContractProto") -> list[ComboLeg]:
     comboLegs = []
     comboLegProtoList = contractProto.comboLegs
     if comboLegProtoList:
@@ -86,7 +90,7 @@ def decodeComboLegs(contractProto: ContractProto) -> list[ComboLeg]:
     return comboLegs
 
 @staticmethod
-def decodeOrderComboLegs(contractProto: ContractProto) -> list[OrderComboLeg]:
+def decodeOrderComboLegs(contractProto: "ContractProto") -> list[OrderComboLeg]:
     orderComboLegs = []
     comboLegProtoList = contractProto.comboLegs
     if comboLegProtoList:
@@ -98,10 +102,10 @@ def decodeOrderComboLegs(contractProto: ContractProto) -> list[OrderComboLeg]:
     return orderComboLegs
 
 @staticmethod
-def decodeDeltaNeutralContract(contractProto: ContractProto) -> DeltaNeutralContract:
+def decodeDeltaNeutralContract(contractProto: "ContractProto") -> DeltaNeutralContract:
     deltaNeutralContract = None
     if contractProto.HasField('deltaNeutralContract'): 
-        deltaNeutralContractProto = DeltaNeutralContractProto()
+        deltaNeutralContractProto = pb.DeltaNeutralContract()
         deltaNeutralContractProto.CopyFrom(contractProto.deltaNeutralContract)
         if deltaNeutralContractProto is not None: 
             deltaNeutralContract = DeltaNeutralContract()
@@ -112,7 +116,7 @@ def decodeDeltaNeutralContract(contractProto: ContractProto) -> DeltaNeutralCont
     return deltaNeutralContract
 
 @staticmethod
-def decodeExecution(executionProto: ExecutionProto) -> Execution:
+def decodeExecution(executionProto: "ExecutionProto") -> Execution:
     execution = Execution()
     if executionProto.HasField('orderId'): execution.orderId = executionProto.orderId
     if executionProto.HasField('clientId'): execution.clientId = executionProto.clientId
@@ -138,7 +142,7 @@ def decodeExecution(executionProto: ExecutionProto) -> Execution:
     return execution
 
 @staticmethod
-def decodeOrder(orderId: int, contractProto: ContractProto, orderProto: OrderProto) -> Order:
+def decodeOrder(orderId: int, contractProto: "ContractProto", orderProto: "OrderProto") -> Order:
     order = Order()
     if isValidIntValue(orderId): order.orderId = orderId
     if orderProto.HasField('orderId'): order.orderId = orderProto.orderId
@@ -290,7 +294,7 @@ def decodeOrder(orderId: int, contractProto: ContractProto, orderProto: OrderPro
 
     return order
 
-def decodeConditions(orderProto: OrderProto) -> list[OrderCondition]:
+def decodeConditions(orderProto: "OrderProto") -> list[OrderCondition]:
     orderConditions = []
     orderConditionsProtoList = []
     if orderProto.conditions is not None: orderConditionsProtoList = orderProto.conditions
@@ -317,22 +321,22 @@ def decodeConditions(orderProto: OrderProto) -> list[OrderCondition]:
     return orderConditions
 
 @staticmethod
-def setConditionFields(orderConditionProto: OrderConditionProto, orderCondition: OrderCondition):
+def setConditionFields(orderConditionProto: "OrderConditionProto", orderCondition: OrderCondition):
     if orderConditionProto.HasField('isConjunctionConnection'): orderCondition.isConjunctionConnection = orderConditionProto.isConjunctionConnection
 
 @staticmethod
-def setOperatorConditionFields(orderConditionProto: OrderConditionProto, operatorCondition: OperatorCondition):
+def setOperatorConditionFields(orderConditionProto: "OrderConditionProto", operatorCondition: OperatorCondition):
     setConditionFields(orderConditionProto, operatorCondition)
     if orderConditionProto.HasField('isMore'): operatorCondition.isMore = orderConditionProto.isMore
 
 @staticmethod
-def setContractConditionFields(orderConditionProto: OrderConditionProto, contractCondition: ContractCondition):
+def setContractConditionFields(orderConditionProto: "OrderConditionProto", contractCondition: ContractCondition):
     setOperatorConditionFields(orderConditionProto, contractCondition)
     if orderConditionProto.HasField('conId'): contractCondition.conId = orderConditionProto.conId
     if orderConditionProto.HasField('exchange'): contractCondition.exchange = orderConditionProto.exchange
 
 @staticmethod
-def createPriceCondition(orderConditionProto: OrderConditionProto) -> PriceCondition:
+def createPriceCondition(orderConditionProto: "OrderConditionProto") -> PriceCondition:
     priceCondition = PriceCondition()
     setContractConditionFields(orderConditionProto, priceCondition)
     if orderConditionProto.HasField('price'): priceCondition.price = orderConditionProto.price
@@ -340,21 +344,21 @@ def createPriceCondition(orderConditionProto: OrderConditionProto) -> PriceCondi
     return priceCondition
 
 @staticmethod
-def createTimeCondition(orderConditionProto: OrderConditionProto) -> TimeCondition:
+def createTimeCondition(orderConditionProto: "OrderConditionProto") -> TimeCondition:
     timeCondition = TimeCondition()
     setOperatorConditionFields(orderConditionProto, timeCondition)
     if orderConditionProto.HasField('time'): timeCondition.time = orderConditionProto.time
     return timeCondition
 
 @staticmethod
-def createMarginCondition(orderConditionProto: OrderConditionProto) -> MarginCondition:
+def createMarginCondition(orderConditionProto: "OrderConditionProto") -> MarginCondition:
     marginCondition = MarginCondition()
     setOperatorConditionFields(orderConditionProto, marginCondition)
     if orderConditionProto.HasField('percent'): marginCondition.percent = orderConditionProto.percent
     return marginCondition
 
 @staticmethod
-def createExecutionCondition(orderConditionProto: OrderConditionProto) -> ExecutionCondition:
+def createExecutionCondition(orderConditionProto: "OrderConditionProto") -> ExecutionCondition:
     executionCondition = ExecutionCondition()
     setConditionFields(orderConditionProto, executionCondition)
     if orderConditionProto.HasField('secType'): executionCondition.secType = orderConditionProto.secType
@@ -363,27 +367,27 @@ def createExecutionCondition(orderConditionProto: OrderConditionProto) -> Execut
     return executionCondition
 
 @staticmethod
-def createVolumeCondition(orderConditionProto: OrderConditionProto) -> VolumeCondition:
+def createVolumeCondition(orderConditionProto: "OrderConditionProto") -> VolumeCondition:
     volumeCondition = VolumeCondition()
     setContractConditionFields(orderConditionProto, volumeCondition)
     if orderConditionProto.HasField('volume'): volumeCondition.volume = orderConditionProto.volume
     return volumeCondition
 
 @staticmethod
-def createPercentChangeCondition(orderConditionProto: OrderConditionProto) -> PercentChangeCondition:
+def createPercentChangeCondition(orderConditionProto: "OrderConditionProto") -> PercentChangeCondition:
     percentChangeCondition = PercentChangeCondition()
     setContractConditionFields(orderConditionProto, percentChangeCondition)
     if orderConditionProto.HasField('changePercent'): percentChangeCondition.changePercent = orderConditionProto.changePercent
     return percentChangeCondition
 
 @staticmethod
-def decodeSoftDollarTierFromOrder(orderProto: OrderProto) -> SoftDollarTier:
+def decodeSoftDollarTierFromOrder(orderProto: "OrderProto") -> SoftDollarTier:
     softDollarTierProto = None
     if orderProto.softDollarTier is not None: softDollarTierProto = orderProto.softDollarTier
     return decodeSoftDollarTier(softDollarTierProto) if softDollarTierProto is not None else None
 
 @staticmethod
-def decodeSoftDollarTier(softDollarTierProto: SoftDollarTierProto) -> SoftDollarTier:
+def decodeSoftDollarTier(softDollarTierProto: "SoftDollarTierProto") -> SoftDollarTier:
     name = ""
     value = ""
     displayName = ""
@@ -408,7 +412,7 @@ def decodeTagValueList(protoMap: dict[str, str]) -> list[TagValue]:
     return tagValueList
 
 @staticmethod
-def decodeOrderState(orderStateProto: OrderStateProto) -> OrderState:
+def decodeOrderState(orderStateProto: "OrderStateProto") -> OrderState:
     orderState = OrderState()
     if orderStateProto.HasField('status'): orderState.status = orderStateProto.status
     if orderStateProto.HasField('initMarginBefore'): orderState.initMarginBefore = orderStateProto.initMarginBefore
@@ -447,7 +451,7 @@ def decodeOrderState(orderStateProto: OrderStateProto) -> OrderState:
     return orderState
 
 @staticmethod
-def decodeOrderAllocations(orderStateProto: OrderStateProto) -> list[OrderAllocation]:
+def decodeOrderAllocations(orderStateProto: "OrderStateProto") -> list[OrderAllocation]:
     orderAllocations = []
     orderAllocationProtoList = []
     if orderStateProto.orderAllocations is not None: orderAllocationProtoList = orderStateProto.orderAllocations
@@ -465,7 +469,7 @@ def decodeOrderAllocations(orderStateProto: OrderStateProto) -> list[OrderAlloca
     return orderAllocations
 
 @staticmethod
-def decodeContractDetails(contractProto: ContractProto, contractDetailsProto: ContractDetailsProto, isBond: bool) -> ContractDetails:
+def decodeContractDetails(contractProto: "ContractProto", contractDetailsProto: "ContractDetailsProto", isBond: bool) -> ContractDetails:
     contractDetails = ContractDetails()
     contract = decodeContract(contractProto)
 
@@ -546,7 +550,7 @@ def decodeContractDetails(contractProto: ContractProto, contractDetailsProto: Co
     return contractDetails
 
 @staticmethod
-def decodeIneligibilityReasonList(contractDetailsProto: ContractDetailsProto) -> list[IneligibilityReason]:
+def decodeIneligibilityReasonList(contractDetailsProto: "ContractDetailsProto") -> list[IneligibilityReason]:
     ineligibilityReasonList = []
     ineligibilityReasonProtoList = contractDetailsProto.ineligibilityReasonList
     if ineligibilityReasonProtoList:
@@ -578,7 +582,7 @@ def setLastTradeDate(lastTradeDateOrContractMonth: str, contract: ContractDetail
             contract.timeZoneId = split[2]
 
 @staticmethod
-def decodeHistoricalTick(historicalTickProto: HistoricalTickProto) -> HistoricalTick:
+def decodeHistoricalTick(historicalTickProto: "HistoricalTickProto") -> HistoricalTick:
     historicalTick = HistoricalTick()
     if historicalTickProto.HasField('time'): historicalTick.time = historicalTickProto.time
     if historicalTickProto.HasField('price'): historicalTick.price = historicalTickProto.price
@@ -586,7 +590,7 @@ def decodeHistoricalTick(historicalTickProto: HistoricalTickProto) -> Historical
     return historicalTick
 
 @staticmethod
-def decodeHistoricalTickBidAsk(historicalTickBidAskProto: HistoricalTickBidAskProto) -> HistoricalTickBidAsk:
+def decodeHistoricalTickBidAsk(historicalTickBidAskProto: "HistoricalTickBidAskProto") -> HistoricalTickBidAsk:
     historicalTickBidAsk = HistoricalTickBidAsk()
     if historicalTickBidAskProto.HasField('time'): historicalTickBidAsk.time = historicalTickBidAskProto.time
     
@@ -604,7 +608,7 @@ def decodeHistoricalTickBidAsk(historicalTickBidAskProto: HistoricalTickBidAskPr
     return historicalTickBidAsk
 
 @staticmethod
-def decodeHistoricalTickLast(historicalTickLastProto: HistoricalTickLastProto) -> HistoricalTickLast:
+def decodeHistoricalTickLast(historicalTickLastProto: "HistoricalTickLastProto") -> HistoricalTickLast:
     historicalTickLast = HistoricalTickLast()
     if historicalTickLastProto.HasField('time'): historicalTickLast.time = historicalTickLastProto.time
     
@@ -622,14 +626,14 @@ def decodeHistoricalTickLast(historicalTickLastProto: HistoricalTickLastProto) -
     return historicalTickLast
 
 @staticmethod
-def decodeHistogramDataEntry(histogramDataEntryProto: HistogramDataEntryProto) -> HistogramData:
+def decodeHistogramDataEntry(histogramDataEntryProto: "HistogramDataEntryProto") -> HistogramData:
     histogramData = HistogramData()
     if histogramDataEntryProto.HasField('price'): histogramData.price = histogramDataEntryProto.price
     if histogramDataEntryProto.HasField('size'): histogramData.size = Decimal(histogramDataEntryProto.size)
     return histogramData
 
 @staticmethod
-def decodeHistoricalDataBar(historicalDataBarProto: HistoricalDataBarProto) -> BarData:
+def decodeHistoricalDataBar(historicalDataBarProto: "HistoricalDataBarProto") -> BarData:
     bar = BarData()
     if historicalDataBarProto.HasField('date'): bar.date = historicalDataBarProto.date
     if historicalDataBarProto.HasField('open'): bar.open = historicalDataBarProto.open
@@ -642,14 +646,14 @@ def decodeHistoricalDataBar(historicalDataBarProto: HistoricalDataBarProto) -> B
     return bar
 
 @staticmethod
-def decodeFamilyCode(familyCodeProto: FamilyCodeProto) -> FamilyCode:
+def decodeFamilyCode(familyCodeProto: "FamilyCodeProto") -> FamilyCode:
     familyCode = FamilyCode()
     if familyCodeProto and familyCodeProto.HasField('accountId'): familyCode.accountID = familyCodeProto.accountId
     if familyCodeProto and familyCodeProto.HasField('familyCode'): familyCode.familyCodeStr = familyCodeProto.familyCode
     return familyCode
 
 @staticmethod
-def decodeSmartComponents(smartComponentsProto: SmartComponentsProto) -> SmartComponentMap:
+def decodeSmartComponents(smartComponentsProto: "SmartComponentsProto") -> SmartComponentMap:
     smartComponentMap = {}
     if smartComponentsProto and smartComponentsProto.smartComponents:
         for smartComponentProto in smartComponentsProto.smartComponents:
@@ -660,14 +664,14 @@ def decodeSmartComponents(smartComponentsProto: SmartComponentsProto) -> SmartCo
     return smartComponentMap
 
 @staticmethod
-def decodePriceIncrement(priceIncrementProto: PriceIncrementProto) -> PriceIncrement:
+def decodePriceIncrement(priceIncrementProto: "PriceIncrementProto") -> PriceIncrement:
     priceIncrement = PriceIncrement()
     if priceIncrementProto and priceIncrementProto.HasField('lowEdge'): priceIncrement.lowEdge = priceIncrementProto.lowEdge
     if priceIncrementProto and priceIncrementProto.HasField('increment'): priceIncrement.increment = priceIncrementProto.increment
     return priceIncrement
 
 @staticmethod
-def decodeDepthMarketDataDescription(depthMarketDataDescriptionProto: DepthMarketDataDescriptionProto) -> DepthMktDataDescription:
+def decodeDepthMarketDataDescription(depthMarketDataDescriptionProto: "DepthMarketDataDescriptionProto") -> DepthMktDataDescription:
     description = DepthMktDataDescription()
     if depthMarketDataDescriptionProto.HasField('exchange'): description.exchange = depthMarketDataDescriptionProto.exchange
     if depthMarketDataDescriptionProto.HasField('secType'): description.secType = depthMarketDataDescriptionProto.secType
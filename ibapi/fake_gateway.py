@@ -0,0 +1,211 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+A local server playing a capture back to a client, in place of TWS.
+
+FakeGateway listens on a local port and plays the messages received in a
+capture (see ibapi.capture) back to every client that connects, so that the
+reader, decoder and wrappers can be benchmarked and tested offline:
+
+    gateway = FakeGateway("open_auction.ibcap", speed=0)
+    client.connect("127.0.0.1", gateway.start(), clientId=0)
+
+The handshake is scripted: the server version message of the capture goes
+out once the client sent its handshake, the rest once it sent startApi.
+After that the messages keep their recorded spacing divided by speed, speed
+0 sends them as fast as the socket takes them. With followRequests each
+message also waits until the client has sent as many messages as had been
+sent before it in the capture, so the answers of a deterministic client,
+such as TWSSyncWrapper requests, arrive after their requests. The requests
+themselves are not looked at.
+"""
+
+import logging
+import socket
+import threading
+import time
+
+from ibapi import comm
+from ibapi.capture import IN, OUT, readCapture
+
+logger = logging.getLogger(__name__)
+
+# bytes of messages due at once written together
+SEND_CHUNK = 65536
+# seconds a message waits for the client requests it followed
+DEFAULT_REQUEST_TIMEOUT = 5
+
+
+class ClientTraffic:
+    """counts the messages a client sends, from a thread of its own"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.cond = threading.Condition()
+        self.nMsgs = 0
+        self.closed = False
+        self.msgBuf = comm.MsgBuffer()
+        self.thread = None
+
+    def readHandshake(self):
+        # "API\0", then the message with the client versions
+        self.sock.settimeout(DEFAULT_REQUEST_TIMEOUT)
+        prefix = b""
+        while len(prefix) < 4:
+            data = self.sock.recv(4 - len(prefix))
+            if not data:
+                raise ConnectionError("client left during the handshake")
+            prefix += data
+        self.waitMsgs(1, DEFAULT_REQUEST_TIMEOUT)
+
+    def run(self):
+        sock = self.sock
+        sock.settimeout(None)
+        try:
+            while True:
+                nRecvd = sock.recv_into(self.msgBuf.writeView())
+                if nRecvd == 0:
+                    break
+                self.msgBuf.commit(nRecvd)
+                n = len(self.msgBuf.popMsgs())
+                if n:
+                    with self.cond:
+                        self.nMsgs += n
+                        self.cond.notify_all()
+        except OSError:
+            pass
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def receiveMsgs(self):
+        """reads messages until at least one more arrived, during the
+        handshake before run() takes over"""
+        nRecvd = self.sock.recv_into(self.msgBuf.writeView())
+        if nRecvd == 0:
+            raise ConnectionError("client left during the handshake")
+        self.msgBuf.commit(nRecvd)
+        self.nMsgs += len(self.msgBuf.popMsgs())
+
+    def waitMsgs(self, n: int, timeout: float) -> bool:
+        """during the handshake reads, later waits for run(), until the
+        client sent n messages"""
+        if self.thread is None:
+            while self.nMsgs < n:
+                self.receiveMsgs()
+            return True
+        with self.cond:
+            return self.cond.wait_for(lambda: self.nMsgs >= n or self.closed, timeout) and not self.closed
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="fake-gateway-client", daemon=True)
+        self.thread.start()
+
+
+class FakeGateway:
+    """Serves the capture at path, see the module docstring. Clients are
+    served one at a time, each one gets the whole capture."""
+
+    def __init__(self, path: str, speed: float = 1.0, followRequests: bool = True,
+                 host: str = "127.0.0.1", port: int = 0,
+                 requestTimeout: float = DEFAULT_REQUEST_TIMEOUT):
+        self.speed = speed
+        self.followRequests = followRequests
+        self.host = host
+        self.port = port
+        self.requestTimeout = requestTimeout
+        self.loadCapture(path)
+        self.server = None
+        self.thread = None
+        self.stopped = threading.Event()
+        self.nServed = 0
+
+    def loadCapture(self, path: str):
+        """splits the capture into the server version message and the
+        (time, messages sent before, payload) of the others"""
+        self.versionMsg = None
+        self.script = []
+        nOut = 0
+        for t, direction, data in readCapture(path):
+            if direction == OUT:
+                nOut += 1
+            elif direction == IN:
+                if self.versionMsg is None:
+                    self.versionMsg = data
+                else:
+                    self.script.append((t, nOut, data))
+        if self.versionMsg is None:
+            raise ValueError(f"{path} has no server version message")
+
+    def start(self) -> int:
+        """listens and returns the port"""
+        self.server = socket.create_server((self.host, self.port))
+        self.port = self.server.getsockname()[1]
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.serve, name="fake-gateway", daemon=True)
+        self.thread.start()
+        return self.port
+
+    def stop(self):
+        self.stopped.set()
+        if self.server is not None:
+            self.server.close()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+
+    def serve(self):
+        while not self.stopped.is_set():
+            try:
+                sock, _ = self.server.accept()
+            except OSError:
+                return
+            try:
+                self.play(sock)
+                self.nServed += 1
+            except OSError as ex:
+                logger.info("fake gateway client left: %s", ex)
+            finally:
+                sock.close()
+
+    def play(self, sock):
+        client = ClientTraffic(sock)
+        client.readHandshake()
+        sock.sendall(frame(self.versionMsg))
+        # startApi
+        client.waitMsgs(2, self.requestTimeout)
+        client.start()
+
+        out = bytearray()
+        base = time.monotonic()
+        t0 = self.script[0][0] if self.script else 0.0
+        for t, nOut, payload in self.script:
+            if self.stopped.is_set():
+                return
+            due = base + (t - t0) / self.speed if self.speed else 0.0
+            waitRequests = self.followRequests and client.nMsgs < nOut
+            if out and (waitRequests or due > time.monotonic() or len(out) >= SEND_CHUNK):
+                sock.sendall(out)
+                out.clear()
+            if waitRequests:
+                waitStart = time.monotonic()
+                if not client.waitMsgs(nOut, self.requestTimeout):
+                    logger.warning("fake gateway: the client did not send request %d", nOut)
+                # the rest of the capture keeps its spacing after the wait
+                base += time.monotonic() - waitStart
+                due = base + (t - t0) / self.speed if self.speed else 0.0
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            out += frame(payload)
+        if out:
+            sock.sendall(out)
+
+        # stays connected until the client leaves
+        with client.cond:
+            while not client.closed and not self.stopped.is_set():
+                client.cond.wait(0.2)
+
+
+def frame(payload: bytes) -> bytes:
+    return len(payload).to_bytes(4, "big") + payload
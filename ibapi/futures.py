@@ -0,0 +1,570 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Request futures over the EClient.
+
+Each *Future request method returns a concurrent.futures.Future that the
+answer callbacks resolve, matched by reqId, when the request's *End callback
+(or its single answer) arrives. Many requests can be in flight over one
+connection, up to FuturesEClient.maxInFlight; the requests above that wait
+in the client and go out as earlier ones complete.
+
+    class App(FuturesWrapper, FuturesEClient):
+        def __init__(self):
+            FuturesWrapper.__init__(self)
+            FuturesEClient.__init__(self, wrapper=self)
+
+    futs = [app.reqHistoricalDataFuture(contract, "", "1 D", "1 min", what)
+            for what in ("BID", "ASK")]
+    bid, ask = (fut.result(timeout=60) for fut in futs)
+
+The answers are delivered on the thread running the message loop, which is
+also where the waiting requests are sent from.
+
+reqHistoricalDataStream() hands the bars over one by one as they arrive,
+through a ResultStream, instead of as a list at the end, and
+reqHistoricalRangeFuture() covers windows longer than one request may.
+
+FuturesEClient.replay() sends the requests still waiting for their answer
+and the market data, real time bar and account subscriptions again, on a new
+connection after the old one dropped, see ibapi.session.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+
+from ibapi import hist_range
+from ibapi.client import EClient
+from ibapi.common import BarData
+from ibapi.contract import Contract, ContractDetails
+from ibapi.errors import NOT_CONNECTED
+from ibapi.utils import ClientException
+from ibapi.wrapper import EWrapper
+
+logger = logging.getLogger(__name__)
+
+# key of the reqCurrentTime answer, which has no reqId
+CURRENT_TIME_KEY = "currentTime"
+
+DEFAULT_MAX_IN_FLIGHT = 10
+
+
+# order warnings and the delayed market data notices
+WARNING_CODES = frozenset((399, 10090, 10167))
+
+
+def isWarningCode(errorCode: int) -> bool:
+    # 2100-2199 are TWS warnings, they do not end a request
+    return 2100 <= errorCode < 2200 or errorCode in WARNING_CODES
+
+
+def notConnectedError() -> ClientException:
+    return ClientException(NOT_CONNECTED.code(), NOT_CONNECTED.msg(), "")
+
+
+def resolveFuture(fut, result=None, ex=None):
+    # the waiting side may cancel at any time, losing that race is fine
+    try:
+        if not fut.done():
+            if ex is None:
+                fut.set_result(result)
+            else:
+                fut.set_exception(ex)
+    except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+        pass
+
+
+class ReqIdAllocator:
+    """Hands out increasing ids from any thread. advance() skips ahead, e.g.
+    to the nextValidId of TWS so that order ids come from here too."""
+
+    def __init__(self, first: int = 1):
+        self.lock = threading.Lock()
+        self.nextId = first
+
+    def next(self) -> int:
+        with self.lock:
+            reqId = self.nextId
+            self.nextId += 1
+        return reqId
+
+    def advance(self, atLeast: int):
+        with self.lock:
+            self.nextId = max(self.nextId, atLeast)
+
+
+class ResultStream:
+    """Results container of a streamed request: the results go to a queue
+    of at most maxQueued of them as they arrive, and the request future
+    resolves to the stream itself once they all did.
+
+    A full queue blocks the message loop thread until the consumer catches
+    up, which holds up all the other answers too, so consume the stream
+    without waiting on other requests in between. close() drops whatever
+    is still queued and any later results."""
+
+    # queued after the last result
+    END = object()
+
+    def __init__(self, maxQueued: int = 1000):
+        self.queue = queue.Queue(maxQueued)
+        self.closed = False
+
+    def append(self, result):
+        if not self.closed:
+            self.queue.put(result)
+
+    def end(self, fut=None):
+        if not self.closed:
+            self.queue.put(ResultStream.END)
+
+    def get(self, timeout=None):
+        """the next result or ResultStream.END, raises queue.Empty after
+        timeout seconds"""
+        return self.queue.get(timeout=timeout)
+
+    def close(self):
+        self.closed = True
+        # unblocks an append() waiting for room
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+
+class PendingRequests:
+    """The futures of the requests waiting for an answer, with the results
+    collected so far, by reqId. Thread safe, and works with asyncio futures
+    as long as they are only resolved on their loop."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = {}
+
+    def __len__(self):
+        return len(self.requests)
+
+    def __contains__(self, key):
+        return key in self.requests
+
+    def start(self, key, fut, results=None):
+        """results collects the answers, a list unless given"""
+        with self.lock:
+            self.requests[key] = (fut, [] if results is None else results)
+
+    def startOrJoin(self, key, fut) -> tuple:
+        """starts the request with fut unless it is already pending, returns
+        the future of the request and whether it was started"""
+        with self.lock:
+            req = self.requests.get(key)
+            if req is not None:
+                return req[0], False
+            self.requests[key] = (fut, [])
+            return fut, True
+
+    def remove(self, key):
+        with self.lock:
+            self.requests.pop(key, None)
+
+    def discard(self, key, fut):
+        """removes the request if fut is still its future, for cleaning up
+        after a waiter gave up while the key may have been reused"""
+        with self.lock:
+            req = self.requests.get(key)
+            if req is not None and req[0] is fut:
+                del self.requests[key]
+
+    def add(self, key, result):
+        req = self.requests.get(key)
+        if req is not None:
+            req[1].append(result)
+
+    def finish(self, key, result=None):
+        """resolves the request with result, or with the results added so far"""
+        with self.lock:
+            req = self.requests.pop(key, None)
+        if req is not None:
+            resolveFuture(req[0], req[1] if result is None else result)
+
+    def fail(self, key, ex: Exception):
+        with self.lock:
+            req = self.requests.pop(key, None)
+        if req is not None:
+            resolveFuture(req[0], ex=ex)
+
+    def failAll(self, ex: Exception, keep=()):
+        """fails all the requests but those with a key in keep"""
+        with self.lock:
+            reqs = self.requests
+            self.requests = {key: req for key, req in reqs.items() if key in keep}
+        for key, (fut, _) in reqs.items():
+            if key not in self.requests:
+                resolveFuture(fut, ex=ex)
+
+    def restart(self, key):
+        """drops the results collected so far for a request sent again"""
+        with self.lock:
+            req = self.requests.get(key)
+        if req is not None and isinstance(req[1], list):
+            del req[1][:]
+
+
+class FuturesWrapper(EWrapper):
+    """EWrapper that resolves the request futures in self.pending.
+    Subclasses that override the callbacks below have to call the super()
+    method for the futures to keep working."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending = PendingRequests()
+        # keys of the requests a dropped connection does not fail, to be
+        # replayed on the next one
+        self.keepOnClose = ()
+
+    def error(self, reqId, errorTime: int, errorCode: int, errorString: str, advancedOrderRejectJson=""):
+        super().error(reqId, errorTime, errorCode, errorString, advancedOrderRejectJson)
+        if reqId in self.pending and not isWarningCode(errorCode):
+            self.pending.fail(reqId, ClientException(errorCode, errorString, advancedOrderRejectJson))
+
+    def connectionClosed(self):
+        super().connectionClosed()
+        self.pending.failAll(notConnectedError(), self.keepOnClose)
+
+    def currentTime(self, time: int):
+        super().currentTime(time)
+        self.pending.finish(CURRENT_TIME_KEY, time)
+
+    def contractDetails(self, reqId: int, contractDetails: ContractDetails):
+        super().contractDetails(reqId, contractDetails)
+        self.pending.add(reqId, contractDetails)
+
+    def contractDetailsEnd(self, reqId: int):
+        super().contractDetailsEnd(reqId)
+        self.pending.finish(reqId)
+
+    def historicalData(self, reqId: int, bar: BarData):
+        super().historicalData(reqId, bar)
+        self.pending.add(reqId, bar)
+
+    def historicalDataEnd(self, reqId: int, start: str, end: str):
+        super().historicalDataEnd(reqId, start, end)
+        self.pending.finish(reqId)
+
+    def headTimestamp(self, reqId: int, headTimestamp: str):
+        super().headTimestamp(reqId, headTimestamp)
+        self.pending.finish(reqId, headTimestamp)
+
+
+class FuturesEClient(EClient):
+    """EClient whose *Future request methods return futures, see the module
+    docstring. The wrapper has to be a FuturesWrapper."""
+
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+        self.maxInFlight = DEFAULT_MAX_IN_FLIGHT
+        self.nInFlight = 0
+        self.waiting = collections.deque()
+        self.inFlightLock = threading.Lock()
+        self.reqIdAllocator = ReqIdAllocator()
+        self.pacer = None
+        # send(reqId) of the requests submitted and not done yet, and the
+        # (request method, args) of the open subscriptions, for replay()
+        self.senders = {}
+        self.subscriptions = {}
+        # the sent futures of the requests not sent yet, see submitRequest()
+        self.unsent = {}
+
+    def setMaxInFlight(self, maxInFlight: int):
+        """how many of the *Future requests may wait for their answer at the
+        same time, the others are sent as these complete"""
+        self.maxInFlight = max(1, maxInFlight)
+
+    def setPacer(self, pacer):
+        """sends the historical data and head time stamp requests through
+        pacer, an ibapi.pacing.PacingScheduler, or directly when None"""
+        self.pacer = pacer
+
+    def pacedCancel(self, cancel):
+        """cancel(reqId) for the requests that made it out of the pacer"""
+        def cancelPaced(reqId):
+            pacer = self.pacer
+            if pacer is None or not pacer.cancel(reqId, self):
+                cancel(reqId)
+        return cancelPaced
+
+    def nextReqId(self) -> int:
+        """request ids of the *Future requests, take your own ids from here
+        too when mixing them with plain requests on the same connection"""
+        return self.reqIdAllocator.next()
+
+    def submitRequest(self, send, cancel=None, results=None, paced=False) -> concurrent.futures.Future:
+        """Sends a request through send(reqId) once there is a free slot and
+        returns the future of its answer. cancel(reqId) is called when the
+        future is cancelled while the request is on TWS. results collects
+        the answers, see PendingRequests.start().
+
+        fut.sent is a future of the time.monotonic() the request went out to
+        TWS, or None if it never did, so that waiting for a slot or for the
+        pacing does not count against the timeout of the answer. A paced
+        send(reqId) calls requestSent(reqId) itself once the request left
+        the pacer."""
+        reqId = self.nextReqId()
+        fut = concurrent.futures.Future()
+        fut.sent = self.unsent[reqId] = concurrent.futures.Future()
+        if not paced:
+            send = self.sentBy(send)
+        self.wrapper.pending.start(reqId, fut, results)
+        self.senders[reqId] = send
+        fut.add_done_callback(lambda fut: self.requestDone(reqId, fut, cancel))
+
+        with self.inFlightLock:
+            sendNow = self.nInFlight < self.maxInFlight
+            if sendNow:
+                self.nInFlight += 1
+            else:
+                self.waiting.append((reqId, fut, send))
+        if sendNow:
+            self.sendRequest(reqId, fut, send)
+        return fut
+
+    def sendRequest(self, reqId, fut, send):
+        """sends a request given a slot, a send that raises fails its future,
+        which frees the slot and the pending entry"""
+        try:
+            send(reqId)
+        except Exception as ex:
+            logger.warning("sending request %d failed: %s", reqId, ex)
+            self.wrapper.pending.fail(reqId, ex)
+            resolveFuture(fut, ex=ex)
+
+    def sentBy(self, send):
+        def sendNow(reqId):
+            send(reqId)
+            self.requestSent(reqId)
+        return sendNow
+
+    def requestSent(self, reqId):
+        """resolves the sent future of a request, see submitRequest()"""
+        sent = self.unsent.pop(reqId, None)
+        if sent is not None:
+            resolveFuture(sent, time.monotonic())
+
+    def requestDone(self, reqId, fut, cancel):
+        self.senders.pop(reqId, None)
+        # answered or given up, nothing to wait for
+        resolveFuture(self.unsent.pop(reqId, fut.sent), None)
+        with self.inFlightLock:
+            sent = all(w[0] != reqId for w in self.waiting)
+            nxt = None
+            if not sent:
+                # cancelled before it went out
+                self.waiting = collections.deque(w for w in self.waiting if w[0] != reqId)
+            else:
+                # pass the slot on to the next waiting request still wanted
+                while self.waiting and nxt is None:
+                    nxt = self.waiting.popleft()
+                    if nxt[1].done():
+                        nxt = None
+                if nxt is None:
+                    self.nInFlight -= 1
+
+        self.wrapper.pending.remove(reqId)
+        if not sent:
+            return
+        if fut.cancelled() and cancel is not None and self.isConnected():
+            cancel(reqId)
+        if nxt is not None:
+            self.sendRequest(*nxt)
+
+    def replay(self) -> tuple:
+        """Sends the open subscriptions and the requests that were sent and
+        not answered yet again, under the same reqIds, on a new connection.
+        Returns how many of each were sent."""
+        with self.sendBatch():
+            for request, args in list(self.subscriptions.values()):
+                request(*args)
+
+        with self.inFlightLock:
+            waiting = {w[0] for w in self.waiting}
+        sent = [(reqId, send) for reqId, send in list(self.senders.items()) if reqId not in waiting]
+        for reqId, send in sent:
+            # a request queued for the old connection goes out once
+            if self.pacer is not None:
+                self.pacer.cancel(reqId, self)
+            self.wrapper.pending.restart(reqId)
+            send(reqId)
+        return len(self.subscriptions), len(sent)
+
+    def reqMktData(self, reqId, contract: Contract, genericTickList: str, snapshot: bool,
+                   regulatorySnapshot: bool, mktDataOptions):
+        args = (reqId, contract, genericTickList, snapshot, regulatorySnapshot, mktDataOptions)
+        if not snapshot and not regulatorySnapshot:
+            self.subscriptions[("mktData", reqId)] = (super().reqMktData, args)
+        super().reqMktData(*args)
+
+    def cancelMktData(self, reqId):
+        self.subscriptions.pop(("mktData", reqId), None)
+        super().cancelMktData(reqId)
+
+    def reqRealTimeBars(self, reqId, contract: Contract, barSize: int, whatToShow: str, useRTH: bool,
+                        realTimeBarsOptions):
+        args = (reqId, contract, barSize, whatToShow, useRTH, realTimeBarsOptions)
+        self.subscriptions[("realTimeBars", reqId)] = (super().reqRealTimeBars, args)
+        super().reqRealTimeBars(*args)
+
+    def cancelRealTimeBars(self, reqId):
+        self.subscriptions.pop(("realTimeBars", reqId), None)
+        super().cancelRealTimeBars(reqId)
+
+    def reqAccountUpdates(self, subscribe: bool, acctCode: str):
+        if subscribe:
+            self.subscriptions[("accountUpdates", acctCode)] = (super().reqAccountUpdates, (True, acctCode))
+        else:
+            self.subscriptions.pop(("accountUpdates", acctCode), None)
+        super().reqAccountUpdates(subscribe, acctCode)
+
+    def reqCurrentTimeFuture(self) -> concurrent.futures.Future:
+        """the server time, concurrent calls share one request"""
+        fut, started = self.wrapper.pending.startOrJoin(CURRENT_TIME_KEY, concurrent.futures.Future())
+        if started:
+            # a cancelled request must not be joined by the next callers
+            fut.add_done_callback(lambda fut: self.wrapper.pending.discard(CURRENT_TIME_KEY, fut))
+            self.reqCurrentTime()
+        return fut
+
+    def reqContractDetailsFuture(self, contract: Contract) -> concurrent.futures.Future:
+        """the list of ContractDetails of the contracts matching contract"""
+        return self.submitRequest(lambda reqId: self.reqContractDetails(reqId, contract))
+
+    def reqHistoricalDataFuture(self, contract: Contract, endDateTime: str, durationStr: str,
+                                barSizeSetting: str, whatToShow: str, useRTH: int = 1,
+                                formatDate: int = 1, priority: int = 0) -> concurrent.futures.Future:
+        """the list of BarData of a historical data request, priority orders
+        the requests waiting in the pacer"""
+        return self.submitRequest(
+            self.historicalDataSender(contract, endDateTime, durationStr, barSizeSetting, whatToShow,
+                                      useRTH, formatDate, priority),
+            self.pacedCancel(self.cancelHistoricalData),
+            paced=True,
+        )
+
+    def reqHistoricalDataStream(self, contract: Contract, endDateTime: str, durationStr: str,
+                                barSizeSetting: str, whatToShow: str, useRTH: int = 1,
+                                formatDate: int = 1, priority: int = 0,
+                                maxQueued: int = 1000) -> tuple:
+        """a historical data request whose BarData come through a
+        ResultStream as they arrive, returns the request future and the
+        stream. Cancelling the future cancels the request."""
+        stream = ResultStream(maxQueued)
+        fut = self.submitRequest(
+            self.historicalDataSender(contract, endDateTime, durationStr, barSizeSetting, whatToShow,
+                                      useRTH, formatDate, priority),
+            self.pacedCancel(self.cancelHistoricalData),
+            stream,
+            paced=True,
+        )
+        fut.add_done_callback(stream.end)
+        return fut, stream
+
+    def reqHistoricalRangeFuture(self, contract: Contract, start, end, barSizeSetting: str,
+                                 whatToShow: str, useRTH: int = 1, formatDate: int = 1, tz=None,
+                                 priority: int = 0) -> concurrent.futures.Future:
+        """The list of BarData from the aware datetime start to end, split into
+        as many requests as TWS needs (see ibapi.hist_range) and sent in
+        parallel. tz is the time zone of the exchange the chunks are aligned
+        to. Chunks without data (holidays) are empty, any other error fails
+        the whole range and cancels the other chunks."""
+        merged = concurrent.futures.Future()
+        # resolves once the last chunk went out, see submitRequest()
+        merged.sent = concurrent.futures.Future()
+        chunks = hist_range.planChunks(start, end, barSizeSetting, tz)
+        if not chunks:
+            merged.sent.set_result(None)
+            merged.set_result([])
+            return merged
+
+        futs = []
+        for chunk in chunks:
+            endDateTime, durationStr = hist_range.chunkRequest(*chunk)
+            futs.append(self.reqHistoricalDataFuture(contract, endDateTime, durationStr, barSizeSetting,
+                                                     whatToShow, useRTH, formatDate, priority))
+
+        results = [None] * len(futs)
+        remaining = [len(futs)]
+        unsent = [len(futs)]
+        sentAt = []
+        lock = threading.Lock()
+
+        def chunkSent(sent):
+            with lock:
+                if sent.result() is not None:
+                    sentAt.append(sent.result())
+                unsent[0] -= 1
+                last = unsent[0] == 0
+            if last:
+                resolveFuture(merged.sent, max(sentAt, default=None))
+
+        def chunkDone(i, fut):
+            if merged.done():
+                return
+            try:
+                bars = fut.result()
+            except concurrent.futures.CancelledError as ex:
+                resolveFuture(merged, ex=ex)
+                return
+            except Exception as ex:
+                if not hist_range.isNoDataError(ex):
+                    resolveFuture(merged, ex=ex)
+                    return
+                bars = []
+            with lock:
+                results[i] = bars
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                resolveFuture(merged, hist_range.mergeBars(results, start, end, barSizeSetting, tz))
+
+        def rangeDone(merged):
+            # failed or cancelled, the chunks still waiting are not needed
+            for fut in futs:
+                fut.cancel()
+
+        merged.add_done_callback(rangeDone)
+        for i, fut in enumerate(futs):
+            fut.sent.add_done_callback(chunkSent)
+            fut.add_done_callback(lambda fut, i=i: chunkDone(i, fut))
+        return merged
+
+    def historicalDataSender(self, contract, endDateTime, durationStr, barSizeSetting, whatToShow,
+                             useRTH, formatDate, priority):
+        def send(reqId):
+            args = (reqId, contract, endDateTime, durationStr, barSizeSetting, whatToShow,
+                    useRTH, formatDate, False, [])
+            if self.pacer is None:
+                self.reqHistoricalData(*args)
+                self.requestSent(reqId)
+            else:
+                self.pacer.reqHistoricalData(*args, priority=priority, client=self,
+                                             onSent=lambda: self.requestSent(reqId))
+        return send
+
+    def reqHeadTimeStampFuture(self, contract: Contract, whatToShow: str, useRTH: int = 1,
+                               formatDate: int = 1, priority: int = 0) -> concurrent.futures.Future:
+        """the earliest date data is available for"""
+        def send(reqId):
+            if self.pacer is None:
+                self.reqHeadTimeStamp(reqId, contract, whatToShow, useRTH, formatDate)
+                self.requestSent(reqId)
+            else:
+                self.pacer.reqHeadTimeStamp(reqId, contract, whatToShow, useRTH, formatDate,
+                                            priority=priority, client=self,
+                                            onSent=lambda: self.requestSent(reqId))
+
+        return self.submitRequest(send, self.pacedCancel(self.cancelHeadTimeStamp), paced=True)
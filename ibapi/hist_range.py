@@ -0,0 +1,169 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Historical data windows longer than one request may cover.
+
+TWS caps the duration of a historical data request by its bar size, e.g. one
+day of 1 min bars. planChunks() splits a window into chunks within that cap,
+aligned to the days of the exchange time zone and skipping weekends, and
+mergeBars() joins the bars of the chunks into one time ordered series,
+dropping the bars that overlapping chunks both returned and those outside
+the window. FuturesEClient.reqHistoricalRangeFuture() requests the chunks
+in parallel and merges them.
+"""
+
+import datetime
+from zoneinfo import ZoneInfo
+
+from ibapi.bar_batch import barDateToEpoch
+from ibapi.utils import ClientException
+
+DAY = 86400
+
+BAR_UNIT_SECONDS = {
+    "sec": 1,
+    "min": 60,
+    "hour": 3600,
+    "day": DAY,
+    "week": 7 * DAY,
+    "month": 30 * DAY,
+}
+
+# (bar size below, longest request in seconds) from the TWS table of valid
+# durations and bar sizes, longer bars take up to a year
+DURATION_LIMITS = (
+    (5, 1800),
+    (10, 3600),
+    (30, 14400),
+    (60, 28800),
+    (120, DAY),
+    (180, 2 * DAY),
+    (1800, 7 * DAY),
+    (DAY, 30 * DAY),
+)
+MAX_DURATION = 365 * DAY
+
+# TWS error of a request with no data, e.g. for a holiday
+HMDS_ERROR = 162
+
+
+def barSizeSeconds(barSizeSetting: str) -> int:
+    """seconds of a bar size setting such as "1 min", "5 mins" or "1 MIN" """
+    n, unit = barSizeSetting.lower().split()
+    unit = unit.rstrip("s")
+    if unit not in BAR_UNIT_SECONDS:
+        raise ValueError(f"unknown bar size {barSizeSetting!r}")
+    return int(n) * BAR_UNIT_SECONDS[unit]
+
+
+def maxChunkSeconds(barSizeSetting: str) -> int:
+    """the longest duration of one request for bars of barSizeSetting"""
+    barSecs = barSizeSeconds(barSizeSetting)
+    for below, limit in DURATION_LIMITS:
+        if barSecs < below:
+            return limit
+    return MAX_DURATION
+
+
+def zoneOf(tz, start: datetime.datetime):
+    if tz is None:
+        return start.tzinfo or datetime.timezone.utc
+    if isinstance(tz, str):
+        return ZoneInfo(tz)
+    return tz
+
+
+def dayStart(day: datetime.date, tz) -> datetime.datetime:
+    return datetime.datetime.combine(day, datetime.time(), tzinfo=tz)
+
+
+def utcMidnight(day: datetime.date) -> int:
+    return int(dayStart(day, datetime.timezone.utc).timestamp())
+
+
+def planChunks(start: datetime.datetime, end: datetime.datetime, barSizeSetting: str, tz=None) -> list:
+    """Splits [start, end) into the (chunkStart, chunkEnd) windows of the
+    requests to send, in time order. Chunks of a day or more cover whole
+    days of tz, the time zone of the exchange (a name or a tzinfo, by
+    default that of start), shorter ones stay within one day. Saturdays and
+    Sundays are skipped unless the bars are daily or longer.
+
+    start and end must be time zone aware."""
+    if start.tzinfo is None or end.tzinfo is None:
+        raise ValueError("start and end must be time zone aware")
+    tz = zoneOf(tz, start)
+    limit = maxChunkSeconds(barSizeSetting)
+    skipWeekends = barSizeSeconds(barSizeSetting) < DAY
+
+    day = start.astimezone(tz).date()
+    endLocal = end.astimezone(tz)
+    lastDay = endLocal.date()
+    if endLocal == dayStart(lastDay, tz):
+        lastDay -= datetime.timedelta(days=1)
+
+    chunks = []
+    if limit >= DAY:
+        nDays = datetime.timedelta(days=limit // DAY)
+        while day <= lastDay:
+            if skipWeekends and day.weekday() >= 5:
+                day += datetime.timedelta(days=1)
+                continue
+            nextDay = min(day + nDays, lastDay + datetime.timedelta(days=1))
+            chunks.append((dayStart(day, tz), dayStart(nextDay, tz)))
+            day = nextDay
+        return chunks
+
+    step = datetime.timedelta(seconds=limit)
+    while day <= lastDay:
+        nextDay = day + datetime.timedelta(days=1)
+        if not (skipWeekends and day.weekday() >= 5):
+            chunkStart = max(start, dayStart(day, tz))
+            dayEnd = min(end, dayStart(nextDay, tz))
+            while chunkStart < dayEnd:
+                chunkEnd = min(chunkStart + step, dayEnd)
+                chunks.append((chunkStart, chunkEnd))
+                chunkStart = chunkEnd
+        day = nextDay
+    return chunks
+
+
+def chunkRequest(chunkStart: datetime.datetime, chunkEnd: datetime.datetime) -> tuple:
+    """the endDateTime and durationStr of the request of a chunk"""
+    endDateTime = chunkEnd.astimezone(datetime.timezone.utc).strftime("%Y%m%d-%H:%M:%S")
+    secs = int((chunkEnd - chunkStart).total_seconds())
+    if secs < DAY:
+        return endDateTime, f"{secs} S"
+    # days across a DST change are an hour off
+    return endDateTime, f"{round(secs / DAY)} D"
+
+
+def isNoDataError(ex: Exception) -> bool:
+    return isinstance(ex, ClientException) and ex.code == HMDS_ERROR and "no data" in ex.msg.lower()
+
+
+def mergeBars(chunkBars, start: datetime.datetime, end: datetime.datetime, barSizeSetting: str,
+              tz=None) -> list:
+    """The bars of all the chunks in time order, once each, and only those
+    starting in [start, end). Daily and longer bars, dated without a time,
+    are kept for the days of tz the window touches."""
+    if barSizeSeconds(barSizeSetting) >= DAY:
+        tz = zoneOf(tz, start)
+        # TWS dates them as days, barDateToEpoch as midnight UTC
+        endLocal = end.astimezone(tz)
+        lastDay = endLocal.date()
+        if endLocal == dayStart(lastDay, tz):
+            lastDay -= datetime.timedelta(days=1)
+        startTs = utcMidnight(start.astimezone(tz).date())
+        endTs = utcMidnight(lastDay) + 1
+    else:
+        startTs = start.timestamp()
+        endTs = end.timestamp()
+
+    byTime = {}
+    for bars in chunkBars:
+        for bar in bars:
+            t = barDateToEpoch(bar.date)
+            if startTs <= t < endTs:
+                byTime[t] = bar
+    return [byTime[t] for t in sorted(byTime)]
@@ -0,0 +1,236 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Latency and throughput of the message loop.
+
+MsgLoopMetrics records, once enabled with EClient.setMetrics(), where the
+time of an incoming message goes:
+
+    - reader: per receive, the time the EReader takes to cut the bytes into
+      messages and queue them
+    - dwell: the time a message waits in EClient.msg_queue for run()
+    - decode: per msgId, the time of the Decoder less that of the wrapper
+      callbacks it calls
+    - callback: per msgId, the time of the wrapper callbacks, e.g. tickPrice
+
+along with the message counts per msgId and the high water mark of the queue
+depth. The times go to Histograms of fixed size, so recording costs the same
+after a day as after a minute. snapshot() pulls them all,
+startLogging() logs a summary every interval seconds.
+
+    client.setMetrics(True)
+    ...
+    stats = client.metrics.snapshot()
+    print(stats["messages"][IN.TICK_PRICE]["callback"]["p99"])
+
+All times are in nanoseconds. The counters are updated without a lock from
+the reader and message loop threads, a snapshot taken meanwhile may be a
+message off.
+"""
+
+import logging
+import threading
+import time
+
+from ibapi.message import IN
+
+logger = logging.getLogger(__name__)
+
+MSG_NAMES = {msgId: name for name, msgId in vars(IN).items() if not name.startswith("_")}
+
+
+class Histogram:
+    """Counts of values in buckets of a few percent of their value, like an
+    HDR histogram: below 2 * 2**subBits the buckets are one apart, above
+    each power of two is split into 2**subBits of them. Values above
+    highest all count in the last bucket."""
+
+    def __init__(self, subBits: int = 5, highest: int = 1 << 40):
+        self.subBits = subBits
+        self.subCount = 1 << subBits
+        self.counts = [0] * (self.index(highest) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def index(self, value: int) -> int:
+        shift = value.bit_length() - self.subBits - 1
+        if shift <= 0:
+            return value
+        return self.subCount * shift + (value >> shift)
+
+    def upperValue(self, index: int) -> int:
+        """the highest value counted in bucket index"""
+        shift = max(0, index // self.subCount - 1)
+        return ((index - self.subCount * shift + 1) << shift) - 1
+
+    def record(self, value: int):
+        i = self.index(value)
+        counts = self.counts
+        counts[i if i < len(counts) else -1] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: float) -> int:
+        """the value p percent of the values are at or below, to within the
+        bucket width"""
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * p / 100))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.upperValue(i), self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min or 0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class MsgStats:
+    __slots__ = ("count", "decode", "callback")
+
+    def __init__(self):
+        self.count = 0
+        self.decode = Histogram()
+        self.callback = Histogram()
+
+
+class TimedWrapper:
+    """Stands in for the wrapper in the Decoder and adds the time of every
+    callback to metrics.callbackNs"""
+
+    def __init__(self, wrapper, metrics):
+        self.wrapper = wrapper
+        self.metrics = metrics
+
+    def __getattr__(self, name):
+        attr = getattr(self.wrapper, name)
+        if not callable(attr):
+            return attr
+        metrics = self.metrics
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                metrics.callbackNs += time.perf_counter_ns() - start
+
+        # looked up once per name
+        setattr(self, name, timed)
+        return timed
+
+
+class MsgLoopMetrics:
+    """See the module docstring."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+        self.logThread = None
+        self.stopLogging = threading.Event()
+
+    def reset(self):
+        with self.lock:
+            self.messages = {}
+            self.reader = Histogram()
+            self.dwell = Histogram()
+            self.queueHighWater = 0
+            self.nReceives = 0
+            self.bytesReceived = 0
+            self.callbackNs = 0
+            self.since = time.time()
+
+    def timedWrapper(self, wrapper) -> TimedWrapper:
+        return TimedWrapper(wrapper, self)
+
+    def recordReceive(self, nBytes: int, parseNs: int, queueDepth: int):
+        self.nReceives += 1
+        self.bytesReceived += nBytes
+        self.reader.record(parseNs)
+        if queueDepth > self.queueHighWater:
+            self.queueHighWater = queueDepth
+
+    def recordDwell(self, dwellNs: int, nMsgs: int = 1):
+        for _ in range(nMsgs):
+            self.dwell.record(dwellNs)
+
+    def startMessage(self):
+        self.callbackNs = 0
+
+    def recordMessage(self, msgId: int, totalNs: int):
+        """after a message was decoded in totalNs, its callbacks included"""
+        stats = self.messages.get(msgId)
+        if stats is None:
+            stats = self.messages[msgId] = MsgStats()
+        callbackNs = self.callbackNs
+        stats.count += 1
+        stats.callback.record(callbackNs)
+        stats.decode.record(max(0, totalNs - callbackNs))
+
+    def snapshot(self) -> dict:
+        """counts and the histogram summaries, see Histogram.snapshot()"""
+        return {
+            "since": self.since,
+            "receives": self.nReceives,
+            "bytesReceived": self.bytesReceived,
+            "queueHighWater": self.queueHighWater,
+            "reader": self.reader.snapshot(),
+            "dwell": self.dwell.snapshot(),
+            "messages": {
+                msgId: {
+                    "name": MSG_NAMES.get(msgId, str(msgId)),
+                    "count": stats.count,
+                    "decode": stats.decode.snapshot(),
+                    "callback": stats.callback.snapshot(),
+                }
+                for msgId, stats in list(self.messages.items())
+            },
+        }
+
+    def logSummary(self, log: logging.Logger = logger, top: int = 10):
+        """logs the queue figures and the top msgIds by time spent"""
+        snap = self.snapshot()
+        dwell = snap["dwell"]
+        log.info("msg loop: %d receives, %d bytes, queue high water %d, dwell p50 %d p99 %d max %d ns",
+                 snap["receives"], snap["bytesReceived"], snap["queueHighWater"],
+                 dwell["p50"], dwell["p99"], dwell["max"])
+
+        def spent(item):
+            stats = item[1]
+            return (stats["decode"]["mean"] + stats["callback"]["mean"]) * stats["count"]
+
+        for msgId, stats in sorted(snap["messages"].items(), key=spent, reverse=True)[:top]:
+            log.info("  %s: %d msgs, decode p50 %d p99 %d ns, callback p50 %d p99 %d ns",
+                     stats["name"], stats["count"], stats["decode"]["p50"], stats["decode"]["p99"],
+                     stats["callback"]["p50"], stats["callback"]["p99"])
+
+    def startLogging(self, interval: float = 60, log: logging.Logger = logger):
+        """logSummary() every interval seconds from a thread, until
+        stopLogging is set"""
+        if self.logThread is not None:
+            return
+        self.stopLogging.clear()
+
+        def run():
+            while not self.stopLogging.wait(interval):
+                self.logSummary(log)
+
+        self.logThread = threading.Thread(target=run, name="ibapi-metrics", daemon=True)
+        self.logThread.start()
@@ -7,7 +7,7 @@ from ibapi import comm
 from ibapi.const import UNSET_DOUBLE
 from ibapi.object_implem import Object
 from ibapi.enum_implem import Enum
-from ibapi.utils import decode
+from ibapi.codec import decode_int, decode_bool, decode_str
 
 
 # TODO: add support for Rebate, P/L, ShortableShares conditions
@@ -37,7 +37,7 @@ class OrderCondition(Object):
         return self
 
     def decode(self, fields):
-        connector = decode(str, fields)
+        connector = decode_str(fields)
         self.isConjunctionConnection = connector == "a"
 
     def make_fields(self):
@@ -56,9 +56,9 @@ class ExecutionCondition(OrderCondition):
 
     def decode(self, fields):
         OrderCondition.decode(self, fields)
-        self.secType = decode(str, fields)
-        self.exchange = decode(str, fields)
-        self.symbol = decode(str, fields)
+        self.secType = decode_str(fields)
+        self.exchange = decode_str(fields)
+        self.symbol = decode_str(fields)
 
     def make_fields(self):
         flds = OrderCondition.make_fields(self) + [
@@ -93,8 +93,8 @@ class OperatorCondition(OrderCondition):
 
     def decode(self, fields):
         OrderCondition.decode(self, fields)
-        self.isMore = decode(bool, fields)
-        text = decode(str, fields)
+        self.isMore = decode_bool(fields)
+        text = decode_str(fields)
         self.setValueFromString(text)
 
     def make_fields(self):
@@ -138,8 +138,8 @@ class ContractCondition(OperatorCondition):
 
     def decode(self, fields):
         OperatorCondition.decode(self, fields)
-        self.conId = decode(int, fields)
-        self.exchange = decode(str, fields)
+        self.conId = decode_int(fields)
+        self.exchange = decode_str(fields)
 
     def make_fields(self):
         return OperatorCondition.make_fields(self) + [
@@ -203,7 +203,7 @@ class PriceCondition(ContractCondition):
 
     def decode(self, fields):
         ContractCondition.decode(self, fields)
-        self.triggerMethod = decode(int, fields)
+        self.triggerMethod = decode_int(fields)
 
     def make_fields(self):
         flds = ContractCondition.make_fields(self) + [
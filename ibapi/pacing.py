@@ -0,0 +1,305 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Pacing of the historical data requests.
+
+TWS answers historical data requests that break its pacing rules with error
+162 (pacing violation) instead of data:
+
+    - no more than 60 requests in any 10 minutes
+    - no identical request within 15 seconds
+    - no more than 6 requests for the same contract, exchange and tick type
+      within 2 seconds
+
+BID_ASK requests count twice. PacingScheduler queues reqHistoricalData,
+reqHistoricalTicks and reqHeadTimeStamp requests and sends each one as soon
+as all the rules allow it, highest priority (lowest number, as
+INV_LOAD_PRIORITY) first, so the requests go out at the highest rate TWS
+takes without a single 162.
+
+    pacer = PacingScheduler(client)
+    pacer.reqHistoricalData(reqId, contract, "", "1 D", "1 min", "BID", 1, 1, False, [], priority=2)
+
+FuturesEClient.setPacer() sends the *Future historical data and head time
+stamp requests through a pacer. One pacer can serve several connections to
+the same TWS, whose requests count together, by passing the client the
+request goes out on to the req* methods.
+"""
+
+import bisect
+import collections
+import itertools
+import logging
+import threading
+import time
+
+from ibapi.contract import Contract
+
+logger = logging.getLogger(__name__)
+
+# added to every rule period, TWS times the requests when they arrive
+PACING_MARGIN = 0.25
+
+
+class TokenBucket:
+    """capacity tokens, each one comes back period seconds after it was
+    taken. Unlike a bucket refilling at a steady rate this never lets more
+    than capacity tokens be taken in any period, which is how the TWS rules
+    count."""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.period = period
+        self.taken = collections.deque()
+
+    def expire(self, now: float):
+        taken = self.taken
+        while taken and taken[0] + self.period <= now:
+            taken.popleft()
+
+    def waitTime(self, now: float, n: int = 1) -> float:
+        """seconds until n tokens can be taken, 0 when they can now"""
+        self.expire(now)
+        n = min(n, self.capacity)
+        over = len(self.taken) + n - self.capacity
+        if over <= 0:
+            return 0.0
+        return self.taken[over - 1] + self.period - now
+
+    def take(self, now: float, n: int = 1):
+        self.taken.extend([now] * min(n, self.capacity))
+
+    def idle(self, now: float) -> bool:
+        self.expire(now)
+        return not self.taken
+
+
+class PacingRule:
+    """At most capacity requests with the same key(req) in any period
+    seconds, a TokenBucket per key. weighted rules take req.cost tokens per
+    request, the others one."""
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, name: str, capacity: int, period: float, key, weighted: bool = True):
+        self.name = name
+        self.capacity = capacity
+        self.period = period
+        self.key = key
+        self.weighted = weighted
+        self.buckets = {}
+        self.nTaken = 0
+
+    def waitTime(self, req, now: float) -> float:
+        bucket = self.buckets.get(self.key(req))
+        if bucket is None:
+            return 0.0
+        return bucket.waitTime(now, req.cost if self.weighted else 1)
+
+    def take(self, req, now: float):
+        key = self.key(req)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(self.capacity, self.period)
+        bucket.take(now, req.cost if self.weighted else 1)
+
+        # forget the keys not requested for a while
+        self.nTaken += 1
+        if self.nTaken % self.PRUNE_EVERY == 0:
+            self.buckets = {k: b for k, b in self.buckets.items() if not b.idle(now)}
+
+
+def contractKey(contract: Contract) -> tuple:
+    return (contract.conId, contract.symbol, contract.secType, contract.lastTradeDateOrContractMonth,
+            contract.strike, contract.right, contract.multiplier, contract.exchange,
+            contract.primaryExchange, contract.currency, contract.localSymbol)
+
+
+def ibHistDataRules(margin: float = PACING_MARGIN) -> list:
+    """the TWS historical data pacing rules, see the module docstring"""
+    return [
+        PacingRule("60 per 10 min", 60, 600 + margin, lambda req: None),
+        PacingRule("identical in 15 s", 1, 15 + margin, lambda req: req.identity, weighted=False),
+        PacingRule("6 per contract in 2 s", 6, 2 + margin,
+                   lambda req: (contractKey(req.contract), req.whatToShow)),
+    ]
+
+
+class PacedRequest:
+    __slots__ = ("reqId", "client", "priority", "contract", "whatToShow", "identity", "cost", "send",
+                 "onSent", "queuedAt", "heldBy")
+
+    def __init__(self, reqId, client, priority, contract, whatToShow, identity, send, queuedAt,
+                 onSent=None):
+        self.reqId = reqId
+        self.client = client
+        self.priority = priority
+        self.contract = contract
+        self.whatToShow = whatToShow
+        self.identity = identity
+        self.cost = 2 if whatToShow == "BID_ASK" else 1
+        self.send = send
+        self.onSent = onSent
+        self.queuedAt = queuedAt
+        # the names of the rules that held it back so far
+        self.heldBy = set()
+
+
+class PacingScheduler:
+    """Sends the requests queued through its req* methods from a thread of
+    its own, as the pacing rules allow, see the module docstring.
+
+    Of the requests the rules allow to go, the one with the lowest priority
+    number goes first, requests of the same priority go in the order they
+    were queued. A request held back by a rule of its own contract does not
+    hold back the others. waitStats() reports how long the requests waited
+    here."""
+
+    def __init__(self, client=None, rules=None, clock=time.monotonic):
+        self.client = client
+        self.rules = ibHistDataRules() if rules is None else rules
+        self.clock = clock
+        self.queue = []
+        self.seq = itertools.count()
+        self.cond = threading.Condition()
+        self.thread = None
+        self.stopped = False
+
+        self.nSent = 0
+        self.totalWait = 0.0
+        self.maxWait = 0.0
+        self.nHeld = collections.Counter()
+
+    def submit(self, reqId: int, contract: Contract, whatToShow: str, identity: tuple, send,
+               priority: int = 0, client=None, onSent=None):
+        """queues send(), identity tells identical requests apart and client
+        the requests of different connections with the same reqId. onSent()
+        is called once send() was"""
+        req = PacedRequest(reqId, client, priority, contract, whatToShow, identity, send, self.clock(),
+                           onSent)
+        with self.cond:
+            if self.stopped:
+                raise RuntimeError("the pacing scheduler is stopped")
+            # seq is unique, the requests themselves are never compared
+            bisect.insort(self.queue, (priority, next(self.seq), req))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="ibapi-pacing", daemon=True)
+                self.thread.start()
+            self.cond.notify()
+
+    def reqHistoricalData(self, reqId: int, contract: Contract, endDateTime: str, durationStr: str,
+                          barSizeSetting: str, whatToShow: str, useRTH: int, formatDate: int,
+                          keepUpToDate: bool, chartOptions, priority: int = 0, client=None,
+                          onSent=None):
+        client = client or self.client
+        identity = ("historicalData", contractKey(contract), endDateTime, durationStr, barSizeSetting,
+                    whatToShow, useRTH, formatDate, keepUpToDate)
+        self.submit(reqId, contract, whatToShow, identity,
+                    lambda: client.reqHistoricalData(reqId, contract, endDateTime, durationStr,
+                                                     barSizeSetting, whatToShow, useRTH, formatDate,
+                                                     keepUpToDate, chartOptions),
+                    priority, client, onSent)
+
+    def reqHistoricalTicks(self, reqId: int, contract: Contract, startDateTime: str, endDateTime: str,
+                           numberOfTicks: int, whatToShow: str, useRth: int, ignoreSize: bool,
+                           miscOptions, priority: int = 0, client=None, onSent=None):
+        client = client or self.client
+        identity = ("historicalTicks", contractKey(contract), startDateTime, endDateTime, numberOfTicks,
+                    whatToShow, useRth, ignoreSize)
+        self.submit(reqId, contract, whatToShow, identity,
+                    lambda: client.reqHistoricalTicks(reqId, contract, startDateTime, endDateTime,
+                                                      numberOfTicks, whatToShow, useRth, ignoreSize,
+                                                      miscOptions),
+                    priority, client, onSent)
+
+    def reqHeadTimeStamp(self, reqId: int, contract: Contract, whatToShow: str, useRTH: int,
+                         formatDate: int, priority: int = 0, client=None, onSent=None):
+        client = client or self.client
+        identity = ("headTimeStamp", contractKey(contract), whatToShow, useRTH, formatDate)
+        self.submit(reqId, contract, whatToShow, identity,
+                    lambda: client.reqHeadTimeStamp(reqId, contract, whatToShow, useRTH, formatDate),
+                    priority, client, onSent)
+
+    def cancel(self, reqId: int, client=None) -> bool:
+        """drops the request if it is still queued, returns whether it was"""
+        client = client or self.client
+        with self.cond:
+            for i, item in enumerate(self.queue):
+                if item[2].reqId == reqId and item[2].client is client:
+                    del self.queue[i]
+                    return True
+        return False
+
+    def stop(self):
+        """stops the thread, the requests still queued are dropped"""
+        with self.cond:
+            self.stopped = True
+            self.queue.clear()
+            self.cond.notify()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def waitTime(self, req: PacedRequest, now: float) -> float:
+        wait = 0.0
+        for rule in self.rules:
+            ruleWait = rule.waitTime(req, now)
+            if ruleWait > 0:
+                # rescanned at every wake-up, counted the first time only
+                if rule.name not in req.heldBy:
+                    req.heldBy.add(rule.name)
+                    self.nHeld[rule.name] += 1
+                wait = max(wait, ruleWait)
+        return wait
+
+    def nextRequest(self):
+        """waits for the next request the rules let go and takes its
+        tokens, None once stopped"""
+        with self.cond:
+            while not self.stopped:
+                now = self.clock()
+                soonest = None
+                for i, (_, _, req) in enumerate(self.queue):
+                    wait = self.waitTime(req, now)
+                    if wait <= 0:
+                        del self.queue[i]
+                        for rule in self.rules:
+                            rule.take(req, now)
+                        return req, now
+                    if soonest is None or wait < soonest:
+                        soonest = wait
+                # woken early by new requests, which may be allowed sooner
+                self.cond.wait(soonest)
+        return None, None
+
+    def run(self):
+        while True:
+            req, now = self.nextRequest()
+            if req is None:
+                return
+            wait = now - req.queuedAt
+            self.nSent += 1
+            self.totalWait += wait
+            self.maxWait = max(self.maxWait, wait)
+            if wait >= 1 and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("paced request %d sent after %.1f s", req.reqId, wait)
+            try:
+                req.send()
+            except Exception:
+                logger.exception("sending paced request %d failed", req.reqId)
+            finally:
+                if req.onSent is not None:
+                    req.onSent()
+
+    def waitStats(self) -> dict:
+        """how many requests were sent and how long they waited for the
+        pacing, in seconds, and how many requests each rule held back"""
+        return {
+            "nSent": self.nSent,
+            "nQueued": len(self.queue),
+            "totalWait": self.totalWait,
+            "meanWait": self.totalWait / self.nSent if self.nSent else 0.0,
+            "maxWait": self.maxWait,
+            "held": dict(self.nHeld),
+        }
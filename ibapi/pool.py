@@ -0,0 +1,166 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+A pool of connections to one TWS or gateway.
+
+Each EClient connection has one socket, one reader thread and one message
+loop, so the loads of a process share them. IBConnectionPool opens a
+connection per client id, so that e.g. historical data, fundamentals and FX
+loads run side by side in one process:
+
+    pool = IBConnectionPool("127.0.0.1", 4002, [11, 12, 13],
+                            routes={"histData": [11, 12], "fx": [13]})
+    pool.connect()
+    fut = pool.client("histData", key=contract.symbol).reqHistoricalDataFuture(...)
+
+client() picks a healthy connection of a route, by a stable hash of key so
+that a ticker always goes to the same connection, or the least busy one
+without a key. The answers come back through the request futures of the
+connection, see ibapi.futures. The historical data requests of all the
+connections go through one PacingScheduler, since TWS counts them together.
+"""
+
+import logging
+import threading
+import time
+import zlib
+
+from ibapi.pacing import PacingScheduler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_HEALTH_TIMEOUT = 2
+
+
+def defaultClientFactory():
+    # not at module level, the sync wrapper imports more than a pool needs
+    from ibapi.sync_wrapper import TWSSyncWrapper
+    return TWSSyncWrapper()
+
+
+class IBConnectionPool:
+    """Connections to host:port, one per client id, see the module
+    docstring. factory() makes the clients, objects that are both a
+    FuturesWrapper and a FuturesEClient (TWSSyncWrapper by default). routes
+    maps route names to the client ids that serve them, any route not in it
+    is served by all of them."""
+
+    def __init__(self, host: str, port: int, clientIds, routes=None, factory=None, pacer=None):
+        self.host = host
+        self.port = port
+        self.clientIds = list(clientIds)
+        self.routes = dict(routes or {})
+        self.factory = factory or defaultClientFactory
+        self.pacer = PacingScheduler() if pacer is None else pacer
+        self.lock = threading.Lock()
+        self.clients = {}
+        self.threads = {}
+        self.healthy = set()
+        self.healthThread = None
+        self.stopHealth = threading.Event()
+
+    def connect(self, timeout: float = DEFAULT_CONNECT_TIMEOUT) -> int:
+        """connects all the client ids not connected yet, returns how many
+        are connected"""
+        for clientId in self.clientIds:
+            client = self.clients.get(clientId)
+            if client is None or not client.isConnected():
+                self.connectClient(clientId, timeout)
+        return len(self.healthy)
+
+    def connectClient(self, clientId: int, timeout: float = DEFAULT_CONNECT_TIMEOUT):
+        client = self.factory()
+        client.setPacer(self.pacer)
+        client.connect(self.host, self.port, clientId)
+        deadline = time.monotonic() + timeout
+        while not client.isConnected() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        if not client.isConnected():
+            logger.warning("could not connect client id %d to %s:%d", clientId, self.host, self.port)
+            # closes the socket and the reader of a handshake that did not finish
+            client.setPacer(None)
+            client.disconnect()
+            with self.lock:
+                self.healthy.discard(clientId)
+            return None
+
+        thread = threading.Thread(target=client.run, name=f"ibapi-pool-{clientId}", daemon=True)
+        thread.start()
+        with self.lock:
+            self.clients[clientId] = client
+            self.threads[clientId] = thread
+            self.healthy.add(clientId)
+        return client
+
+    def disconnect(self):
+        self.stopHealth.set()
+        self.healthThread = None
+        with self.lock:
+            clients, self.clients = self.clients, {}
+            threads, self.threads = self.threads, {}
+            self.healthy.clear()
+        for client in clients.values():
+            client.setPacer(None)
+            client.disconnect()
+        for thread in threads.values():
+            thread.join(timeout=1)
+        self.pacer.stop()
+
+    def checkHealth(self, timeout: float = DEFAULT_HEALTH_TIMEOUT) -> set:
+        """asks every connection for the server time, the ones that do not
+        answer within timeout are not routed to until they do again.
+        Returns the healthy client ids."""
+        futs = {}
+        for clientId, client in list(self.clients.items()):
+            if client.isConnected():
+                futs[clientId] = client.reqCurrentTimeFuture()
+
+        deadline = time.monotonic() + timeout
+        healthy = set()
+        for clientId, fut in futs.items():
+            try:
+                fut.result(max(0.0, deadline - time.monotonic()))
+                healthy.add(clientId)
+            except Exception:
+                logger.warning("client id %d failed its health check", clientId)
+                fut.cancel()
+
+        with self.lock:
+            self.healthy = healthy
+        return set(healthy)
+
+    def startHealthChecks(self, interval: float = 60, reconnect: bool = True):
+        """checks the health every interval seconds from a thread, and
+        reconnects the connections that are gone"""
+        if self.healthThread is not None:
+            return
+        self.stopHealth.clear()
+
+        def run():
+            while not self.stopHealth.wait(interval):
+                if reconnect:
+                    self.connect()
+                self.checkHealth()
+
+        self.healthThread = threading.Thread(target=run, name="ibapi-pool-health", daemon=True)
+        self.healthThread.start()
+
+    def client(self, route: str = None, key=None):
+        """a healthy connection of route, chosen by key or the least busy,
+        raises ConnectionError when the route has none"""
+        with self.lock:
+            ids = [clientId for clientId in self.routes.get(route, self.clientIds)
+                   if clientId in self.healthy]
+            if not ids:
+                raise ConnectionError(f"no healthy connection for route {route!r}")
+            if key is None:
+                clientId = min(ids, key=lambda clientId: self.clients[clientId].nInFlight)
+            else:
+                # hash() of a str changes from one process to the next
+                clientId = ids[zlib.crc32(str(key).encode()) % len(ids)]
+            return self.clients[clientId]
+
+    def __len__(self):
+        return len(self.clients)
@@ -1 +1,129 @@
-""" Package includes the Python API protocol buffers generated files for the TWS/IB Gateway """
+""" Package includes the Python API protocol buffers generated files for the TWS/IB Gateway
+
+The generated modules are imported lazily: ibapi.protobuf.TickPrice is the
+TickPrice message class, its TickPrice_pb2 module is only imported on first
+access. The Decoder parses incoming messages through IN_MSG_PROTOS, so a
+process only pays for the messages it actually receives.
+"""
+
+import importlib
+
+from ibapi.message import IN
+
+# message class name of each incoming protobuf message, by message id
+IN_MSG_PROTOS = {
+    IN.ORDER_STATUS: "OrderStatus",
+    IN.ERR_MSG: "ErrorMessage",
+    IN.OPEN_ORDER: "OpenOrder",
+    IN.EXECUTION_DATA: "ExecutionDetails",
+    IN.OPEN_ORDER_END: "OpenOrdersEnd",
+    IN.EXECUTION_DATA_END: "ExecutionDetailsEnd",
+    IN.COMPLETED_ORDER: "CompletedOrder",
+    IN.COMPLETED_ORDERS_END: "CompletedOrdersEnd",
+    IN.ORDER_BOUND: "OrderBound",
+    IN.CONTRACT_DATA: "ContractData",
+    IN.BOND_CONTRACT_DATA: "ContractData",
+    IN.CONTRACT_DATA_END: "ContractDataEnd",
+    IN.TICK_PRICE: "TickPrice",
+    IN.TICK_SIZE: "TickSize",
+    IN.TICK_OPTION_COMPUTATION: "TickOptionComputation",
+    IN.TICK_GENERIC: "TickGeneric",
+    IN.TICK_STRING: "TickString",
+    IN.TICK_SNAPSHOT_END: "TickSnapshotEnd",
+    IN.MARKET_DEPTH: "MarketDepth",
+    IN.MARKET_DEPTH_L2: "MarketDepthL2",
+    IN.MARKET_DATA_TYPE: "MarketDataType",
+    IN.TICK_REQ_PARAMS: "TickReqParams",
+    IN.ACCT_VALUE: "AccountValue",
+    IN.PORTFOLIO_VALUE: "PortfolioValue",
+    IN.ACCT_UPDATE_TIME: "AccountUpdateTime",
+    IN.ACCT_DOWNLOAD_END: "AccountDataEnd",
+    IN.MANAGED_ACCTS: "ManagedAccounts",
+    IN.POSITION_DATA: "Position",
+    IN.POSITION_END: "PositionEnd",
+    IN.ACCOUNT_SUMMARY: "AccountSummary",
+    IN.ACCOUNT_SUMMARY_END: "AccountSummaryEnd",
+    IN.POSITION_MULTI: "PositionMulti",
+    IN.POSITION_MULTI_END: "PositionMultiEnd",
+    IN.ACCOUNT_UPDATE_MULTI: "AccountUpdateMulti",
+    IN.ACCOUNT_UPDATE_MULTI_END: "AccountUpdateMultiEnd",
+    IN.HISTORICAL_DATA: "HistoricalData",
+    IN.HISTORICAL_DATA_UPDATE: "HistoricalDataUpdate",
+    IN.HISTORICAL_DATA_END: "HistoricalDataEnd",
+    IN.REAL_TIME_BARS: "RealTimeBarTick",
+    IN.HEAD_TIMESTAMP: "HeadTimestamp",
+    IN.HISTOGRAM_DATA: "HistogramData",
+    IN.HISTORICAL_TICKS: "HistoricalTicks",
+    IN.HISTORICAL_TICKS_BID_ASK: "HistoricalTicksBidAsk",
+    IN.HISTORICAL_TICKS_LAST: "HistoricalTicksLast",
+    IN.TICK_BY_TICK: "TickByTickData",
+    IN.NEWS_BULLETINS: "NewsBulletin",
+    IN.NEWS_ARTICLE: "NewsArticle",
+    IN.NEWS_PROVIDERS: "NewsProviders",
+    IN.HISTORICAL_NEWS: "HistoricalNews",
+    IN.HISTORICAL_NEWS_END: "HistoricalNewsEnd",
+    IN.WSH_META_DATA: "WshMetaData",
+    IN.WSH_EVENT_DATA: "WshEventData",
+    IN.TICK_NEWS: "TickNews",
+    IN.SCANNER_PARAMETERS: "ScannerParameters",
+    IN.SCANNER_DATA: "ScannerData",
+    IN.FUNDAMENTAL_DATA: "FundamentalsData",
+    IN.PNL: "PnL",
+    IN.PNL_SINGLE: "PnLSingle",
+    IN.RECEIVE_FA: "ReceiveFA",
+    IN.REPLACE_FA_END: "ReplaceFAEnd",
+    IN.COMMISSION_AND_FEES_REPORT: "CommissionAndFeesReport",
+    IN.HISTORICAL_SCHEDULE: "HistoricalSchedule",
+    IN.REROUTE_MKT_DATA_REQ: "RerouteMarketDataRequest",
+    IN.REROUTE_MKT_DEPTH_REQ: "RerouteMarketDepthRequest",
+    IN.SECURITY_DEFINITION_OPTION_PARAMETER: "SecDefOptParameter",
+    IN.SECURITY_DEFINITION_OPTION_PARAMETER_END: "SecDefOptParameterEnd",
+    IN.SOFT_DOLLAR_TIERS: "SoftDollarTiers",
+    IN.FAMILY_CODES: "FamilyCodes",
+    IN.SYMBOL_SAMPLES: "SymbolSamples",
+    IN.SMART_COMPONENTS: "SmartComponents",
+    IN.MARKET_RULE: "MarketRule",
+    IN.USER_INFO: "UserInfo",
+    IN.NEXT_VALID_ID: "NextValidId",
+    IN.CURRENT_TIME: "CurrentTime",
+    IN.CURRENT_TIME_IN_MILLIS: "CurrentTimeInMillis",
+    IN.VERIFY_MESSAGE_API: "VerifyMessageApi",
+    IN.VERIFY_COMPLETED: "VerifyCompleted",
+    IN.DISPLAY_GROUP_LIST: "DisplayGroupList",
+    IN.DISPLAY_GROUP_UPDATED: "DisplayGroupUpdated",
+    IN.MKT_DEPTH_EXCHANGES: "MarketDepthExchanges",
+}
+
+_inMsgClasses = {}
+
+
+def __getattr__(name):
+    # only called for names not yet in the package namespace, the class is
+    # stored there so later lookups are plain attribute access
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    moduleName = f"{__name__}.{name}_pb2"
+    try:
+        module = importlib.import_module(moduleName)
+    except ModuleNotFoundError as ex:
+        if ex.name != moduleName:
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    msgClass = getattr(module, name)
+    globals()[name] = msgClass
+    return msgClass
+
+
+def inMsgClass(msgId: int):
+    """returns the message class of an incoming protobuf message id"""
+    msgClass = _inMsgClasses.get(msgId)
+    if msgClass is None:
+        msgClass = _inMsgClasses[msgId] = __getattr__(IN_MSG_PROTOS[msgId])
+    return msgClass
+
+
+def parseProtoBuf(msgId: int, protoBuf: bytes):
+    """parses the payload of an incoming protobuf message"""
+    msg = inMsgClass(msgId)()
+    msg.ParseFromString(protoBuf)
+    return msg
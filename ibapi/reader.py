@@ -4,11 +4,13 @@ Copyright (C) 2019 Interactive Brokers LLC. All rights reserved. This code is su
 
 The EReader runs in a separate threads and is responsible for receiving the
 incoming messages.
-It will read the packets from the wire, use the low level IB messaging to
-remove the size prefix and put the rest in a Queue.
+It will read the packets from the wire into a reusable comm.MsgBuffer, use
+the low level IB messaging to remove the size prefix and put the rest in a
+Queue.
 """
 
 import logging
+import time
 from threading import Thread
 
 from ibapi import comm
@@ -17,33 +19,49 @@ logger = logging.getLogger(__name__)
 
 
 class EReader(Thread):
-    def __init__(self, conn, msg_queue):
+    def __init__(self, conn, msg_queue, batched=False, metrics=None):
         super().__init__()
         self.conn = conn
         self.msg_queue = msg_queue
+        # queue the messages of one receive as a single list
+        self.batched = batched
+        # an ibapi.metrics.MsgLoopMetrics, the items are then queued as
+        # (time queued, item) for EClient.getMsgBatch to time their dwell
+        self.metrics = metrics
 
     def run(self):
         try:
             logger.debug("EReader thread started")
-            buf = b""
+            msgBuf = comm.MsgBuffer(self.conn.recvSize)
             while self.conn.isConnected():
-                data = self.conn.recvMsg()
-                logger.debug("reader loop, recvd size %d", len(data))
-                buf += data
-
-                while len(buf) > 0:
-                    (size, msg, buf) = comm.read_msg(buf)
-                    # logger.debug("resp %s", buf.decode('ascii'))
-                    logger.debug(
-                        "size:%d msg.size:%d msg:|%s| buf:%s|", size, len(msg), buf, "|"
-                    )
-
-                    if msg:
+                nRecvd = self.conn.recvMsgInto(msgBuf.writeView())
+                if nRecvd == 0:
+                    continue
+                msgBuf.commit(nRecvd)
+                if self.metrics is not None:
+                    self.queueTimed(msgBuf, nRecvd)
+                    continue
+
+                msgs = msgBuf.popMsgs()
+                if self.batched:
+                    if msgs:
+                        self.msg_queue.put(msgs)
+                else:
+                    for msg in msgs:
                         self.msg_queue.put(msg)
-                    else:
-                        logger.debug("more incoming packet(s) are needed ")
-                        break
 
             logger.debug("EReader thread finished")
         except:
             logger.exception("unhandled exception in EReader thread")
+
+    def queueTimed(self, msgBuf, nRecvd):
+        start = time.perf_counter_ns()
+        msgs = msgBuf.popMsgs()
+        if msgs:
+            queuedAt = time.perf_counter_ns()
+            if self.batched:
+                self.msg_queue.put((queuedAt, msgs))
+            else:
+                for msg in msgs:
+                    self.msg_queue.put((queuedAt, msg))
+        self.metrics.recordReceive(nRecvd, time.perf_counter_ns() - start, self.msg_queue.qsize())
@@ -0,0 +1,173 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+A connection that comes back by itself.
+
+When TWS or the gateway goes away, e.g. for its nightly restart, the EReader
+sees the socket close, EClient.run() returns and every request waiting for
+an answer fails. ReconnectingSession runs the message loop of a
+FuturesEClient and, when the connection drops, connects again after an
+exponential backoff, waits for the API to be started on the new connection
+and replays what was open on the old one through FuturesEClient.replay():
+the market data, real time bar and account subscriptions, and the requests
+not answered yet, under their original reqIds. The futures of these
+requests stay pending across the outage and resolve from the new
+connection.
+
+    session = ReconnectingSession(app, "127.0.0.1", 4002, clientId=0)
+    session.start()
+    bars = app.reqHistoricalDataFuture(contract, "", "1 D", "1 min", "BID").result(3600)
+    session.stop()
+"""
+
+import logging
+import random
+import threading
+import time
+
+from ibapi.futures import notConnectedError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECT_TIMEOUT = 5
+# seconds for the API to answer on a new connection before replaying
+DEFAULT_HANDSHAKE_TIMEOUT = 10
+
+
+class Backoff:
+    """Delays between connection attempts, initial seconds doubling up to
+    maximum, each one off by up to jitter of itself so that the clients of
+    a restarted gateway do not all come back at the same time."""
+
+    def __init__(self, initial: float = 1, maximum: float = 60, factor: float = 2, jitter: float = 0.1):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+
+    def delays(self):
+        delay = self.initial
+        while True:
+            yield delay * (1 + random.uniform(-self.jitter, self.jitter))
+            delay = min(delay * self.factor, self.maximum)
+
+
+class ReconnectingSession:
+    """Keeps client, a FuturesEClient whose wrapper is a FuturesWrapper,
+    connected to host:port, see the module docstring. maxAttempts bounds
+    the connection attempts after each drop, None retries until stop().
+    nReconnects counts the connections made after the first one."""
+
+    def __init__(self, client, host: str, port: int, clientId: int, backoff: Backoff = None,
+                 maxAttempts: int = None, connectTimeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 handshakeTimeout: float = DEFAULT_HANDSHAKE_TIMEOUT):
+        self.client = client
+        self.host = host
+        self.port = port
+        self.clientId = clientId
+        self.backoff = backoff or Backoff()
+        self.maxAttempts = maxAttempts
+        self.connectTimeout = connectTimeout
+        self.handshakeTimeout = handshakeTimeout
+        self.stopped = threading.Event()
+        self.thread = None
+        self.loopThread = None
+        self.nReconnects = 0
+
+    def start(self) -> bool:
+        """connects and starts the message loop, returns whether the first
+        attempt connected. When it did not the attempts go on in the
+        background."""
+        self.stopped.clear()
+        # the requests of a dropped connection stay pending for replay()
+        self.client.wrapper.keepOnClose = self.client.senders
+        connected = self.connectOnce()
+        if connected:
+            self.startLoop()
+        self.thread = threading.Thread(target=self.run, name="ibapi-session", daemon=True)
+        self.thread.start()
+        return connected
+
+    def stop(self):
+        """disconnects for good, the requests still pending fail"""
+        self.stopped.set()
+        self.dropPending()
+        self.client.disconnect()
+        for thread in (self.thread, self.loopThread):
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout=1)
+
+    def dropPending(self):
+        """fails the requests kept pending for replay"""
+        wrapper = self.client.wrapper
+        wrapper.keepOnClose = ()
+        wrapper.pending.failAll(notConnectedError())
+
+    def isConnected(self) -> bool:
+        return self.client.isConnected()
+
+    def connectOnce(self) -> bool:
+        client = self.client
+        client.connect(self.host, self.port, self.clientId)
+        deadline = time.monotonic() + self.connectTimeout
+        while not client.isConnected() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        if not client.isConnected():
+            # closes the socket of a handshake that did not finish
+            client.disconnect()
+            return False
+        return True
+
+    def startLoop(self):
+        self.loopThread = threading.Thread(target=self.client.run, name="ibapi-session-loop", daemon=True)
+        self.loopThread.start()
+
+    def run(self):
+        while not self.stopped.is_set():
+            if self.loopThread is not None:
+                self.loopThread.join()
+            if self.stopped.is_set():
+                return
+            logger.warning("connection to %s:%d lost, reconnecting", self.host, self.port)
+            if not self.reconnect():
+                if not self.stopped.is_set():
+                    logger.error("could not reconnect to %s:%d", self.host, self.port)
+                    self.dropPending()
+                return
+
+    def reconnect(self) -> bool:
+        """connects again with backoff and replays, False after maxAttempts
+        failed attempts or once stopped"""
+        for attempt, delay in enumerate(self.backoff.delays(), 1):
+            if self.maxAttempts is not None and attempt > self.maxAttempts:
+                return False
+            if self.stopped.wait(delay):
+                return False
+            if not self.connectOnce():
+                logger.info("reconnect attempt %d to %s:%d failed", attempt, self.host, self.port)
+                continue
+
+            self.startLoop()
+            if not self.handshake():
+                # dropped again right away, back to the backoff
+                self.client.disconnect()
+                self.loopThread.join()
+                continue
+            self.nReconnects += 1
+            nSubscriptions, nRequests = self.client.replay()
+            logger.warning("reconnected to %s:%d, replayed %d subscriptions and %d requests",
+                           self.host, self.port, nSubscriptions, nRequests)
+            return True
+        return False
+
+    def handshake(self) -> bool:
+        """waits for an answer on the new connection, which TWS only gives
+        once the API is started"""
+        fut = self.client.reqCurrentTimeFuture()
+        try:
+            fut.result(self.handshakeTimeout)
+            return True
+        except Exception:
+            fut.cancel()
+            return False
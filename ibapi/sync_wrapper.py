@@ -13,28 +13,58 @@ This wrapper simplifies the asynchronous nature of the original API by allowing
 synchronous calls that wait for responses before returning.
 """
 
+import collections
+import concurrent.futures
+import queue
 import threading
 import time
 from decimal import Decimal
 from ibapi.account_summary_tags import AccountSummaryTags
-from ibapi.client import EClient
-from ibapi.wrapper import EWrapper
-from ibapi.contract import Contract, ContractDetails
+from ibapi import hist_range
+from ibapi.contract_cache import DEFAULT_TTL, ContractDetailsCache
+from ibapi.futures import FuturesEClient, FuturesWrapper, ResultStream, isWarningCode
+from ibapi.pacing import PacingScheduler
+from ibapi.session import ReconnectingSession
+from ibapi.contract import Contract
 from ibapi.order import Order
 from ibapi.order_state import OrderState
 from ibapi.execution import Execution, ExecutionFilter
 from ibapi.order_cancel import OrderCancel
-from ibapi.common import TickerId, OrderId, BarData
+from ibapi.common import TickerId, OrderId
 from ibapi.ticktype import TickTypeEnum
+from ibapi.utils import ClientException
+
+# Keys of the answers that have no request ID
+NEXT_VALID_ID_KEY = "next_valid_id"
+OPEN_ORDERS_KEY = "open_orders"
+PORTFOLIO_KEY = "portfolio"
+POSITIONS_KEY = "positions"
+
+# TWS error of a cancelled order, the expected answer to cancelOrder
+ORDER_CANCELLED_CODE = 202
+
+# Bounds of the errors kept in TWSSyncWrapper.errors
+MAX_ERROR_REQ_IDS = 1000
+MAX_ERRORS_PER_REQ_ID = 100
+
+def order_status_key(order_id):
+	return ("order_status", order_id)
 
 class ResponseTimeout(Exception):
 	"""Exception raised when a response is not received within the timeout period."""
 	pass
 
-class TWSSyncWrapper(EWrapper, EClient):
+class TWSSyncWrapper(FuturesWrapper, FuturesEClient):
 	"""
 	Synchronous wrapper for the TWS API that combines EWrapper and EClient
 	and provides synchronous methods to interact with TWS.
+
+	Every answer goes to a slot in self.pending (see ibapi.futures), which
+	is registered before the request is sent, so an answer arriving before
+	the caller starts waiting is not lost. Request and order IDs all come
+	from nextReqId(), so they never collide. The *_future methods can have
+	many requests in flight at once and the get_* methods wait on a single
+	one.
 	"""
 
 	def __init__(self, timeout=30):
@@ -44,18 +74,13 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Args:
 		timeout: Default timeout in seconds for synchronous operations.
 		"""
-		EWrapper.__init__(self)
-		EClient.__init__(self, wrapper=self)
+		FuturesWrapper.__init__(self)
+		FuturesEClient.__init__(self, wrapper=self)
 
 		# Default timeout for synchronous operations
 		self.timeout = timeout
 
-		# Synchronization primitives
-		self.response_events = {}
-		self.response_data = {}
-
 		# For storing responses
-		self.contract_details = {}
 		self.order_status = {}
 		self.open_orders = {}
 		self.executions = {}
@@ -63,13 +88,18 @@ class TWSSyncWrapper(EWrapper, EClient):
 		self.positions = {}
 		self.account_summary = {}
 		self.market_data = {}
-		self.historical_data = {}
 		self.current_time_value = None
 		self.next_valid_id_value = None
 		self.completion_events = {}
+		# The latest errors of the latest request IDs
 		self.errors = {}
 
-	def connect_and_start(self, host, port, client_id):
+		# See enable_contract_cache
+		self.contract_cache = None
+		# See connect_and_start
+		self.session = None
+
+	def connect_and_start(self, host, port, client_id, reconnect=False):
 		"""
 		Connect to TWS and start the message processing thread.
 
@@ -77,10 +107,18 @@ class TWSSyncWrapper(EWrapper, EClient):
 		host: TWS host, usually '127.0.0.1'
 		port: TWS port, usually 7496 for TWS or 4001 for IB Gateway
 		client_id: A unique client ID
+		reconnect: Whether to reconnect when the connection drops, e.g. on
+		the nightly gateway restart, and send the subscriptions and the
+		unanswered requests again (see ibapi.session). The *_future
+		requests then wait through the outage instead of failing.
 
 		Returns:
 		True if connection is successful, False otherwise
 		"""
+		if reconnect:
+			self.session = ReconnectingSession(self, host, port, client_id)
+			return self.session.start()
+
 		self.connect(host, port, client_id)
 
 		# Wait for connection to be established
@@ -95,17 +133,36 @@ class TWSSyncWrapper(EWrapper, EClient):
 
 		return self.isConnected()
 
-	def _wait_for_response(self, req_id, event_name, timeout=None):
+	def _start_request(self, key, shared=False):
 		"""
-		Wait for a response from TWS for a specific request.
+		Register the slot the answer to a request is delivered to. Call it
+		before sending the request.
 
 		Args:
-			req_id: The request ID to wait for
-			event_name: The event name to wait for
-			timeout: Timeout in seconds (uses default if None)
+			key: The request ID, or the key of an answer without one
+			shared: Whether concurrent callers share one request
 
 		Returns:
-			The response data
+			The future of the answer, and whether the request has to be sent
+			(False when joining a shared one already on its way)
+		"""
+		fut = concurrent.futures.Future()
+		if shared:
+			fut, started = self.pending.startOrJoin(key, fut)
+		else:
+			self.pending.start(key, fut)
+			started = True
+		if started:
+			# Free the slot when the caller gives up waiting
+			fut.add_done_callback(lambda fut: self.pending.discard(key, fut))
+		return fut, started
+
+	def _wait_for_future(self, fut, event_name, timeout=None):
+		"""
+		Wait for a request future, cancelling it on a timeout.
+
+		The timeout starts once the request went out to TWS, the time it
+		waits for a free slot or for the pacing does not count.
 
 		Raises:
 			ResponseTimeout: If no response is received within the timeout period
@@ -113,50 +170,31 @@ class TWSSyncWrapper(EWrapper, EClient):
 		if timeout is None:
 			timeout = self.timeout
 
-		event_key = f"{event_name}_{req_id}"
+		self._wait_sent(fut)
+		try:
+			return fut.result(timeout)
+		except concurrent.futures.TimeoutError:
+			fut.cancel()
+			raise ResponseTimeout(f"No response received for {event_name} request within {timeout} seconds")
+		except concurrent.futures.CancelledError:
+			# Another caller sharing the request gave up on it
+			raise ResponseTimeout(f"No response received for {event_name} request, it was given up")
 
-		# Create event if it doesn't exist
-		if event_key not in self.response_events:
-			self.response_events[event_key] = threading.Event()
-
-		# Wait for the event to be set
-		if not self.response_events[event_key].wait(timeout):
-			# Clean up
-			if event_key in self.response_events:
-				del self.response_events[event_key]
-			if event_key in self.response_data:
-				del self.response_data[event_key]
-				raise ResponseTimeout(f"No response received for {event_name} request {req_id} within {timeout} seconds")
-
-		# Get the response data
-		response = self.response_data.get(event_key)
-
-		# Clean up
-		del self.response_events[event_key]
-		del self.response_data[event_key]
-
-		return response
-
-	def _set_event(self, req_id, event_name, data=None):
+	def _wait_sent(self, fut):
 		"""
-		Set an event to indicate that a response has been received.
-
-		Args:
-		req_id: The request ID
-		event_name: The event name
-		data: The response data
+		Wait until a request future's request went out to TWS, or was
+		given up before, see FuturesEClient.submitRequest.
 		"""
-		event_key = f"{event_name}_{req_id}"
-		self.response_data[event_key] = data
-
-		if event_key in self.response_events:
-			self.response_events[event_key].set()
+		sent = getattr(fut, "sent", None)
+		if sent is not None:
+			sent.result()
 
 	# EWrapper method overrides
 	def nextValidId(self, orderId: int):
 		"""Called by TWS with the next valid order ID."""
 		self.next_valid_id_value = orderId
-		self._set_event(0, "next_valid_id", orderId)
+		self.reqIdAllocator.advance(orderId)
+		self.pending.finish(NEXT_VALID_ID_KEY, orderId)
 		super().nextValidId(orderId)
 
 	def error(self, reqId: TickerId, errorTime: int, errorCode: int, errorString: str, advancedOrderRejectJson=""):
@@ -169,33 +207,27 @@ class TWSSyncWrapper(EWrapper, EClient):
 			"advancedOrderRejectJson": advancedOrderRejectJson
 		}
 
-		if reqId not in self.errors:
-			self.errors[reqId] = []
-			self.errors[reqId].append(error_info)
+		errors = self.errors.get(reqId)
+		if errors is None:
+			errors = self.errors[reqId] = collections.deque(maxlen=MAX_ERRORS_PER_REQ_ID)
+			if len(self.errors) > MAX_ERROR_REQ_IDS:
+				# Forget the oldest request ID
+				del self.errors[next(iter(self.errors))]
+		errors.append(error_info)
 
-		# Set event for any waiting synchronous calls
-		self._set_event(reqId, "error", error_info)
+		# Fail a wait for the status of a rejected order
+		key = order_status_key(reqId)
+		if key in self.pending and not isWarningCode(errorCode) and errorCode != ORDER_CANCELLED_CODE:
+			self.pending.fail(key, ClientException(errorCode, errorString, advancedOrderRejectJson))
 
+		# The request futures of reqId fail in FuturesWrapper.error
 		super().error(reqId, errorTime, errorCode, errorString, advancedOrderRejectJson)
 
 	def currentTime(self, time_value: int):
 		"""Called with the current system time on the server side."""
 		self.current_time_value = time_value
-		self._set_event(0, "current_time", time_value)
 		super().currentTime(time_value)
 
-	def contractDetails(self, reqId: int, contractDetails: ContractDetails):
-		"""Called with contract details."""
-		if reqId not in self.contract_details:
-			self.contract_details[reqId] = []
-		self.contract_details[reqId].append(contractDetails)
-		super().contractDetails(reqId, contractDetails)
-
-	def contractDetailsEnd(self, reqId: int):
-		"""Called when all contract details have been received."""
-		self._set_event(reqId, "contract_details", self.contract_details.get(reqId, []))
-		super().contractDetailsEnd(reqId)
-
 	def orderStatus(self, orderId: OrderId, status: str, filled: Decimal, remaining: Decimal,avgFillPrice: float, permId: int, parentId: int, lastFillPrice: float, clientId: int, whyHeld: str, mktCapPrice: float):
 		"""Called when the status of an order changes."""
 		order_status_data = {
@@ -213,7 +245,7 @@ class TWSSyncWrapper(EWrapper, EClient):
 		}
 
 		self.order_status[orderId] = order_status_data
-		self._set_event(orderId, "order_status", order_status_data)
+		self.pending.finish(order_status_key(orderId), order_status_data)
 		super().orderStatus(orderId, status, filled, remaining, avgFillPrice, permId, parentId,lastFillPrice, clientId, whyHeld, mktCapPrice)
 
 	def openOrder(self, orderId: OrderId, contract: Contract, order: Order, orderState: OrderState):
@@ -230,7 +262,7 @@ class TWSSyncWrapper(EWrapper, EClient):
 
 	def openOrderEnd(self):
 		"""Called at the end of a request for open orders."""
-		self._set_event(0, "open_orders", self.open_orders)
+		self.pending.finish(OPEN_ORDERS_KEY, self.open_orders)
 		super().openOrderEnd()
 
 	def execDetails(self, reqId: int, contract: Contract, execution: Execution):
@@ -247,7 +279,7 @@ class TWSSyncWrapper(EWrapper, EClient):
 
 	def execDetailsEnd(self, reqId: int):
 		"""Called when all execution details have been received."""
-		self._set_event(reqId, "executions", self.executions.get(reqId, []))
+		self.pending.finish(reqId, self.executions.pop(reqId, []))
 		super().execDetailsEnd(reqId)
 
 	def updatePortfolio(self, contract: Contract, position: Decimal, marketPrice: float, marketValue: float, averageCost: float, unrealizedPNL: float, realizedPNL: float, accountName: str):
@@ -268,7 +300,7 @@ class TWSSyncWrapper(EWrapper, EClient):
 
 	def accountDownloadEnd(self, accountName: str):
 		"""Called when account download has finished."""
-		self._set_event(0, "portfolio", self.portfolio)
+		self.pending.finish(PORTFOLIO_KEY, self.portfolio)
 		super().accountDownloadEnd(accountName)
 
 	def position(self, account: str, contract: Contract, position: Decimal, avgCost: float):
@@ -286,7 +318,7 @@ class TWSSyncWrapper(EWrapper, EClient):
 
 	def positionEnd(self):
 		"""Called when all position data has been received."""
-		self._set_event(0, "positions", self.positions)
+		self.pending.finish(POSITIONS_KEY, self.positions)
 		super().positionEnd()
 
 	def accountSummary(self, reqId: int, account: str, tag: str, value: str, currency: str):
@@ -306,7 +338,7 @@ class TWSSyncWrapper(EWrapper, EClient):
 
 	def accountSummaryEnd(self, reqId: int):
 		"""Called when all account summary data has been received."""
-		self._set_event(reqId, "account_summary", self.account_summary.get(reqId, {}))
+		self.pending.finish(reqId, self.account_summary.pop(reqId, {}))
 		super().accountSummaryEnd(reqId)
 
 	def tickPrice(self, reqId: TickerId, tickType: int, price: float, attrib):
@@ -350,22 +382,9 @@ class TWSSyncWrapper(EWrapper, EClient):
 	
 	def tickSnapshotEnd(self, reqId: int):
 		"""Called when all market data for a snapshot has been received."""
-		self._set_event(reqId, "market_data", self.market_data.get(reqId, {}))
+		self.pending.finish(reqId, self.market_data.pop(reqId, {}))
 		super().tickSnapshotEnd(reqId)
 
-	def historicalData(self, reqId: int, bar: BarData):
-		"""Called when historical data is returned."""
-		if reqId not in self.historical_data:
-			self.historical_data[reqId] = []
-
-		self.historical_data[reqId].append(bar)
-		super().historicalData(reqId, bar)
-
-	def historicalDataEnd(self, reqId: int, start: str, end: str):
-		"""Called when all historical data has been received."""
-		self._set_event(reqId, "historical_data", self.historical_data.get(reqId, []))
-		super().historicalDataEnd(reqId, start, end)
-
 	# Synchronous methods
 	def get_next_valid_id(self, timeout=None):
 		"""
@@ -380,8 +399,16 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
-		self.reqIds(-1)
-		return self._wait_for_response(0, "next_valid_id", timeout)
+		fut, started = self._start_request(NEXT_VALID_ID_KEY, shared=True)
+		if started:
+			self.reqIds(-1)
+		return self._wait_for_future(fut, "next_valid_id", timeout)
+
+	def _next_order_id(self):
+		"""The ID of a new order, above the next valid ID of TWS."""
+		if self.next_valid_id_value is None:
+			self.get_next_valid_id()
+		return self.nextReqId()
 
 	def get_current_time(self, timeout=1):
 		"""
@@ -396,8 +423,7 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
-		self.reqCurrentTime()
-		return self._wait_for_response(0, "current_time", timeout)
+		return self._wait_for_future(self.reqCurrentTimeFuture(), "current_time", timeout)
 
 	def get_contract_details(self, contract, timeout=5):
 		"""
@@ -408,14 +434,37 @@ class TWSSyncWrapper(EWrapper, EClient):
 		timeout: Timeout in seconds (uses default if None)
 
 		Returns:
-		A list of ContractDetails db_objects
+		A list of ContractDetails db_objects, from the contract cache when
+		it is enabled and has them
 
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
-		req_id = self.get_next_valid_id()
-		self.reqContractDetails(req_id, contract)
-		return self._wait_for_response(req_id, "contract_details", timeout)
+		cache = self.contract_cache
+		if cache is not None:
+			details = cache.get(contract)
+			if details is not None:
+				return details
+
+		details = self._wait_for_future(self.reqContractDetailsFuture(contract), "contract_details", timeout)
+		if cache is not None and details:
+			cache.put(contract, details)
+		return details
+
+	def enable_contract_cache(self, path=None, ttl=DEFAULT_TTL):
+		"""
+		Answer get_contract_details from a cache, see ibapi.contract_cache.
+
+		Args:
+		path: SQLite file keeping the cache between runs, memory only if None
+		ttl: Seconds after which cached details are requested again
+
+		Returns:
+		The ContractDetailsCache
+		"""
+		if self.contract_cache is None:
+			self.contract_cache = ContractDetailsCache(path, ttl)
+		return self.contract_cache
 
 	def place_order_sync(self, contract, order, timeout=None):
 		"""
@@ -434,15 +483,12 @@ class TWSSyncWrapper(EWrapper, EClient):
 		"""
 		timeout = 5 if order.orderType in ["LMT", "MKT"] else 2
 
-		order_id = self.get_next_valid_id()
+		order_id = self._next_order_id()
 		order.orderId = order_id
 
-		# Clear any previous order status for this order ID
-		if order_id in self.order_status:
-			del self.order_status[order_id]
-
+		fut, _ = self._start_request(order_status_key(order_id), shared=True)
 		self.placeOrder(order_id, contract, order)
-		return self._wait_for_response(order_id, "order_status", timeout)
+		return self._wait_for_future(fut, "order_status", timeout)
 
 	def cancel_order_sync(self, order_id, orderCancel=None, timeout=3):
 		"""
@@ -462,8 +508,9 @@ class TWSSyncWrapper(EWrapper, EClient):
 		if orderCancel is None:
 			orderCancel = OrderCancel()
 
+		fut, _ = self._start_request(order_status_key(order_id), shared=True)
 		self.cancelOrder(order_id, orderCancel)
-		return self._wait_for_response(order_id, "order_status", timeout)
+		return self._wait_for_future(fut, "order_status", timeout)
 
 	def get_open_orders(self, timeout=3):
 		"""
@@ -478,11 +525,12 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
-		# Clear existing open orders
-		self.open_orders = {}
-
-		self.reqOpenOrders()
-		return self._wait_for_response(0, "open_orders", timeout)
+		fut, started = self._start_request(OPEN_ORDERS_KEY, shared=True)
+		if started:
+			# Clear existing open orders
+			self.open_orders = {}
+			self.reqOpenOrders()
+		return self._wait_for_future(fut, "open_orders", timeout)
 
 	def get_executions(self, exec_filter=None, timeout=10):
 		"""
@@ -501,14 +549,13 @@ class TWSSyncWrapper(EWrapper, EClient):
 		if exec_filter is None:
 			exec_filter = ExecutionFilter()
 
-		req_id = self.get_next_valid_id()
-
-		# Clear existing executions for this request ID
-		if req_id in self.executions:
-			del self.executions[req_id]
-
+		req_id = self.nextReqId()
+		fut, _ = self._start_request(req_id)
 		self.reqExecutions(req_id, exec_filter)
-		return self._wait_for_response(req_id, "executions", timeout)
+		try:
+			return self._wait_for_future(fut, "executions", timeout)
+		finally:
+			self.executions.pop(req_id, None)
 
 	def get_portfolio(self, account_code="", timeout=None):
 		"""
@@ -524,16 +571,19 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
+		fut, started = self._start_request(PORTFOLIO_KEY, shared=True)
+		if not started:
+			return self._wait_for_future(fut, "portfolio", timeout)
+
 		# Clear existing portfolio
 		self.portfolio = []
 
 		self.reqAccountUpdates(True, account_code)
-		portfolio = self._wait_for_response(0, "portfolio", timeout)
-
-		# Stop the updates
-		self.reqAccountUpdates(False, account_code)
-
-		return portfolio
+		try:
+			return self._wait_for_future(fut, "portfolio", timeout)
+		finally:
+			# Stop the updates
+			self.reqAccountUpdates(False, account_code)
 
 	def get_positions(self, timeout=10):
 		"""
@@ -548,16 +598,19 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
+		fut, started = self._start_request(POSITIONS_KEY, shared=True)
+		if not started:
+			return self._wait_for_future(fut, "positions", timeout)
+
 		# Clear existing positions
 		self.positions = {}
 
 		self.reqPositions()
-		positions = self._wait_for_response(0, "positions", timeout)
-
-		# Cancel position updates
-		self.cancelPositions()
-
-		return positions
+		try:
+			return self._wait_for_future(fut, "positions", timeout)
+		finally:
+			# Cancel position updates
+			self.cancelPositions()
 
 	def get_account_summary(self, tags, group="All", timeout=5):
 		"""
@@ -574,19 +627,15 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
-		req_id = self.get_next_valid_id()
-
-		# Clear existing account summary for this request
-		if req_id in self.account_summary:
-			del self.account_summary[req_id]
-
+		req_id = self.nextReqId()
+		fut, _ = self._start_request(req_id)
 		self.reqAccountSummary(req_id, group, tags)
-		summary = self._wait_for_response(req_id, "account_summary", timeout)
-
-		# Cancel the subscription
-		self.cancelAccountSummary(req_id)
-
-		return summary
+		try:
+			return self._wait_for_future(fut, "account_summary", timeout)
+		finally:
+			# Cancel the subscription
+			self.cancelAccountSummary(req_id)
+			self.account_summary.pop(req_id, None)
 
 	def get_market_data_snapshot(self, contract, generic_tick_list="", snapshot=True, timeout=None):
 		"""
@@ -605,30 +654,27 @@ class TWSSyncWrapper(EWrapper, EClient):
 		ResponseTimeout: If no response is received within the timeout period
 		"""
 		timeout = 11 if snapshot == True else 5
-		req_id = self.get_next_valid_id()
-
-		# Clear existing market data for this request
-		if req_id in self.market_data:
-			del self.market_data[req_id]
-
-		self.reqMktData(req_id, contract, generic_tick_list, snapshot, False, [])
+		req_id = self.nextReqId()
 
 		# For snapshots, we'll get a tickSnapshotEnd event
 		if snapshot:
-			data = self._wait_for_response(req_id, "market_data", timeout)
-		else:
+			fut, _ = self._start_request(req_id)
+			self.reqMktData(req_id, contract, generic_tick_list, snapshot, False, [])
+			try:
+				return self._wait_for_future(fut, "market_data", timeout)
+			finally:
+				self.market_data.pop(req_id, None)
+
 		# For streaming data, we need to wait a bit and then return what we have
-			time.sleep(1 if timeout is None or timeout > 1 else timeout / 2)
-			data = self.market_data.get(req_id, {})
+		self.reqMktData(req_id, contract, generic_tick_list, snapshot, False, [])
+		time.sleep(1 if timeout is None or timeout > 1 else timeout / 2)
 
 		# Cancel if not a snapshot (snapshots auto-cancel)
-		if not snapshot:
-			self.cancelMktData(req_id)
-
-		return data
+		self.cancelMktData(req_id)
+		return self.market_data.pop(req_id, {})
 
 	def get_historical_data(self, contract, end_date_time, duration_str, bar_size_setting,
-		what_to_show, use_rth=True, format_date=1, timeout=30):
+		what_to_show, use_rth=True, format_date=1, timeout=30, priority=0):
 		"""
 		Get historical data for a contract.
 
@@ -640,7 +686,8 @@ class TWSSyncWrapper(EWrapper, EClient):
 		what_to_show: Type of data to show
 		use_rth: Whether to use regular trading hours only
 		format_date: Date format (1 or 2)
-		timeout: Timeout in seconds (uses default if None)
+		timeout: Timeout in seconds from when the request is sent, after the pacing (uses default if None)
+		priority: Order of the requests waiting for pacing, lowest first
 
 		Returns:
 		Historical bar data
@@ -648,19 +695,150 @@ class TWSSyncWrapper(EWrapper, EClient):
 		Raises:
 		ResponseTimeout: If no response is received within the timeout period
 		"""
-		req_id = self.get_next_valid_id()
+		fut = self.get_historical_data_future(contract, end_date_time, duration_str, bar_size_setting,
+			what_to_show, use_rth, format_date, priority)
+		return self._wait_for_future(fut, "historical_data", timeout)
+
+	def get_historical_data_future(self, contract, end_date_time, duration_str, bar_size_setting,
+		what_to_show, use_rth=True, format_date=1, priority=0):
+		"""
+		Request historical data for a contract without waiting for it.
+
+		Takes the same arguments as get_historical_data. Up to maxInFlight
+		requests are on TWS at once (see setMaxInFlight), later ones are
+		sent as earlier ones complete. With pacing enabled they also wait
+		for the TWS pacing rules, see enable_pacing.
+
+		Returns:
+		A concurrent.futures.Future of the list of bars, failing with a
+		ClientException when TWS answers the request with an error
+		"""
+		return self.reqHistoricalDataFuture(contract, end_date_time, duration_str, bar_size_setting,
+			what_to_show, int(use_rth), format_date, priority)
+
+	def plan_historical_range(self, start, end, bar_size_setting, time_zone=None):
+		"""
+		Plan the requests of get_historical_range, without sending them.
+
+		Returns:
+		A list of (end_date_time, duration_str), one per request
+		"""
+		return [hist_range.chunkRequest(*chunk)
+			for chunk in hist_range.planChunks(start, end, bar_size_setting, time_zone)]
+
+	def get_historical_range(self, contract, start, end, bar_size_setting, what_to_show,
+		use_rth=True, format_date=1, time_zone=None, timeout=None, priority=0):
+		"""
+		Get the historical data of a window of any length.
+
+		Args:
+		contract: Contract object
+		start: Start of the window, a time zone aware datetime
+		end: End of the window (excluded), a time zone aware datetime
+		bar_size_setting: Bar size (e.g., "1 min", "1 day")
+		what_to_show: Type of data to show
+		use_rth: Whether to use regular trading hours only
+		format_date: Date format (1 or 2)
+		time_zone: Time zone of the exchange, the requests cover its days
+		timeout: Timeout in seconds for each request of the window, from when the last one is sent (uses default if None)
+		priority: Order of the requests waiting for pacing, lowest first
+
+		Returns:
+		The bars of the window in time order, without duplicates
+
+		Raises:
+		ResponseTimeout: If the window is not received within the timeout period
+		ClientException: If TWS answers a request with an error other than no data
+		"""
+		if timeout is None:
+			timeout = self.timeout
+		n_requests = len(hist_range.planChunks(start, end, bar_size_setting, time_zone))
+		fut = self.get_historical_range_future(contract, start, end, bar_size_setting, what_to_show,
+			use_rth, format_date, time_zone, priority)
+		return self._wait_for_future(fut, "historical_range", timeout * max(1, n_requests))
+
+	def get_historical_range_future(self, contract, start, end, bar_size_setting, what_to_show,
+		use_rth=True, format_date=1, time_zone=None, priority=0):
+		"""
+		Request the historical data of a window of any length without
+		waiting for it.
 
-		# Clear existing historical data for this request
-		if req_id in self.historical_data:
-			del self.historical_data[req_id]
+		Takes the same arguments as get_historical_range. The window is
+		split into as many requests as TWS needs for the bar size (see
+		plan_historical_range), which are sent in parallel through the
+		pacing.
 
-		self.reqHistoricalData(req_id, contract, end_date_time, duration_str, bar_size_setting,
-		what_to_show, use_rth, format_date, False, [])
+		Returns:
+		A concurrent.futures.Future of the merged list of bars
+		"""
+		self.enable_pacing()
+		return self.reqHistoricalRangeFuture(contract, start, end, bar_size_setting, what_to_show,
+			int(use_rth), format_date, time_zone, priority)
 
-		return self._wait_for_response(req_id, "historical_data", timeout)
+	def iter_historical_data(self, contract, end_date_time, duration_str, bar_size_setting,
+		what_to_show, use_rth=True, format_date=1, timeout=None, priority=0, max_queued=1000):
+		"""
+		Iterate over the bars of a historical data request as they arrive.
+
+		Takes the same arguments as get_historical_data. At most max_queued
+		bars wait for the caller, beyond that TWS waits (see
+		ibapi.futures.ResultStream), so do not wait on other requests while
+		iterating. Leaving the loop early cancels the request.
+
+		Yields:
+		Historical bars, in the order TWS sends them
+
+		Raises:
+		ResponseTimeout: If no bar is received within timeout seconds of the previous one
+		ClientException: If TWS answers the request with an error
+		"""
+		if timeout is None:
+			timeout = self.timeout
+
+		fut, stream = self.reqHistoricalDataStream(contract, end_date_time, duration_str,
+			bar_size_setting, what_to_show, int(use_rth), format_date, priority, max_queued)
+		try:
+			self._wait_sent(fut)
+			while True:
+				try:
+					bar = stream.get(timeout)
+				except queue.Empty:
+					raise ResponseTimeout(f"No response received for historical_data request within {timeout} seconds")
+				if bar is ResultStream.END:
+					break
+				yield bar
+			# Raises the error the request ended with
+			fut.result()
+		finally:
+			stream.close()
+			fut.cancel()
+
+	def enable_pacing(self):
+		"""
+		Send the historical data requests as fast as the TWS pacing rules
+		allow and no faster, so that none of them fails with error 162.
+
+		Returns:
+		The ibapi.pacing.PacingScheduler, whose waitStats() tells how long
+		the requests waited for the pacing
+		"""
+		if self.pacer is None:
+			self.setPacer(PacingScheduler(self))
+		return self.pacer
 
 	def disconnect_and_stop(self):
 		"""Disconnect from TWS and stop the message processing thread."""
+		if self.pacer is not None:
+			# A pacer shared with other connections keeps running
+			if self.pacer.client is self:
+				self.pacer.stop()
+			self.setPacer(None)
+		if self.contract_cache is not None:
+			self.contract_cache.close()
+			self.contract_cache = None
+		if self.session is not None:
+			self.session.stop()
+			self.session = None
 		self.disconnect()
 
 		# Wait for the thread to finish if it's running
@@ -183,6 +183,9 @@ def intMaxString(val):
 
 
 def isAsciiPrintable(val):
+    # both run in C, only tabs and line breaks take the slow way
+    if val.isascii() and val.isprintable():
+        return True
     return all(ord(c) >= 32 and ord(c) < 127 or ord(c) == 9 or ord(c) == 10 or ord(c) == 13 for c in val)
 
 
@@ -0,0 +1,92 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Logging for the wire layer: Connection, EReader and the send and receive
+paths of EClient, which run for every message in and out.
+
+Call sites there ask debugOn()/infoOn() once per operation and skip the
+whole block when the level is off, so neither frame inspection
+(current_fn_name) nor argument formatting happen on the hot path. The check
+is Logger.isEnabledFor, which the logging module caches per level, so level
+changes made while connected still take effect.
+
+WireTrace is the structured trace of the messages themselves. It is off
+unless enabled with EClient.setWireTrace() and logs one JSON object per
+sampled message on the "ibapi.wire" logger.
+"""
+
+import json
+import logging
+import time
+
+from ibapi.utils import current_fn_name
+
+wireLogger = logging.getLogger("ibapi.wire")
+
+
+def debugOn(logger: logging.Logger) -> bool:
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def infoOn(logger: logging.Logger) -> bool:
+    return logger.isEnabledFor(logging.INFO)
+
+
+class WireTrace:
+    """Logs every sampleEvery-th message in each direction as one JSON line:
+
+    {"dir": "out", "seq": 12, "msgId": 20, "fn": "reqHistoricalData", "time": ..., "fields": [...]}
+
+    seq counts all the messages of that direction, sampled or not, so gaps
+    show what was skipped. Text messages are logged as their fields, at
+    most maxFields of them; protobuf messages as the hex of at most maxBytes
+    bytes. "fn" is the EClient request method, for sent messages only."""
+
+    def __init__(self, sampleEvery: int = 1, maxFields: int = 64, maxBytes: int = 256):
+        self.sampleEvery = max(1, sampleEvery)
+        self.maxFields = maxFields
+        self.maxBytes = maxBytes
+        self.nSent = 0
+        self.nReceived = 0
+
+    def sent(self, msgId: int, msg, isProtoBuf: bool = False):
+        """msg is the payload passed to EClient.sendMsg/sendMsgProtoBuf, call
+        it from there so the request method can be found"""
+        self.nSent += 1
+        if self.nSent % self.sampleEvery == 0 and wireLogger.isEnabledFor(logging.DEBUG):
+            # the request method is the caller of EClient.sendMsg
+            self.log("out", self.nSent, msgId, msg, isProtoBuf, current_fn_name(2))
+
+    def received(self, msgId: int, msg, isProtoBuf: bool = False):
+        """msg is the protobuf payload or the already split fields"""
+        self.nReceived += 1
+        if self.nReceived % self.sampleEvery == 0 and wireLogger.isEnabledFor(logging.DEBUG):
+            self.log("in", self.nReceived, msgId, msg, isProtoBuf, None)
+
+    def log(self, direction, seq, msgId, msg, isProtoBuf, fnName):
+        rec = {"dir": direction, "seq": seq, "msgId": msgId}
+        if fnName is not None:
+            rec["fn"] = fnName
+        rec["time"] = round(time.time(), 6)
+
+        if isProtoBuf:
+            rec["len"] = len(msg)
+            rec["protobuf"] = bytes(msg[: self.maxBytes]).hex()
+        else:
+            if type(msg) is str:
+                fields = msg.split("\0")
+            elif type(msg) in (bytes, bytearray):
+                fields = msg.split(b"\0")
+            else:
+                fields = list(msg)
+            if fields and not fields[-1]:
+                # the trailing separator of the last field
+                fields.pop()
+            rec["nFields"] = len(fields)
+            rec["fields"] = [
+                f if type(f) is str else f.decode("UTF-8", errors="backslashreplace")
+                for f in fields[: self.maxFields]
+            ]
+
+        wireLogger.debug("%s", json.dumps(rec))
@@ -13,17 +13,45 @@
 #                    and calculating the period from those
 # 2025-12-16 105 MW  Instead of hard-coded database user and 
 #                    password, use host_name_passwd_get
+# 2026-10-18 106 AG  request the BID and ASK data of all the tickers
+#                    at once with get_historical_data_future
+# 2026-10-18 107 AG  pace the requests to the TWS historical data
+#                    limits instead of running into error 162
+# 2026-10-18 108 AG  request the whole window with get_historical_range,
+#                    split into as many requests as the bar size needs
+# 2026-10-18 109 AG  cache the contract details between runs and request
+#                    the historical data by conId
+# 2026-10-18 110 AG  reconnect when the gateway restarts and send the
+#                    unanswered requests again instead of failing them
+# 2026-10-18 111 AG  save the bars of each request with one MERGE per
+#                    batch through ImsHistMktDataBulk, not one agt_put
+#                    per bar
+# 2026-10-18 112 AG  merge the BID and ASK bars of a ticker with
+#                    HistMktBarMerger and save each bar once, ending
+#                    a second before the next one starts
+# 2026-10-18 113 AG  request the bar dates as epoch seconds, parsed
+#                    for all the bars of a ticker at once
+# 2026-10-18 114 AG  save the bars with the HMD_FREQ_TYPE of their bar
+#                    size, '1 min', not 'DAILY'
+# 2026-10-18 115 AG  backfill the IMS_LOAD_TODOS and the IMS_INVESTMENTS
+#                    loading prices with HistMktBackfill, checkpointed
+#                    per chunk in IMS_LOAD_DONE, instead of a fixed list
+#                    of tickers
 # ------------------------------------------------------------
 
 from   ibapi.sync_wrapper import TWSSyncWrapper
 from   ibapi.contract     import Contract
 from   datetime           import datetime
+from   os                 import path
 from   zoneinfo           import ZoneInfo
 
 from   agents.AvaAgtOra   import AvaAgtOra
 from   agents.AvaAgtOs    import host_name_passwd_get
 from   agents.AvaAgtLog   import AvaAgtLog
 
+from   load_data.hist_mkt_backfill   import HistMktBackfill
+
+import oracledb
 
 # ============================================================================================================================
 # config
@@ -33,6 +61,15 @@ from utils.config import DB_PORT, DB_TIMEZONE, DB_TNS_SERVICE
 from utils.config import AGT_KIND_ERR, AGT_KIND_LOG
 from utils.config import FOLDER_ERR,  FOLDER_LOG
 
+# the bar dates come as epoch seconds, cheaper to parse than date strings
+HIST_DATA_FORMAT_DATE = 2
+
+# the requests cover whole days of the exchange
+EXCHANGE_TIME_ZONE = 'America/Toronto'
+
+# contract details are kept here between runs, with the logs
+CONTRACT_CACHE_FILE = path.join(FOLDER_LOG, 'contract_details.sqlite')
+
 # ============================================================================================================================
 # globals
 # ============================================================================================================================
@@ -45,7 +82,7 @@ from utils.config import FOLDER_ERR,  FOLDER_LOG
 # mw_get_hist_mkt_data
 # ----------------------------------------------------------------------------------------------------------------------------
 
-def get_hist_mkt_data(agt_err, agt_log, agt_ora, start_datetime_str, end_datetime_str):
+def get_hist_mkt_data(agt_err, agt_log, agt_ora, db_con, start_datetime_str, end_datetime_str):
 
     # Create the wrapper
     tws = TWSSyncWrapper(timeout=10) # 10 seconds timeout
@@ -53,13 +90,21 @@ def get_hist_mkt_data(agt_err, agt_log, agt_ora, start_datetime_str, end_datetim
     try:
         # Connect to TWS
         #if not tws.connect_and_start("127.0.0.1", 7497, 0): # using Trader Workstation
-        if not tws.connect_and_start("127.0.0.1", 4002, 0):  # using Gateway
+        # a gateway restart during the run reconnects and requests again what
+        # was not answered yet
+        if not tws.connect_and_start("127.0.0.1", 4002, 0, reconnect=True):  # using Gateway
             agt_err.title_put(text = 'Failed to connect to TWS')
             print("Failed to connect to TWS")
             exit(1)
     
         agt_log.title_put(text = 'Connected to TWS')
         print("Connected to TWS")
+
+        # send the historical data requests as fast as TWS allows
+        pacer = tws.enable_pacing()
+
+        # only ask TWS for the contract details not cached by the last runs
+        tws.enable_contract_cache(CONTRACT_CACHE_FILE)
         
         # Get server time
         try:
@@ -71,152 +116,39 @@ def get_hist_mkt_data(agt_err, agt_log, agt_ora, start_datetime_str, end_datetim
             print(f"Error getting server time: {e}")
 
         
-        # Get the tickers I want to get historic market data for
-        
-        ticker_list =[]
-        ticker_list = get_tickers()
-        
         # Set up the parameters to ask for
         bar_size_setting="1 MIN"
 
-        # calculate the duration_str from the start and end date times
+        # the start and end date times are in UTC
         fmt = "%Y%m%d %H:%M:%S %Z"
-        start_dt = datetime.strptime(start_datetime_str, fmt)
-        end_dt = datetime.strptime(end_datetime_str, fmt)
-
-        delta = end_dt - start_dt
-        number_days = int(delta.total_seconds() / 86400)  # exact fractional days convert to integer
-        
-        duration_str = f"{number_days} D"
-        print("duration_str:", duration_str)
-        
-        agt_log.log_put(f"Requesting date for duration string {duration_str}")
-            
-        # go through each ticker at a time
-        
-        for this_ticker in ticker_list:
-            agt_log.title_put(text = this_ticker)
-            print("this_ticker", this_ticker)
-            
-            # Define a contract (e.g., AAPL stock)
-            contract = Contract()
-            contract.symbol = this_ticker
-            contract.secType = "STK"
-            contract.currency = "CAD"
-            contract.exchange = "TSE"
-        
-            # Get contract details
-            try:
-                details = ''
-                details = tws.get_contract_details(contract)
-                #print(f"Contract details: {details[0].longName if details else 'No details'}")
-                print(f"Contract details: {this_ticker if details else 'No details'}")
-            except Exception as e:
-                agt_err.title_put(text = 'Error getting server time')
-                agt_err.log_put(e)
-                print(f"Error getting contract details: {e}")
-                
-            # First get the historical BID data for this ticker
-            what_to_show="BID"
-            
-            agt_log.log_put(f"About to request Historical BID Data for : {this_ticker} {end_datetime_str} {duration_str} {bar_size_setting} {what_to_show}")
-            try:
-                bid_bars = tws.get_historical_data(
-                                contract=               contract,
-                                end_date_time=          end_datetime_str, 
-                                duration_str=           duration_str, 
-                                bar_size_setting=       bar_size_setting,
-                                what_to_show=           what_to_show,
-                                use_rth=                True
-                )
-                #agt_log.title_put(text = 'Requesting bid data')
-                agt_log.log_put(f"BID data received: {len(bid_bars)} bid_bars")
-                
-                for bid_bar in bid_bars: 
-                    #agt_log.log_put(bid_bar.date)
-                    date_str = bid_bar.date
-                    # convert the date string to the correct format
-                    # Split into datetime part and timezone part
-                    dt_part, tz_part = date_str.rsplit(" ", 1)
-
-                    # Parse the datetime portion
-                    dt_obj = datetime.strptime(dt_part, "%Y%m%d %H:%M:%S")
-
-                    # Attach timezone
-                    dt_obj = dt_obj.replace(tzinfo=ZoneInfo(tz_part))
-                    
-                    # save the BID data as a dict                   
-                    bid_dict = {'hmd_inv_ticker'          : this_ticker, 
-                                'hmd_start_datetime'      : dt_obj, 
-                                'hmd_end_datetime'        : dt_obj, 
-                                'hmd_freq_type'           : 'DAILY', 
-                                'hmd_start_bid_price'     : bid_bar.open, 
-                                'hmd_highest_bid_price'   : bid_bar.high, 
-                                'hmd_lowest_bid_price'    : bid_bar.low, 
-                                'hmd_last_bid_price'      : bid_bar.close, 
-                                'hmd_total_traded_volume' : bid_bar.volume}
-                    
-                    # save this BID data directly to the database
-                    #agt_ora.agt_put(table_name = 'IMS_HIST_MKT_DATA', row_data_lis=[bid_dict], agt_log = agt_log)
-                    agt_ora.agt_put(table_name = 'IMS_HIST_MKT_DATA', row_data_lis=[bid_dict])
-                    
-                                
-            except Exception as e:
-                agt_err.title_put(text = 'Error getting server time')
-                agt_err.log_put(e)
-                print(f"Error getting contract details: {e}")
-                        
-            # Next get the historical ASK data for this ticker
-            what_to_show="ASK"
-            #agt_log.title_put(text = 'Requesting ask data')
-            agt_log.log_put(f"About to request Historical ASK Data for : {this_ticker} {end_datetime_str} {duration_str} {bar_size_setting} {what_to_show}")
-            
-            try:
-                ask_bars = tws.get_historical_data(
-                                contract=               contract,
-                                end_date_time=          end_datetime_str, 
-                                duration_str=           duration_str, 
-                                bar_size_setting=       bar_size_setting,
-                                what_to_show=           what_to_show,
-                                use_rth=                True
-                )
-                agt_log.log_put(f"ASK data received: {len(ask_bars)} ask_bars")
-                
-                for ask_bar in ask_bars: # Print all
-                    #agt_log.log_put(ask_bar.date)
-                    date_str = ask_bar.date
-                    # convert the date string to the correct format
-                    # Split into datetime part and timezone part
-                    dt_part, tz_part = date_str.rsplit(" ", 1)
-
-                    # Parse the datetime portion
-                    dt_obj = datetime.strptime(dt_part, "%Y%m%d %H:%M:%S")
-
-                    # Attach timezone
-                    dt_obj = dt_obj.replace(tzinfo=ZoneInfo(tz_part))
-                    
-                    # save the ASK data as an object before adding it in a Dict for the
-                    # key of inv_ticker, inv_start_datetime, freq_type
-                    
-                    # save the ASK data as a dict                   
-                    ask_dict = {'hmd_inv_ticker'          : this_ticker, 
-                                'hmd_start_datetime'      : dt_obj, 
-                                'hmd_end_datetime'        : dt_obj, 
-                                'hmd_freq_type'           : 'DAILY', 
-                                'hmd_start_ask_price'     : ask_bar.open, 
-                                'hmd_highest_ask_price'   : ask_bar.high, 
-                                'hmd_lowest_ask_price'    : ask_bar.low, 
-                                'hmd_last_ask_price'      : ask_bar.close}
-                    
-                    # save this ASK data directly to the database
-                    #agt_ora.agt_put(table_name = 'IMS_HIST_MKT_DATA', row_data_lis=[ask_dict], agt_log = agt_log)
-                    agt_ora.agt_put(table_name = 'IMS_HIST_MKT_DATA', row_data_lis=[ask_dict])
-                    
-                    
-            except Exception as e:
-                agt_err.title_put(text = 'Error getting historical ask data')
-                agt_err.log_put(e)
-                print(f"Error getting historical ask data: {e}")
+        start_dt = datetime.strptime(start_datetime_str, fmt).replace(tzinfo=ZoneInfo('UTC'))
+        end_dt = datetime.strptime(end_datetime_str, fmt).replace(tzinfo=ZoneInfo('UTC'))
+
+        # the todos and the window of the investments loading prices, in
+        # chunks of a request each, the ones checkpointed by the last runs
+        # skipped
+        backfill = HistMktBackfill(tws          = tws,
+                                   db_con       = db_con,
+                                   agt_log      = agt_log,
+                                   agt_err      = agt_err,
+                                   contract_get = tse_contract_get,
+                                   time_zone    = EXCHANGE_TIME_ZONE,
+                                   format_date  = HIST_DATA_FORMAT_DATE)
+
+        ticker_list = backfill.investments_get()
+        print("tickers:", ticker_list)
+
+        agt_log.log_put(f"Requesting data from {start_datetime_str} to {end_datetime_str} for {len(ticker_list)} tickers")
+
+        unit_lis = backfill.plan_todos()
+        unit_lis += backfill.plan_window(ticker_list, start_dt, end_dt, bar_size_setting, ('BID', 'ASK'))
+
+        stats = backfill.run(unit_lis)
+        agt_log.log_put(f"Backfill: {stats['saved']} chunks saved with {stats['bars']} bars, {stats['skipped']} done already, {stats['failed']} failed")
+        print("backfill:", stats)
+
+        wait_stats = pacer.waitStats()
+        agt_log.log_put(f"Historical data requests waited {wait_stats['totalWait']:.1f} s for pacing, at most {wait_stats['maxWait']:.1f} s for one")
                     
     
     finally:
@@ -228,6 +160,7 @@ def get_hist_mkt_data(agt_err, agt_log, agt_ora, start_datetime_str, end_datetim
         print("Disconnected")
         
    
+    db_con.close()
     agt_ora.agt_clo()
     agt_log.agt_clo()
     agt_err.agt_clo() 
@@ -236,18 +169,22 @@ def get_hist_mkt_data(agt_err, agt_log, agt_ora, start_datetime_str, end_datetim
     return 
 
 # ------------------------------------------------------------------------------------------------------------------------
-# function : get_tickers
-# descr    : get the tickers that want historic market data for
+# function : tse_contract_get
+# descr    : the contract of a ticker on the TSE, in CAD
 # 
-# in         : ()
-# out        : (ticker_list)
+# in         : (this_ticker)
+# out        : (contract)
 #------------------------------------------------------------------------------------------------------------------------
 
-def get_tickers():
+def tse_contract_get(this_ticker):
     
-    ticker_list = ['RY', 'TD', 'BNS', 'CM', 'BMO']
+    contract = Contract()
+    contract.symbol = this_ticker
+    contract.secType = "STK"
+    contract.currency = "CAD"
+    contract.exchange = "TSE"
 
-    return ticker_list
+    return contract
     
 
       
@@ -288,6 +225,12 @@ if __name__ == '__main__':
                                 agt_err = agt_err, 
                                 agt_log = agt_log, 
                                 params  = ora_params)
+
+    # the connection the bars are saved over in batches
+    
+    db_con          = oracledb.connect(user     = 'IMS', 
+                                       password = password, 
+                                       dsn      = f"{hostname}:{DB_PORT}/{DB_TNS_SERVICE}")
    
     # setting up start and end date times as strings
     
@@ -297,6 +240,7 @@ if __name__ == '__main__':
     status = get_hist_mkt_data(agt_err            = agt_err, 
                                agt_log            = agt_log, 
                                agt_ora            = agt_ora,
+                               db_con             = db_con,
                                start_datetime_str = start_datetime_str, 
                                end_datetime_str   = end_datetime_str)
     
@@ -0,0 +1,649 @@
+# ------------------------------------------------------------
+# filename : hist_mkt_backfill.py
+# descr    : resumable backfill of historic market data
+#
+#            the work is planned as units of one ticker, what to show
+#            and chunk, a window one historical data request covers,
+#            from the ready IMS_LOAD_TODOS or from a window for the
+#            IMS_INVESTMENTS loading prices. The requests of the units
+#            run concurrently through the pacing of the TWS wrapper,
+#            and once the bars of a chunk are committed each unit is
+#            checkpointed in IMS_LOAD_DONE
+#
+#            a rerun reads the checkpoints of its window once and skips
+#            the units already done with a set lookup, so a crash only
+#            costs the chunks that were in flight
+#
+# date       ver who change
+# ---------- --- --- ------
+# 2026-10-18 101 AG  initial write
+# 2026-10-18 102 AG  give up only the requests not answered STALL_TIMEOUT
+#                    seconds after they left the pacing
+# 2026-10-18 103 AG  plan a todo and a window asking for the same chunk
+#                    as one unit, and checkpoint a unit once
+# 2026-10-18 104 AG  bind the checkpoint key by name, it is used twice
+# ------------------------------------------------------------
+
+import queue
+import threading
+import time
+
+from collections import OrderedDict, namedtuple
+from datetime    import datetime
+from zoneinfo    import ZoneInfo
+
+from ibapi.hist_range                import chunkRequest, isNoDataError, mergeBars, planChunks
+
+from db_objects.HistMktBarMerger     import HistMktBarMerger
+from db_objects.HistMktBarSize       import bar_size_get
+from db_objects.ImsHistMktDataBulk   import BATCH_SIZE, SQLITE, ImsHistMktDataBulk, bind_datetime, db_dialect
+
+# ============================================================================================================================
+# config
+# ============================================================================================================================
+
+# LTO_REQ_TYPE and LDO_REQ_TYPE of historic market data, followed by the
+# what to show, e.g. HISTMKTDATA_BID
+REQ_TYPE_PREFIX    = 'HISTMKTDATA_'
+
+TODO_STATUS_READY  = 'RDY'
+TODO_STATUS_WIP    = 'WIP'
+
+# chunks requested and not saved yet, the others wait to be requested
+MAX_PENDING_CHUNKS = 50
+
+# seconds a request may wait for its answer once sent before it is given
+# up, the minutes the pacing may hold it back before do not count
+STALL_TIMEOUT      = 900
+
+# seconds between the looks for requests given up
+STALL_CHECK        = 60
+
+# a unit of work, todo_keys are the IMS_LOAD_TODOS keys it comes from, if any
+HistMktUnit        = namedtuple('HistMktUnit', ['inv_ticker', 'what_to_show', 'hmd_freq_type', 'chunk_start', 'chunk_end', 'todo_keys'])
+
+# ============================================================================================================================
+# functions
+# ============================================================================================================================
+
+# --------------------------------------------------------
+# function : sql_binds
+# descr    : n bind placeholders of the dialect
+#
+# in       : (dialect, n)
+# out      : (bind_lis)
+# --------------------------------------------------------
+
+def sql_binds(dialect, n):
+
+    if dialect == SQLITE:
+        return ['?'] * n
+
+    return [f':{i + 1}' for i in range(n)]
+
+
+# --------------------------------------------------------
+# function : db_datetime
+# descr    : a DATE read from the database as a date time of time_zone,
+#            Oracle returns the wall clock time, sqlite the text
+#            bind_datetime made of it
+#
+# in       : (value, time_zone)
+# out      : (result)
+# --------------------------------------------------------
+
+def db_datetime(value, time_zone):
+
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+
+    return value.replace(tzinfo = time_zone)
+
+
+# --------------------------------------------------------
+# function : req_type_get
+# descr    : the LDO_REQ_TYPE of the bars of a what to show
+#
+# in       : (what_to_show)
+# out      : (req_type)
+# --------------------------------------------------------
+
+def req_type_get(what_to_show):
+
+    return REQ_TYPE_PREFIX + what_to_show
+
+# ============================================================================================================================
+# classes
+# ============================================================================================================================
+
+class HistMktBackfill:
+
+    # ------------------------------------------------------------
+    # class : HistMktBackfill
+    # descr : the backfill engine, see the file descr. tws is a connected
+    #         TWSSyncWrapper, db_con a DB-API connection, contract_get
+    #         gives the Contract of a ticker before its details are
+    #         asked, time_zone is the exchange one the chunks follow
+    #
+    # in    : (tws, db_con, agt_log, agt_err, contract_get, time_zone, use_rth, format_date, max_pending, batch_size)
+    # out   : n/a
+    # ------------------------------------------------------------
+
+    def __init__(self, tws, db_con, agt_log, agt_err, contract_get, time_zone, use_rth = True, format_date = 2,
+                 max_pending = MAX_PENDING_CHUNKS, batch_size = BATCH_SIZE):
+
+        self.tws          = tws
+        self.db_con       = db_con
+        self.agt_log      = agt_log
+        self.agt_err      = agt_err
+        self.contract_get = contract_get
+        self.time_zone    = ZoneInfo(time_zone) if isinstance(time_zone, str) else time_zone
+        self.use_rth      = use_rth
+        self.format_date  = format_date
+        self.max_pending  = max_pending
+        self.dialect      = db_dialect(db_con)
+        self.hmd_bulk     = ImsHistMktDataBulk(db_con = db_con, batch_size = batch_size)
+        self.contracts    = {}
+
+        # units left per todo, the todo goes once they are all done
+        self.todo_units   = {}
+
+        return
+
+
+    # ========================================================================================================================
+    # functions
+    # ========================================================================================================================
+
+    # --------------------------------------------------------
+    # function : investments_get
+    # descr    : the tickers of the investments loading prices, by load
+    #            priority
+    #
+    # in       : ()
+    # out      : (ticker_lis)
+    # --------------------------------------------------------
+
+    def investments_get(self):
+
+        (bind,) = sql_binds(self.dialect, 1)
+        sql     = (f"SELECT INV_TICKER FROM IMS_INVESTMENTS WHERE INV_LOAD_PRICES = {bind} "
+                   f"ORDER BY INV_LOAD_PRIORITY, INV_TICKER")
+
+        cursor = self.db_con.cursor()
+        try:
+            cursor.execute(sql, ['Y'])
+            ticker_lis = [inv_ticker for (inv_ticker,) in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+        return ticker_lis
+
+
+    # --------------------------------------------------------
+    # function : plan_chunks
+    # descr    : the units of a ticker and what to show between start and
+    #            end, a chunk per request
+    #
+    # in       : (inv_ticker, what_to_show, bar_size, start_datetime, end_datetime, todo_key)
+    # out      : (unit_lis)
+    # --------------------------------------------------------
+
+    def plan_chunks(self, inv_ticker, what_to_show, bar_size, start_datetime, end_datetime, todo_key = None):
+
+        todo_keys = () if todo_key is None else (todo_key,)
+        unit_lis  = []
+        for (chunk_start, chunk_end) in planChunks(start_datetime, end_datetime, bar_size.bar_size_setting, self.time_zone):
+            # all the chunks in the exchange time zone, as IMS_LOAD_DONE keeps them
+            unit_lis.append(HistMktUnit(inv_ticker, what_to_show, bar_size.hmd_freq_type,
+                                        chunk_start.astimezone(self.time_zone), chunk_end.astimezone(self.time_zone), todo_keys))
+
+        return unit_lis
+
+
+    # --------------------------------------------------------
+    # function : plan_window
+    # descr    : the units of the tickers for each what to show between
+    #            start and end, time zone aware date times
+    #
+    # in       : (ticker_lis, start_datetime, end_datetime, bar_size_setting, what_to_show_lis)
+    # out      : (unit_lis)
+    # --------------------------------------------------------
+
+    def plan_window(self, ticker_lis, start_datetime, end_datetime, bar_size_setting, what_to_show_lis = ('BID', 'ASK')):
+
+        bar_size = bar_size_get(bar_size_setting)
+        unit_lis = []
+        for inv_ticker in ticker_lis:
+            for what_to_show in what_to_show_lis:
+                unit_lis += self.plan_chunks(inv_ticker, what_to_show, bar_size, start_datetime, end_datetime)
+
+        return unit_lis
+
+
+    # --------------------------------------------------------
+    # function : plan_todos
+    # descr    : the units of the historic market data todos, ready or
+    #            left in progress by a run that stopped, by priority.
+    #            They are set in progress until all their units are done
+    #
+    # in       : ()
+    # out      : (unit_lis)
+    # --------------------------------------------------------
+
+    def plan_todos(self):
+
+        binds = sql_binds(self.dialect, 3)
+        sql   = (f"SELECT LTO_INV_TICKER, LTO_START_DATETIME, LTO_FREQ_TYPE, LTO_REQ_TYPE, LTO_END_DATETIME "
+                 f"FROM IMS_LOAD_TODOS WHERE LTO_REQ_TYPE LIKE {binds[0]} AND LTO_STATUS IN ({binds[1]}, {binds[2]}) "
+                 f"ORDER BY LTO_PRIORITY, LTO_INV_TICKER, LTO_START_DATETIME")
+
+        cursor = self.db_con.cursor()
+        try:
+            cursor.execute(sql, [REQ_TYPE_PREFIX + '%', TODO_STATUS_READY, TODO_STATUS_WIP])
+            todo_lis = cursor.fetchall()
+
+            unit_lis = []
+            for (inv_ticker, start_datetime, freq_type, req_type, end_datetime) in todo_lis:
+                todo_key  = (inv_ticker, start_datetime, freq_type, req_type)
+                todo_plan = self.plan_chunks(inv_ticker, req_type[len(REQ_TYPE_PREFIX):], bar_size_get(freq_type),
+                                             db_datetime(start_datetime, self.time_zone), db_datetime(end_datetime, self.time_zone),
+                                             todo_key)
+                self.todo_units[todo_key] = len(todo_plan)
+                unit_lis += todo_plan
+
+            binds = sql_binds(self.dialect, 5)
+            cursor.executemany(f"UPDATE IMS_LOAD_TODOS SET LTO_STATUS = {binds[0]} "
+                               f"WHERE LTO_INV_TICKER = {binds[1]} AND LTO_START_DATETIME = {binds[2]} "
+                               f"AND LTO_FREQ_TYPE = {binds[3]} AND LTO_REQ_TYPE = {binds[4]}",
+                               [[TODO_STATUS_WIP] + list(todo_key) for todo_key in self.todo_units])
+        finally:
+            cursor.close()
+        self.db_con.commit()
+
+        self.agt_log.log_put(f"{len(todo_lis)} historic market data todos in {len(unit_lis)} chunks")
+
+        return unit_lis
+
+
+    # --------------------------------------------------------
+    # function : done_key
+    # descr    : the key of a unit in the set of done_keys_get
+    #
+    # in       : (unit)
+    # out      : (key)
+    # --------------------------------------------------------
+
+    def done_key(self, unit):
+
+        return (unit.inv_ticker, unit.hmd_freq_type, req_type_get(unit.what_to_show),
+                bind_datetime(self.dialect, unit.chunk_start), bind_datetime(self.dialect, unit.chunk_end))
+
+
+    # --------------------------------------------------------
+    # function : done_keys_get
+    # descr    : the checkpoints of the historic market data between the
+    #            first and the last chunk of the units, in one query
+    #
+    # in       : (unit_lis)
+    # out      : (key_set)
+    # --------------------------------------------------------
+
+    def done_keys_get(self, unit_lis):
+
+        if not unit_lis:
+            return set()
+
+        binds = sql_binds(self.dialect, 3)
+        sql   = (f"SELECT LDO_INV_TICKER, LDO_FREQ_TYPE, LDO_REQ_TYPE, LDO_START_DATETIME, LDO_END_DATETIME "
+                 f"FROM IMS_LOAD_DONE WHERE LDO_REQ_TYPE LIKE {binds[0]} "
+                 f"AND LDO_START_DATETIME BETWEEN {binds[1]} AND {binds[2]}")
+        starts = [bind_datetime(self.dialect, unit.chunk_start) for unit in unit_lis]
+
+        cursor = self.db_con.cursor()
+        try:
+            cursor.execute(sql, [REQ_TYPE_PREFIX + '%', min(starts), max(starts)])
+            key_set = {tuple(key) for key in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+        return key_set
+
+
+    # --------------------------------------------------------
+    # function : units_unique
+    # descr    : the units once each by done_key, in plan order, a todo
+    #            and a window, or two todos, asking for the same chunk
+    #            share its unit, which carries all their todo keys
+    #
+    # in       : (unit_lis)
+    # out      : (unit_lis)
+    # --------------------------------------------------------
+
+    def units_unique(self, unit_lis):
+
+        units = OrderedDict()
+        for unit in unit_lis:
+            key  = self.done_key(unit)
+            same = units.get(key)
+            if same is None:
+                units[key] = unit
+            else:
+                todo_keys  = same.todo_keys + tuple(todo_key for todo_key in unit.todo_keys if todo_key not in same.todo_keys)
+                units[key] = same._replace(todo_keys = todo_keys)
+
+        return list(units.values())
+
+
+    # --------------------------------------------------------
+    # function : tws_contract_get
+    # descr    : the contract of a ticker as TWS knows it, asked once, or as
+    #            contract_get gives it when TWS cannot say
+    #
+    # in       : (inv_ticker)
+    # out      : (contract)
+    # --------------------------------------------------------
+
+    def tws_contract_get(self, inv_ticker):
+
+        contract = self.contracts.get(inv_ticker)
+        if contract is None:
+            contract = self.contract_get(inv_ticker)
+            try:
+                details = self.tws.get_contract_details(contract)
+                if details:
+                    # conId included
+                    contract = details[0].contract
+            except Exception as e:
+                # TWS may still find the contract by its symbol
+                self.agt_err.log_put(f"Error getting contract details of {inv_ticker}: {e}")
+            self.contracts[inv_ticker] = contract
+
+        return contract
+
+
+    # --------------------------------------------------------
+    # function : run
+    # descr    : requests and saves the units not done yet, and returns
+    #            the counts of units planned, skipped as done, saved and
+    #            failed, and of bars saved. Failed units are done again
+    #            by the next run
+    #
+    # in       : (unit_lis)
+    # out      : (stats)
+    # --------------------------------------------------------
+
+    def run(self, unit_lis):
+
+        unit_lis = self.units_unique(unit_lis)
+        stats    = {'units' : len(unit_lis), 'skipped' : 0, 'saved' : 0, 'failed' : 0, 'bars' : 0}
+        done_set = self.done_keys_get(unit_lis)
+
+        # the units of the same chunk of a ticker are saved together, their
+        # bars merged into one row per bar
+        chunks = OrderedDict()
+        for unit in unit_lis:
+            if self.done_key(unit) in done_set:
+                stats['skipped'] += 1
+                self.unit_done(unit)
+                continue
+            chunk_key = (unit.inv_ticker, unit.hmd_freq_type, unit.chunk_start, unit.chunk_end)
+            chunks.setdefault(chunk_key, []).append(unit)
+
+        self.agt_log.log_put(f"Backfill of {stats['units']} units, {stats['skipped']} done already, {len(chunks)} chunks to request")
+
+        chunk_iter = iter(enumerate(chunks.items()))
+        answered   = queue.Queue()
+        in_flight  = {}
+
+        while True:
+            while len(in_flight) < self.max_pending:
+                (priority, (chunk_key, chunk_units)) = next(chunk_iter, (None, (None, None)))
+                if chunk_key is None:
+                    break
+                in_flight[chunk_key] = self.request_chunk(chunk_key, chunk_units, priority, answered)
+            if not in_flight:
+                break
+
+            try:
+                chunk_key = answered.get(timeout = STALL_CHECK)
+            except queue.Empty:
+                self.stalled_cancel(in_flight)
+                continue
+
+            self.save_chunk(chunk_key, in_flight.pop(chunk_key), stats)
+
+        return stats
+
+
+    # --------------------------------------------------------
+    # function : stalled_cancel
+    # descr    : gives up the requests in flight sent more than
+    #            STALL_TIMEOUT seconds ago and not answered yet
+    #
+    # in       : (in_flight)
+    # out      : ()
+    # --------------------------------------------------------
+
+    def stalled_cancel(self, in_flight):
+
+        now_mono  = time.monotonic()
+        n_stalled = 0
+        for unit_futures in in_flight.values():
+            for (_, hist_future) in unit_futures:
+                if hist_future is None or hist_future.done() or not hist_future.sent.done():
+                    continue
+                sent_at = hist_future.sent.result()
+                if sent_at is not None and now_mono - sent_at >= STALL_TIMEOUT and hist_future.cancel():
+                    n_stalled += 1
+
+        if n_stalled:
+            self.agt_err.log_put(f"{n_stalled} historical data requests not answered {STALL_TIMEOUT} s after they were sent, given up")
+
+        return
+
+
+    # --------------------------------------------------------
+    # function : request_chunk
+    # descr    : sends the requests of the units of a chunk, the chunk key
+    #            goes to answered once they are all answered
+    #
+    # in       : (chunk_key, chunk_units, priority, answered)
+    # out      : (unit_futures)
+    # --------------------------------------------------------
+
+    def request_chunk(self, chunk_key, chunk_units, priority, answered):
+
+        (inv_ticker, hmd_freq_type, chunk_start, chunk_end) = chunk_key
+        (end_date_time, duration_str) = chunkRequest(chunk_start, chunk_end)
+        bar_size_setting = bar_size_get(hmd_freq_type).bar_size_setting
+
+        unit_futures = []
+        try:
+            contract = self.tws_contract_get(inv_ticker)
+            for unit in chunk_units:
+                unit_futures.append((unit, self.tws.get_historical_data_future(
+                                            contract         = contract,
+                                            end_date_time    = end_date_time,
+                                            duration_str     = duration_str,
+                                            bar_size_setting = bar_size_setting,
+                                            what_to_show     = unit.what_to_show,
+                                            use_rth          = self.use_rth,
+                                            format_date      = self.format_date,
+                                            priority         = priority)))
+        except Exception as e:
+            self.agt_err.log_put(f"Error requesting {inv_ticker} from {chunk_start}: {e}")
+            for unit_future in unit_futures:
+                unit_future[1].cancel()
+            unit_futures = [(unit, None) for unit in chunk_units]
+            answered.put(chunk_key)
+            return unit_futures
+
+        n_left = [len(unit_futures)]
+        lock   = threading.Lock()
+
+        def unit_answered(_):
+            # called once per unit, from the thread answering the future or
+            # from the one cancelling it
+            with lock:
+                n_left[0] -= 1
+                last = n_left[0] == 0
+            if last:
+                answered.put(chunk_key)
+
+        for (_, hist_future) in unit_futures:
+            hist_future.add_done_callback(unit_answered)
+
+        return unit_futures
+
+
+    # --------------------------------------------------------
+    # function : save_chunk
+    # descr    : merges and saves the bars of a chunk, then checkpoints
+    #            its units that were answered
+    #
+    # in       : (chunk_key, unit_futures, stats)
+    # out      : ()
+    # --------------------------------------------------------
+
+    def save_chunk(self, chunk_key, unit_futures, stats):
+
+        (inv_ticker, hmd_freq_type, chunk_start, chunk_end) = chunk_key
+        bar_size    = bar_size_get(hmd_freq_type)
+        hist_merger = HistMktBarMerger(inv_ticker, bar_size.bar_size_setting, chunk_start, chunk_end, self.time_zone)
+
+        unit_done_lis = []
+        for (unit, hist_future) in unit_futures:
+            if hist_future is None:
+                stats['failed'] += 1
+                continue
+            try:
+                bars = mergeBars([hist_future.result(timeout = 0)], chunk_start, chunk_end, bar_size.bar_size_setting, self.time_zone)
+                hist_merger.add_bars(unit.what_to_show, bars)
+            except Exception as e:
+                if not isNoDataError(e):
+                    stats['failed'] += 1
+                    self.agt_err.log_put(f"Error getting historical {unit.what_to_show} data for {inv_ticker} from {chunk_start}: {e!r}")
+                    continue
+                # a holiday, done with no bars
+            unit_done_lis.append(unit)
+
+        if not unit_done_lis:
+            return
+
+        try:
+            row_lis   = hist_merger.hist_mkt_data()
+            batch_lis = self.hmd_bulk.put_db(row_lis)
+            for batch in batch_lis:
+                for (row_no, message) in batch['errors']:
+                    self.agt_err.log_put(f"{inv_ticker} bar {row_lis[row_no].hmd_start_datetime} not saved: {message}")
+            self.checkpoint(unit_done_lis)
+        except Exception as e:
+            self.db_con.rollback()
+            stats['failed'] += len(unit_done_lis)
+            self.agt_err.log_put(f"Error saving historical data for {inv_ticker} from {chunk_start}: {e!r}")
+            return
+
+        stats['saved'] += len(unit_done_lis)
+        stats['bars']  += len(row_lis)
+        for unit in unit_done_lis:
+            self.unit_done(unit)
+
+        return
+
+
+    # --------------------------------------------------------
+    # function : checkpoint
+    # descr    : records the units in IMS_LOAD_DONE and commits, those
+    #            recorded already, e.g. by a run that stopped before
+    #            its todos were deleted, are left as they are
+    #
+    # in       : (unit_lis)
+    # out      : ()
+    # --------------------------------------------------------
+
+    def checkpoint(self, unit_lis):
+
+        # the key is bound by name, Oracle binds each placeholder of a SQL
+        # statement by position, so :1 used twice would need two values
+        from_dual    = '' if self.dialect == SQLITE else ' FROM dual'
+        sql          = (f"INSERT INTO IMS_LOAD_DONE (LDO_INV_TICKER, LDO_FREQ_TYPE, LDO_REQ_TYPE, LDO_START_DATETIME, "
+                        f"LDO_END_DATETIME, LDO_DATETIME_LOADED) "
+                        f"SELECT :ticker, :freq, :req_type, :start_dt, :end_dt, :loaded{from_dual} "
+                        f"WHERE NOT EXISTS (SELECT 1 FROM IMS_LOAD_DONE WHERE LDO_INV_TICKER = :ticker "
+                        f"AND LDO_FREQ_TYPE = :freq AND LDO_REQ_TYPE = :req_type "
+                        f"AND LDO_START_DATETIME = :start_dt AND LDO_END_DATETIME = :end_dt)")
+        now_datetime = bind_datetime(self.dialect, datetime.now())
+
+        bind_lis = []
+        for unit in unit_lis:
+            (ticker, freq, req_type, start_dt, end_dt) = self.done_key(unit)
+            bind_lis.append({'ticker' : ticker, 'freq' : freq, 'req_type' : req_type,
+                             'start_dt' : start_dt, 'end_dt' : end_dt, 'loaded' : now_datetime})
+
+        cursor = self.db_con.cursor()
+        try:
+            cursor.executemany(sql, bind_lis)
+        finally:
+            cursor.close()
+        self.db_con.commit()
+
+        return
+
+
+    # --------------------------------------------------------
+    # function : unit_done
+    # descr    : counts a unit as done for each todo it comes from and
+    #            deletes the todos all of whose units are
+    #
+    # in       : (unit)
+    # out      : ()
+    # --------------------------------------------------------
+
+    def unit_done(self, unit):
+
+        for todo_key in unit.todo_keys:
+            if todo_key not in self.todo_units:
+                continue
+            self.todo_units[todo_key] -= 1
+            if self.todo_units[todo_key] == 0:
+                del self.todo_units[todo_key]
+                self.todo_delete(todo_key)
+
+        return
+
+
+    # --------------------------------------------------------
+    # function : todo_delete
+    # descr    : deletes a todo done and commits
+    #
+    # in       : (todo_key)
+    # out      : ()
+    # --------------------------------------------------------
+
+    def todo_delete(self, todo_key):
+
+        binds  = sql_binds(self.dialect, 4)
+        cursor = self.db_con.cursor()
+        try:
+            cursor.execute(f"DELETE FROM IMS_LOAD_TODOS WHERE LTO_INV_TICKER = {binds[0]} AND LTO_START_DATETIME = {binds[1]} "
+                           f"AND LTO_FREQ_TYPE = {binds[2]} AND LTO_REQ_TYPE = {binds[3]}", list(todo_key))
+        finally:
+            cursor.close()
+        self.db_con.commit()
+
+        return
+
+
+    # ========================================================================================================================
+    #
+    # ========================================================================================================================
+
+    def __repr__(self):
+
+        return f"backfill {len(self.todo_units)} todos open"
+
+
+    def __str__(self):
+
+        return f"backfill {len(self.todo_units)} todos open"
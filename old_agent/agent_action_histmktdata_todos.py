@@ -16,6 +16,8 @@
 # 2021-09-03 101 DW  Improved debug messages
 # 2022-11-05 200 DW  Reorg
 # 2022-11-18 201 DW  Reworked for ava
+# 2026-10-18 202 AG  End the bars by their bar size from HistMktBarSize
+# 2026-10-18 203 AG  End each bar by the bar size of its own request
 #------------------------------------------------------------
 
 
@@ -58,6 +60,7 @@ from ibapi.account_summary_tags import *
 from apis.ib_api.ContractSamples import ContractSamples
 
 from database.db_objects.ImsExchangeDB import get_ticker, get_exchange
+from db_objects.HistMktBarSize import bar_size_get
 from database.db_objects.ImsHistMktDataDB import insert_ask, insert_bid, insert_trades
 from database.db_objects.ImsInvestmentDB import update_latest_price_date
 from database.db_objects.ImsLoadDoneDB import ImsLoadDoneDB
@@ -1123,22 +1126,20 @@ class TestApp(TestWrapper, TestClient):
         hmd_inv_ticker = hmd_id.split('$')[0]
         hmd_inv_exc_symbol = hmd_id.split('$')[1]
         
-        hmd_start_datetime = (datetime.datetime.strptime(bar.date,"%Y%m%d  %H:%M:%S")).strftime("%Y-%m-%d %H:%M:%S")
-        index_start_dt = (datetime.datetime.strptime(bar.date,"%Y%m%d  %H:%M:%S")).strftime("%Y%m%d%H%M")
-        
-        if self.hmd_freq_type == '1 min':
-            hmd_end_datetime = (datetime.datetime.strptime(bar.date,"%Y%m%d %H:%M:%S") + datetime.timedelta(seconds=59)).strftime("%Y-%m-%d %H:%M:%S")
-            index_end_dt = (datetime.datetime.strptime(bar.date,"%Y%m%d %H:%M:%S") + datetime.timedelta(seconds=59)).strftime("%Y%m%d%H%M")
-        elif self.hmd_freq_type == '5 mins':
-            hmd_end_datetime = (datetime.datetime.strptime(bar.date,"%Y%m%d %H:%M:%S") + datetime.timedelta(seconds=59)).strftime("%Y-%m-%d %H:%M:%S")
-            index_end_dt = (datetime.datetime.strptime(date,"%Y%m%d %H:%M:%S") + datetime.timedelta(seconds=299)).strftime("%Y%m%d%H%M")
-        elif self.hmd_freq_type == '15 mins':
-            hmd_end_datetime = (datetime.datetime.strptime(bar.date,"%Y%m%d %H:%M:%S") + datetime.timedelta(seconds=59)).strftime("%Y-%m-%d %H:%M:%S")
-            index_end_dt = (datetime.datetime.strptime(date,"%Y%m%d %H:%M:%S") + datetime.timedelta(seconds=899)).strftime("%Y%m%d%H%M")
-              
+        # the frequency of the request this bar answers, the todos in flight
+        # may be of different bar sizes
         rectype = this_tracking_rec[1]
         hmd_freq_type = this_tracking_rec[3]
         
+        # parse the bar date once, the bar size registry gives its end
+        bar_start_dt = datetime.datetime.strptime(bar.date,"%Y%m%d  %H:%M:%S")
+        bar_end_dt = bar_size_get(hmd_freq_type).end_datetime(bar_start_dt)
+        
+        hmd_start_datetime = bar_start_dt.strftime("%Y-%m-%d %H:%M:%S")
+        index_start_dt = bar_start_dt.strftime("%Y%m%d%H%M")
+        hmd_end_datetime = bar_end_dt.strftime("%Y-%m-%d %H:%M:%S")
+        index_end_dt = bar_end_dt.strftime("%Y%m%d%H%M")
+              
         df_temp = pd.DataFrame()
         
         # change delimiter to dollar sign rather than period